@@ -0,0 +1,148 @@
+#!/usr/bin/env -S uv run --quiet python
+# Description: Throughput benchmark for push_metrics' coalescing metric batcher.
+# Description: Compares one request per payload with batched pushes against a local ingest server.
+
+"""Push synthetic metric payloads to a local stand-in ingest server.
+
+    $ uv run python scripts/bench_metric_push.py
+    $ uv run python scripts/bench_metric_push.py --payloads 50000 --latency-ms 50
+
+Each payload carries one datapoint sample for one of ``--sources`` resources,
+the shape a collector pushing every few seconds produces. The stand-in server
+speaks just enough HTTP/1.1 to accept POSTs on /rest/metric/ingest, sleeps
+``--latency-ms`` per request to stand in for the network round trip and
+portal processing, and answers 202. The per-payload run sends each payload
+as its own request (the previous push_metrics behavior) with the same upload
+concurrency the batcher uses, so the difference is coalescing alone.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+
+from lm_mcp.auth.lmv1 import LMv1Auth
+from lm_mcp.client import LogicMonitorClient
+from lm_mcp.metric_batcher import METRIC_INGEST_PATH, MetricBatcher
+
+_RESPONSE = b'{"success":true,"message":"Accepted"}'
+
+
+class IngestServer:
+    """Minimal keep-alive HTTP server that counts ingestion requests."""
+
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+        self.requests = 0
+        self.bytes = 0
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for line in head.split(b"\r\n")[1:]:
+                    name, _, value = line.partition(b":")
+                    if name.strip().lower() == b"content-length":
+                        length = int(value)
+                await reader.readexactly(length)
+                self.requests += 1
+                self.bytes += length
+                if self.latency:
+                    await asyncio.sleep(self.latency)
+                writer.write(
+                    b"HTTP/1.1 202 Accepted\r\nContent-Type: application/json\r\n"
+                    b"Content-Length: %d\r\n\r\n%s" % (len(_RESPONSE), _RESPONSE)
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+def synthetic_payloads(count: int, sources: int) -> list[dict]:
+    """Build ``count`` single-sample payloads spread round-robin over ``sources`` resources."""
+    return [
+        {
+            "resourceIds": {"system.hostname": f"host-{i % sources}"},
+            "dataSource": "BenchApp",
+            "instances": [
+                {
+                    "instanceName": "main",
+                    "dataPoints": [
+                        {
+                            "dataPointName": ("requests", "errors", "latency")[i % 3],
+                            "values": {str(1_700_000_000 + i // sources): i % 97},
+                        }
+                    ],
+                }
+            ],
+        }
+        for i in range(count)
+    ]
+
+
+async def per_payload(client: LogicMonitorClient, payloads: list[dict], concurrency: int) -> None:
+    """One ingestion request per payload, ``concurrency`` in flight."""
+    slots = asyncio.Semaphore(concurrency)
+
+    async def push(payload: dict) -> None:
+        async with slots:
+            await client.ingest_post(METRIC_INGEST_PATH, json_body=payload)
+
+    await asyncio.gather(*(push(p) for p in payloads))
+
+
+async def batched(client: LogicMonitorClient, payloads: list[dict], concurrency: int) -> None:
+    """Payloads submitted in tool-call-sized chunks through the batcher, then flushed."""
+    batcher = MetricBatcher(client, max_pending=len(payloads), concurrency=concurrency)
+    for offset in range(0, len(payloads), 100):
+        await batcher.submit(payloads[offset : offset + 100], timeout=60)
+    await batcher.flush()
+    await batcher.close()
+
+
+async def run(args: argparse.Namespace) -> int:
+    payloads = synthetic_payloads(args.payloads, args.sources)
+    runs = [("batched", batched)]
+    if not args.skip_baseline:
+        runs.append(("per-payload", per_payload))
+
+    for name, fn in runs:
+        ingest = IngestServer(args.latency_ms / 1000)
+        server = await asyncio.start_server(ingest.handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        client = LogicMonitorClient(
+            base_url=f"http://127.0.0.1:{port}/santaba/rest",
+            auth=LMv1Auth("bench-id", "bench-key"),
+            ingest_url=f"http://127.0.0.1:{port}",
+        )
+        start = time.perf_counter()
+        await fn(client, payloads, args.concurrency)
+        elapsed = time.perf_counter() - start
+        await client.close()
+        server.close()
+        await server.wait_closed()
+        print(
+            f"{name:>12}: {elapsed:7.2f} s  {len(payloads) / elapsed:9.0f} payloads/s  "
+            f"requests={ingest.requests}  bytes={ingest.bytes}"
+        )
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--payloads", type=int, default=10_000)
+    parser.add_argument("--sources", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--latency-ms", type=float, default=20)
+    parser.add_argument("--skip-baseline", action="store_true")
+    args = parser.parse_args()
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
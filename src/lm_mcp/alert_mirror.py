@@ -0,0 +1,467 @@
+# Description: Optional in-memory alert mirror kept in sync with /alert/alerts by watermark.
+# Description: Indexes alerts by device, datasource, datapoint, group, severity, and start time.
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import contextlib
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from lm_mcp.client import LogicMonitorClient
+
+logger = logging.getLogger(__name__)
+
+# Alerts re-read on every sync on each side of the watermark, so alerts that
+# became visible slightly out of start order are still picked up.
+WATERMARK_OVERLAP_SECONDS = 300
+
+# Page size and page cap for sync queries.
+PAGE_SIZE = 1000
+MAX_PAGES = 200
+
+# Longest wait between full-load attempts after a load was cut short by the
+# page cap; the wait starts at the mirror's freshness age and doubles.
+FULL_LOAD_RETRY_MAX_SECONDS = 3600
+
+# Alert fields indexed for equality lookups (field -> index name).
+_INDEXED_FIELDS = {
+    "monitorObjectName": "device",
+    "monitorObjectId": "device_id",
+    "resourceTemplateName": "datasource",
+    "dataPointName": "datapoint",
+    "severity": "severity",
+}
+
+_state: dict[str, Any] = {
+    "mirror": None,
+    "task": None,
+}
+
+
+def _group_paths(alert: dict) -> list[str]:
+    """Extract device group full paths from an alert's monitorObjectGroups field."""
+    groups = alert.get("monitorObjectGroups")
+    if not groups:
+        return []
+    if isinstance(groups, str):
+        return [g.strip() for g in groups.split(",") if g.strip()]
+    paths = []
+    for group in groups:
+        if isinstance(group, dict):
+            path = group.get("fullPath") or group.get("name")
+            if path:
+                paths.append(path)
+        elif isinstance(group, str):
+            paths.append(group)
+    return paths
+
+
+class AlertMirror:
+    """Local, memory-bounded copy of recent alerts with secondary indexes.
+
+    The first sync loads every alert that started within the retention window.
+    Later syncs read only alerts that started after the watermark (the newest
+    start time seen) or that cleared since the previous sync, so each refresh
+    costs two small queries however many tools read from the mirror. Acks and
+    notes are not tracked; the mirror reflects start, end, and cleared state.
+
+    When more than ``max_alerts`` are held, the oldest by start time are
+    evicted and the covered window shrinks accordingly, so a query reaching
+    further back is reported as not covered and the caller uses the API.
+    A sync cut short by the page cap leaves the mirror covering nothing
+    until a later full load completes. After a truncated full load, syncs
+    make no API calls until the next attempt, which backs off exponentially.
+    """
+
+    def __init__(
+        self,
+        client: LogicMonitorClient,
+        retention_seconds: int = 168 * 3600,
+        max_alerts: int = 50000,
+        max_age_seconds: float = 120.0,
+    ) -> None:
+        self.client = client
+        self.retention_seconds = retention_seconds
+        self.max_alerts = max_alerts
+        self.max_age_seconds = max_age_seconds
+        self._alerts: dict[str, dict] = {}
+        self._indexes: dict[str, dict[Any, set[str]]] = {
+            name: {} for name in (*_INDEXED_FIELDS.values(), "group")
+        }
+        self._by_start: list[tuple[int, str]] = []
+        self.watermark: int | None = None
+        self.coverage_start: int | None = None
+        self.last_sync: float | None = None
+        self.last_sync_epoch: int | None = None
+        self.sync_count = 0
+        self._full_load_due = True
+        self._full_load_failures = 0
+        self._full_load_retry_at: float | None = None
+
+    def __len__(self) -> int:
+        return len(self._alerts)
+
+    def is_fresh(self) -> bool:
+        """True when the last successful sync is recent enough to answer queries."""
+        return self.last_sync is not None and (
+            time.monotonic() - self.last_sync <= self.max_age_seconds
+        )
+
+    def covers(self, start_epoch: int) -> bool:
+        """True when the mirror is fresh and holds every alert started since ``start_epoch``."""
+        return (
+            self.is_fresh()
+            and self.coverage_start is not None
+            and (start_epoch >= self.coverage_start)
+        )
+
+    async def _fetch(self, filter_str: str) -> tuple[list[dict], bool]:
+        """Read every page of alerts matching ``filter_str``.
+
+        Returns:
+            Tuple of (alerts, whether every page was read before the page cap).
+        """
+        items: list[dict] = []
+        for page in range(MAX_PAGES):
+            result = await self.client.get(
+                "/alert/alerts",
+                params={"size": PAGE_SIZE, "offset": page * PAGE_SIZE, "filter": filter_str},
+            )
+            batch = result.get("items", [])
+            items.extend(batch)
+            total = result.get("total")
+            if len(batch) < PAGE_SIZE or (isinstance(total, int) and len(items) >= total):
+                return items, True
+        logger.warning(
+            "alert mirror query %r stopped at the %d-page cap (%d alerts); "
+            "the mirror will not answer queries until a full load completes",
+            filter_str,
+            MAX_PAGES,
+            len(items),
+        )
+        return items, False
+
+    async def sync(self) -> int:
+        """Bring the mirror up to date.
+
+        Returns:
+            Number of alerts inserted or updated.
+        """
+        if self._full_load_retry_at is not None:
+            if time.monotonic() < self._full_load_retry_at:
+                return 0  # covering nothing: incremental reads would be wasted
+            self._full_load_due = True
+
+        now = int(time.time())
+        if self._full_load_due or self.watermark is None or self.last_sync_epoch is None:
+            start = now - self.retention_seconds
+            items, complete = await self._fetch(f"startEpoch>:{start},cleared:*")
+            self._full_load_due = False
+            if complete:
+                self.coverage_start = start
+                self._full_load_failures = 0
+                self._full_load_retry_at = None
+            else:
+                self.coverage_start = None
+                self._full_load_failures += 1
+                delay = min(
+                    FULL_LOAD_RETRY_MAX_SECONDS,
+                    self.max_age_seconds * 2 ** (self._full_load_failures - 1),
+                )
+                self._full_load_retry_at = time.monotonic() + delay
+                logger.warning(
+                    "alert mirror full load was truncated; retrying in %.0fs "
+                    "(consider lowering LM_ALERT_MIRROR_HOURS)",
+                    delay,
+                )
+        else:
+            started, started_complete = await self._fetch(
+                f"startEpoch>:{self.watermark - WATERMARK_OVERLAP_SECONDS},cleared:*"
+            )
+            ended, ended_complete = await self._fetch(
+                f"endEpoch>:{self.last_sync_epoch - WATERMARK_OVERLAP_SECONDS},cleared:*"
+            )
+            items = started + ended
+            if not (started_complete and ended_complete):
+                # Alerts were missed: nothing held can be trusted as complete
+                # until the next sync reloads the whole window.
+                self.coverage_start = None
+                self._full_load_due = True
+
+        self._upsert_all(items)
+        self._evict(now - self.retention_seconds)
+
+        self.last_sync = time.monotonic()
+        self.last_sync_epoch = now
+        self.sync_count += 1
+        return len(items)
+
+    def _upsert_all(self, alerts: list[dict]) -> None:
+        """Upsert a sync's alerts, re-sorting the start index once for a bulk load."""
+        if len(alerts) <= PAGE_SIZE:
+            for alert in alerts:
+                self._upsert(alert)
+            return
+        for alert in alerts:
+            self._upsert(alert, ordered=False)
+        self._by_start = sorted(
+            (int(alert.get("startEpoch") or 0), alert_id)
+            for alert_id, alert in self._alerts.items()
+        )
+
+    def _upsert(self, alert: dict, ordered: bool = True) -> None:
+        """Insert or replace one alert.
+
+        With ``ordered`` False the start index is left stale; the caller
+        rebuilds it.
+        """
+        alert_id = alert.get("id")
+        if alert_id is None:
+            return
+        alert_id = str(alert_id)
+        if alert_id in self._alerts:
+            old = (int(self._alerts[alert_id].get("startEpoch") or 0), alert_id)
+            self._remove(alert_id)
+            if ordered:
+                pos = bisect.bisect_left(self._by_start, old)
+                if pos < len(self._by_start) and self._by_start[pos] == old:
+                    del self._by_start[pos]
+        start = int(alert.get("startEpoch") or 0)
+        self._alerts[alert_id] = alert
+        for field, index in _INDEXED_FIELDS.items():
+            value = alert.get(field)
+            if value is not None:
+                self._indexes[index].setdefault(value, set()).add(alert_id)
+        for path in _group_paths(alert):
+            self._indexes["group"].setdefault(path, set()).add(alert_id)
+        if ordered:
+            bisect.insort(self._by_start, (start, alert_id))
+        if self.watermark is None or start > self.watermark:
+            self.watermark = start
+
+    def _remove(self, alert_id: str) -> None:
+        """Remove an alert from the table and field indexes (not from ``_by_start``)."""
+        alert = self._alerts.pop(alert_id)
+        keys = [(index, alert.get(field)) for field, index in _INDEXED_FIELDS.items()]
+        keys.extend(("group", path) for path in _group_paths(alert))
+        for index, key in keys:
+            ids = self._indexes[index].get(key)
+            if ids is not None:
+                ids.discard(alert_id)
+                if not ids:
+                    del self._indexes[index][key]
+
+    def _evict(self, cutoff: int) -> None:
+        """Drop alerts older than the retention window, then the oldest over the size cap.
+
+        The covered window only ever narrows here; an uncovered mirror stays so.
+        """
+        if self.coverage_start is not None and cutoff > self.coverage_start:
+            self.coverage_start = cutoff
+        drop = bisect.bisect_left(self._by_start, (cutoff, ""))
+        if len(self._by_start) - drop > self.max_alerts:
+            drop = len(self._by_start) - self.max_alerts
+            if self.coverage_start is not None:
+                # Alerts that started after the last evicted one are all still held.
+                self.coverage_start = max(self.coverage_start, self._by_start[drop - 1][0] + 1)
+        for _, alert_id in self._by_start[:drop]:
+            self._remove(alert_id)
+        del self._by_start[:drop]
+
+    def _contains(self, index: str, needle: str) -> set[str]:
+        """Union of ids whose indexed key contains ``needle`` (case-insensitive)."""
+        needle = needle.lower()
+        ids: set[str] = set()
+        for key, key_ids in self._indexes[index].items():
+            if needle in str(key).lower():
+                ids |= key_ids
+        return ids
+
+    def query(
+        self,
+        start_epoch: int | None = None,
+        end_epoch: int | None = None,
+        device: str | None = None,
+        device_id: int | None = None,
+        datasource: str | None = None,
+        datapoint: str | None = None,
+        group_path: str | None = None,
+        severity: int | None = None,
+        min_severity: int | None = None,
+        cleared: bool | None = None,
+        limit: int | None = None,
+    ) -> list[dict]:
+        """Return mirrored alerts matching every given filter, oldest first.
+
+        Name filters (device, datasource, datapoint, group_path) are
+        case-insensitive contains matches, like the API's ``~`` operator.
+
+        Args:
+            start_epoch: Alerts started at or after this time.
+            end_epoch: Alerts started at or before this time.
+            device: Device display name contains.
+            device_id: Exact device ID.
+            datasource: DataSource (resource template) name contains.
+            datapoint: Datapoint name contains.
+            group_path: Device group full path contains.
+            severity: Exact severity level.
+            min_severity: Minimum severity level.
+            cleared: Only cleared (True) or only active (False) alerts.
+            limit: Keep only the most recent ``limit`` matches.
+
+        Returns:
+            Raw alert dicts as returned by the API.
+        """
+        candidates: list[set[str]] = []
+        if device_id is not None:
+            candidates.append(self._indexes["device_id"].get(device_id, set()))
+        if severity is not None:
+            candidates.append(self._indexes["severity"].get(severity, set()))
+        elif min_severity is not None:
+            candidates.append(
+                set().union(
+                    *(ids for sev, ids in self._indexes["severity"].items() if sev >= min_severity)
+                )
+            )
+        for index, needle in (
+            ("device", device),
+            ("datasource", datasource),
+            ("datapoint", datapoint),
+            ("group", group_path),
+        ):
+            if needle:
+                candidates.append(self._contains(index, needle))
+
+        lo = 0 if start_epoch is None else bisect.bisect_left(self._by_start, (start_epoch, ""))
+        hi = (
+            len(self._by_start)
+            if end_epoch is None
+            else bisect.bisect_left(self._by_start, (end_epoch + 1, ""))
+        )
+
+        if candidates:
+            matched = set.intersection(*sorted(candidates, key=len))
+            if len(matched) < hi - lo:
+                # Few index hits: sort them rather than scan the time range.
+                low = self._by_start[lo][0] if lo < hi else 0
+                high = self._by_start[hi - 1][0] if lo < hi else -1
+                ordered = [
+                    alert_id
+                    for start, alert_id in sorted(
+                        (int(self._alerts[i].get("startEpoch") or 0), i) for i in matched
+                    )
+                    if low <= start <= high
+                ]
+            else:
+                ordered = [alert_id for _, alert_id in self._by_start[lo:hi] if alert_id in matched]
+        else:
+            ordered = [alert_id for _, alert_id in self._by_start[lo:hi]]
+
+        alerts = [self._alerts[i] for i in ordered]
+        if cleared is not None:
+            alerts = [a for a in alerts if bool(a.get("cleared")) == cleared]
+        if limit is not None and len(alerts) > limit:
+            alerts = alerts[-limit:]
+        return alerts
+
+    def stats(self) -> dict[str, Any]:
+        """Return size, coverage, and sync status."""
+        return {
+            "alerts": len(self._alerts),
+            "watermark": self.watermark,
+            "coverage_start": self.coverage_start,
+            "last_sync_epoch": self.last_sync_epoch,
+            "fresh": self.is_fresh(),
+            "syncs": self.sync_count,
+        }
+
+
+def get_alert_mirror() -> AlertMirror | None:
+    """Return the running alert mirror, if one was started."""
+    return _state["mirror"]
+
+
+async def _run_sync_loop(mirror: AlertMirror, interval: int) -> None:
+    """Sync the mirror every ``interval`` seconds until cancelled."""
+    while True:
+        try:
+            count = await mirror.sync()
+            logger.debug("alert mirror synced %d alerts (%d held)", count, len(mirror))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("alert mirror sync failed: %s", e)
+        await asyncio.sleep(interval)
+
+
+def start_alert_mirror(
+    client: LogicMonitorClient,
+    interval: int = 60,
+    retention_hours: int = 168,
+    max_alerts: int = 50000,
+) -> AlertMirror:
+    """Create the process-wide alert mirror and start its background sync task.
+
+    The mirror counts as fresh for two sync intervals, so one failed sync
+    does not send every tool back to the API.
+    """
+    mirror = AlertMirror(
+        client,
+        retention_seconds=retention_hours * 3600,
+        max_alerts=max_alerts,
+        max_age_seconds=interval * 2,
+    )
+    _state["mirror"] = mirror
+    _state["task"] = asyncio.get_running_loop().create_task(_run_sync_loop(mirror, interval))
+    return mirror
+
+
+async def stop_alert_mirror() -> None:
+    """Cancel the background sync task and drop the mirror."""
+    task = _state["task"]
+    _state["task"] = None
+    _state["mirror"] = None
+    if task is not None:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+
+async def mirrored_alerts(
+    client: LogicMonitorClient,
+    start_epoch: int,
+    group_id: int | None = None,
+    cleared: bool | None = False,
+    **filters: Any,
+) -> list[dict] | None:
+    """Answer an alert query from the mirror when it can, else return None.
+
+    The mirror is used only when it belongs to ``client``'s portal, is fresh,
+    and covers ``start_epoch``; otherwise the caller should query the API.
+    Only active alerts are returned by default, the same set the API returns
+    for a ``startEpoch>:`` query without a ``cleared`` filter, so a tool gives
+    the same answer whichever path serves it.
+
+    Args:
+        client: LogicMonitor API client the caller would have queried.
+        start_epoch: Alerts started at or after this time.
+        group_id: Optional device group ID (resolved to its full path).
+        cleared: Only active (False, default) or only cleared (True) alerts;
+            None for both, for callers whose API query passes ``cleared:*``.
+        **filters: Further keyword filters for :meth:`AlertMirror.query`.
+
+    Returns:
+        Matching alerts, or None when the mirror cannot answer.
+    """
+    mirror = get_alert_mirror()
+    if mirror is None or mirror.client is not client or not mirror.covers(start_epoch):
+        return None
+    if group_id is not None:
+        from lm_mcp.tools import resolve_group_path
+
+        filters["group_path"] = await resolve_group_path(client, group_id)
+    return mirror.query(start_epoch=start_epoch, cleared=cleared, **filters)
@@ -3,11 +3,21 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import json
 import logging
+import re
 import time
 import uuid
 from dataclasses import dataclass, field
-from typing import Any
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from mcp.types import TextContent
+
+    from lm_mcp.client import LogicMonitorClient
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +59,7 @@ class AnalysisRequest:
     completed_at: float | None = None
     result: dict[str, Any] | None = None
     error: str | None = None
+    scheduled: bool = False
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize to dictionary."""
@@ -61,22 +72,54 @@ class AnalysisRequest:
             "completed_at": self.completed_at,
             "result": self.result,
             "error": self.error,
+            "scheduled": self.scheduled,
         }
 
 
+# Analysis tools whose results a scheduled workflow computes, and which may be
+# answered from that run. The primitive reads the workflows make (get_alerts,
+# get_devices, get_collectors, get_alert_statistics) are never recorded: an
+# ordinary listing must reflect acks, SDTs, and new alerts immediately.
+WORKFLOW_TOOLS: dict[str, frozenset[str]] = {
+    "alert_correlation": frozenset({"correlate_alerts"}),
+    "capacity_forecast": frozenset({"forecast_metric", "classify_trend"}),
+}
+
+
+@dataclass
+class PrecomputedResult:
+    """A workflow or workflow-tool result recorded by a scheduled run, served while fresh."""
+
+    result: Any
+    recorded_at: float
+    max_age: float
+    analysis_id: str | None = None
+
+    def is_fresh(self) -> bool:
+        return time.time() - self.recorded_at <= self.max_age
+
+
 class AnalysisStore:
     """In-memory store for analysis requests with TTL expiration."""
 
     def __init__(self, ttl_minutes: int = 60) -> None:
         self._store: dict[str, AnalysisRequest] = {}
         self._ttl_seconds = ttl_minutes * 60
-
-    def create(self, workflow: str, arguments: dict[str, Any]) -> AnalysisRequest:
+        # (portal, tool, arguments key) -> latest result from a scheduled run
+        self._tool_results: dict[tuple[str, str, str], PrecomputedResult] = {}
+        self._tool_names: set[str] = set()
+        # (portal, workflow, arguments key) -> latest completed scheduled run
+        self._workflow_results: dict[tuple[str, str, str], PrecomputedResult] = {}
+
+    def create(
+        self, workflow: str, arguments: dict[str, Any], scheduled: bool = False
+    ) -> AnalysisRequest:
         """Create a new analysis request.
 
         Args:
             workflow: Workflow name.
             arguments: Workflow arguments.
+            scheduled: Whether the request was started by the scheduler.
 
         Returns:
             The created AnalysisRequest.
@@ -86,6 +129,7 @@ class AnalysisStore:
             id=analysis_id,
             workflow=workflow,
             arguments=arguments,
+            scheduled=scheduled,
         )
         self._store[analysis_id] = req
         return req
@@ -159,8 +203,89 @@ class AnalysisStore:
         )
         return items[:limit]
 
+    def record_tool_result(
+        self,
+        portal: str,
+        tool: str,
+        arguments: dict[str, Any],
+        result: list[TextContent],
+        max_age: float,
+    ) -> None:
+        """Keep a workflow tool's result from a scheduled run for later identical calls.
+
+        Args:
+            portal: Portal the result was read from.
+            tool: Tool name.
+            arguments: Arguments the tool was called with.
+            result: The tool's TextContent result.
+            max_age: Seconds the result may be served for.
+        """
+        key = (portal, tool, tool_arguments_key(tool, arguments))
+        self._tool_results[key] = PrecomputedResult(result, time.time(), max_age)
+        self._tool_names.add(tool)
+
+    def tool_result(
+        self, portal: str, tool: str, arguments: dict[str, Any]
+    ) -> PrecomputedResult | None:
+        """Return a fresh precomputed result for this exact call, if any.
+
+        Args:
+            portal: Portal the call targets.
+            tool: Tool name.
+            arguments: Call arguments (schema defaults are filled in).
+
+        Returns:
+            The recorded result with its timestamp, or None.
+        """
+        if tool not in self._tool_names:
+            return None
+        entry = self._tool_results.get((portal, tool, tool_arguments_key(tool, arguments)))
+        if entry is None or not entry.is_fresh():
+            return None
+        return entry
+
+    def record_workflow_result(self, portal: str, req: AnalysisRequest, max_age: float) -> None:
+        """Keep a completed scheduled run for later identical analysis requests."""
+        key = (portal, req.workflow, json.dumps(req.arguments, sort_keys=True, default=str))
+        self._workflow_results[key] = PrecomputedResult(
+            req.result, req.completed_at or time.time(), max_age, req.id
+        )
+
+    def workflow_result(
+        self, portal: str, workflow: str, arguments: dict[str, Any]
+    ) -> PrecomputedResult | None:
+        """Return the fresh result of a scheduled run with these arguments, if any."""
+        key = (portal, workflow, json.dumps(arguments, sort_keys=True, default=str))
+        entry = self._workflow_results.get(key)
+        if entry is None or not entry.is_fresh():
+            return None
+        return entry
+
+
+@lru_cache(maxsize=512)
+def _schema_defaults(tool: str) -> tuple[tuple[str, Any], ...]:
+    """Default argument values declared in a tool's input schema."""
+    from lm_mcp.registry import TOOLS
+
+    for t in TOOLS:
+        if t.name == tool:
+            props = t.inputSchema.get("properties", {})
+            return tuple((k, v["default"]) for k, v in props.items() if "default" in v)
+    return ()
+
+
+def tool_arguments_key(tool: str, arguments: dict[str, Any]) -> str:
+    """Canonical form of a tool call's arguments, with schema defaults applied.
+
+    ``correlate_alerts({})`` and ``correlate_alerts({"hours_back": 4})`` map
+    to the same key.
+    """
+    merged = {k: v for k, v in _schema_defaults(tool) if k not in arguments}
+    merged.update({k: v for k, v in arguments.items() if v is not None})
+    return json.dumps(merged, sort_keys=True, default=str)
+
 
-async def run_analysis(store: AnalysisStore, analysis_id: str) -> None:
+async def run_analysis(store: AnalysisStore, analysis_id: str, execute_tool: Any = None) -> None:
     """Execute an analysis workflow asynchronously.
 
     Updates the store with running/completed/failed status.
@@ -168,6 +293,7 @@ async def run_analysis(store: AnalysisStore, analysis_id: str) -> None:
     Args:
         store: The analysis store.
         analysis_id: The analysis request ID to execute.
+        execute_tool: Tool execution function (default: ``server.execute_tool``).
     """
     req = store.get(analysis_id)
     if req is None:
@@ -176,7 +302,8 @@ async def run_analysis(store: AnalysisStore, analysis_id: str) -> None:
     store.update(analysis_id, status="running")
 
     try:
-        from lm_mcp.server import execute_tool
+        if execute_tool is None:
+            from lm_mcp.server import execute_tool
 
         result = await _dispatch_workflow(req.workflow, req.arguments, execute_tool)
         store.update(analysis_id, status="completed", result=result)
@@ -379,3 +506,212 @@ async def _run_device_health_assessment(
         "blast_radius": blast_radius,
         "anomalies": anomalies,
     }
+
+
+# Scheduled workflows: bounds on the interval between runs, in seconds.
+MIN_SCHEDULE_INTERVAL = 60
+MAX_SCHEDULE_INTERVAL = 86400
+
+_INTERVAL_PATTERN = re.compile(r"^(\d+)([smh]?)$")
+_INTERVAL_UNITS = {"": 1, "s": 1, "m": 60, "h": 3600}
+
+
+@dataclass
+class ScheduledWorkflow:
+    """A workflow run on a fixed interval by the analysis scheduler."""
+
+    workflow: str
+    interval: int
+    arguments: dict[str, Any] = field(default_factory=dict)
+
+
+def _parse_interval(value: Any) -> int:
+    """Parse an interval such as ``300``, ``"300s"``, ``"5m"``, or ``"1h"``."""
+    match = _INTERVAL_PATTERN.match(str(value).strip().lower())
+    if not match:
+        raise ValueError(f"Invalid schedule interval: {value!r} (use e.g. 300, 5m, or 1h)")
+    seconds = int(match.group(1)) * _INTERVAL_UNITS[match.group(2)]
+    if not MIN_SCHEDULE_INTERVAL <= seconds <= MAX_SCHEDULE_INTERVAL:
+        raise ValueError(
+            f"Schedule interval must be between {MIN_SCHEDULE_INTERVAL} and "
+            f"{MAX_SCHEDULE_INTERVAL} seconds, got {seconds}"
+        )
+    return seconds
+
+
+def parse_schedule(spec: str) -> list[ScheduledWorkflow]:
+    """Parse an ``LM_ANALYSIS_SCHEDULE`` value.
+
+    Accepts comma-separated ``workflow=interval`` pairs
+    (``health_check=5m,alert_correlation=10m``), or a JSON list of
+    ``{"workflow", "interval", "arguments"}`` objects for workflows that
+    need arguments such as ``capacity_forecast``.
+
+    Args:
+        spec: Schedule specification.
+
+    Returns:
+        Parsed schedule entries.
+
+    Raises:
+        ValueError: If the specification, a workflow, or an interval is invalid.
+    """
+    spec = spec.strip()
+    if not spec:
+        return []
+
+    if spec.startswith("["):
+        try:
+            raw = json.loads(spec)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid analysis schedule JSON: {e}") from None
+        entries = []
+        for item in raw:
+            if not isinstance(item, dict) or "workflow" not in item or "interval" not in item:
+                raise ValueError("Each schedule entry needs 'workflow' and 'interval'")
+            arguments = item.get("arguments") or {}
+            if not isinstance(arguments, dict):
+                raise ValueError("Schedule 'arguments' must be an object")
+            entries.append((item["workflow"], item["interval"], arguments))
+    else:
+        entries = []
+        for part in spec.split(","):
+            workflow, sep, interval = part.partition("=")
+            if not sep:
+                raise ValueError(
+                    f"Invalid schedule entry: {part.strip()!r} (use workflow=interval)"
+                )
+            entries.append((workflow.strip(), interval, {}))
+
+    schedule = []
+    for workflow, interval, arguments in entries:
+        validate_workflow(workflow)
+        schedule.append(ScheduledWorkflow(workflow, _parse_interval(interval), arguments))
+    return schedule
+
+
+_state: dict[str, Any] = {
+    "store": None,
+    "tasks": [],
+}
+
+
+def get_analysis_store() -> AnalysisStore:
+    """Process-wide store shared by the HTTP analysis endpoints and the scheduler."""
+    if _state["store"] is None:
+        _state["store"] = AnalysisStore(ttl_minutes=60)
+    return _state["store"]
+
+
+def _recording_executor(
+    client: LogicMonitorClient, store: AnalysisStore, tools: frozenset[str], max_age: float
+) -> Any:
+    """Tool executor for scheduled runs that records successful results of ``tools``."""
+    from lm_mcp.registry import get_tool_handler
+    from lm_mcp.tools.workflows import check_required_tools
+
+    portal = str(client.base_url)
+
+    async def execute(name: str, arguments: dict[str, Any]) -> list[TextContent]:
+        blocked = check_required_tools([name])
+        if blocked:
+            return blocked
+        result = await get_tool_handler(name)(client, **arguments)
+        if name in tools and result and not result[0].text.startswith("Error"):
+            store.record_tool_result(portal, name, arguments, result, max_age)
+        return result
+
+    return execute
+
+
+async def _run_schedule(client: LogicMonitorClient, entry: ScheduledWorkflow) -> None:
+    """Run one scheduled workflow every ``entry.interval`` seconds until cancelled."""
+    store = get_analysis_store()
+    portal = str(client.base_url)
+    # A result stays servable for two intervals, so one slow or failed run
+    # does not send callers back to the API.
+    max_age = entry.interval * 2
+    tools = WORKFLOW_TOOLS.get(entry.workflow, frozenset())
+    execute = _recording_executor(client, store, tools, max_age)
+    while True:
+        req = store.create(entry.workflow, dict(entry.arguments), scheduled=True)
+        await run_analysis(store, req.id, execute)
+        if req.status == "completed":
+            store.record_workflow_result(portal, req, max_age)
+        store.cleanup_expired()
+        await asyncio.sleep(entry.interval)
+
+
+def start_analysis_scheduler(client: LogicMonitorClient, schedule: list[ScheduledWorkflow]) -> None:
+    """Start running each scheduled workflow against ``client`` in the background.
+
+    Args:
+        client: Client for the portal the workflows read from.
+        schedule: Workflows and their intervals.
+    """
+    loop = asyncio.get_running_loop()
+    _state["tasks"] = [loop.create_task(_run_schedule(client, entry)) for entry in schedule]
+
+
+async def stop_analysis_scheduler() -> None:
+    """Cancel every scheduled workflow."""
+    tasks = _state["tasks"]
+    _state["tasks"] = []
+    for task in tasks:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+
+def precomputed_result(
+    client: LogicMonitorClient, tool: str, arguments: dict[str, Any]
+) -> list[TextContent] | None:
+    """Fresh result of a scheduled workflow's own tool for this exact call, if any.
+
+    Only the analysis tools in ``WORKFLOW_TOOLS`` are served, never the
+    primitive reads a workflow makes. The served result is marked with
+    ``cached: true`` and ``computed_at`` (epoch seconds of the scheduled run).
+
+    Args:
+        client: Client the call targets; results are kept per portal.
+        tool: Tool name.
+        arguments: Call arguments.
+
+    Returns:
+        The marked result, or None when the call must run.
+    """
+    store = _state["store"]
+    if store is None or not _state["tasks"]:
+        return None
+    entry = store.tool_result(str(client.base_url), tool, arguments)
+    if entry is None:
+        return None
+    from lm_mcp.tools import format_response, result_data
+
+    data = result_data(entry.result)
+    if data is None:
+        try:
+            data = json.loads(entry.result[0].text)
+        except (json.JSONDecodeError, AttributeError):
+            return None
+    if not isinstance(data, dict):
+        return None
+    return format_response({**data, "cached": True, "computed_at": entry.recorded_at})
+
+
+def precomputed_workflow(
+    client: LogicMonitorClient, workflow: str, arguments: dict[str, Any]
+) -> PrecomputedResult | None:
+    """Fresh result of a scheduled run of ``workflow`` with these arguments, if any."""
+    store = _state["store"]
+    if store is None or not _state["tasks"]:
+        return None
+    return store.workflow_result(str(client.base_url), workflow, arguments)
+
+
+def reset_analysis_scheduler() -> None:
+    """Cancel scheduled workflows without awaiting them and drop the store. Used in tests."""
+    for task in _state["tasks"]:
+        task.cancel()
+    _state["tasks"] = []
+    _state["store"] = None
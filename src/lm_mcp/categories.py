@@ -20,6 +20,7 @@ WORKFLOW_TOOLS: frozenset[str] = frozenset(
         "correlate_alerts",
         "correlate_changes",
         "correlate_metrics",
+        "find_correlated_metrics",
         "detect_change_points",
         "detect_seasonality",
         "calculate_availability",
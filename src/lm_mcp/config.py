@@ -77,6 +77,13 @@ class LMConfig(BaseSettings):
         LM_AGE_KEY: Path to the age identity file that decrypts the vault
         LM_PORTALS_FILE: Plaintext JSON portal map (multi-portal, testing only;
             the encrypted vault takes precedence when both are set)
+        LM_PORTAL_POOL_SIZE: Portal clients kept open in multi-portal mode; the least
+            recently used is closed past this (default: 32, range: 1-1000)
+        LM_PORTAL_IDLE_TIMEOUT: Seconds before an unused portal client is closed
+            (default: 900; 0 = never, otherwise 60-86400)
+        LM_PORTAL_PREWARM: Most-used portals to connect at startup (default: 0)
+        LM_PORTAL_USAGE_FILE: JSON file recording per-portal use counts, which
+            LM_PORTAL_PREWARM ranks by (default: none)
         LM_HTTP_HOST: HTTP server bind address (default: 0.0.0.0)
         LM_HTTP_PORT: HTTP server port (default: 8080)
         LM_CORS_ORIGINS: Comma-separated CORS origins (default: empty, no CORS)
@@ -88,6 +95,14 @@ class LMConfig(BaseSettings):
         LM_HTTP_SSL_KEYFILE_PASSWORD: Password for an encrypted TLS private key
         LM_SESSION_ENABLED: Enable session context tracking (default: true)
         LM_SESSION_HISTORY_SIZE: Number of tool calls to keep in history (default: 50)
+        LM_SESSION_MAX_SESSIONS: Per-client session contexts kept in HTTP mode,
+            least recently used evicted first (default: 1000)
+        LM_SESSION_IDLE_TIMEOUT: Seconds an idle HTTP session context is kept
+            (default: 3600; 0 keeps it until evicted)
+        LM_SESSION_MAX_VARIABLE_BYTES: JSON size cap on one HTTP session's
+            variables (default: 1048576; 0 disables the cap)
+        LM_SESSION_RECORD_DEFERRED: Record tool results in the session after the
+            call returns instead of before (default: false)
         LM_FIELD_VALIDATION: Field validation mode - off, warn, or error (default: warn)
         LM_ENABLED_TOOLS: Comma-separated tool names or glob patterns to enable (default: all)
         LM_DISABLED_TOOLS: Comma-separated tool names or glob patterns to disable (default: none)
@@ -97,6 +112,22 @@ class LMConfig(BaseSettings):
             only narrows the surface, never expands.
         LM_HEALTH_CHECK_CONNECTIVITY: Include LM API ping in health checks (default: false)
         LM_LOG_LEVEL: Logging level - debug, info, warning, or error (default: warning)
+        LM_ANALYSIS_WORKERS: Worker processes for CPU-heavy analytics (default: 2,
+            range: 0-64; 0 runs every analysis inline on the event loop)
+        LM_ANALYSIS_OFFLOAD_THRESHOLD: Input size in data points at which an
+            analysis moves off the event loop (default: 5000)
+        LM_ALERT_MIRROR_ENABLED: Keep a local alert mirror in sync in the background
+            and answer alert analysis tools from it (default: false; single-portal)
+        LM_ALERT_MIRROR_INTERVAL: Seconds between mirror syncs (default: 60, range: 10-3600)
+        LM_ALERT_MIRROR_HOURS: Hours of alert history the mirror keeps (default: 168,
+            range: 1-720)
+        LM_ALERT_MIRROR_MAX_ALERTS: Maximum alerts held in memory (default: 50000,
+            range: 1000-1000000)
+        LM_OVERVIEW_REFRESH_INTERVAL: Seconds between background rebuilds of the
+            default portal_overview report (default: 0 = off, range: 60-3600)
+        LM_ANALYSIS_SCHEDULE: Analysis workflows to precompute on an interval, as
+            "workflow=interval" pairs (e.g. "health_check=5m,alert_correlation=10m")
+            or a JSON list with arguments (default: none; single-portal)
 
     Authentication:
         Either bearer_token OR both (access_id AND access_key) must be provided.
@@ -112,12 +143,27 @@ class LMConfig(BaseSettings):
     timeout: int = 30
     enable_write_operations: bool = False
     max_retries: int = 3
+    ingest_gzip_min_bytes: int = 0
+
+    # Log ingestion pipeline settings
+    log_queue_size: int = 100_000
+    log_upload_concurrency: int = 4
+    log_spool_dir: str | None = None
+
+    # Metric push batching settings
+    metric_queue_size: int = 50_000
+    metric_upload_concurrency: int = 8
+    metric_flush_interval: float = 1.0
 
     # Multi-portal settings (one server serving many customer portals)
     multi_portal: bool = False
     vault_file: str | None = None
     age_key: str | None = None
     portals_file: str | None = None
+    portal_pool_size: int = 32
+    portal_idle_timeout: int = 900
+    portal_prewarm: int = 0
+    portal_usage_file: str | None = None
 
     # Transport settings
     transport: Literal["stdio", "http"] = "stdio"
@@ -132,6 +178,10 @@ class LMConfig(BaseSettings):
     # Session settings
     session_enabled: bool = True
     session_history_size: int = 50
+    session_max_sessions: int = 1000
+    session_idle_timeout: int = 3600
+    session_max_variable_bytes: int = 1_048_576
+    session_record_deferred: bool = False
 
     # Validation settings
     field_validation: Literal["off", "warn", "error"] = "warn"
@@ -148,6 +198,18 @@ class LMConfig(BaseSettings):
     # Logging settings
     log_level: Literal["debug", "info", "warning", "error"] = "warning"
 
+    # Analytics executor settings
+    analysis_workers: int = 2
+    analysis_offload_threshold: int = 5000
+
+    # Alert mirror settings
+    alert_mirror_enabled: bool = False
+    alert_mirror_interval: int = 60
+    alert_mirror_hours: int = 168
+    alert_mirror_max_alerts: int = 50000
+    overview_refresh_interval: int = 0
+    analysis_schedule: str | None = None
+
     model_config = {
         "env_prefix": "LM_",
         # Validation errors must never echo the rejected value: these fields hold
@@ -164,14 +226,46 @@ class LMConfig(BaseSettings):
             return v
         return normalize_portal_host(v)
 
-    @field_validator("portals_file", "vault_file", "age_key", mode="before")
+    @field_validator(
+        "portals_file", "vault_file", "age_key", "portal_usage_file", "log_spool_dir", mode="before"
+    )
     @classmethod
     def expand_vault_paths(cls, v: str | None) -> str | None:
-        """Expand ~ in vault paths; GUI-launched stdio servers get no shell expansion."""
+        """Expand ~ in file paths; GUI-launched stdio servers get no shell expansion."""
         if v is None:
             return v
         return os.path.expanduser(str(v))
 
+    @field_validator("portal_pool_size", mode="after")
+    @classmethod
+    def validate_portal_pool_size(cls, v: int) -> int:
+        """Validate the portal client pool size."""
+        if v < 1:
+            raise ValueError("portal_pool_size must be at least 1")
+        if v > 1000:
+            raise ValueError("portal_pool_size must not exceed 1000")
+        return v
+
+    @field_validator("portal_idle_timeout", mode="after")
+    @classmethod
+    def validate_portal_idle_timeout(cls, v: int) -> int:
+        """Validate the portal client idle timeout (0 disables idle eviction)."""
+        if v == 0:
+            return v
+        if v < 60:
+            raise ValueError("portal_idle_timeout must be 0 or at least 60 seconds")
+        if v > 86400:
+            raise ValueError("portal_idle_timeout must not exceed 86400 seconds")
+        return v
+
+    @field_validator("portal_prewarm", mode="after")
+    @classmethod
+    def validate_portal_prewarm(cls, v: int) -> int:
+        """Validate the number of portals pre-warmed at startup."""
+        if v < 0:
+            raise ValueError("portal_prewarm must not be negative")
+        return v
+
     @field_validator("timeout", mode="after")
     @classmethod
     def validate_timeout(cls, v: int) -> int:
@@ -192,6 +286,54 @@ class LMConfig(BaseSettings):
             raise ValueError("max_retries must not exceed 10")
         return v
 
+    @field_validator("ingest_gzip_min_bytes", mode="after")
+    @classmethod
+    def validate_ingest_gzip_min_bytes(cls, v: int) -> int:
+        """Validate the ingestion compression threshold (0 disables gzip)."""
+        if v < 0:
+            raise ValueError("ingest_gzip_min_bytes must be non-negative")
+        return v
+
+    @field_validator("log_queue_size", mode="after")
+    @classmethod
+    def validate_log_queue_size(cls, v: int) -> int:
+        """Validate the log pipeline queue capacity (entries)."""
+        if v < 1 or v > 10_000_000:
+            raise ValueError("log_queue_size must be between 1 and 10000000")
+        return v
+
+    @field_validator("log_upload_concurrency", mode="after")
+    @classmethod
+    def validate_log_upload_concurrency(cls, v: int) -> int:
+        """Validate the number of concurrent log batch uploads."""
+        if v < 1 or v > 32:
+            raise ValueError("log_upload_concurrency must be between 1 and 32")
+        return v
+
+    @field_validator("metric_queue_size", mode="after")
+    @classmethod
+    def validate_metric_queue_size(cls, v: int) -> int:
+        """Validate the metric batcher capacity (payloads)."""
+        if v < 1 or v > 1_000_000:
+            raise ValueError("metric_queue_size must be between 1 and 1000000")
+        return v
+
+    @field_validator("metric_upload_concurrency", mode="after")
+    @classmethod
+    def validate_metric_upload_concurrency(cls, v: int) -> int:
+        """Validate the number of concurrent metric uploads."""
+        if v < 1 or v > 32:
+            raise ValueError("metric_upload_concurrency must be between 1 and 32")
+        return v
+
+    @field_validator("metric_flush_interval", mode="after")
+    @classmethod
+    def validate_metric_flush_interval(cls, v: float) -> float:
+        """Validate how long metric payloads are buffered for coalescing (seconds)."""
+        if v < 0.05 or v > 60:
+            raise ValueError("metric_flush_interval must be between 0.05 and 60 seconds")
+        return v
+
     @field_validator("http_port", mode="after")
     @classmethod
     def validate_http_port(cls, v: int) -> int:
@@ -230,6 +372,100 @@ class LMConfig(BaseSettings):
             raise ValueError("session_history_size must not exceed 1000")
         return v
 
+    @field_validator("session_max_sessions", mode="after")
+    @classmethod
+    def validate_session_max_sessions(cls, v: int) -> int:
+        """Validate how many HTTP session contexts are kept."""
+        if v < 1 or v > 100_000:
+            raise ValueError("session_max_sessions must be between 1 and 100000")
+        return v
+
+    @field_validator("session_idle_timeout", mode="after")
+    @classmethod
+    def validate_session_idle_timeout(cls, v: int) -> int:
+        """Validate the HTTP session idle expiry (0 disables expiry)."""
+        if v < 0:
+            raise ValueError("session_idle_timeout must be non-negative")
+        return v
+
+    @field_validator("session_max_variable_bytes", mode="after")
+    @classmethod
+    def validate_session_max_variable_bytes(cls, v: int) -> int:
+        """Validate the per-session variable size cap (0 disables the cap)."""
+        if v < 0:
+            raise ValueError("session_max_variable_bytes must be non-negative")
+        return v
+
+    @field_validator("analysis_workers", mode="after")
+    @classmethod
+    def validate_analysis_workers(cls, v: int) -> int:
+        """Validate the analytics worker count is within acceptable range."""
+        if v < 0:
+            raise ValueError("analysis_workers must be non-negative")
+        if v > 64:
+            raise ValueError("analysis_workers must not exceed 64")
+        return v
+
+    @field_validator("analysis_offload_threshold", mode="after")
+    @classmethod
+    def validate_analysis_offload_threshold(cls, v: int) -> int:
+        """Validate the offload threshold is positive."""
+        if v < 1:
+            raise ValueError("analysis_offload_threshold must be at least 1")
+        return v
+
+    @field_validator("alert_mirror_interval", mode="after")
+    @classmethod
+    def validate_alert_mirror_interval(cls, v: int) -> int:
+        """Validate the alert mirror sync interval is within acceptable range."""
+        if v < 10:
+            raise ValueError("alert_mirror_interval must be at least 10 seconds")
+        if v > 3600:
+            raise ValueError("alert_mirror_interval must not exceed 3600 seconds")
+        return v
+
+    @field_validator("alert_mirror_hours", mode="after")
+    @classmethod
+    def validate_alert_mirror_hours(cls, v: int) -> int:
+        """Validate the alert mirror retention is within acceptable range."""
+        if v < 1:
+            raise ValueError("alert_mirror_hours must be at least 1")
+        if v > 720:
+            raise ValueError("alert_mirror_hours must not exceed 720")
+        return v
+
+    @field_validator("alert_mirror_max_alerts", mode="after")
+    @classmethod
+    def validate_alert_mirror_max_alerts(cls, v: int) -> int:
+        """Validate the alert mirror size cap is within acceptable range."""
+        if v < 1000:
+            raise ValueError("alert_mirror_max_alerts must be at least 1000")
+        if v > 1_000_000:
+            raise ValueError("alert_mirror_max_alerts must not exceed 1000000")
+        return v
+
+    @field_validator("overview_refresh_interval", mode="after")
+    @classmethod
+    def validate_overview_refresh_interval(cls, v: int) -> int:
+        """Validate the portal overview refresh interval (0 disables it)."""
+        if v == 0:
+            return v
+        if v < 60:
+            raise ValueError("overview_refresh_interval must be 0 or at least 60 seconds")
+        if v > 3600:
+            raise ValueError("overview_refresh_interval must not exceed 3600 seconds")
+        return v
+
+    @field_validator("analysis_schedule", mode="after")
+    @classmethod
+    def validate_analysis_schedule(cls, v: str | None) -> str | None:
+        """Validate the scheduled analysis workflows and their intervals."""
+        if v:
+            from lm_mcp.analysis import parse_schedule
+
+            parse_schedule(v)
+        return v
+
     @model_validator(mode="after")
     def validate_authentication(self) -> "LMConfig":
         """Validate that at least one authentication method is configured.
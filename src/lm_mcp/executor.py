@@ -0,0 +1,222 @@
+# Description: Shared executor that moves CPU-heavy analytics off the asyncio event loop.
+# Description: Offloads large inputs to a process pool (thread-pool fallback) and records timings.
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import multiprocessing
+import pickle
+import time
+import traceback
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Used when the LM config cannot be built (unit tests without LM_* env vars).
+DEFAULT_WORKERS = 2
+DEFAULT_OFFLOAD_THRESHOLD = 5000
+
+# Process-local executor state. The pool is created lazily on the first offloaded
+# call so servers that never run a large analysis never fork workers.
+_state: dict[str, Any] = {
+    "executor": None,
+    "kind": None,  # "process" | "thread"
+    "threads": None,  # thread pool for calls that cannot be pickled to a worker
+}
+
+# Per-function timing: label -> {calls, offloaded, total_seconds, max_seconds}
+_stats: dict[str, dict[str, Any]] = {}
+
+
+def _settings() -> tuple[int, int]:
+    """Return (workers, offload_threshold) from config, or defaults without config."""
+    try:
+        from lm_mcp.config import get_config
+
+        config = get_config()
+        return config.analysis_workers, config.analysis_offload_threshold
+    except Exception:
+        return DEFAULT_WORKERS, DEFAULT_OFFLOAD_THRESHOLD
+
+
+def _get_executor(workers: int) -> tuple[Executor, str]:
+    """Create (once) and return the shared executor and its kind.
+
+    Spawned rather than forked workers: forking a process that is running an
+    event loop and httpx connection pools copies state the child must never touch.
+    """
+    if _state["executor"] is None:
+        try:
+            _state["executor"] = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            _state["kind"] = "process"
+        except (OSError, NotImplementedError, ValueError) as e:
+            logger.warning("process pool unavailable (%s); using a thread pool for analytics", e)
+            _state["executor"] = ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="lm-analysis"
+            )
+            _state["kind"] = "thread"
+    return _state["executor"], _state["kind"]
+
+
+def _fall_back_to_threads(workers: int, reason: Exception) -> tuple[Executor, str]:
+    """Replace a broken or unusable process pool with a thread pool for the process lifetime."""
+    logger.warning("process pool failed (%s); falling back to a thread pool for analytics", reason)
+    broken = _state["executor"]
+    _state["executor"] = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="lm-analysis")
+    _state["kind"] = "thread"
+    if broken is not None:
+        broken.shutdown(wait=False, cancel_futures=True)
+    return _state["executor"], _state["kind"]
+
+
+def _thread_pool(workers: int) -> Executor:
+    """Return the shared executor if it is a thread pool, else a (lazily created) side pool."""
+    if _state["kind"] == "thread":
+        return _state["executor"]
+    if _state["threads"] is None:
+        _state["threads"] = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="lm-analysis"
+        )
+    return _state["threads"]
+
+
+# Raised by the pool while pickling a call for a worker (AttributeError for
+# local functions, TypeError for locks and similar objects).
+_PICKLING_ERRORS = (pickle.PicklingError, AttributeError, TypeError)
+
+
+class _Raised:
+    """An exception raised by an offloaded function, returned from the worker as a value.
+
+    Returning it keeps the function's own errors apart from pool failures, so a
+    TypeError raised by the function is never mistaken for an unpicklable call.
+    """
+
+    def __init__(self, error: Exception) -> None:
+        self.error = error
+
+
+def _call_in_worker(call: Callable[..., Any]) -> Any:
+    """Run ``call`` in a worker process, returning any exception it raises."""
+    try:
+        return call()
+    except Exception as e:
+        e.add_note(f"Raised in an analysis worker:\n{traceback.format_exc()}")
+        return _Raised(e)
+
+
+def _record(label: str, mode: str, elapsed: float, size: int) -> None:
+    """Accumulate timing for one call and log it at DEBUG level."""
+    entry = _stats.setdefault(
+        label,
+        {"calls": 0, "offloaded": 0, "total_seconds": 0.0, "max_seconds": 0.0},
+    )
+    entry["calls"] += 1
+    if mode != "inline":
+        entry["offloaded"] += 1
+    entry["total_seconds"] += elapsed
+    entry["max_seconds"] = max(entry["max_seconds"], elapsed)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("%s size=%d mode=%s %.1fms", label, size, mode, elapsed * 1000)
+
+
+async def run_cpu_bound(func: Callable[..., T], *args: Any, size: int, **kwargs: Any) -> T:
+    """Run a CPU-heavy function, offloading it from the event loop when the input is large.
+
+    Inputs below ``LM_ANALYSIS_OFFLOAD_THRESHOLD`` run inline: pickling a small
+    series to a worker costs more than the computation. Larger inputs run in the
+    shared process pool so one heavy analysis cannot stall every other in-flight
+    tool call. ``func`` and its arguments must be picklable (module-level
+    functions and plain data) for the process pool; a call the pool fails to
+    pickle is retried on a thread. The call is pickled once, by the pool, with
+    no separate check beforehand. If the pool cannot start or breaks, the call
+    is retried on a thread pool, which the process keeps using. Exceptions
+    raised by ``func`` itself propagate unchanged and never trigger a fallback.
+
+    Args:
+        func: Module-level function to call.
+        *args: Positional arguments for ``func``.
+        size: Approximate input size (data points) used against the threshold.
+        **kwargs: Keyword arguments for ``func``.
+
+    Returns:
+        Whatever ``func`` returns.
+    """
+    workers, threshold = _settings()
+    call = functools.partial(func, *args, **kwargs)
+    label = getattr(func, "__qualname__", repr(func))
+    start = time.perf_counter()
+
+    if workers <= 0 or size < threshold:
+        result = call()
+        _record(label, "inline", time.perf_counter() - start, size)
+        return result
+
+    executor, mode = _get_executor(workers)
+    loop = asyncio.get_running_loop()
+
+    # Only failures of the pool itself fall back to threads: an error raised while
+    # submitting (workers cannot start), a pool broken by a dead worker, or a call
+    # the pool could not pickle. The function's own exceptions come back wrapped
+    # in _Raised and reach the caller unchanged, OSError and TypeError included.
+    try:
+        if mode == "process":
+            outcome = await loop.run_in_executor(executor, functools.partial(_call_in_worker, call))
+        else:
+            outcome = await loop.run_in_executor(executor, call)
+    except (BrokenProcessPool, OSError) as e:
+        if mode != "process":
+            raise
+        executor, mode = _fall_back_to_threads(workers, e)
+        outcome = await loop.run_in_executor(executor, call)
+    except _PICKLING_ERRORS as e:
+        if mode != "process":
+            raise
+        logger.debug("%s could not be sent to a worker (%s); running it on a thread", label, e)
+        mode = "thread"
+        outcome = await loop.run_in_executor(_thread_pool(workers), call)
+    if isinstance(outcome, _Raised):
+        raise outcome.error
+    result = outcome
+
+    _record(label, mode, time.perf_counter() - start, size)
+    return result
+
+
+def get_executor_stats() -> dict[str, Any]:
+    """Return the executor kind and per-function timing collected so far."""
+    return {
+        "kind": _state["kind"],
+        "functions": {
+            label: {
+                **entry,
+                "total_seconds": round(entry["total_seconds"], 4),
+                "max_seconds": round(entry["max_seconds"], 4),
+            }
+            for label, entry in _stats.items()
+        },
+    }
+
+
+def shutdown_executor() -> None:
+    """Shut down the shared executor (called on transport shutdown and in tests)."""
+    pools = (_state["executor"], _state["threads"])
+    _state.update({"executor": None, "kind": None, "threads": None})
+    for pool in pools:
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+def reset_executor_stats() -> None:
+    """Clear recorded timings. Used in tests."""
+    _stats.clear()
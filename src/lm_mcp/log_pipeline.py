@@ -0,0 +1,522 @@
+# Description: Buffered, batched log ingestion pipeline in front of /rest/log/ingest.
+# Description: Bounded queue, size-limited batches, concurrent uploads, retries, and a disk spool.
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit
+
+import httpx
+
+from lm_mcp.exceptions import LMConnectionError, LMError, RateLimitError, ServerError
+
+if TYPE_CHECKING:
+    from lm_mcp.client import LogicMonitorClient
+
+logger = logging.getLogger(__name__)
+
+LOG_INGEST_PATH = "/rest/log/ingest"
+
+# LM rejects log ingestion requests over 8 MB; batches keep 64 KB of headroom.
+MAX_BATCH_BYTES = 8 * 1024 * 1024 - 64 * 1024
+# Records per ingestion request.
+MAX_BATCH_RECORDS = 10_000
+
+# How long an upload worker waits for more records before sending a partial batch.
+BATCH_LINGER_SECONDS = 0.25
+
+# Upload attempts per batch on retryable failures, on top of the client's own
+# 429/5xx retries, with exponential backoff from UPLOAD_BACKOFF_SECONDS.
+UPLOAD_MAX_ATTEMPTS = 3
+UPLOAD_BACKOFF_SECONDS = 1.0
+
+# 4xx codes that one bad record or an oversized body can cause: the batch is
+# halved and each half retried, so the rest of the batch still lands.
+_SPLIT_CODES = frozenset({"HTTP_400", "HTTP_413"})
+
+# Failures worth retrying: throttling, server errors, and transport errors.
+_RETRYABLE = (RateLimitError, ServerError, LMConnectionError, httpx.TransportError)
+
+# Error messages kept per submission and in the pipeline stats.
+_MAX_ERRORS = 5
+
+
+class QueueFullError(LMError):
+    """An ingestion queue had no room for a submission in time."""
+
+    def __init__(self, message: str):
+        super().__init__(
+            message=message,
+            code="QUEUE_FULL",
+            suggestion="Retry shortly, or send fewer entries per request.",
+        )
+
+
+@dataclass(eq=False)
+class Submission:
+    """Delivery state of one submitted list of log entries (or metric payloads)."""
+
+    accepted: int = 0
+    rejected: int = 0
+    delivered: int = 0
+    spooled: int = 0
+    failed: int = 0
+    # Entries LM rejected from batches shared with other submissions; LM does
+    # not say whose they were, so they stay counted as delivered as well.
+    batch_rejected: int = 0
+    errors: list[str] = field(default_factory=list)
+    pending: int = 0
+    done: asyncio.Future | None = None
+
+    def settle(self, outcome: str, count: int, error: str | None = None) -> None:
+        """Record ``count`` entries reaching ``outcome`` (delivered, rejected, ...)."""
+        setattr(self, outcome, getattr(self, outcome) + count)
+        if error and len(self.errors) < _MAX_ERRORS and error not in self.errors:
+            self.errors.append(error)
+
+    def finish(self, count: int) -> None:
+        """Mark ``count`` queued entries as settled; resolves ``done`` after the last."""
+        self.pending -= count
+        if self.pending <= 0 and self.done is not None and not self.done.done():
+            self.done.set_result(None)
+
+    async def wait(self) -> None:
+        """Wait until every queued entry is delivered, rejected, spooled, or failed."""
+        if self.done is not None:
+            await asyncio.shield(self.done)
+
+    def to_dict(self) -> dict:
+        return {
+            "accepted": self.accepted,
+            "delivered": self.delivered,
+            "rejected": self.rejected,
+            "spooled": self.spooled,
+            "failed": self.failed,
+            "batch_rejected": self.batch_rejected,
+            "errors": self.errors,
+        }
+
+
+class _Record:
+    """One serialized log entry on its way through the pipeline."""
+
+    __slots__ = ("body", "settled", "submission")
+
+    def __init__(self, body: str, submission: Submission) -> None:
+        self.body = body
+        self.submission = submission
+        self.settled = False
+
+
+class LogPipeline:
+    """Bounded, batching log ingestion queue for one portal client.
+
+    Entries are serialized once on submit and queued. ``concurrency`` upload
+    workers each take up to ``max_batch_records`` entries or ``max_batch_bytes``
+    of JSON (waiting ``BATCH_LINGER_SECONDS`` for a batch to fill) and POST
+    them as one request. Retryable failures are retried with backoff; a 400 or
+    413 halves the batch to isolate bad entries; batches that still fail are
+    written to ``spool_dir`` when configured and replayed on the next start.
+
+    Submissions wait for queue room (backpressure) instead of growing memory:
+    the queue holds at most ``max_queue`` entries, counting those in flight.
+    """
+
+    def __init__(
+        self,
+        client: LogicMonitorClient,
+        max_queue: int = 100_000,
+        concurrency: int = 4,
+        spool_dir: str | None = None,
+        max_batch_bytes: int = MAX_BATCH_BYTES,
+        max_batch_records: int = MAX_BATCH_RECORDS,
+    ) -> None:
+        self.client = client
+        self.max_queue = max_queue
+        self.concurrency = concurrency
+        self.spool_dir = spool_dir
+        self.max_batch_bytes = max_batch_bytes
+        self.max_batch_records = max_batch_records
+        self._queue: asyncio.Queue[_Record] = asyncio.Queue()
+        self._space = asyncio.Condition()
+        self._pending = 0
+        self._workers: list[asyncio.Task] = []
+        self._replay: asyncio.Task | None = None
+        self.counters = {
+            "received": 0,
+            "delivered": 0,
+            "rejected": 0,
+            "spooled": 0,
+            "failed": 0,
+            "replayed": 0,
+            "batches": 0,
+            "retries": 0,
+            "splits": 0,
+        }
+        self.errors: list[str] = []
+
+    @property
+    def pending(self) -> int:
+        """Entries queued or in flight."""
+        return self._pending
+
+    def _spool_path(self) -> str | None:
+        if not self.spool_dir:
+            return None
+        host = urlsplit(self.client.ingest_url or "").hostname or "default"
+        return os.path.join(self.spool_dir, host)
+
+    def start(self) -> None:
+        """Start the upload workers and replay spooled batches (idempotent)."""
+        if self._workers:
+            return
+        loop = asyncio.get_running_loop()
+        self._workers = [loop.create_task(self._work()) for _ in range(self.concurrency)]
+        if self._spool_path():
+            self._replay = loop.create_task(self._replay_spool())
+
+    async def submit(self, logs: list, timeout: float = 0) -> Submission:
+        """Queue log entries for delivery.
+
+        Entries that are not objects, or that alone exceed the batch size
+        limit, are rejected up front; the rest are queued together or not at
+        all.
+
+        Args:
+            logs: Log entries (dicts with message and _lm.resourceId).
+            timeout: Seconds to wait for queue room (0 fails immediately when full).
+
+        Returns:
+            The submission; await ``wait()`` on it for the delivery outcome.
+
+        Raises:
+            QueueFullError: If the queue has no room within ``timeout``.
+        """
+        submission = Submission()
+        bodies = []
+        for entry in logs:
+            if not isinstance(entry, dict):
+                submission.settle("rejected", 1, "log entry must be a JSON object")
+                continue
+            body = json.dumps(entry)
+            if len(body) + 2 > self.max_batch_bytes:
+                submission.settle(
+                    "rejected",
+                    1,
+                    f"log entry of {len(body)} bytes exceeds the "
+                    f"{self.max_batch_bytes}-byte request limit",
+                )
+                continue
+            bodies.append(body)
+        self.counters["received"] += len(logs)
+        self.counters["rejected"] += submission.rejected
+        if not bodies:
+            return submission
+
+        await self._reserve(len(bodies), timeout)
+        self.start()
+        submission.accepted = submission.pending = len(bodies)
+        submission.done = asyncio.get_running_loop().create_future()
+        for body in bodies:
+            self._queue.put_nowait(_Record(body, submission))
+        return submission
+
+    async def _reserve(self, count: int, timeout: float) -> None:
+        if count > self.max_queue:
+            raise QueueFullError(f"{count} log entries exceed the queue size of {self.max_queue}")
+
+        def has_room() -> bool:
+            return self._pending + count <= self.max_queue
+
+        async with self._space:
+            if not has_room():
+                if timeout <= 0:
+                    raise QueueFullError(f"log queue is full ({self._pending} pending)")
+                try:
+                    await asyncio.wait_for(self._space.wait_for(has_room), timeout)
+                except TimeoutError as e:
+                    raise QueueFullError(
+                        f"log queue stayed full for {timeout:g}s ({self._pending} pending)"
+                    ) from e
+            self._pending += count
+
+    async def _release(self, count: int) -> None:
+        async with self._space:
+            self._pending -= count
+            self._space.notify_all()
+
+    async def flush(self) -> None:
+        """Wait until every queued entry has been settled."""
+        async with self._space:
+            await self._space.wait_for(lambda: self._pending == 0)
+
+    async def _fill_batch(self, batch: list[_Record]) -> _Record | None:
+        """Fill ``batch`` from the queue; returns the entry that did not fit, if any.
+
+        Entries are appended as they are taken, so a cancelled worker still
+        holds (and spools) everything it removed from the queue.
+        """
+        if not batch:
+            batch.append(await self._queue.get())
+        size = 2 + sum(len(r.body) for r in batch) + len(batch) - 1
+        deadline = time.monotonic() + BATCH_LINGER_SECONDS
+        while len(batch) < self.max_batch_records:
+            try:
+                record = self._queue.get_nowait()
+            except asyncio.QueueEmpty:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    record = await asyncio.wait_for(self._queue.get(), remaining)
+                except TimeoutError:
+                    break
+            if size + len(record.body) + 1 > self.max_batch_bytes:
+                return record
+            batch.append(record)
+            size += len(record.body) + 1
+        return None
+
+    async def _work(self) -> None:
+        carry: _Record | None = None
+        while True:
+            batch: list[_Record] = [carry] if carry is not None else []
+            carry = None
+            try:
+                carry = await self._fill_batch(batch)
+                await self._send(batch)
+            except asyncio.CancelledError:
+                # Stopping: keep what this worker holds on disk (or count it failed).
+                self._spool_or_fail(batch + ([carry] if carry else []), "pipeline stopped")
+                raise
+            except Exception as e:
+                logger.warning("log pipeline upload failed: %s", e)
+                self._settle(batch, "failed", str(e))
+            finally:
+                settled = [r for r in batch + ([carry] if carry else []) if r.settled]
+                for record in settled:
+                    record.submission.finish(1)
+                if settled:
+                    await self._release(len(settled))
+
+    def _settle(self, records: list[_Record], outcome: str, error: str | None = None) -> None:
+        for record in records:
+            if record.settled:
+                continue
+            record.settled = True
+            record.submission.settle(outcome, 1, error)
+            self.counters[outcome] += 1
+        if error and len(self.errors) < _MAX_ERRORS and error not in self.errors:
+            self.errors.append(error)
+
+    async def _send(self, batch: list[_Record]) -> None:
+        """Upload ``batch``, retrying, splitting, or spooling it on failure."""
+        body = "[" + ",".join(r.body for r in batch) + "]"
+        for attempt in range(UPLOAD_MAX_ATTEMPTS):
+            try:
+                result = await self.client.ingest_post(LOG_INGEST_PATH, json_body=body)
+            except _RETRYABLE as e:
+                if attempt + 1 < UPLOAD_MAX_ATTEMPTS:
+                    self.counters["retries"] += 1
+                    await asyncio.sleep(UPLOAD_BACKOFF_SECONDS * 2**attempt)
+                    continue
+                self._spool_or_fail(batch, str(e))
+                return
+            except LMError as e:
+                if e.code in _SPLIT_CODES and len(batch) > 1:
+                    self.counters["splits"] += 1
+                    middle = len(batch) // 2
+                    await self._send(batch[:middle])
+                    await self._send(batch[middle:])
+                    return
+                # LM reports partial rejections without naming the entries, so
+                # the whole batch is counted as rejected rather than resent.
+                self._settle(batch, "rejected", e.message)
+                return
+            self.counters["batches"] += 1
+            self._settle(batch, "delivered")
+            rejected = _rejected_count(result, len(batch))
+            if rejected:
+                self._count_rejections(batch, rejected, _first_error(result))
+            return
+
+    def _count_rejections(self, batch: list[_Record], count: int, error: str) -> None:
+        """Count ``count`` entries of a delivered batch as rejected, per batch.
+
+        LM reports how many entries of a request it rejected, not which, so
+        the count is never pinned on particular entries. When the batch holds
+        one submission's entries, that many of them move from delivered to
+        rejected; a shared batch reports the count to each of its submissions
+        as ``batch_rejected``.
+        """
+        self.counters["delivered"] -= count
+        self.counters["rejected"] += count
+        if len(self.errors) < _MAX_ERRORS and error not in self.errors:
+            self.errors.append(error)
+        submissions = {r.submission for r in batch}
+        if len(submissions) == 1:
+            (submission,) = submissions
+            submission.delivered -= count
+            submission.settle("rejected", count, error)
+            return
+        for submission in submissions:
+            submission.settle("batch_rejected", count, error)
+
+    def _spool_or_fail(self, records: list[_Record], error: str) -> None:
+        """Write unsettled entries to the spool, or count them failed without one."""
+        records = [r for r in records if not r.settled]
+        if not records:
+            return
+        path = self._spool_path()
+        if path:
+            try:
+                _write_spool(path, "[" + ",".join(r.body for r in records) + "]")
+                self._settle(records, "spooled", error)
+                return
+            except OSError as e:
+                logger.warning("could not spool %d log entries: %s", len(records), e)
+        self._settle(records, "failed", error)
+
+    async def _replay_spool(self) -> None:
+        """Resubmit spooled batches, oldest first, removing each once it is settled."""
+        path = self._spool_path()
+        if not path or not os.path.isdir(path):
+            return
+        for name in sorted(os.listdir(path)):
+            if not name.endswith(".json"):
+                continue
+            file_path = os.path.join(path, name)
+            try:
+                with open(file_path) as f:
+                    logs = json.load(f)
+                if not isinstance(logs, list):
+                    raise ValueError("not a JSON array")
+            except (OSError, ValueError) as e:
+                logger.warning("skipping unreadable log spool file %s: %s", file_path, e)
+                with contextlib.suppress(OSError):
+                    os.replace(file_path, f"{file_path}.bad")
+                continue
+            submission = await self.submit(logs, timeout=3600)
+            await submission.wait()
+            self.counters["replayed"] += submission.accepted
+            with contextlib.suppress(OSError):
+                os.remove(file_path)
+
+    async def close(self, timeout: float = 10) -> None:
+        """Deliver what is queued within ``timeout``, then spool the rest and stop."""
+        if self._workers:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self.flush(), timeout)
+        tasks = [*self._workers, *([self._replay] if self._replay else [])]
+        self._workers, self._replay = [], None
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+        leftover = []
+        while not self._queue.empty():
+            leftover.append(self._queue.get_nowait())
+        for start in range(0, len(leftover), self.max_batch_records):
+            self._spool_or_fail(
+                leftover[start : start + self.max_batch_records], "pipeline stopped"
+            )
+        for record in leftover:
+            record.submission.finish(1)
+        self._pending = 0
+
+    def stats(self) -> dict:
+        """Queue depth, limits, and delivery counters."""
+        return {
+            "pending": self._pending,
+            "max_queue": self.max_queue,
+            "concurrency": self.concurrency,
+            "spool_dir": self._spool_path(),
+            **self.counters,
+            "recent_errors": list(self.errors),
+        }
+
+
+def _rejected_count(result: Any, size: int) -> int:
+    """Entries LM reported as rejected in an otherwise successful response."""
+    errors = result.get("errors") if isinstance(result, dict) else None
+    return min(len(errors), size) if isinstance(errors, list) else 0
+
+
+def _first_error(result: dict) -> str:
+    error = result["errors"][0]
+    if isinstance(error, dict):
+        return str(error.get("error") or error.get("message") or error)
+    return str(error)
+
+
+def _write_spool(path: str, body: str) -> None:
+    """Atomically write one spooled batch under ``path``."""
+    os.makedirs(path, exist_ok=True)
+    final = os.path.join(path, f"{time.time_ns()}-{uuid.uuid4().hex[:8]}.json")
+    tmp = f"{final}.tmp"
+    with open(tmp, "w") as f:
+        f.write(body)
+    os.replace(tmp, final)
+
+
+# Process-wide pipelines, one per portal client.
+_state: dict[str, Any] = {"pipelines": {}}
+
+
+def get_log_pipeline(client: LogicMonitorClient) -> LogPipeline:
+    """Return the pipeline for ``client``, creating it from config on first use."""
+    pipeline = _state["pipelines"].get(client)
+    if pipeline is None:
+        from lm_mcp.config import get_config
+
+        cfg = get_config()
+        pipeline = LogPipeline(
+            client,
+            max_queue=cfg.log_queue_size,
+            concurrency=cfg.log_upload_concurrency,
+            spool_dir=cfg.log_spool_dir,
+        )
+        _state["pipelines"][client] = pipeline
+    return pipeline
+
+
+def start_log_pipeline(client: LogicMonitorClient) -> LogPipeline:
+    """Start ``client``'s pipeline now so spooled batches are replayed at startup."""
+    pipeline = get_log_pipeline(client)
+    pipeline.start()
+    return pipeline
+
+
+async def close_log_pipeline(client: LogicMonitorClient, timeout: float = 10) -> None:
+    """Drain and stop ``client``'s pipeline, if any, before the client is closed."""
+    pipeline = _state["pipelines"].pop(client, None)
+    if pipeline is not None:
+        await pipeline.close(timeout)
+
+
+async def stop_log_pipelines(timeout: float = 10) -> None:
+    """Drain (up to ``timeout`` seconds) and stop every pipeline."""
+    pipelines = list(_state["pipelines"].values())
+    _state["pipelines"].clear()
+    for pipeline in pipelines:
+        await pipeline.close(timeout)
+
+
+def reset_log_pipelines() -> None:
+    """Forget every pipeline without awaiting its workers. Used in tests."""
+    for pipeline in _state["pipelines"].values():
+        for task in [*pipeline._workers, *([pipeline._replay] if pipeline._replay else [])]:
+            if not task.done():
+                with contextlib.suppress(RuntimeError):
+                    task.cancel()
+    _state["pipelines"].clear()
@@ -87,6 +87,9 @@ WRITE_TOOL_PREFIXES = (
     "reload_portals",
 )
 
+# Read-only tools whose names happen to start with a write prefix
+READ_TOOL_EXCEPTIONS = frozenset({"run_across_portals"})
+
 
 def is_write_tool(tool_name: str) -> bool:
     """Check if a tool name indicates a write operation.
@@ -97,6 +100,8 @@ def is_write_tool(tool_name: str) -> bool:
     Returns:
         True if the tool performs write/modify operations.
     """
+    if tool_name in READ_TOOL_EXCEPTIONS:
+        return False
     return any(tool_name.startswith(prefix) for prefix in WRITE_TOOL_PREFIXES)
 
 
@@ -0,0 +1,420 @@
+# Description: Coalescing metric batcher in front of /rest/metric/ingest.
+# Description: Groups payloads by resource and datasource, merges them, and flushes concurrently.
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from lm_mcp.exceptions import LMConnectionError, LMError, RateLimitError, ServerError
+from lm_mcp.log_pipeline import QueueFullError, Submission
+
+if TYPE_CHECKING:
+    from lm_mcp.client import LogicMonitorClient
+
+logger = logging.getLogger(__name__)
+
+METRIC_INGEST_PATH = "/rest/metric/ingest?create=true"
+
+# A group is sent as soon as its merged payloads reach this many bytes of JSON,
+# well under the ingestion API's 1 MB request limit once headers are added.
+MAX_GROUP_BYTES = 900 * 1024
+
+# Upload attempts per group on retryable failures, on top of the client's own
+# 429/5xx retries, with exponential backoff from UPLOAD_BACKOFF_SECONDS.
+UPLOAD_MAX_ATTEMPTS = 3
+UPLOAD_BACKOFF_SECONDS = 1.0
+
+# Failures worth retrying: throttling, server errors, and transport errors.
+_RETRYABLE = (RateLimitError, ServerError, LMConnectionError, httpx.TransportError)
+
+# Error messages kept per submission and in the batcher stats.
+_MAX_ERRORS = 5
+
+
+def group_key(payload: dict) -> tuple:
+    """Payloads with the same key describe the same resource and datasource."""
+    return (
+        json.dumps(payload.get("resourceIds"), sort_keys=True),
+        payload.get("dataSource"),
+        payload.get("dataSourceId"),
+    )
+
+
+def _merge_value(old: Any, new: Any) -> Any:
+    """Dicts are merged (later keys win), lists are concatenated, scalars are replaced."""
+    if isinstance(old, dict) and isinstance(new, dict):
+        return {**old, **new}
+    if isinstance(old, list) and isinstance(new, list):
+        return old + new
+    return new
+
+
+def _merge_fields(target: dict, source: dict, skip: str) -> None:
+    for name, value in source.items():
+        if name != skip:
+            target[name] = _merge_value(target[name], value) if name in target else value
+
+
+class _Group:
+    """Payloads for one resource and datasource, merged into a single request body."""
+
+    __slots__ = ("contributors", "count", "created", "header", "instances", "parts", "size")
+
+    def __init__(self) -> None:
+        self.header: dict = {}
+        # instanceName -> (instance fields, dataPointName -> datapoint)
+        self.instances: dict[Any, tuple[dict, dict[Any, dict]]] = {}
+        self.size = 0
+        self.count = 0
+        self.contributors: dict[Submission, int] = {}
+        # The payloads as submitted, so a refused group can be resent per submission.
+        self.parts: list[tuple[dict, int, Submission]] = []
+        self.created = time.monotonic()
+
+    def merge(self, payload: dict, size: int, submission: Submission) -> None:
+        _merge_fields(self.header, payload, "instances")
+        for instance in payload.get("instances") or []:
+            name = instance.get("instanceName")
+            fields, datapoints = self.instances.setdefault(name, ({}, {}))
+            _merge_fields(fields, instance, "dataPoints")
+            for datapoint in instance.get("dataPoints") or []:
+                merged = datapoints.setdefault(datapoint.get("dataPointName"), {})
+                _merge_fields(merged, datapoint, "")
+        self.size += size
+        self.count += 1
+        self.contributors[submission] = self.contributors.get(submission, 0) + 1
+        self.parts.append((payload, size, submission))
+
+    def split(self) -> list[_Group]:
+        """Regroup the merged payloads into one group per contributing submission."""
+        groups: dict[Submission, _Group] = {}
+        for payload, size, submission in self.parts:
+            groups.setdefault(submission, _Group()).merge(payload, size, submission)
+        return list(groups.values())
+
+    def payload(self) -> dict:
+        return {
+            **self.header,
+            "instances": [
+                {**fields, "dataPoints": list(datapoints.values())}
+                for fields, datapoints in self.instances.values()
+            ],
+        }
+
+
+class MetricBatcher:
+    """Coalescing metric push queue for one portal client.
+
+    Submitted payloads are grouped by resource and datasource: instances are
+    merged by ``instanceName`` and datapoints by ``dataPointName``, so many
+    small pushes for the same source become one request. A group is sent when
+    it reaches ``max_group_bytes`` of submitted JSON, when it is older than
+    ``flush_interval`` seconds, or when a caller asks for an immediate flush.
+    Up to ``concurrency`` groups upload at once; retryable failures are
+    retried with backoff. A group LM refuses (4xx) is resent one submission
+    at a time, so one caller's bad payload only rejects that caller's.
+
+    Submissions wait for room (backpressure) once ``max_pending`` payloads are
+    buffered or in flight.
+    """
+
+    def __init__(
+        self,
+        client: LogicMonitorClient,
+        max_pending: int = 50_000,
+        concurrency: int = 8,
+        flush_interval: float = 1.0,
+        max_group_bytes: int = MAX_GROUP_BYTES,
+    ) -> None:
+        self.client = client
+        self.max_pending = max_pending
+        self.concurrency = concurrency
+        self.flush_interval = flush_interval
+        self.max_group_bytes = max_group_bytes
+        self._groups: dict[tuple, _Group] = {}
+        self._space = asyncio.Condition()
+        self._pending = 0
+        self._slots = asyncio.Semaphore(concurrency)
+        self._uploads: set[asyncio.Task] = set()
+        self._flusher: asyncio.Task | None = None
+        self.counters = {
+            "received": 0,
+            "coalesced": 0,
+            "delivered": 0,
+            "rejected": 0,
+            "failed": 0,
+            "requests": 0,
+            "retries": 0,
+            "splits": 0,
+        }
+        self.errors: list[str] = []
+
+    @property
+    def pending(self) -> int:
+        """Payloads buffered or in flight."""
+        return self._pending
+
+    def start(self) -> None:
+        """Start the interval flusher (idempotent)."""
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.get_running_loop().create_task(self._flush_aged())
+
+    async def submit(self, payloads: list, timeout: float = 0, flush: bool = False) -> Submission:
+        """Buffer metric payloads for delivery.
+
+        Payloads that are not objects or lack ``resourceIds`` or
+        ``dataSource`` are rejected up front; the rest are buffered together
+        or not at all.
+
+        Args:
+            payloads: Metric ingestion payloads.
+            timeout: Seconds to wait for room (0 fails immediately when full).
+            flush: Send the groups these payloads joined now instead of at
+                the next size or interval threshold.
+
+        Returns:
+            The submission; await ``wait()`` on it for the delivery outcome.
+
+        Raises:
+            QueueFullError: If there is no room within ``timeout``.
+        """
+        submission = Submission()
+        valid = []
+        for payload in payloads:
+            if not isinstance(payload, dict):
+                submission.settle("rejected", 1, "metric payload must be a JSON object")
+            elif "resourceIds" not in payload or "dataSource" not in payload:
+                submission.settle(
+                    "rejected", 1, "metric payload requires resourceIds and dataSource"
+                )
+            else:
+                valid.append(payload)
+        self.counters["received"] += len(payloads)
+        self.counters["rejected"] += submission.rejected
+        if not valid:
+            return submission
+
+        await self._reserve(len(valid), timeout)
+        self.start()
+        submission.accepted = submission.pending = len(valid)
+        submission.done = asyncio.get_running_loop().create_future()
+        touched = set()
+        for payload in valid:
+            size = len(json.dumps(payload))
+            key = group_key(payload)
+            group = self._groups.get(key)
+            if group is not None and group.size + size > self.max_group_bytes:
+                self._dispatch(key)
+                group = None
+            if group is None:
+                group = self._groups[key] = _Group()
+            else:
+                self.counters["coalesced"] += 1
+            group.merge(payload, size, submission)
+            touched.add(key)
+            if group.size >= self.max_group_bytes:
+                self._dispatch(key)
+        if flush:
+            for key in touched:
+                self._dispatch(key)
+        return submission
+
+    async def _reserve(self, count: int, timeout: float) -> None:
+        if count > self.max_pending:
+            raise QueueFullError(
+                f"{count} metric payloads exceed the queue size of {self.max_pending}"
+            )
+
+        def has_room() -> bool:
+            return self._pending + count <= self.max_pending
+
+        async with self._space:
+            if not has_room():
+                if timeout <= 0:
+                    raise QueueFullError(f"metric queue is full ({self._pending} pending)")
+                try:
+                    await asyncio.wait_for(self._space.wait_for(has_room), timeout)
+                except TimeoutError as e:
+                    raise QueueFullError(
+                        f"metric queue stayed full for {timeout:g}s ({self._pending} pending)"
+                    ) from e
+            self._pending += count
+
+    async def _release(self, count: int) -> None:
+        async with self._space:
+            self._pending -= count
+            self._space.notify_all()
+
+    def _dispatch(self, key: tuple) -> None:
+        """Start uploading the group under ``key``, if it is still buffered."""
+        group = self._groups.pop(key, None)
+        if group is None:
+            return
+        task = asyncio.get_running_loop().create_task(self._upload(group))
+        self._uploads.add(task)
+        task.add_done_callback(self._uploads.discard)
+
+    async def _flush_aged(self) -> None:
+        """Send groups older than ``flush_interval``, checking twice per interval."""
+        while True:
+            await asyncio.sleep(self.flush_interval / 2)
+            cutoff = time.monotonic() - self.flush_interval
+            # Groups are created in order, so the oldest come first.
+            aged = []
+            for key, group in self._groups.items():
+                if group.created > cutoff:
+                    break
+                aged.append(key)
+            for key in aged:
+                self._dispatch(key)
+
+    async def _upload(self, group: _Group) -> None:
+        outcomes: dict[Submission, tuple[str, str | None]] = {}
+        unsettled: tuple[str, str | None] = ("failed", None)
+        try:
+            async with self._slots:
+                await self._deliver(group, outcomes)
+        except asyncio.CancelledError:
+            unsettled = ("failed", "batcher stopped")
+            raise
+        except Exception as e:
+            logger.warning("metric push failed: %s", e)
+            unsettled = ("failed", str(e))
+        finally:
+            for submission, count in group.contributors.items():
+                outcome, error = outcomes.get(submission, unsettled)
+                self.counters[outcome] += count
+                if error and len(self.errors) < _MAX_ERRORS and error not in self.errors:
+                    self.errors.append(error)
+                submission.settle(outcome, count, error)
+                submission.finish(count)
+            await self._release(group.count)
+
+    async def _deliver(
+        self, group: _Group, outcomes: dict[Submission, tuple[str, str | None]]
+    ) -> None:
+        """Upload ``group``, recording the outcome of each contributing submission.
+
+        A group merges payloads from unrelated callers, so when LM refuses it
+        each submission's payloads are resent on their own, as the log
+        pipeline splits a refused batch.
+        """
+        result = await self._send(group)
+        if result[0] == "rejected" and len(group.contributors) > 1:
+            self.counters["splits"] += 1
+            for part in group.split():
+                (submission,) = part.contributors
+                outcomes[submission] = await self._send(part)
+            return
+        for submission in group.contributors:
+            outcomes[submission] = result
+
+    async def _send(self, group: _Group) -> tuple[str, str | None]:
+        """Upload one merged group; returns its outcome and error, if any."""
+        body = json.dumps(group.payload())
+        for attempt in range(UPLOAD_MAX_ATTEMPTS):
+            try:
+                await self.client.ingest_post(METRIC_INGEST_PATH, json_body=body)
+            except _RETRYABLE as e:
+                if attempt + 1 < UPLOAD_MAX_ATTEMPTS:
+                    self.counters["retries"] += 1
+                    await asyncio.sleep(UPLOAD_BACKOFF_SECONDS * 2**attempt)
+                    continue
+                return "failed", str(e)
+            except LMError as e:
+                # 4xx: LM refused the payload itself, so resending cannot help.
+                outcome = "rejected" if e.code.startswith("HTTP_4") else "failed"
+                return outcome, e.message
+            self.counters["requests"] += 1
+            return "delivered", None
+        return "failed", None
+
+    async def flush(self) -> None:
+        """Send every buffered group and wait until all uploads have settled."""
+        for key in list(self._groups):
+            self._dispatch(key)
+        async with self._space:
+            await self._space.wait_for(lambda: self._pending == 0)
+
+    async def close(self, timeout: float = 10) -> None:
+        """Deliver what is buffered within ``timeout``, then fail the rest and stop."""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flusher
+            self._flusher = None
+        if self._pending:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self.flush(), timeout)
+        uploads = list(self._uploads)
+        for task in uploads:
+            task.cancel()
+        for task in uploads:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    def stats(self) -> dict:
+        """Buffered groups, limits, and delivery counters."""
+        return {
+            "pending": self._pending,
+            "groups": len(self._groups),
+            "uploading": len(self._uploads),
+            "max_pending": self.max_pending,
+            "concurrency": self.concurrency,
+            "flush_interval": self.flush_interval,
+            **self.counters,
+            "recent_errors": list(self.errors),
+        }
+
+
+# Process-wide batchers, one per portal client.
+_state: dict[str, Any] = {"batchers": {}}
+
+
+def get_metric_batcher(client: LogicMonitorClient) -> MetricBatcher:
+    """Return the batcher for ``client``, creating it from config on first use."""
+    batcher = _state["batchers"].get(client)
+    if batcher is None:
+        from lm_mcp.config import get_config
+
+        cfg = get_config()
+        batcher = MetricBatcher(
+            client,
+            max_pending=cfg.metric_queue_size,
+            concurrency=cfg.metric_upload_concurrency,
+            flush_interval=cfg.metric_flush_interval,
+        )
+        _state["batchers"][client] = batcher
+    return batcher
+
+
+async def close_metric_batcher(client: LogicMonitorClient, timeout: float = 10) -> None:
+    """Flush and stop ``client``'s batcher, if any, before the client is closed."""
+    batcher = _state["batchers"].pop(client, None)
+    if batcher is not None:
+        await batcher.close(timeout)
+
+
+async def stop_metric_batchers(timeout: float = 10) -> None:
+    """Flush (up to ``timeout`` seconds) and stop every batcher."""
+    batchers = list(_state["batchers"].values())
+    _state["batchers"].clear()
+    for batcher in batchers:
+        await batcher.close(timeout)
+
+
+def reset_metric_batchers() -> None:
+    """Forget every batcher without awaiting its tasks. Used in tests."""
+    for batcher in _state["batchers"].values():
+        for task in [*batcher._uploads, *([batcher._flusher] if batcher._flusher else [])]:
+            if not task.done():
+                with contextlib.suppress(RuntimeError):
+                    task.cancel()
+    _state["batchers"].clear()
@@ -1,27 +1,233 @@
 # Description: Multi-portal registry for the LogicMonitor MCP server.
 # Description: Loads per-customer portal credentials from an age-encrypted vault (or a
 # plaintext JSON file for testing), builds a LogicMonitor client per customer on demand,
-# and tracks the active portal for this process. Lets one server serve many customer
+# and tracks the active portal per session. Lets one server serve many customer
 # portals, switched at runtime via the use_portal tool (no per-portal process needed).
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import hashlib
 import json
 import logging
+import os
 import subprocess
+import time
+import weakref
+from collections import Counter, OrderedDict
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
-# Process-local state. Under stdio each client (Claude Desktop, Codex) spawns its own
-# process, so a single "active" portal per process is safe (one user drives it).
+
+@dataclass
+class PooledClient:
+    """A pooled portal client and its usage bookkeeping."""
+
+    client: Any
+    created_at: float
+    last_used: float
+    leases: int = 0
+    # Removed from the pool while leased: closed when the last lease ends.
+    retired: bool = False
+
+
+class ClientPool:
+    """Bounded LRU pool of portal clients.
+
+    Each client owns an httpx connection pool, so the pool caps how many stay
+    open: past ``max_size`` the least recently used client is evicted, and a
+    sweep evicts clients idle longer than ``idle_timeout`` seconds. Evicted
+    clients are closed. A client that a session has active or that is leased
+    by an in-flight call is never evicted, so the pool can briefly exceed
+    ``max_size`` when every entry is in use.
+
+    Reads (``in``, ``[]``, iteration, ``values()``) behave like the plain dict
+    this replaces and do not count as use.
+    """
+
+    def __init__(self, max_size: int = 32, idle_timeout: int = 900) -> None:
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self._entries: OrderedDict[str, PooledClient] = OrderedDict()
+        # Times each portal's client was handed out; persisted for pre-warming.
+        self.usage: Counter[str] = Counter()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.prewarmed = 0
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._entries
+
+    def __getitem__(self, name: str) -> Any:
+        return self._entries[name].client
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def values(self) -> list[Any]:
+        return [entry.client for entry in self._entries.values()]
+
+    def configure(self, max_size: int, idle_timeout: int) -> None:
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+
+    def acquire(self, name: str, build: Callable[[], Any]) -> tuple[Any, list[Any]]:
+        """Return the client for ``name``, building it on a miss.
+
+        Returns:
+            The client and any clients evicted to make room (the caller closes them).
+        """
+        now = time.monotonic()
+        entry = self._entries.get(name)
+        if entry is None:
+            self.misses += 1
+            entry = self._entries[name] = PooledClient(build(), now, now)
+        else:
+            self.hits += 1
+            entry.last_used = now
+            self._entries.move_to_end(name)
+        self.usage[name] += 1
+        # Never evict the client being handed out, even when the rest are pinned.
+        evicted = self._evict(lambda n, e: n != name and len(self._entries) > self.max_size)
+        return entry.client, evicted
+
+    def put(self, name: str, client: Any) -> None:
+        """Pool ``client`` under ``name`` without counting it as use."""
+        now = time.monotonic()
+        self._entries[name] = PooledClient(client, now, now)
+
+    def discard(self, names: set[str]) -> list[Any]:
+        """Remove the named clients; returns the unleased ones for closing.
+
+        A leased client is retired instead: its in-flight call keeps using it
+        and lease() closes it when the last lease ends, as eviction would.
+        """
+        removed = []
+        for name in names:
+            entry = self._entries.pop(name, None)
+            if entry is None:
+                continue
+            if entry.leases:
+                entry.retired = True
+            else:
+                removed.append(entry.client)
+        return removed
+
+    def drain(self) -> list[Any]:
+        """Remove every client; returns them for closing."""
+        removed = self.values()
+        self._entries.clear()
+        return removed
+
+    def evict_idle(self) -> list[Any]:
+        """Evict clients unused for ``idle_timeout`` seconds (0 disables)."""
+        if not self.idle_timeout:
+            return []
+        cutoff = time.monotonic() - self.idle_timeout
+        return self._evict(lambda n, e: e.last_used < cutoff)
+
+    def _evict(self, should_evict: Callable[[str, PooledClient], bool]) -> list[Any]:
+        bound = {b.name for b in list(_bindings)}
+        evicted = []
+        for name, entry in list(self._entries.items()):
+            if not should_evict(name, entry):
+                continue
+            if entry.leases or name in bound:
+                continue
+            del self._entries[name]
+            self.evictions += 1
+            evicted.append(entry.client)
+        return evicted
+
+    def stats(self) -> dict:
+        """Pool size, limits, and hit/miss/eviction counters."""
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "idle_timeout_seconds": self.idle_timeout,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "prewarmed": self.prewarmed,
+        }
+
+
+# Process-local registry: portal records and their pooled clients.
 _state: dict[str, Any] = {
     "portals": {},  # name -> record {portal, bearer_token | access_id/access_key, writable}
-    "clients": {},  # name -> LogicMonitorClient (lazily built, cached)
-    "active": None,  # active portal name
-    "active_writable": False,
+    "clients": ClientPool(),  # name -> LogicMonitorClient (lazily built, pooled)
     "loaded": False,
+    "maintenance": None,  # idle-eviction / pre-warm task
 }
 
+# Closes scheduled from synchronous eviction paths (held to avoid GC, RUF006).
+_closing: set[asyncio.Task] = set()
+
+
+@dataclass(eq=False)
+class PortalBinding:
+    """The portal one MCP session targets: its name, client, and write flag.
+
+    The binding is mutable and shared by reference, so use_portal in one
+    request is seen by later requests of the same session while other
+    sessions keep their own portal.
+    """
+
+    name: str | None = None
+    client: Any = None
+    writable: bool = False
+
+    def clear(self) -> None:
+        self.name = None
+        self.client = None
+        self.writable = False
+
+
+# Under stdio each client (Claude Desktop, Codex) spawns its own process, so one
+# session per process is the norm; it uses the process binding unless a caller
+# opened its own with bind_session().
+_process_binding = PortalBinding()
+_binding: ContextVar[PortalBinding | None] = ContextVar("lm_portal_binding", default=None)
+_bindings: weakref.WeakSet[PortalBinding] = weakref.WeakSet([_process_binding])
+
+
+def current_binding() -> PortalBinding:
+    """The portal binding of the running context (the process binding by default)."""
+    return _binding.get() or _process_binding
+
+
+@contextmanager
+def bind_session(binding: PortalBinding | None = None) -> Iterator[PortalBinding]:
+    """Give the current context, and tasks started from it, its own active portal.
+
+    Args:
+        binding: Binding to install (default: a new one with no portal selected).
+
+    Yields:
+        The installed binding.
+    """
+    binding = binding if binding is not None else PortalBinding()
+    _bindings.add(binding)
+    token = _binding.set(binding)
+    try:
+        yield binding
+    finally:
+        _binding.reset(token)
+
+
+def active_client():
+    """Client of the current context's active portal, or None before use_portal."""
+    return current_binding().client
+
 
 def _require_multi_portal() -> None:
     """Refuse portal-registry access unless multi-portal mode is enabled.
@@ -39,8 +245,17 @@ def _require_multi_portal() -> None:
         )
 
 
-def _load_vault() -> dict[str, dict]:
-    """Load the portal map from the age-encrypted vault or a plaintext file.
+# Seconds `age -d` may run before the decryption is abandoned.
+_AGE_TIMEOUT = 30
+
+# Decrypted vault per (vault file, age key): the file's (mtime_ns, size), the
+# SHA-256 of its ciphertext, and the decrypted map. A matching stat, or a
+# matching hash after a touch, skips running age again.
+_vault_cache: dict[tuple[str, str], tuple[tuple[int, int], str, dict]] = {}
+
+
+def _vault_source() -> tuple[str, str] | None:
+    """The (vault file, age key) pair when the encrypted vault is configured.
 
     The encrypted vault takes precedence: a stale LM_PORTALS_FILE left over from
     testing must not silently serve credentials in place of the production vault.
@@ -50,34 +265,140 @@ def _load_vault() -> dict[str, dict]:
     cfg = get_config()
     vault_file = getattr(cfg, "vault_file", None)
     age_key = getattr(cfg, "age_key", None)
-    if vault_file and age_key:
-        if getattr(cfg, "portals_file", None):
-            logger.warning(
-                "both LM_PORTALS_FILE and the age vault are configured; using the encrypted vault"
-            )
-        try:
-            proc = subprocess.run(
-                ["age", "-d", "-i", age_key, vault_file],
-                capture_output=True,
-                check=True,
-                timeout=30,
-            )
-        except FileNotFoundError as e:
-            raise RuntimeError(
-                "age binary not found - install age (https://age-encryption.org)"
-            ) from e
-        except subprocess.CalledProcessError as e:
-            stderr = (e.stderr or b"").decode(errors="replace").strip()
-            raise RuntimeError(f"age decryption failed: {stderr}") from e
-        except subprocess.TimeoutExpired as e:
-            raise RuntimeError("age decryption timed out after 30s") from e
-        return json.loads(proc.stdout)
+    if not (vault_file and age_key):
+        return None
+    if getattr(cfg, "portals_file", None):
+        logger.warning(
+            "both LM_PORTALS_FILE and the age vault are configured; using the encrypted vault"
+        )
+    return vault_file, age_key
+
+
+def _load_plaintext() -> dict[str, dict]:
+    from lm_mcp.config import get_config
+
+    cfg = get_config()
     if getattr(cfg, "portals_file", None):
         with open(cfg.portals_file) as f:
             return json.load(f)
     raise RuntimeError("Multi-portal mode needs LM_PORTALS_FILE, or LM_VAULT_FILE + LM_AGE_KEY.")
 
 
+def _cached_vault(source: tuple[str, str]) -> tuple[dict | None, tuple | None]:
+    """Look up the decrypted vault for ``source``.
+
+    Returns:
+        The cached map (or None on a miss) and the file's fingerprint to store
+        with a fresh decryption (None when the file cannot be read, which is
+        then left for age to report).
+    """
+    try:
+        st = os.stat(source[0])
+    except OSError:
+        return None, None
+    stat = (st.st_mtime_ns, st.st_size)
+    cached = _vault_cache.get(source)
+    if cached is not None and cached[0] == stat:
+        return cached[2], None
+    try:
+        with open(source[0], "rb") as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None, None
+    if cached is not None and cached[1] == digest:
+        _vault_cache[source] = (stat, digest, cached[2])
+        return cached[2], None
+    return None, (stat, digest)
+
+
+def _remember_vault(source: tuple[str, str], fingerprint: tuple | None, plaintext: bytes) -> dict:
+    portals_map = json.loads(plaintext)
+    if fingerprint is not None:
+        _vault_cache[source] = (*fingerprint, portals_map)
+    return portals_map
+
+
+def _decrypt_failed(stderr: bytes | None) -> RuntimeError:
+    detail = (stderr or b"").decode(errors="replace").strip()
+    return RuntimeError(f"age decryption failed: {detail}")
+
+
+def _age_missing() -> RuntimeError:
+    return RuntimeError("age binary not found - install age (https://age-encryption.org)")
+
+
+def _age_timed_out() -> RuntimeError:
+    return RuntimeError(f"age decryption timed out after {_AGE_TIMEOUT}s")
+
+
+def _decrypt_vault(vault_file: str, age_key: str) -> bytes:
+    try:
+        proc = subprocess.run(
+            ["age", "-d", "-i", age_key, vault_file],
+            capture_output=True,
+            check=True,
+            timeout=_AGE_TIMEOUT,
+        )
+    except FileNotFoundError as e:
+        raise _age_missing() from e
+    except subprocess.CalledProcessError as e:
+        raise _decrypt_failed(e.stderr) from e
+    except subprocess.TimeoutExpired as e:
+        raise _age_timed_out() from e
+    return proc.stdout
+
+
+async def _decrypt_vault_async(vault_file: str, age_key: str) -> bytes:
+    """Run `age -d` as an async subprocess so the event loop keeps serving calls."""
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            "age",
+            "-d",
+            "-i",
+            age_key,
+            vault_file,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+    except FileNotFoundError as e:
+        raise _age_missing() from e
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=_AGE_TIMEOUT)
+    except TimeoutError as e:
+        proc.kill()
+        await proc.wait()
+        raise _age_timed_out() from e
+    if proc.returncode != 0:
+        raise _decrypt_failed(stderr)
+    return stdout
+
+
+def _load_vault() -> dict[str, dict]:
+    """Load the portal map from the age-encrypted vault or a plaintext file.
+
+    Blocks while age runs; used once at startup. reload() decrypts with
+    _load_vault_async instead. Both skip decryption when the vault is unchanged.
+    """
+    source = _vault_source()
+    if source is None:
+        return _load_plaintext()
+    cached, fingerprint = _cached_vault(source)
+    if cached is not None:
+        return cached
+    return _remember_vault(source, fingerprint, _decrypt_vault(*source))
+
+
+async def _load_vault_async() -> dict[str, dict]:
+    """Non-blocking _load_vault for use on the event loop."""
+    source = _vault_source()
+    if source is None:
+        return _load_plaintext()
+    cached, fingerprint = _cached_vault(source)
+    if cached is not None:
+        return cached
+    return _remember_vault(source, fingerprint, await _decrypt_vault_async(*source))
+
+
 def _normalize_records(portals_map: dict[str, dict]) -> dict[str, dict]:
     """Canonicalize each record's portal host; warn and keep raw on invalid values.
 
@@ -101,14 +422,22 @@ def _normalize_records(portals_map: dict[str, dict]) -> dict[str, dict]:
     return out
 
 
-def _parse_vault() -> dict[str, dict]:
-    """Load, validate, and normalize the vault without touching module state."""
-    portals_map = _load_vault()
+def _validate_vault(portals_map: Any) -> dict[str, dict]:
     if not isinstance(portals_map, dict) or not portals_map:
         raise RuntimeError("Portal vault must be a non-empty JSON object of name -> record.")
     return _normalize_records(portals_map)
 
 
+def _parse_vault() -> dict[str, dict]:
+    """Load, validate, and normalize the vault without touching module state."""
+    return _validate_vault(_load_vault())
+
+
+async def _parse_vault_async() -> dict[str, dict]:
+    """_parse_vault without blocking the event loop on decryption."""
+    return _validate_vault(await _load_vault_async())
+
+
 def load() -> None:
     """Parse the vault once (idempotent) into the in-memory portal map.
 
@@ -118,13 +447,19 @@ def load() -> None:
     _require_multi_portal()
     if _state["loaded"]:
         return
+    from lm_mcp.config import get_config
+
+    cfg = get_config()
+    _state["clients"].configure(cfg.portal_pool_size, cfg.portal_idle_timeout)
     _state["portals"] = _parse_vault()
+    _state["clients"].usage.update(_load_usage())
     _state["loaded"] = True
 
 
 def names() -> list[dict]:
     """Return portal metadata (never secrets): name, portal host, auth type, writable."""
     load()
+    current = current_binding().name
     out = []
     for name, rec in sorted(_state["portals"].items()):
         rec = rec or {}
@@ -135,12 +470,19 @@ def names() -> list[dict]:
                 "portal": rec.get("portal", ""),
                 "auth": auth,
                 "writable": bool(rec.get("writable", False)),
-                "active": name == _state["active"],
+                "active": name == current,
+                "pooled": name in _state["clients"],
+                "uses": _state["clients"].usage[name],
             }
         )
     return out
 
 
+def pool_stats() -> dict:
+    """Stats for the portal client pool (exposed by list_portals)."""
+    return _state["clients"].stats()
+
+
 def _build_client(rec: dict):
     from lm_mcp.auth.bearer import BearerAuth
     from lm_mcp.auth.lmv1 import LMv1Auth
@@ -165,110 +507,271 @@ def _build_client(rec: dict):
         api_version=cfg.api_version,
         max_retries=cfg.max_retries,
         ingest_url=f"https://{portal}",
+        ingest_gzip_min_bytes=cfg.ingest_gzip_min_bytes,
     )
 
 
-def activate(customer: str) -> dict:
-    """Make `customer` the active portal for subsequent tool calls."""
+def client_for(customer: str):
+    """Return the cached client for `customer`, building it on first use.
+
+    Does not change the active portal; used by activate() and by cross-portal
+    fan-out, which needs many portals' clients at once.
+    """
     load()
     if customer not in _state["portals"]:
         raise ValueError(
             f"portal '{customer}' not found. Available: {', '.join(sorted(_state['portals']))}"
         )
-    rec = _state["portals"][customer] or {}
-    client = _state["clients"].get(customer)
-    if client is None:
-        client = _build_client(rec)
-        _state["clients"][customer] = client
+    client, evicted = _state["clients"].acquire(
+        customer, lambda: _build_client(_state["portals"][customer] or {})
+    )
+    _close_soon(evicted)
+    return client
 
-    from lm_mcp.server import _set_client
 
-    _set_client(client)
-    _state["active"] = customer
-    _state["active_writable"] = bool(rec.get("writable", False))
+@asynccontextmanager
+async def lease(customer: str) -> AsyncIterator[Any]:
+    """Hold `customer`'s client for the duration of a call so it cannot be evicted.
+
+    A client that reload() replaced during the call is closed when its last
+    lease ends.
+    """
+    client = client_for(customer)
+    entry = _state["clients"]._entries.get(customer)
+    if entry is not None:
+        entry.leases += 1
+    try:
+        yield client
+    finally:
+        if entry is not None:
+            entry.leases -= 1
+            if entry.retired and not entry.leases:
+                await _close_clients([entry.client])
+
+
+async def _close_clients(clients: list[Any]) -> None:
+    from lm_mcp.log_pipeline import close_log_pipeline
+    from lm_mcp.metric_batcher import close_metric_batcher
+
+    for client in clients:
+        try:
+            # Deliver (or spool) its queued logs and metrics while the client is still open.
+            await close_log_pipeline(client)
+            await close_metric_batcher(client)
+            await client.close()
+        except Exception:
+            logger.debug("error closing a portal client", exc_info=True)
+
+
+def _close_soon(clients: list[Any]) -> None:
+    """Close evicted clients from a synchronous caller."""
+    if not clients:
+        return
+    try:
+        task = asyncio.get_running_loop().create_task(_close_clients(clients))
+    except RuntimeError:
+        return  # no loop (sync caller): the clients are released with their pools
+    _closing.add(task)
+    task.add_done_callback(_closing.discard)
+
+
+def is_writable(customer: str) -> bool:
+    """Whether `customer`'s vault record opts in to write tools."""
+    return bool((_state["portals"].get(customer) or {}).get("writable", False))
+
+
+def activate(customer: str) -> dict:
+    """Make `customer` the active portal for this session's subsequent tool calls."""
+    client = client_for(customer)
+    rec = _state["portals"][customer] or {}
+
+    binding = current_binding()
+    binding.name = customer
+    binding.client = client
+    binding.writable = is_writable(customer)
     return {
         "active": customer,
         "portal": rec.get("portal", ""),
-        "writable": _state["active_writable"],
+        "writable": binding.writable,
     }
 
 
+def _credentials(rec: dict | None) -> tuple | None:
+    """The record fields a client is built from; a change means a rebuild."""
+    if rec is None:
+        return None
+    return tuple(rec.get(k) for k in ("portal", "bearer_token", "access_id", "access_key"))
+
+
 async def reload() -> dict:
     """Re-read the vault from disk so added/removed portals take effect without a restart.
 
-    Atomic: the new map is parsed and the surviving active portal's replacement
-    client is built before any state is swapped, so a failure at any point leaves
-    the old registry, active portal, and installed client fully intact. Replaced
-    clients are closed after the swap.
+    Decryption runs as an async subprocess (and is skipped when the vault file
+    is unchanged), so in-flight tool calls keep running during a reload. Old and
+    new records are diffed: pooled clients whose portal and credentials are
+    unchanged are kept, and only changed or removed ones are replaced.
+
+    Atomic: the new map is parsed and a replacement client is built for every
+    changed portal a session has active before any state is swapped, so a
+    failure at any point leaves the old registry, active portals, and clients
+    fully intact. Sessions whose portal was removed are left with none selected.
+    Replaced clients are closed after the swap, or, when a call still holds a
+    lease on one, once that call finishes.
     """
     _require_multi_portal()
-    new_portals = _parse_vault()
-
-    prev_active = _state["active"]
-    keep_active = prev_active is not None and prev_active in new_portals
-    new_client = None
-    if keep_active:
-        # Build before swapping: a broken record for the active portal aborts
-        # the reload without degrading the running server.
-        new_client = _build_client(new_portals[prev_active] or {})
+    new_portals = await _parse_vault_async()
+    old_portals = _state["portals"]
+    pool = _state["clients"]
+
+    bindings = [b for b in list(_bindings) if b.name is not None]
+    changed = {
+        name
+        for name in set(pool) | {b.name for b in bindings}
+        if _credentials(old_portals.get(name)) != _credentials(new_portals.get(name))
+    }
+    # Build before swapping: a broken record for an active portal aborts the
+    # reload without degrading the running server.
+    rebuilt = {
+        name: _build_client(new_portals[name] or {})
+        for name in {b.name for b in bindings}
+        if name in changed and name in new_portals
+    }
 
-    old_clients = list(_state["clients"].values())
     _state["portals"] = new_portals
-    _state["clients"] = {}
+    old_clients = pool.discard(changed)
+    for name, client in rebuilt.items():
+        pool.put(name, client)
     _state["loaded"] = True
 
-    from lm_mcp.server import _set_client
-
-    if keep_active:
-        _state["clients"][prev_active] = new_client
-        _set_client(new_client)
-        _state["active"] = prev_active
-        _state["active_writable"] = bool((new_portals[prev_active] or {}).get("writable", False))
-    else:
-        if prev_active:
-            _set_client(None)
-        _state["active"] = None
-        _state["active_writable"] = False
+    for binding in bindings:
+        if binding.name not in new_portals:
+            binding.clear()
+            continue
+        if binding.name in rebuilt:
+            binding.client = rebuilt[binding.name]
+        binding.writable = bool((new_portals[binding.name] or {}).get("writable", False))
 
-    for client in old_clients:
-        try:
-            await client.close()
-        except Exception:
-            logger.debug("error closing a replaced portal client", exc_info=True)
+    await _close_clients(old_clients)
 
     return {
         "reloaded": True,
         "count": len(_state["portals"]),
-        "active": _state["active"],
+        "active": current_binding().name,
+        "clients_replaced": sorted(changed),
         "portals": names(),
     }
 
 
 def active() -> dict:
-    """Return the currently active portal (or nulls if none selected yet)."""
-    name = _state["active"]
+    """Return this session's active portal (or nulls if none selected yet)."""
+    binding = current_binding()
+    name = binding.name
     portal = (_state["portals"].get(name) or {}).get("portal") if name else None
-    return {"active": name, "portal": portal, "writable": _state["active_writable"]}
+    return {"active": name, "portal": portal, "writable": binding.writable}
 
 
 def has_active() -> bool:
-    return _state["active"] is not None
+    return current_binding().name is not None
 
 
 def is_active_writable() -> bool:
-    return bool(_state["active_writable"])
+    return bool(current_binding().writable)
 
 
 async def close_all() -> None:
-    """Close every cached client (called on shutdown)."""
-    for client in _state["clients"].values():
-        try:
-            await client.close()
-        except Exception:
-            logger.debug("error closing a portal client", exc_info=True)
-    _state["clients"] = {}
+    """Stop pool maintenance and close every pooled client (called on shutdown)."""
+    await stop_pool_maintenance()
+    _save_usage()
+    await _close_clients(_state["clients"].drain())
+
+    # Never leave a session pointing at a closed client.
+    for binding in list(_bindings):
+        binding.clear()
+
+
+def _load_usage() -> dict[str, int]:
+    """Per-portal use counts from LM_PORTAL_USAGE_FILE (empty when unset or unreadable)."""
+    from lm_mcp.config import get_config
+
+    path = get_config().portal_usage_file
+    if not path or not os.path.exists(path):
+        return {}
+    try:
+        with open(path) as f:
+            data = json.load(f)
+        return {str(k): int(v) for k, v in data.items()}
+    except (OSError, ValueError, AttributeError):
+        logger.warning("ignoring unreadable portal usage file %s", path)
+        return {}
+
+
+def _save_usage() -> None:
+    """Persist per-portal use counts (names and counts only, never credentials)."""
+    from lm_mcp.config import get_config
+
+    path = get_config().portal_usage_file
+    usage = _state["clients"].usage
+    if not path or not usage:
+        return
+    tmp = f"{path}.tmp"
+    try:
+        with open(tmp, "w") as f:
+            json.dump(dict(usage), f)
+        os.replace(tmp, path)
+    except OSError:
+        logger.warning("could not write portal usage file %s", path, exc_info=True)
+
+
+async def _warm(customer: str) -> None:
+    """Build `customer`'s client and open its connection with one small request."""
+    async with lease(customer) as client:
+        await client.get("/setting/admins", params={"size": 1, "fields": "id"})
+
+
+async def prewarm(count: int) -> list[str]:
+    """Open clients for the `count` most-used portals that are in the vault.
+
+    Failures are logged, never raised: pre-warming only saves latency.
+
+    Returns:
+        The portals warmed successfully.
+    """
+    pool = _state["clients"]
+    candidates = [n for n, _ in pool.usage.most_common() if n in _state["portals"]][:count]
+    results = await asyncio.gather(*(_warm(n) for n in candidates), return_exceptions=True)
+    warmed = []
+    for name, result in zip(candidates, results, strict=True):
+        if isinstance(result, Exception):
+            logger.warning("pre-warming portal '%s' failed: %s", name, result)
+        else:
+            warmed.append(name)
+    pool.prewarmed += len(warmed)
+    return warmed
+
+
+async def _maintain_pool(prewarm_count: int) -> None:
+    """Pre-warm once, then evict idle clients and save usage until cancelled."""
+    if prewarm_count:
+        await prewarm(prewarm_count)
+    pool = _state["clients"]
+    interval = max(10, min(60, pool.idle_timeout // 2)) if pool.idle_timeout else 60
+    while True:
+        await asyncio.sleep(interval)
+        await _close_clients(pool.evict_idle())
+        _save_usage()
+
+
+def start_pool_maintenance(prewarm_count: int = 0) -> None:
+    """Start background pre-warming and idle eviction for the client pool."""
+    load()
+    _state["maintenance"] = asyncio.get_running_loop().create_task(_maintain_pool(prewarm_count))
 
-    # Never leave the process-global client pointing at a closed instance.
-    from lm_mcp.server import _set_client
 
-    _set_client(None)
+async def stop_pool_maintenance() -> None:
+    """Cancel the pool maintenance task, if running."""
+    task = _state["maintenance"]
+    _state["maintenance"] = None
+    if task is not None:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
@@ -1707,10 +1707,10 @@ TOOLS.extend(
                     "limit": {"type": "integer", "default": 50, "description": "Max results"},
                     "detail": {
                         "type": "boolean",
-                        "default": False,
+                        "default": True,
                         "description": (
-                            "When true, fetch each group's full recipient list via an extra"
-                            " GET per group. Off by default to avoid N+1 API calls."
+                            "Include each group's recipient list. Details are fetched"
+                            " concurrently; set false for names only."
                         ),
                     },
                 },
@@ -4347,7 +4347,11 @@ TOOLS.extend(
     [
         Tool(
             name="ingest_logs",
-            description="Ingest log entries into LogicMonitor (requires LMv1 auth)",
+            description=(
+                "Ingest log entries into LogicMonitor (requires LMv1 auth). Entries are "
+                "batched within the ingestion size limits and uploaded concurrently; "
+                "set wait=false to return as soon as they are queued"
+            ),
             annotations=_WRITE,
             inputSchema={
                 "type": "object",
@@ -4371,20 +4375,34 @@ TOOLS.extend(
                             "required": ["message"],
                         },
                     },
+                    "wait": {
+                        "type": "boolean",
+                        "description": (
+                            "Wait for delivery and report delivered/rejected counts (default: true)"
+                        ),
+                    },
                 },
                 "required": ["logs"],
             },
         ),
         Tool(
             name="push_metrics",
-            description="Push custom metrics into LogicMonitor (requires LMv1 auth)",
+            description=(
+                "Push custom metrics into LogicMonitor (requires LMv1 auth). Payloads for "
+                "the same resource and datasource are merged into one request and uploaded "
+                "concurrently; set wait=false to return as soon as they are buffered"
+            ),
             annotations=_WRITE,
             inputSchema={
                 "type": "object",
                 "properties": {
                     "metrics": {
-                        "type": "object",
-                        "description": "Metric payload with resource mapping and datapoints",
+                        "type": ["object", "array"],
+                        "description": (
+                            "Metric payload with resource mapping and datapoints, "
+                            "or an array of such payloads"
+                        ),
+                        "items": {"type": "object"},
                         "properties": {
                             "resourceIds": {
                                 "type": "object",
@@ -4405,6 +4423,13 @@ TOOLS.extend(
                         },
                         "required": ["resourceIds", "dataSource"],
                     },
+                    "wait": {
+                        "type": "boolean",
+                        "description": (
+                            "Send now, wait for delivery, and report delivered/rejected "
+                            "counts (default: true)"
+                        ),
+                    },
                 },
                 "required": ["metrics"],
             },
@@ -4525,6 +4550,14 @@ TOOLS.extend(
                             "Anomaly detection method (auto selects based on data distribution)"
                         ),
                     },
+                    "stream": {
+                        "type": "boolean",
+                        "default": False,
+                        "description": (
+                            "Keep rolling statistics between calls and return only "
+                            "anomalies since the previous call with the same arguments"
+                        ),
+                    },
                 },
                 "required": ["device_id", "device_datasource_id", "instance_id"],
             },
@@ -4668,6 +4701,14 @@ TOOLS.extend(
                             "based on data and watsonx availability."
                         ),
                     },
+                    "optimize_params": {
+                        "type": "boolean",
+                        "default": False,
+                        "description": (
+                            "Grid-search Holt-Winters smoothing parameters against "
+                            "one-step-ahead error instead of using the defaults"
+                        ),
+                    },
                 },
                 "required": [
                     "device_id",
@@ -4682,7 +4723,9 @@ TOOLS.extend(
             description=(
                 "Compute Pearson correlation between multiple metric series. "
                 "Builds an NxN correlation matrix and highlights strong "
-                "correlations (|r| > 0.7). Maximum 10 sources."
+                "correlations (|r| > 0.7). Sources on the same instance are "
+                "fetched together and series are aligned on shared timestamps. "
+                "Maximum 100 sources."
             ),
             annotations=_READ_ONLY,
             inputSchema={
@@ -4716,6 +4759,84 @@ TOOLS.extend(
                 "required": ["sources"],
             },
         ),
+        Tool(
+            name="find_correlated_metrics",
+            description=(
+                "Find the series in a device group that moved most like a "
+                "reference series ('what else moved like this?'). Pulls every "
+                "instance of the reference DataSource on each group device and "
+                "ranks the top-k by absolute Pearson correlation, optionally "
+                "allowing candidates to lead or lag the reference."
+            ),
+            annotations=_READ_ONLY,
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "device_id": {
+                        "type": "integer",
+                        "description": "Device ID of the reference series",
+                    },
+                    "device_datasource_id": {
+                        "type": "integer",
+                        "description": "Device-DataSource ID of the reference series",
+                    },
+                    "instance_id": {
+                        "type": "integer",
+                        "description": "Instance ID of the reference series",
+                    },
+                    "datapoint": {
+                        "type": "string",
+                        "description": "Reference datapoint name",
+                    },
+                    "group_id": {
+                        "type": "integer",
+                        "description": "Device group to search for correlated series",
+                    },
+                    "datapoints": {
+                        "type": "string",
+                        "description": (
+                            "Comma-separated candidate datapoints (default: the "
+                            "reference datapoint)"
+                        ),
+                    },
+                    "hours_back": {
+                        "type": "integer",
+                        "default": 24,
+                        "description": "Hours of data to compare",
+                    },
+                    "top_k": {
+                        "type": "integer",
+                        "default": 10,
+                        "description": "Number of matches to return (max 100)",
+                    },
+                    "max_lag_minutes": {
+                        "type": "integer",
+                        "default": 0,
+                        "description": (
+                            "Largest lead/lag in minutes to test; 0 compares "
+                            "only simultaneous samples"
+                        ),
+                    },
+                    "min_correlation": {
+                        "type": "number",
+                        "default": 0.5,
+                        "description": "Minimum absolute correlation for a match",
+                    },
+                    "max_devices": {
+                        "type": "integer",
+                        "default": 200,
+                        "description": "Maximum devices to scan in the group (max 1000)",
+                    },
+                },
+                "required": [
+                    "device_id",
+                    "device_datasource_id",
+                    "instance_id",
+                    "datapoint",
+                    "group_id",
+                ],
+            },
+        ),
         Tool(
             name="detect_change_points",
             description=(
@@ -4834,7 +4955,9 @@ TOOLS.extend(
                 "Computes SLA-style uptime metrics, MTTR, and per-device "
                 "breakdown from cleared and active alerts."
                 "\n\nCommon mistakes: hours_back defaults to 720 (30 days). "
-                "Narrow scope with device_id/group_id for performance."
+                "Narrow scope with device_id/group_id for performance. "
+                "For a monthly SLA report over a whole group, set fleet=true "
+                "with group_id instead of calling once per device."
             ),
             annotations=_READ_ONLY,
             inputSchema={
@@ -4860,6 +4983,20 @@ TOOLS.extend(
                             "Minimum severity for downtime (critical, error, warning, info)"
                         ),
                     },
+                    "fleet": {
+                        "type": "boolean",
+                        "default": False,
+                        "description": (
+                            "Group-wide SLA report: stream every qualifying alert for "
+                            "group_id and return fleet and group availability, MTTR, "
+                            "and the worst devices (requires group_id)"
+                        ),
+                    },
+                    "top_n": {
+                        "type": "integer",
+                        "default": 10,
+                        "description": "Worst devices to list in fleet mode (default 10)",
+                    },
                 },
             },
         ),
@@ -4881,7 +5018,7 @@ TOOLS.extend(
                     "depth": {
                         "type": "integer",
                         "default": 2,
-                        "description": "Max traversal depth (1-3)",
+                        "description": "Max traversal depth (1-5)",
                     },
                 },
                 "required": ["device_id"],
@@ -6190,9 +6327,9 @@ TOOLS.extend(
         Tool(
             name="portal_overview",
             description=(
-                "Composite portal overview: aggregates alert statistics, collector "
-                "health, maintenance windows, noise scores, and dead devices into "
-                "a shift-handoff report."
+                "Composite portal overview: aggregates alert statistics, critical "
+                "and error alerts, alert clusters, collector health, maintenance "
+                "windows, noise scores, and dead devices into a shift-handoff report."
             ),
             annotations=_READ_ONLY,
             inputSchema={
@@ -6217,6 +6354,14 @@ TOOLS.extend(
                             "(requires WATSONX_API_KEY)"
                         ),
                     },
+                    "max_age_seconds": {
+                        "type": "integer",
+                        "description": (
+                            "Serve a cached report up to this many seconds old "
+                            "(default: fresh, or the background refresh window "
+                            "when LM_OVERVIEW_REFRESH_INTERVAL is set)"
+                        ),
+                    },
                 },
             },
         ),
@@ -6656,6 +6801,14 @@ TOOLS.extend(
                         "default": 7,
                         "description": "CollectorDown history lookback in days",
                     },
+                    "collector_ids": {
+                        "type": "array",
+                        "items": {"type": "integer"},
+                        "description": (
+                            "Specific collector IDs, checked together in one call. "
+                            "Ignored if collector_id is set."
+                        ),
+                    },
                 },
             },
         ),
@@ -6747,7 +6900,9 @@ TOOLS.extend(
                 "Portal audit that counts UPS/PDU devices onboarded, interface "
                 "DataSources applied, SNMP credentials configured, and NetFlow exporters "
                 "set up. Returns a prioritized gap list with onboarding recommendations "
-                "— turns 'you can't detect X' into 'here's how to enable detection of X.'"
+                "— turns 'you can't detect X' into 'here's how to enable detection of X.' "
+                "Pages the full device inventory; a repeat audit of the same scope also "
+                "returns `changes` since the previous one."
             ),
             annotations=_READ_ONLY,
             inputSchema={
@@ -7434,6 +7589,34 @@ TOOLS.extend(
             annotations=_SESSION_WRITE,
             inputSchema={"type": "object", "properties": {}},
         ),
+        Tool(
+            name="run_across_portals",
+            description=(
+                "Run one read-only tool against many customer portals concurrently "
+                "without switching the active portal. Returns per-portal results, "
+                "with failing portals reported separately."
+            ),
+            annotations=_READ_ONLY,
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "tool": {
+                        "type": "string",
+                        "description": "Read-only tool to run, e.g. get_collectors",
+                    },
+                    "arguments": {
+                        "type": "object",
+                        "description": "Arguments passed to the tool on every portal",
+                    },
+                    "portals": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Portal keys from list_portals (default: all portals)",
+                    },
+                },
+                "required": ["tool"],
+            },
+        ),
     ]
 )
 
@@ -7513,6 +7696,7 @@ def get_tool_handler(tool_name: str) -> Any:
         "use_portal": portal_tools.use_portal,
         "current_portal": portal_tools.current_portal,
         "reload_portals": portal_tools.reload_portals,
+        "run_across_portals": portal_tools.run_across_portals,
         # Devices
         "get_devices": devices.get_devices,
         "get_device": devices.get_device,
@@ -7794,6 +7978,7 @@ def get_tool_handler(tool_name: str) -> Any:
         # ML/Statistical Analysis
         "forecast_metric": forecasting.forecast_metric,
         "correlate_metrics": correlation.correlate_metrics,
+        "find_correlated_metrics": correlation.find_correlated_metrics,
         "detect_change_points": forecasting.detect_change_points,
         "score_alert_noise": scoring.score_alert_noise,
         "detect_seasonality": forecasting.detect_seasonality,
@@ -0,0 +1,118 @@
+# Description: Shared cache for expensive composite reports with single-flight builds.
+# Description: Concurrent callers share one build; optional background refresh keeps entries warm.
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+# Reports kept (LRU across report kinds, portals, and arguments).
+_REPORT_CACHE_MAX = 64
+
+
+@dataclass
+class CachedReport:
+    """A finished report and when it was generated."""
+
+    report: dict
+    generated_at: float
+    built_monotonic: float
+
+    def age(self) -> float:
+        return time.monotonic() - self.built_monotonic
+
+
+_reports: OrderedDict[Hashable, CachedReport] = OrderedDict()
+_inflight: dict[Hashable, asyncio.Task] = {}
+_refreshers: dict[Hashable, tuple[asyncio.Task, int]] = {}
+
+
+def refresh_interval(key: Hashable) -> int | None:
+    """Interval of the background refresh for ``key``, if one is running."""
+    entry = _refreshers.get(key)
+    return entry[1] if entry else None
+
+
+async def _build(key: Hashable, build: Callable[[], Awaitable[dict]]) -> CachedReport:
+    """Build ``key`` once, sharing the in-flight build with concurrent callers."""
+    task = _inflight.get(key)
+    if task is None:
+
+        async def _run() -> CachedReport:
+            try:
+                report = await build()
+                entry = CachedReport(report, time.time(), time.monotonic())
+                _reports[key] = entry
+                _reports.move_to_end(key)
+                while len(_reports) > _REPORT_CACHE_MAX:
+                    _reports.popitem(last=False)
+                return entry
+            finally:
+                _inflight.pop(key, None)
+
+        task = _inflight[key] = asyncio.get_running_loop().create_task(_run())
+    # shield: one caller cancelling must not cancel the build the others await.
+    return await asyncio.shield(task)
+
+
+async def get_report(
+    key: Hashable,
+    build: Callable[[], Awaitable[dict]],
+    max_age: float = 0,
+) -> CachedReport:
+    """Return a report no older than ``max_age`` seconds, building it if needed.
+
+    With ``max_age`` 0 a new build is always started unless one is already
+    running, in which case its result is shared.
+    """
+    entry = _reports.get(key)
+    if entry is not None and max_age > 0 and entry.age() <= max_age:
+        _reports.move_to_end(key)
+        return entry
+    return await _build(key, build)
+
+
+async def _refresh_loop(key: Hashable, build: Callable[[], Awaitable[dict]], interval: int) -> None:
+    """Rebuild ``key`` every ``interval`` seconds until cancelled."""
+    while True:
+        try:
+            await _build(key, build)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("report refresh failed for %s: %s", key, e)
+        await asyncio.sleep(interval)
+
+
+def start_report_refresh(
+    key: Hashable, build: Callable[[], Awaitable[dict]], interval: int
+) -> None:
+    """Precompute ``key`` now and every ``interval`` seconds in the background."""
+    task = asyncio.get_running_loop().create_task(_refresh_loop(key, build, interval))
+    _refreshers[key] = (task, interval)
+
+
+async def stop_report_refreshes() -> None:
+    """Cancel every background refresh."""
+    tasks = [task for task, _ in _refreshers.values()]
+    _refreshers.clear()
+    for task in tasks:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+
+def reset_report_cache() -> None:
+    """Drop cached reports and forget refreshers without awaiting them. Used in tests."""
+    for task, _ in _refreshers.values():
+        task.cancel()
+    _refreshers.clear()
+    _inflight.clear()
+    _reports.clear()
@@ -396,6 +396,7 @@ TOOL_CATEGORIES = {
             "tools": [
                 "forecast_metric",
                 "correlate_metrics",
+                "find_correlated_metrics",
                 "detect_change_points",
                 "score_alert_noise",
                 "detect_seasonality",
@@ -427,6 +428,7 @@ TOOL_CATEGORIES = {
                 "use_portal",
                 "current_portal",
                 "reload_portals",
+                "run_across_portals",
             ],
         },
         "ansible": {
@@ -9,6 +9,7 @@ from fnmatch import fnmatch
 from mcp.server import Server
 from mcp.types import CompleteResult, GetPromptResult, TextContent
 
+from lm_mcp.analysis import precomputed_result
 from lm_mcp.client import LogicMonitorClient
 from lm_mcp.completions import get_completions
 from lm_mcp.config import get_config
@@ -16,14 +17,15 @@ from lm_mcp.logging import is_write_tool, log_write_operation
 from lm_mcp.prompts import PROMPTS, get_prompt_messages
 from lm_mcp.registry import AWX_TOOLS, TF_TOOLS, TOOLS, WATSONX_TOOLS, get_tool_handler
 from lm_mcp.resources import RESOURCES, get_resource_content
-from lm_mcp.session import get_session
+from lm_mcp.session import SessionContext, get_session
+from lm_mcp.tools import result_data
 from lm_mcp.validation import infer_resource_type, validate_fields, validate_filter_fields
 
 logger = logging.getLogger(__name__)
 
 # Create server instance
 SERVER_INSTRUCTIONS = (
-    "This server exposes 306 LogicMonitor tools, more than most clients load at once. "
+    "This server exposes 308 LogicMonitor tools, more than most clients load at once. "
     "To find the right tool for a task, call `search_tools` with relevant keywords (or a "
     "`category`) first instead of enumerating the full list. Composite workflow tools -- "
     "`triage`, `diagnose`, `health_check`, `portal_overview`, `capacity_plan`, "
@@ -38,15 +40,26 @@ _client: LogicMonitorClient | None = None
 
 
 def get_client() -> LogicMonitorClient:
-    """Get the initialized LogicMonitor client.
+    """Get the LogicMonitor client for the current call.
+
+    Single-portal mode returns the client bound at startup. In multi-portal
+    mode the client comes from the calling session's portal binding, so
+    concurrent sessions can target different portals.
 
     Returns:
         The LogicMonitor API client instance.
 
     Raises:
-        RuntimeError: If called before server initialization.
+        RuntimeError: If called before server initialization or, in
+            multi-portal mode, before use_portal.
     """
-    if _client is None:
+    if _client is not None:
+        return _client
+
+    from lm_mcp import portals
+
+    client = portals.active_client()
+    if client is None:
         # Only surface the multi-portal hint when we can confirm multi-portal mode.
         # If the config can't be built yet (e.g. no env in a unit test), fall back to
         # the plain "not initialized" message rather than leaking a config error.
@@ -62,13 +75,14 @@ def get_client() -> LogicMonitorClient:
                 "No portal selected. Call use_portal(<customer>) first (see list_portals)."
             )
         raise RuntimeError("Client not initialized")
-    return _client
+    return client
 
 
 def _set_client(client: LogicMonitorClient) -> None:
     """Set the global LogicMonitor client.
 
-    Called by transport runners during initialization.
+    Called by transport runners during single-portal initialization; in
+    multi-portal mode it stays None and clients come from portal bindings.
 
     Args:
         client: The LogicMonitor API client instance.
@@ -239,6 +253,7 @@ PORTAL_TOOLS = {
     "use_portal",
     "current_portal",
     "reload_portals",
+    "run_across_portals",
 }
 
 # Discovery tools that take the client argument by convention but never use it,
@@ -250,6 +265,24 @@ CLIENT_OPTIONAL_TOOLS = {
 }
 
 
+def _record_in_session(
+    session: SessionContext, name: str, arguments: dict, result: list[TextContent]
+) -> None:
+    """Record a successful tool result in the session context.
+
+    Uses the data format_response() kept on the result, so the (possibly
+    large) JSON text is only parsed for results built some other way.
+    """
+    data = result_data(result)
+    if data is None:
+        try:
+            data = json.loads(result[0].text)
+        except (json.JSONDecodeError, AttributeError):
+            # Non-JSON result, just record with minimal info
+            data = {}
+    session.record_result(name, arguments, data, success=True)
+
+
 async def execute_tool(name: str, arguments: dict) -> list[TextContent]:
     """Execute a LogicMonitor tool with full middleware chain.
 
@@ -440,7 +473,10 @@ async def execute_tool(name: str, arguments: dict) -> list[TextContent]:
             result = await handler(_client, **arguments)
         else:
             client = get_client()
-            result = await handler(client, **arguments)
+            # A fresh result from a scheduled analysis run answers the call
+            result = precomputed_result(client, name, arguments)
+            if result is None:
+                result = await handler(client, **arguments)
 
         # Audit trail for write operations
         if is_write_tool(name):
@@ -448,17 +484,16 @@ async def execute_tool(name: str, arguments: dict) -> list[TextContent]:
 
         # Record result in session if enabled. Portal tools are recorded too:
         # a portal switch is the marker that scopes every entry around it.
-        if config.session_enabled and name not in SESSION_TOOLS:
+        if config.session_enabled and name not in SESSION_TOOLS and result:
+            # The session is resolved now: a deferred recording must land in
+            # this request's context, not whichever is current when it runs.
             session = get_session()
-            # Try to parse the result for session storage
-            if result and len(result) > 0:
-                try:
-                    text = result[0].text
-                    data = json.loads(text)
-                    session.record_result(name, arguments, data, success=True)
-                except (json.JSONDecodeError, AttributeError):
-                    # Non-JSON result, just record with minimal info
-                    session.record_result(name, arguments, {}, success=True)
+            if config.session_record_deferred:
+                asyncio.get_running_loop().call_soon(
+                    _record_in_session, session, name, arguments, result
+                )
+            else:
+                _record_in_session(session, name, arguments, result)
 
         return result
     except ValueError as e:
@@ -1,11 +1,17 @@
 # Description: Session context module for tracking operation results across tool calls.
 # Description: Enables conversational workflows like "update the device" without re-specifying IDs.
 
+import atexit
 import contextlib
 import json
 import logging
 import os
 import tempfile
+import time
+from collections import OrderedDict, deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any
@@ -24,18 +30,32 @@ class HistoryEntry:
     result_summary: str | None = None
 
 
+# Fields kept from each recorded result item: enough to resolve implicit IDs
+# and to name the item, without holding whole result payloads per session.
+_REF_FIELDS = ("id", "name", "displayName", "alertId")
+
+
+def _ref(item: dict[str, Any]) -> dict[str, Any]:
+    return {key: item[key] for key in _REF_FIELDS if key in item}
+
+
 @dataclass
 class SessionContext:
     """Per-session state for tracking operation results.
 
     Enables conversational workflows by storing:
-    - Last results by resource type for implicit ID resolution
+    - Last results by resource type for implicit ID resolution (their id and
+      name fields only)
     - User-defined variables for cross-tool state
     - Recent tool call history for context
 
     Thread Safety:
         This implementation is NOT thread-safe. Each session should have
         its own SessionContext instance.
+
+    Memory caps (0 = unlimited) bound what one session may hold:
+    ``max_variable_bytes`` limits the JSON size of all variables and
+    ``max_list_items`` the items kept per last_*_list result.
     """
 
     # Last results by resource type (singular)
@@ -68,10 +88,19 @@ class SessionContext:
     # User-defined variables
     variables: dict[str, Any] = field(default_factory=dict)
 
-    # Tool call history (circular buffer)
-    history: list[HistoryEntry] = field(default_factory=list)
+    # Tool call history (circular buffer of max_history_size entries)
+    history: deque[HistoryEntry] = field(default_factory=deque)
     max_history_size: int = 50
 
+    # Streaming get_metric_anomalies state, least recently used first; each
+    # session resumes from its own last call and never consumes another's
+    anomaly_streams: OrderedDict[tuple, Any] = field(default_factory=OrderedDict)
+
+    # Per-session memory caps and file persistence (process session only)
+    max_variable_bytes: int = 0
+    max_list_items: int = 0
+    persistent: bool = True
+
     # Mapping from tool name patterns to resource types
     _tool_resource_map: dict[str, str] = field(
         default_factory=lambda: {
@@ -141,12 +170,11 @@ class SessionContext:
             success=success,
             result_summary=summary,
         )
+        if self.history.maxlen != self.max_history_size:
+            # max_history_size is set after creation (e.g. from config)
+            self.history = deque(self.history, maxlen=self.max_history_size)
         self.history.append(entry)
 
-        # Trim history if needed
-        if len(self.history) > self.max_history_size:
-            self.history = self.history[-self.max_history_size :]
-
         # Update last result if successful and we know the resource type
         if success and tool_name in self._tool_resource_map:
             resource_type = self._tool_resource_map[tool_name]
@@ -163,13 +191,16 @@ class SessionContext:
             if isinstance(items, list):
                 attr_name = f"last_{resource_type}"
                 if hasattr(self, attr_name):
-                    setattr(self, attr_name, items)
+                    if self.max_list_items:
+                        items = items[: self.max_list_items]
+                    refs = [_ref(item) for item in items if isinstance(item, dict)]
+                    setattr(self, attr_name, refs)
                     # Also store first item as singular
                     singular_type = resource_type[:-5]  # Remove "_list"
-                    if items:
+                    if refs:
                         singular_attr = f"last_{singular_type}"
                         if hasattr(self, singular_attr):
-                            setattr(self, singular_attr, items[0])
+                            setattr(self, singular_attr, refs[0])
         else:
             # Handle singular results
             # Look for the item in common result structures
@@ -177,7 +208,7 @@ class SessionContext:
             if isinstance(item, dict):
                 attr_name = f"last_{resource_type}"
                 if hasattr(self, attr_name):
-                    setattr(self, attr_name, item)
+                    setattr(self, attr_name, _ref(item))
 
     def _summarize_result(self, result: Any) -> str | None:
         """Create a brief summary of a result for history display."""
@@ -247,9 +278,19 @@ class SessionContext:
         Args:
             name: Variable name
             value: Variable value (must be JSON-serializable)
+
+        Raises:
+            ValueError: If the variables would exceed ``max_variable_bytes``.
         """
+        if self.max_variable_bytes:
+            size = len(json.dumps({**self.variables, name: value}, default=str))
+            if size > self.max_variable_bytes:
+                raise ValueError(
+                    f"Session variables would use {size} bytes, over the "
+                    f"{self.max_variable_bytes}-byte limit. Delete unused variables first."
+                )
         self.variables[name] = value
-        _save_variables(self)
+        _save_variables(self, {"op": "set", "name": name, "value": value})
 
     def get_variable(self, name: str, default: Any = None) -> Any:
         """Get a user-defined variable.
@@ -274,7 +315,7 @@ class SessionContext:
         """
         if name in self.variables:
             del self.variables[name]
-            _save_variables(self)
+            _save_variables(self, {"op": "delete", "name": name})
             return True
         return False
 
@@ -307,10 +348,12 @@ class SessionContext:
         self.last_website_group_list = []
         self.last_collector_group_list = []
 
+        self.anomaly_streams = OrderedDict()
+
         # Clear variables and history
         self.variables = {}
-        self.history = []
-        _save_variables(self)
+        self.history = deque(maxlen=self.max_history_size)
+        _save_variables(self, {"op": "clear"})
 
     def to_dict(self) -> dict[str, Any]:
         """Convert session context to dictionary for serialization.
@@ -345,7 +388,7 @@ class SessionContext:
                     "success": e.success,
                     "summary": e.result_summary,
                 }
-                for e in self.history[-10:]  # Last 10 entries only
+                for e in list(self.history)[-10:]  # Last 10 entries only
             ],
             "history_count": len(self.history),
         }
@@ -357,14 +400,106 @@ _session: SessionContext | None = None
 # File-backed persistence path (None = in-memory only)
 _persistence_path: str | None = None
 
+# Variables persist as a snapshot at the configured path plus an append-only
+# journal beside it (<path>.journal) holding one JSON record per mutation, so
+# a write costs the size of the change rather than of every variable. Replay
+# applies the journal over the snapshot on load.
+JOURNAL_SUFFIX = ".journal"
+
+# The journal is fsynced once this many records are unsynced, or on the first
+# write after this many seconds; records always reach the OS immediately.
+JOURNAL_FSYNC_RECORDS = 32
+JOURNAL_FSYNC_SECONDS = 1.0
+
+# The journal is folded into a new snapshot once it is larger than both this
+# and the snapshot itself, which keeps compaction amortized O(change).
+JOURNAL_COMPACT_BYTES = 1024 * 1024
+
+
+class _Journal:
+    """Append handle on the variables journal with batched fsync."""
+
+    def __init__(self, snapshot_path: str) -> None:
+        self.snapshot_path = snapshot_path
+        self.path = snapshot_path + JOURNAL_SUFFIX
+        self.fd: int | None = None
+        self.size = 0
+        self.unsynced = 0
+        self.last_sync = time.monotonic()
+        try:
+            self.snapshot_size = os.path.getsize(snapshot_path)
+        except OSError:
+            self.snapshot_size = 0
+
+    def _open(self) -> int:
+        if self.fd is None:
+            fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+            self.size = os.fstat(fd).st_size
+            if self.size:
+                # A crash can leave a torn last record; start on a fresh line
+                # so the loader skips only that record.
+                with open(self.path, "rb") as f:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b"\n":
+                        os.write(fd, b"\n")
+                        self.size += 1
+            self.fd = fd
+        return self.fd
+
+    def append(self, record: dict[str, Any]) -> None:
+        line = (json.dumps(record) + "\n").encode()
+        os.write(self._open(), line)
+        self.size += len(line)
+        self.unsynced += 1
+        if (
+            self.unsynced >= JOURNAL_FSYNC_RECORDS
+            or time.monotonic() - self.last_sync >= JOURNAL_FSYNC_SECONDS
+        ):
+            self.sync()
+
+    def sync(self) -> None:
+        if self.fd is not None and self.unsynced:
+            os.fsync(self.fd)
+        self.unsynced = 0
+        self.last_sync = time.monotonic()
+
+    def needs_compaction(self) -> bool:
+        return self.size > max(JOURNAL_COMPACT_BYTES, self.snapshot_size)
+
+    def compact(self, variables: dict[str, Any]) -> None:
+        """Write ``variables`` as the new snapshot, then empty the journal.
+
+        A crash between the two steps is harmless: replaying the old journal
+        over the new snapshot yields the same variables.
+        """
+        self.snapshot_size = _write_snapshot(self.snapshot_path, variables)
+        fd = self._open()
+        os.ftruncate(fd, 0)
+        os.fsync(fd)
+        self.size = 0
+        self.unsynced = 0
+        self.last_sync = time.monotonic()
+
+    def close(self) -> None:
+        if self.fd is not None:
+            with contextlib.suppress(OSError):
+                self.sync()
+            os.close(self.fd)
+            self.fd = None
+
+
+_journal: _Journal | None = None
+
 
 def set_persistence_path(path: str | None) -> None:
     """Configure file-backed persistence for session variables.
 
     Args:
-        path: File path for JSON storage, or None to disable.
+        path: File path for the JSON snapshot (the journal is written next to
+            it), or None to disable.
     """
     global _persistence_path
+    close_persistence()
     _persistence_path = path
 
 
@@ -377,27 +512,75 @@ def get_persistence_path() -> str | None:
     return _persistence_path
 
 
-def _save_variables(session: SessionContext) -> None:
-    """Write session variables to persistence file (atomic).
+def close_persistence() -> None:
+    """Fsync and close the variables journal. Registered to run at exit."""
+    global _journal
+    if _journal is not None:
+        _journal.close()
+        _journal = None
 
-    Uses write-to-temp + os.replace() for crash safety.
-    No-op when persistence is disabled.
-    """
+
+def compact_persistence(session: SessionContext | None = None) -> None:
+    """Fold the journal into a fresh snapshot of ``session``'s variables now."""
     if _persistence_path is None:
         return
+    session = session if session is not None else get_session()
+    try:
+        _get_journal(_persistence_path).compact(session.variables)
+    except Exception:
+        logger.warning(
+            "Failed to compact session variables at %s", _persistence_path, exc_info=True
+        )
+
+
+def _get_journal(path: str) -> _Journal:
+    global _journal
+    if _journal is None or _journal.snapshot_path != path:
+        close_persistence()
+        _journal = _Journal(path)
+    return _journal
+
+
+atexit.register(close_persistence)
 
+
+def _write_snapshot(path: str, variables: dict[str, Any]) -> int:
+    """Atomically replace the snapshot at ``path``; returns its size in bytes.
+
+    Uses write-to-temp + fsync + os.replace() for crash safety.
+    """
+    dir_name = os.path.dirname(path) or "."
+    fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=dir_name)
     try:
-        dir_name = os.path.dirname(_persistence_path) or "."
-        fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=dir_name)
-        try:
-            with os.fdopen(fd, "w") as f:
-                json.dump(session.variables, f)
-            os.replace(tmp_path, _persistence_path)
-        except BaseException:
-            # Clean up temp file on any failure
-            with contextlib.suppress(OSError):
-                os.unlink(tmp_path)
-            raise
+        with os.fdopen(fd, "w") as f:
+            json.dump(variables, f)
+            f.flush()
+            os.fsync(f.fileno())
+            size = f.tell()
+        os.replace(tmp_path, path)
+    except BaseException:
+        # Clean up temp file on any failure
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+    return size
+
+
+def _save_variables(session: SessionContext, record: dict[str, Any]) -> None:
+    """Append one variable mutation to the journal, compacting when it is due.
+
+    ``record`` is {"op": "set", "name", "value"}, {"op": "delete", "name"},
+    or {"op": "clear"}. No-op when persistence is disabled or the session
+    is not persistent.
+    """
+    if _persistence_path is None or not session.persistent:
+        return
+
+    try:
+        journal = _get_journal(_persistence_path)
+        journal.append(record)
+        if journal.needs_compaction():
+            journal.compact(session.variables)
     except Exception:
         logger.warning(
             "Failed to save session variables to %s",
@@ -406,20 +589,49 @@ def _save_variables(session: SessionContext) -> None:
         )
 
 
+def _replay_journal(path: str, variables: dict[str, Any]) -> None:
+    """Apply the journal records at ``path`` to ``variables`` in order."""
+    try:
+        with open(path, "rb") as f:
+            lines = f.read().splitlines()
+    except FileNotFoundError:
+        return
+    skipped = 0
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+            op = record["op"]
+            if op == "set":
+                variables[record["name"]] = record["value"]
+            elif op == "delete":
+                variables.pop(record["name"], None)
+            elif op == "clear":
+                variables.clear()
+            else:
+                raise ValueError(f"unknown op {op!r}")
+        except (ValueError, KeyError, TypeError):
+            skipped += 1
+    if skipped:
+        logger.warning("Skipped %d unreadable session journal records in %s", skipped, path)
+
+
 def _load_variables(session: SessionContext) -> None:
-    """Load session variables from persistence file.
+    """Load session variables from the snapshot, then replay the journal.
 
-    Handles missing files and corrupt JSON gracefully.
+    Handles missing files, corrupt JSON, and torn journal records gracefully.
     No-op when persistence is disabled.
     """
     if _persistence_path is None:
         return
 
+    variables: dict[str, Any] = {}
     try:
         with open(_persistence_path) as f:
             data = json.load(f)
         if isinstance(data, dict):
-            session.variables = data
+            variables = data
     except FileNotFoundError:
         pass
     except (json.JSONDecodeError, OSError):
@@ -428,16 +640,155 @@ def _load_variables(session: SessionContext) -> None:
             _persistence_path,
             exc_info=True,
         )
+    try:
+        _replay_journal(_persistence_path + JOURNAL_SUFFIX, variables)
+    except OSError:
+        logger.warning(
+            "Failed to replay session journal for %s",
+            _persistence_path,
+            exc_info=True,
+        )
+    session.variables = variables
+
+
+class SessionStore:
+    """Bounded map of per-client session contexts (HTTP transport).
+
+    Contexts are kept in least-recently-used order: a lookup refreshes its
+    entry, contexts idle for ``idle_timeout`` seconds are dropped (0 keeps
+    them until evicted), and the least recently used context is evicted
+    once ``max_sessions`` are held. Store contexts are in-memory only and
+    carry the store's memory caps.
+    """
+
+    def __init__(
+        self,
+        max_sessions: int = 1000,
+        idle_timeout: float = 3600,
+        max_variable_bytes: int = 1_048_576,
+        max_list_items: int = 200,
+        history_size: int = 50,
+    ) -> None:
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.max_variable_bytes = max_variable_bytes
+        self.max_list_items = max_list_items
+        self.history_size = history_size
+        self._sessions: OrderedDict[str, tuple[SessionContext, float]] = OrderedDict()
+        self.evicted = 0
+        self.expired = 0
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def get(self, key: str) -> SessionContext:
+        """Return the context for ``key``, creating it (and evicting) as needed."""
+        now = time.monotonic()
+        self._expire(now)
+        entry = self._sessions.pop(key, None)
+        if entry is None:
+            session = SessionContext(
+                max_history_size=self.history_size,
+                max_variable_bytes=self.max_variable_bytes,
+                max_list_items=self.max_list_items,
+                persistent=False,
+            )
+            while len(self._sessions) >= self.max_sessions:
+                self._sessions.popitem(last=False)
+                self.evicted += 1
+        else:
+            session = entry[0]
+        self._sessions[key] = (session, now)
+        return session
+
+    def _expire(self, now: float) -> None:
+        if not self.idle_timeout:
+            return
+        cutoff = now - self.idle_timeout
+        # Oldest first: stop at the first context used since the cutoff.
+        while self._sessions:
+            key, (_, last_used) = next(iter(self._sessions.items()))
+            if last_used >= cutoff:
+                break
+            del self._sessions[key]
+            self.expired += 1
+
+    def clear(self) -> None:
+        self._sessions.clear()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "sessions": len(self._sessions),
+            "max_sessions": self.max_sessions,
+            "idle_timeout": self.idle_timeout,
+            "evicted": self.evicted,
+            "expired": self.expired,
+        }
+
+
+# Context selected for the running request by use_session(); None means the
+# process-wide session (stdio, or HTTP requests that carry no session key).
+_current: ContextVar[SessionContext | None] = ContextVar("lm_session", default=None)
+_store: SessionStore | None = None
+
+
+def get_session_store() -> SessionStore:
+    """Return the per-client session store, creating it from config on first use."""
+    global _store
+    if _store is None:
+        from lm_mcp.config import get_config
+
+        cfg = get_config()
+        _store = SessionStore(
+            max_sessions=cfg.session_max_sessions,
+            idle_timeout=cfg.session_idle_timeout,
+            max_variable_bytes=cfg.session_max_variable_bytes,
+            history_size=cfg.session_history_size,
+        )
+    return _store
+
+
+def reset_session_store() -> None:
+    """Drop the per-client session store. Used in tests."""
+    global _store
+    _store = None
+
+
+@contextmanager
+def use_session(key: str | None) -> Iterator[SessionContext]:
+    """Make the context for ``key`` the current session for this request.
+
+    Args:
+        key: Session key (MCP session ID or auth principal), or None to keep
+            the process-wide session.
+
+    Yields:
+        The selected SessionContext.
+    """
+    if key is None:
+        yield get_session()
+        return
+    session = get_session_store().get(key)
+    token = _current.set(session)
+    try:
+        yield session
+    finally:
+        _current.reset(token)
 
 
 def get_session() -> SessionContext:
-    """Get the global session context, creating it if needed.
+    """Get the current session context, creating the global one if needed.
 
-    On first creation, loads persisted variables from file if configured.
+    Inside use_session() this is that request's context; otherwise the
+    process-wide context, which on first creation loads persisted variables
+    from file if configured.
 
     Returns:
-        The global SessionContext instance
+        The current SessionContext instance
     """
+    current = _current.get()
+    if current is not None:
+        return current
     global _session
     if _session is None:
         _session = SessionContext()
@@ -3,13 +3,15 @@
 
 from __future__ import annotations
 
+import asyncio
 import functools
 import json
 import logging
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable, Iterable
 from typing import Any, TypeVar
 
 from mcp.types import TextContent
+from pydantic import PrivateAttr
 
 from lm_mcp.exceptions import LMError
 
@@ -18,14 +20,18 @@ logger = logging.getLogger(__name__)
 __all__ = [
     "SEVERITY_MAP",
     "SEVERITY_NAMES",
+    "bounded_gather",
     "call_sub_tool",
     "format_response",
     "handle_error",
+    "hydrate",
     "normalize_definition_fields",
     "portal_url",
     "quote_filter_value",
     "require_write_permission",
     "resolve_group_filter",
+    "resolve_group_path",
+    "result_data",
     "safe_total",
     "sanitize_filter_value",
     "validation_error",
@@ -43,6 +49,12 @@ SEVERITY_MAP: dict[str, int] = {
 SEVERITY_NAMES: dict[int, str] = {v: k for k, v in SEVERITY_MAP.items()}
 
 F = TypeVar("F", bound=Callable[..., Any])
+T = TypeVar("T")
+
+# Upper bound on LM API requests a single tool call keeps in flight at once.
+# High enough to hide per-request latency on fan-out work, low enough to stay
+# well inside the portal's per-endpoint rate limits.
+MAX_CONCURRENT_REQUESTS = 8
 
 # Mapping of common alternate field names to REST API camelCase equivalents.
 # Covers LM Exchange format names, snake_case variants from get_* output,
@@ -211,6 +223,23 @@ def portal_url(resource_type: str, resource_id: int | str) -> str:
     return f"https://{host}/santaba/uiv4/{path}"
 
 
+async def resolve_group_path(client: Any, group_id: int) -> str:
+    """Resolve a device group ID to its fullPath.
+
+    Args:
+        client: LogicMonitor API client.
+        group_id: Device group ID to resolve.
+
+    Returns:
+        Group full path, e.g. "My Group/Sub".
+
+    Raises:
+        LMError: If the group cannot be found.
+    """
+    result = await client.get(f"/device/groups/{group_id}")
+    return result.get("fullPath", "")
+
+
 async def resolve_group_filter(client: Any, group_id: int) -> str:
     """Resolve a device group ID to a monitorObjectGroups filter clause.
 
@@ -229,11 +258,36 @@ async def resolve_group_filter(client: Any, group_id: int) -> str:
     Raises:
         LMError: If the group cannot be found.
     """
-    result = await client.get(f"/device/groups/{group_id}")
-    full_path = result.get("fullPath", "")
+    full_path = await resolve_group_path(client, group_id)
     return f"monitorObjectGroups~{quote_filter_value(full_path)}"
 
 
+class _ResultText(TextContent):
+    """TextContent that keeps the data it was rendered from.
+
+    The data is a private attribute, so it never reaches the wire; in-process
+    consumers (session recording) read it via result_data() instead of
+    parsing the JSON text back.
+    """
+
+    _data: Any = PrivateAttr(default=None)
+
+
+def result_data(result: list[TextContent]) -> Any:
+    """The data a format_response() success result was rendered from.
+
+    Args:
+        result: A tool result.
+
+    Returns:
+        The original data, or None when the result was built some other way
+        (callers then fall back to parsing the text).
+    """
+    if result and isinstance(result[0], _ResultText):
+        return result[0]._data
+    return None
+
+
 def format_response(data: Any) -> list[TextContent]:
     """Format data as MCP TextContent response.
 
@@ -251,9 +305,12 @@ def format_response(data: Any) -> list[TextContent]:
         return [TextContent(type="text", text=text)]
 
     # Success response
-    text = json.dumps(data, indent=2, default=str) if isinstance(data, (dict, list)) else str(data)
+    if isinstance(data, (dict, list)):
+        content = _ResultText(type="text", text=json.dumps(data, indent=2, default=str))
+        content._data = data
+        return [content]
 
-    return [TextContent(type="text", text=text)]
+    return [TextContent(type="text", text=str(data))]
 
 
 def handle_error(error: Exception) -> list[TextContent]:
@@ -320,6 +377,82 @@ async def call_sub_tool(handler: Callable[..., Any], client: Any, **kwargs: Any)
     return data
 
 
+async def bounded_gather(
+    awaitables: Iterable[Awaitable[T]],
+    limit: int = MAX_CONCURRENT_REQUESTS,
+) -> list[T]:
+    """Await several API calls concurrently, at most ``limit`` at a time.
+
+    Results come back in input order. The first exception propagates
+    unchanged (so ``handle_error`` still sees the LMError subclass) after the
+    remaining calls are cancelled.
+
+    Args:
+        awaitables: Coroutines to run, typically one LM API request each.
+        limit: Maximum number in flight at once.
+
+    Returns:
+        Results in the same order as ``awaitables``.
+    """
+    semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def _run(aw: Awaitable[T]) -> T:
+        try:
+            async with semaphore:
+                return await aw
+        finally:
+            # A coroutine cancelled while waiting on the semaphore never started;
+            # close it so it is not reported as "never awaited".
+            if asyncio.iscoroutine(aw):
+                aw.close()
+
+    tasks = [asyncio.ensure_future(_run(aw)) for aw in awaitables]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+async def hydrate(
+    client: Any,
+    items: Iterable[T],
+    detail_path: Callable[[T], str | None],
+    limit: int = MAX_CONCURRENT_REQUESTS,
+) -> list[dict | Exception | None]:
+    """Fetch the detail record behind each item of a list response.
+
+    Replaces the list-then-GET-each loop: detail requests run concurrently,
+    at most ``limit`` at a time, and each distinct path is requested once per
+    call. A failed lookup is returned as its exception rather than failing the
+    whole list, so callers can report it on the affected item.
+
+    Args:
+        client: LogicMonitor API client.
+        items: Items from a list response.
+        detail_path: Maps an item to its detail path, or None to skip it.
+        limit: Maximum detail requests in flight at once.
+
+    Returns:
+        One entry per item, in input order: the detail record, the exception
+        raised fetching it, or None for skipped items.
+    """
+    paths = [detail_path(item) for item in items]
+    unique = list(dict.fromkeys(p for p in paths if p is not None))
+
+    async def _fetch(path: str) -> dict | Exception:
+        try:
+            return await client.get(path)
+        except Exception as exc:
+            logger.warning("hydrate: detail lookup failed for %s: %s", path, exc)
+            return exc
+
+    fetched = dict(zip(unique, await bounded_gather(map(_fetch, unique), limit), strict=True))
+    return [None if p is None else fetched[p] for p in paths]
+
+
 def validation_error(
     code: str,
     message: str,
@@ -38,6 +38,17 @@ def _normalize_alert_id(alert_id: str) -> str:
     return alert_id
 
 
+def alert_row(item: dict) -> dict:
+    """Project a raw alert into the get_alerts list shape."""
+    return {
+        "id": item.get("id"),
+        "severity": item.get("severity"),
+        "device": item.get("monitorObjectName"),
+        "message": item.get("alertValue"),
+        "start_time": item.get("startEpoch"),
+    }
+
+
 async def get_alerts(
     client: LogicMonitorClient,
     severity: str | None = None,
@@ -140,17 +151,7 @@ async def get_alerts(
 
         result = await client.get("/alert/alerts", params=params)
 
-        alerts = []
-        for item in result.get("items", []):
-            alerts.append(
-                {
-                    "id": item.get("id"),
-                    "severity": item.get("severity"),
-                    "device": item.get("monitorObjectName"),
-                    "message": item.get("alertValue"),
-                    "start_time": item.get("startEpoch"),
-                }
-            )
+        alerts = [alert_row(item) for item in result.get("items", [])]
 
         total = safe_total(result)
         has_more = (offset + len(alerts)) < total
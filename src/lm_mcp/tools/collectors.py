@@ -5,12 +5,15 @@ from __future__ import annotations
 
 import logging
 import time
-from typing import TYPE_CHECKING
+from collections.abc import Awaitable
+from typing import TYPE_CHECKING, Any
 
 from mcp.types import TextContent
 
+from lm_mcp.alert_mirror import mirrored_alerts
 from lm_mcp.tools import (
     WILDCARD_STRIP_NOTE,
+    bounded_gather,
     format_response,
     handle_error,
     quote_filter_value,
@@ -24,6 +27,10 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# CollectorDown alerts bucketed by lowercased hostname (None when the lookup
+# failed) and whether the page cap cut the lookup short.
+_CollectorDownAlerts = tuple[dict[str, list[dict]] | None, bool]
+
 
 async def get_collectors(
     client: LogicMonitorClient,
@@ -63,7 +70,8 @@ async def get_collectors(
             if hostname_filter:
                 clean_hostname, was_modified = sanitize_filter_value(hostname_filter)
                 wildcards_stripped = wildcards_stripped or was_modified
-                filters.append(f"hostname~{quote_filter_value(clean_hostname)}")
+                if clean_hostname:
+                    filters.append(f"hostname~{quote_filter_value(clean_hostname)}")
             if collector_group_id is not None:
                 filters.append(f"collectorGroupId:{collector_group_id}")
 
@@ -153,7 +161,8 @@ async def get_collector_groups(
         elif name_filter:
             clean_name, was_modified = sanitize_filter_value(name_filter)
             wildcards_stripped = wildcards_stripped or was_modified
-            params["filter"] = f"name~{quote_filter_value(clean_name)}"
+            if clean_name:
+                params["filter"] = f"name~{quote_filter_value(clean_name)}"
 
         result = await client.get("/setting/collector/groups", params=params)
 
@@ -219,12 +228,18 @@ async def get_collector_group(
         return handle_error(e)
 
 
+# Page size and page cap for the portal-wide CollectorDown alert queries.
+_COLLECTOR_ALERT_PAGE_SIZE = 1000
+_COLLECTOR_ALERT_MAX_PAGES = 20
+
+
 async def get_collector_health(
     client: LogicMonitorClient,
     collector_id: int | None = None,
     collector_group_id: int | None = None,
     include_history: bool = False,
     history_days: int = 7,
+    collector_ids: list[int] | None = None,
 ) -> list[TextContent]:
     """Enriched collector status with downstream device count and CollectorDown history.
 
@@ -233,19 +248,34 @@ async def get_collector_health(
     collector is currently down, how many devices it monitors, and optionally
     the history of CollectorDown alerts over a lookback window.
 
+    Downstream device counts are fetched concurrently. CollectorDown alerts
+    for every collector come from one active-alert query (plus one windowed
+    query when history is requested), bucketed by hostname locally.
+
     Args:
         client: LogicMonitor API client.
         collector_id: Single collector ID. If set, other scope args are ignored.
         collector_group_id: Restrict to collectors in this group.
         include_history: Include recent CollectorDown alert history (default: False).
         history_days: CollectorDown history lookback in days (default: 7).
+        collector_ids: Specific collector IDs. Fetched concurrently; IDs that
+            cannot be read are listed under ``collector_errors``.
 
     Returns:
         List of TextContent with enriched collector records.
     """
     try:
+        collector_errors: list[dict] = []
         if collector_id is not None:
             collectors = [await client.get(f"/setting/collector/collectors/{collector_id}")]
+        elif collector_ids:
+            fetched = await bounded_gather([_fetch_collector(client, cid) for cid in collector_ids])
+            collectors = []
+            for cid, (col, error) in zip(collector_ids, fetched, strict=True):
+                if col is None:
+                    collector_errors.append({"collector_id": cid, "error": error})
+                else:
+                    collectors.append(col)
         else:
             params: dict = {"size": 100}
             if collector_group_id is not None:
@@ -253,9 +283,30 @@ async def get_collector_health(
             list_result = await client.get("/setting/collector/collectors", params=params)
             collectors = list_result.get("items", [])
 
-        enriched: list[dict] = []
-        for col in collectors:
-            enriched.append(await _enrich_collector(client, col, include_history, history_days))
+        hostnames = [col.get("hostname") or "" for col in collectors]
+        lookups: list[Awaitable[Any]] = [
+            _downstream_device_count(client, col) for col in collectors
+        ]
+        lookups.append(_collector_down_alerts(client, hostnames, "cleared:false"))
+        if include_history:
+            start_epoch = int(time.time()) - (history_days * 86400)
+            lookups.append(_collector_down_history(client, hostnames, start_epoch))
+        results = await bounded_gather(lookups)
+        device_counts: list[int] = results[: len(collectors)]
+        active_lookup: _CollectorDownAlerts = results[len(collectors)]
+        active_alerts, active_truncated = active_lookup
+        history_alerts: dict[str, list[dict]] | None = None
+        history_truncated = False
+        if include_history:
+            history_lookup: _CollectorDownAlerts = results[len(collectors) + 1]
+            # A failed history query reports empty history rather than dropping the field.
+            history_alerts = history_lookup[0] or {}
+            history_truncated = history_lookup[1]
+
+        enriched = [
+            _enrich_collector(col, count, active_alerts, history_alerts, active_truncated)
+            for col, count in zip(collectors, device_counts, strict=True)
+        ]
 
         down_count = sum(1 for c in enriched if c["is_down"])
         unknown_signal = sum(1 for c in enriched if c.get("down_signal_unavailable"))
@@ -267,6 +318,15 @@ async def get_collector_health(
             "history_days": history_days if include_history else None,
             "collectors": enriched,
         }
+        if collector_errors:
+            response["collector_errors"] = collector_errors
+        if active_truncated or history_truncated:
+            response["truncated"] = True
+            response["truncated_detail"] = (
+                f"CollectorDown alert lookup stopped after {_COLLECTOR_ALERT_MAX_PAGES} "
+                f"pages of {_COLLECTOR_ALERT_PAGE_SIZE} alerts; collectors without a "
+                "matching alert may still be down or have more history."
+            )
         if unknown_signal:
             response["collectors_down_signal_unavailable"] = unknown_signal
             response["warning"] = (
@@ -278,19 +338,17 @@ async def get_collector_health(
         return handle_error(e)
 
 
-async def _enrich_collector(
-    client: LogicMonitorClient,
-    col: dict,
-    include_history: bool,
-    history_days: int,
-) -> dict:
-    """Attach downstream device count and CollectorDown signals to a collector."""
-    cid = col.get("id")
-    hostname = col.get("hostname") or ""
-    status = col.get("status")
-    num_hosts_reported = col.get("numberOfHosts") or 0
+async def _fetch_collector(client: LogicMonitorClient, cid: int) -> tuple[dict | None, str]:
+    """Fetch one collector record, returning (record, "") or (None, error message)."""
+    try:
+        return await client.get(f"/setting/collector/collectors/{cid}"), ""
+    except Exception as exc:
+        return None, str(exc)
+
 
-    downstream_count = num_hosts_reported
+async def _downstream_device_count(client: LogicMonitorClient, col: dict) -> int:
+    """Count devices currently monitored by a collector."""
+    cid = col.get("id")
     try:
         device_result = await client.get(
             "/device/devices",
@@ -299,7 +357,7 @@ async def _enrich_collector(
                 "filter": f"currentCollectorId:{cid}",
             },
         )
-        downstream_count = safe_total(device_result)
+        return safe_total(device_result)
     except Exception:
         # Fall back to numberOfHosts from the collector record when the
         # devices filter is not supported.
@@ -309,15 +367,34 @@ async def _enrich_collector(
             cid,
             exc_info=True,
         )
-        downstream_count = num_hosts_reported
+        return col.get("numberOfHosts") or 0
 
-    active_collector_down = await _active_collector_down_count(client, hostname)
-    down_signal_unavailable = active_collector_down is None
-    active_down = active_collector_down or 0
 
-    history: list[dict] = []
-    if include_history and hostname:
-        history = await _collector_down_history(client, hostname, history_days)
+def _enrich_collector(
+    col: dict,
+    downstream_count: int,
+    active_alerts: dict[str, list[dict]] | None,
+    history_alerts: dict[str, list[dict]] | None,
+    active_truncated: bool = False,
+) -> dict:
+    """Attach downstream device count and CollectorDown signals to a collector.
+
+    ``active_alerts`` and ``history_alerts`` are CollectorDown alerts bucketed
+    by lowercased hostname; ``active_alerts`` is None when the active-alert
+    query failed and ``history_alerts`` is None when history was not requested.
+    ``active_truncated`` means the active query hit its page cap, so a
+    collector without an active alert may still be down.
+    """
+    cid = col.get("id")
+    hostname = col.get("hostname") or ""
+    status = col.get("status")
+    key = hostname.lower()
+
+    down_signal_unavailable = bool(hostname) and active_alerts is None
+    active_down = 0
+    if hostname and active_alerts is not None:
+        active_down = sum(1 for a in active_alerts.get(key, ()) if not a.get("cleared"))
+        down_signal_unavailable = active_truncated and not active_down
 
     is_down = bool(active_down) or _status_indicates_down(status)
 
@@ -330,14 +407,24 @@ async def _enrich_collector(
         "status": status,
         "is_down": is_down,
         "downstream_device_count": downstream_count,
-        "reported_numberOfHosts": num_hosts_reported,
+        "reported_numberOfHosts": col.get("numberOfHosts") or 0,
         "active_collector_down_alerts": active_down,
         "up_time_seconds": col.get("upTime"),
     }
     if down_signal_unavailable:
         record["down_signal_unavailable"] = True
-    if include_history:
-        record["collector_down_history"] = history
+    if history_alerts is not None:
+        record["collector_down_history"] = [
+            {
+                "alert_id": item.get("id"),
+                "severity": item.get("severity"),
+                "start_epoch": item.get("startEpoch"),
+                "end_epoch": item.get("endEpoch"),
+                "cleared": item.get("cleared", False),
+                "alert_type": item.get("alertType"),
+            }
+            for item in (history_alerts.get(key, []) if hostname else [])
+        ]
     return record
 
 
@@ -358,80 +445,86 @@ def _status_indicates_down(status: int | str | None) -> bool:
     return False
 
 
-async def _active_collector_down_count(
+async def _collector_down_alerts(
     client: LogicMonitorClient,
-    hostname: str,
-) -> int | None:
-    """Count active CollectorDown alerts for a collector hostname.
-
-    Returns None (not 0) when the alert query fails, so the caller can distinguish "no
-    active CollectorDown alerts" from "could not determine" and avoid reporting a real
-    outage as zero collectors down.
+    hostnames: list[str],
+    scope_filter: str,
+) -> _CollectorDownAlerts:
+    """Fetch CollectorDown alerts once and bucket them by lowercased hostname.
+
+    A single hostname is filtered server-side; several are served by one
+    portal-wide query, since CollectorDown alerts are few compared with the
+    number of collectors they would otherwise cost a query each.
+
+    Returns None (not an empty mapping) when the alert query fails, so the caller can
+    distinguish "no CollectorDown alerts" from "could not determine" and avoid reporting
+    a real outage as zero collectors down. The flag is True when the page cap was
+    reached with alerts left unread, so collectors without a bucket are not known
+    to be up.
     """
-    if not hostname:
-        return 0
+    wanted = {h.lower() for h in hostnames if h}
+    if not wanted:
+        return {}, False
+    filter_str = f'type:alert,{scope_filter},alertType~"CollectorDown"'
+    if len(wanted) == 1:
+        filter_str += f",monitorObjectName:{quote_filter_value(next(h for h in hostnames if h))}"
+
+    buckets: dict[str, list[dict]] = {}
     try:
-        result = await client.get(
-            "/alert/alerts",
-            params={
-                "size": 10,
-                "filter": (
-                    "type:alert,"
-                    f"monitorObjectName:{quote_filter_value(hostname)},"
-                    "cleared:false,"
-                    'alertType~"CollectorDown"'
-                ),
-            },
-        )
+        for page in range(_COLLECTOR_ALERT_MAX_PAGES):
+            result = await client.get(
+                "/alert/alerts",
+                params={
+                    "size": _COLLECTOR_ALERT_PAGE_SIZE,
+                    "offset": page * _COLLECTOR_ALERT_PAGE_SIZE,
+                    "filter": filter_str,
+                },
+            )
+            items = result.get("items", [])
+            for item in items:
+                key = (item.get("monitorObjectName") or "").lower()
+                if key in wanted:
+                    buckets.setdefault(key, []).append(item)
+            if len(items) < _COLLECTOR_ALERT_PAGE_SIZE:
+                return buckets, False
     except Exception:
         logger.exception(
-            "collector-down alert query failed for hostname=%s; down signal unavailable",
-            hostname,
+            "collector-down alert query failed (%s) for %d collector(s)",
+            scope_filter,
+            len(wanted),
         )
-        return None
-    return len(result.get("items", []))
+        return None, False
+    logger.warning(
+        "collector-down alert query (%s) stopped at %d pages; results are incomplete",
+        scope_filter,
+        _COLLECTOR_ALERT_MAX_PAGES,
+    )
+    return buckets, True
 
 
 async def _collector_down_history(
     client: LogicMonitorClient,
-    hostname: str,
-    history_days: int,
-) -> list[dict]:
-    """Fetch recent CollectorDown alerts for a collector hostname."""
-    start_epoch = int(time.time()) - (history_days * 86400)
-    try:
-        result = await client.get(
-            "/alert/alerts",
-            params={
-                "size": 100,
-                "filter": (
-                    f"monitorObjectName:{quote_filter_value(hostname)},"
-                    f"startEpoch>:{start_epoch},"
-                    'alertType~"CollectorDown"'
-                ),
-            },
-        )
-    except Exception:
-        logger.warning(
-            "collector history query failed for hostname=%s; returning empty history",
-            hostname,
-            exc_info=True,
-        )
-        return []
-
-    history: list[dict] = []
-    for item in result.get("items", []):
-        history.append(
-            {
-                "alert_id": item.get("id"),
-                "severity": item.get("severity"),
-                "start_epoch": item.get("startEpoch"),
-                "end_epoch": item.get("endEpoch"),
-                "cleared": item.get("cleared", False),
-                "alert_type": item.get("alertType"),
-            }
-        )
-    return history
+    hostnames: list[str],
+    start_epoch: int,
+) -> _CollectorDownAlerts:
+    """CollectorDown alerts started since ``start_epoch``, bucketed by lowercased hostname.
+
+    Served from the alert mirror when it covers the window (active alerts
+    only, as the API query returns), else from the API. The active-alert
+    lookup cannot use the mirror: a collector can have been down since
+    before the mirror's retention window. Returns the same (buckets,
+    truncated) pair as :func:`_collector_down_alerts`.
+    """
+    mirrored = await mirrored_alerts(client, start_epoch, cleared=False)
+    if mirrored is None:
+        return await _collector_down_alerts(client, hostnames, f"startEpoch>:{start_epoch}")
+    wanted = {h.lower() for h in hostnames if h}
+    buckets: dict[str, list[dict]] = {}
+    for item in mirrored:
+        key = (item.get("monitorObjectName") or "").lower()
+        if key in wanted and "collectordown" in str(item.get("alertType") or "").lower():
+            buckets.setdefault(key, []).append(item)
+    return buckets, False
 
 
 @require_write_permission
@@ -6,14 +6,19 @@ from __future__ import annotations
 import math
 import statistics
 import time
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 from mcp.types import TextContent
 
+from lm_mcp.alert_mirror import mirrored_alerts
+from lm_mcp.executor import run_cpu_bound
+from lm_mcp.session import get_session
 from lm_mcp.tools import (
     SEVERITY_MAP,
     SEVERITY_NAMES,
+    bounded_gather,
     format_response,
     handle_error,
     quote_filter_value,
@@ -21,10 +26,15 @@ from lm_mcp.tools import (
     sanitize_filter_value,
 )
 from lm_mcp.tools.stats_helpers import (
+    RollingWindow,
+    align_series,
+    correlation_matrix,
     fetch_metric_series,
     iqr_anomalies,
     mad_anomalies,
-    pearson_correlation,
+    rank_correlated_series,
+    sampling_interval,
+    transpose_metric_data,
 )
 
 if TYPE_CHECKING:
@@ -33,6 +43,12 @@ if TYPE_CHECKING:
 # Temporal proximity window for clustering (seconds)
 TEMPORAL_WINDOW_SECONDS = 300  # 5 minutes
 
+# Upper bound on correlate_metrics sources (an N^2 matrix of dot products)
+MAX_CORRELATION_SOURCES = 100
+
+# Per-device errors listed by find_correlated_metrics (all are counted)
+_MAX_DEVICE_ERRORS = 20
+
 
 async def _build_alert_filter(
     client: Any,
@@ -69,6 +85,50 @@ async def _build_alert_filter(
     return ",".join(filters)
 
 
+async def _fetch_active_alerts(
+    client: Any,
+    hours_back: int,
+    limit: int,
+    severity: str | None = None,
+    device: str | None = None,
+    group_id: int | None = None,
+) -> list[dict]:
+    """Fetch active alerts from the alert mirror when it is fresh, else from the API.
+
+    Args:
+        client: LogicMonitor API client.
+        hours_back: Number of hours to look back from now.
+        limit: Maximum alerts to return.
+        severity: Optional severity name filter.
+        device: Optional device name filter.
+        group_id: Optional device group ID filter.
+
+    Returns:
+        List of raw alert dicts.
+    """
+    start_epoch = int(time.time()) - (hours_back * 3600)
+    sev = SEVERITY_MAP.get(severity.lower()) if severity else None
+    alerts = await mirrored_alerts(
+        client,
+        start_epoch,
+        group_id=group_id,
+        cleared=False,
+        severity=sev,
+        device=device,
+        limit=min(limit, 1000),
+    )
+    if alerts is not None:
+        return alerts
+
+    filter_str = await _build_alert_filter(client, hours_back, severity, device, group_id)
+    params: dict[str, Any] = {
+        "size": min(limit, 1000),
+        "filter": filter_str,
+    }
+    result = await client.get("/alert/alerts", params=params)
+    return result.get("items", [])
+
+
 def _cluster_by_device(alerts: list[dict]) -> list[dict]:
     """Group alerts by device name.
 
@@ -217,34 +277,27 @@ async def correlate_alerts(
         List of TextContent with correlation clusters or error.
     """
     try:
-        filter_str = await _build_alert_filter(client, hours_back, severity, device, group_id)
-        params: dict[str, Any] = {
-            "size": min(limit, 1000),
-            "filter": filter_str,
-        }
-
-        result = await client.get("/alert/alerts", params=params)
-        alerts = result.get("items", [])
-
-        # Build all cluster types
-        device_clusters = _cluster_by_device(alerts)
-        ds_clusters = _cluster_by_datasource(alerts)
-        temporal_clusters = _cluster_by_time(alerts)
-
-        all_clusters = device_clusters + ds_clusters + temporal_clusters
-
-        return format_response(
-            {
-                "total_alerts": len(alerts),
-                "cluster_count": len(all_clusters),
-                "time_window_hours": hours_back,
-                "clusters": all_clusters,
-            }
+        alerts = await _fetch_active_alerts(
+            client, hours_back, limit, severity=severity, device=device, group_id=group_id
         )
+        return format_response(cluster_alerts(alerts, hours_back))
     except Exception as e:
         return handle_error(e)
 
 
+def cluster_alerts(alerts: list[dict], hours_back: int) -> dict:
+    """Device, datasource, and temporal clusters for already-fetched alerts."""
+    all_clusters = (
+        _cluster_by_device(alerts) + _cluster_by_datasource(alerts) + _cluster_by_time(alerts)
+    )
+    return {
+        "total_alerts": len(alerts),
+        "cluster_count": len(all_clusters),
+        "time_window_hours": hours_back,
+        "clusters": all_clusters,
+    }
+
+
 async def get_alert_statistics(
     client: LogicMonitorClient,
     hours_back: int = 24,
@@ -267,82 +320,81 @@ async def get_alert_statistics(
         List of TextContent with statistical summary or error.
     """
     try:
-        filter_str = await _build_alert_filter(client, hours_back, device=device, group_id=group_id)
-        params: dict[str, Any] = {
-            "size": min(limit, 1000),
-            "filter": filter_str,
-        }
+        alerts = await _fetch_active_alerts(
+            client, hours_back, limit, device=device, group_id=group_id
+        )
+        return format_response(summarize_alert_statistics(alerts, hours_back, bucket_size_hours))
+    except Exception as e:
+        return handle_error(e)
 
-        result = await client.get("/alert/alerts", params=params)
-        alerts = result.get("items", [])
 
-        # Count by severity
-        by_severity: dict[str, int] = {
-            "critical": 0,
-            "error": 0,
-            "warning": 0,
-            "info": 0,
-        }
-        for alert in alerts:
-            sev = alert.get("severity", 0)
-            name = SEVERITY_NAMES.get(sev, "unknown")
-            if name in by_severity:
-                by_severity[name] += 1
-
-        # Count by device (top 10)
-        device_counts: dict[str, int] = defaultdict(int)
-        for alert in alerts:
-            dev = alert.get("monitorObjectName", "unknown")
-            device_counts[dev] += 1
-        by_device = [
-            {"device": d, "count": c}
-            for d, c in sorted(device_counts.items(), key=lambda x: x[1], reverse=True)
-        ][:10]
-
-        # Count by datasource (top 10)
-        ds_counts: dict[str, int] = defaultdict(int)
-        for alert in alerts:
-            ds = alert.get("resourceTemplateName", "unknown")
-            ds_counts[ds] += 1
-        by_datasource = [
-            {"datasource": ds, "count": c}
-            for ds, c in sorted(ds_counts.items(), key=lambda x: x[1], reverse=True)
-        ][:10]
-
-        # Time bucketing
-        now_epoch = int(time.time())
-        start_epoch = now_epoch - (hours_back * 3600)
-        bucket_seconds = bucket_size_hours * 3600
-        num_buckets = max(1, math.ceil(hours_back / bucket_size_hours))
-
-        time_buckets = []
-        for i in range(num_buckets):
-            bucket_start = start_epoch + (i * bucket_seconds)
-            bucket_end = bucket_start + bucket_seconds
-            count = sum(1 for a in alerts if bucket_start <= a.get("startEpoch", 0) < bucket_end)
-            time_buckets.append(
-                {
-                    "bucket_start": bucket_start,
-                    "bucket_end": bucket_end,
-                    "count": count,
-                }
-            )
+def summarize_alert_statistics(
+    alerts: list[dict], hours_back: int, bucket_size_hours: int = 1
+) -> dict:
+    """Severity, device, datasource, and time-bucket counts for already-fetched alerts."""
+    # Count by severity
+    by_severity: dict[str, int] = {
+        "critical": 0,
+        "error": 0,
+        "warning": 0,
+        "info": 0,
+    }
+    for alert in alerts:
+        sev = alert.get("severity", 0)
+        name = SEVERITY_NAMES.get(sev, "unknown")
+        if name in by_severity:
+            by_severity[name] += 1
 
-        return format_response(
+    # Count by device (top 10)
+    device_counts: dict[str, int] = defaultdict(int)
+    for alert in alerts:
+        dev = alert.get("monitorObjectName", "unknown")
+        device_counts[dev] += 1
+    by_device = [
+        {"device": d, "count": c}
+        for d, c in sorted(device_counts.items(), key=lambda x: x[1], reverse=True)
+    ][:10]
+
+    # Count by datasource (top 10)
+    ds_counts: dict[str, int] = defaultdict(int)
+    for alert in alerts:
+        ds = alert.get("resourceTemplateName", "unknown")
+        ds_counts[ds] += 1
+    by_datasource = [
+        {"datasource": ds, "count": c}
+        for ds, c in sorted(ds_counts.items(), key=lambda x: x[1], reverse=True)
+    ][:10]
+
+    # Time bucketing
+    now_epoch = int(time.time())
+    start_epoch = now_epoch - (hours_back * 3600)
+    bucket_seconds = bucket_size_hours * 3600
+    num_buckets = max(1, math.ceil(hours_back / bucket_size_hours))
+
+    time_buckets = []
+    for i in range(num_buckets):
+        bucket_start = start_epoch + (i * bucket_seconds)
+        bucket_end = bucket_start + bucket_seconds
+        count = sum(1 for a in alerts if bucket_start <= a.get("startEpoch", 0) < bucket_end)
+        time_buckets.append(
             {
-                "summary": {
-                    "total": len(alerts),
-                    "by_severity": by_severity,
-                    "by_device": by_device,
-                    "by_datasource": by_datasource,
-                },
-                "time_buckets": time_buckets,
-                "time_window_hours": hours_back,
-                "bucket_size_hours": bucket_size_hours,
+                "bucket_start": bucket_start,
+                "bucket_end": bucket_end,
+                "count": count,
             }
         )
-    except Exception as e:
-        return handle_error(e)
+
+    return {
+        "summary": {
+            "total": len(alerts),
+            "by_severity": by_severity,
+            "by_device": by_device,
+            "by_datasource": by_datasource,
+        },
+        "time_buckets": time_buckets,
+        "time_window_hours": hours_back,
+        "bucket_size_hours": bucket_size_hours,
+    }
 
 
 def _detect_anomalies(
@@ -438,6 +490,7 @@ async def get_metric_anomalies(
     hours_back: int = 24,
     threshold: float = 2.0,
     method: str = "auto",
+    stream: bool = False,
 ) -> list[TextContent]:
     """Detect metric anomalies using statistical analysis.
 
@@ -445,6 +498,11 @@ async def get_metric_anomalies(
     from normal behavior. Supports z-score, IQR, and MAD methods.
     Auto mode selects IQR for skewed data, z-score otherwise.
 
+    In stream mode the first call analyzes the full window and keeps rolling
+    statistics per datapoint; later calls with the same arguments fetch only
+    points newer than the last one seen, score each against the updated
+    window, and return only those new anomalies.
+
     Args:
         client: LogicMonitor API client.
         device_id: Device ID.
@@ -454,11 +512,25 @@ async def get_metric_anomalies(
         hours_back: Number of hours to look back (default: 24).
         threshold: Z-score threshold for anomaly detection (default: 2.0).
         method: Detection method - auto, zscore, iqr, or mad (default: auto).
+        stream: Keep rolling state and report only anomalies since the last
+            call (default: False).
 
     Returns:
         List of TextContent with anomaly report or error.
     """
     try:
+        if stream:
+            return await _stream_metric_anomalies(
+                client,
+                device_id,
+                device_datasource_id,
+                instance_id,
+                datapoints,
+                hours_back,
+                threshold,
+                method,
+            )
+
         now_epoch = int(time.time())
         start_epoch = now_epoch - (hours_back * 3600)
 
@@ -499,25 +571,33 @@ async def get_metric_anomalies(
             effective_method = _select_anomaly_method(method, dp_values)
             method_used = effective_method
 
+            # Large windows run off the event loop; detectors are module-level
+            # so the process pool can pickle them by reference.
             if effective_method == "iqr":
-                anomalies = _detect_anomalies_iqr(
+                anomalies = await run_cpu_bound(
+                    _detect_anomalies_iqr,
                     dp_name,
                     dp_values,
                     dp_timestamps,
+                    size=len(dp_values),
                 )
             elif effective_method == "mad":
-                anomalies = _detect_anomalies_mad(
+                anomalies = await run_cpu_bound(
+                    _detect_anomalies_mad,
                     dp_name,
                     dp_values,
                     dp_timestamps,
                     threshold,
+                    size=len(dp_values),
                 )
             else:
-                anomalies = _detect_anomalies(
+                anomalies = await run_cpu_bound(
+                    _detect_anomalies,
                     dp_name,
                     dp_values,
                     dp_timestamps,
                     threshold,
+                    size=len(dp_values),
                 )
             all_anomalies.extend(anomalies)
 
@@ -547,6 +627,206 @@ async def get_metric_anomalies(
         return handle_error(e)
 
 
+@dataclass
+class _AnomalyStream:
+    """Rolling anomaly state for one instance between streaming calls."""
+
+    last_timestamp: int
+    windows: dict[str, RollingWindow] = field(default_factory=dict)
+    methods: dict[str, str] = field(default_factory=dict)
+
+
+# Streaming anomaly state lives on the current session, keyed by (portal base
+# URL, device, device-datasource, instance, datapoints, method, hours_back).
+_ANOMALY_STREAMS_MAX = 256
+
+
+def reset_anomaly_streams() -> None:
+    """Clear the current session's streaming anomaly state. Used in tests."""
+    get_session().anomaly_streams.clear()
+
+
+def _score_stream_point(
+    datapoint_name: str,
+    window: RollingWindow,
+    method: str,
+    value: float,
+    timestamp: int,
+    threshold: float,
+) -> dict | None:
+    """Score one new point against its rolling window, mirroring the batch detectors."""
+    if method == "iqr":
+        if window.count < 4:
+            return None
+        q1 = window.quantile(0.25)
+        q3 = window.quantile(0.75)
+        iqr = q3 - q1
+        if q1 - 1.5 * iqr <= value <= q3 + 1.5 * iqr:
+            return None
+        return {
+            "datapoint": datapoint_name,
+            "value": value,
+            "timestamp": timestamp,
+            "z_score": 0.0,
+            "mean": round((q1 + q3) / 2, 2),
+            "stddev": round(iqr, 2),
+        }
+    if method == "mad":
+        if window.count < 3:
+            return None
+        median = window.median()
+        mad = window.mad()
+        if mad == 0:
+            return None
+        modified_z = 0.6745 * (value - median) / mad
+        if abs(modified_z) <= threshold:
+            return None
+        return {
+            "datapoint": datapoint_name,
+            "value": value,
+            "timestamp": timestamp,
+            "z_score": abs(round(modified_z, 4)),
+            "mean": round(median, 2),
+            "stddev": round(mad, 2),
+        }
+    stddev = window.stdev()
+    if window.count < 2 or stddev == 0:
+        return None
+    z_score = abs(value - window.mean) / stddev
+    if z_score <= threshold:
+        return None
+    return {
+        "datapoint": datapoint_name,
+        "value": value,
+        "timestamp": timestamp,
+        "z_score": round(z_score, 2),
+        "mean": round(window.mean, 2),
+        "stddev": round(stddev, 2),
+    }
+
+
+async def _stream_metric_anomalies(
+    client: LogicMonitorClient,
+    device_id: int,
+    device_datasource_id: int,
+    instance_id: int,
+    datapoints: str | None,
+    hours_back: int,
+    threshold: float,
+    method: str,
+) -> list[TextContent]:
+    """Streaming mode of get_metric_anomalies: O(new points) per call after the first."""
+    key = (
+        client.base_url,
+        device_id,
+        device_datasource_id,
+        instance_id,
+        datapoints or "",
+        method,
+        hours_back,
+    )
+    streams: OrderedDict[tuple, _AnomalyStream] = get_session().anomaly_streams
+    state = streams.get(key)
+    window_seconds = hours_back * 3600
+    since = state.last_timestamp if state else None
+    start_epoch = since + 1 if since is not None else int(time.time()) - window_seconds
+
+    series = await fetch_metric_series(
+        client,
+        device_id,
+        device_datasource_id,
+        instance_id,
+        datapoints=datapoints,
+        hours_back=hours_back,
+        start_epoch=start_epoch,
+    )
+
+    anomalies: list[dict] = []
+    new_points = 0
+    if state is None:
+        # First call: batch analysis over the window, then keep its statistics.
+        newest = [max(dp["timestamps"]) for dp in series.values() if dp["timestamps"]]
+        state = _AnomalyStream(last_timestamp=max(newest, default=start_epoch - 1))
+        for dp_name, dp_series in series.items():
+            values, timestamps = dp_series["values"], dp_series["timestamps"]
+            effective_method = _select_anomaly_method(method, values)
+            state.methods[dp_name] = effective_method
+            state.windows[dp_name] = RollingWindow.from_points(window_seconds, timestamps, values)
+            if effective_method == "iqr":
+                found = await run_cpu_bound(
+                    _detect_anomalies_iqr, dp_name, values, timestamps, size=len(values)
+                )
+            elif effective_method == "mad":
+                found = await run_cpu_bound(
+                    _detect_anomalies_mad,
+                    dp_name,
+                    values,
+                    timestamps,
+                    threshold,
+                    size=len(values),
+                )
+            else:
+                found = await run_cpu_bound(
+                    _detect_anomalies, dp_name, values, timestamps, threshold, size=len(values)
+                )
+            anomalies.extend(found)
+            new_points += len(values)
+    else:
+        for dp_name, dp_series in series.items():
+            window = state.windows.get(dp_name)
+            if window is None:
+                window = state.windows[dp_name] = RollingWindow(window_seconds=window_seconds)
+                state.methods[dp_name] = "zscore" if method == "auto" else method
+            floor = window.last_timestamp if window.last_timestamp is not None else since
+            for ts, val in sorted(zip(dp_series["timestamps"], dp_series["values"], strict=False)):
+                if ts <= floor:
+                    continue
+                window.push(ts, val)
+                new_points += 1
+                state.last_timestamp = max(state.last_timestamp, ts)
+                anomaly = _score_stream_point(
+                    dp_name, window, state.methods[dp_name], val, ts, threshold
+                )
+                if anomaly is not None:
+                    anomalies.append(anomaly)
+
+    streams[key] = state
+    streams.move_to_end(key)
+    while len(streams) > _ANOMALY_STREAMS_MAX:
+        streams.popitem(last=False)
+
+    window_points = sum(w.count for w in state.windows.values())
+    if window_points < 10:
+        data_quality = "insufficient"
+    elif window_points < 50:
+        data_quality = "limited"
+    else:
+        data_quality = "good"
+
+    methods_used = set(state.methods.values())
+    return format_response(
+        {
+            "device_id": device_id,
+            "device_datasource_id": device_datasource_id,
+            "instance_id": instance_id,
+            "total_datapoints_checked": len(state.windows),
+            "anomaly_count": len(anomalies),
+            "anomalies": anomalies,
+            "threshold": threshold,
+            "hours_back": hours_back,
+            "method_used": methods_used.pop() if len(methods_used) == 1 else "mixed",
+            "data_quality": data_quality,
+            "stream": {
+                "primed": since is None,
+                "since": since,
+                "last_timestamp": state.last_timestamp,
+                "new_points": new_points,
+                "window_points": window_points,
+            },
+        }
+    )
+
+
 def _select_anomaly_method(method: str, values: list[float]) -> str:
     """Select anomaly detection method based on data characteristics.
 
@@ -649,26 +929,32 @@ async def correlate_metrics(
 ) -> list[TextContent]:
     """Compute Pearson correlation between multiple metric series.
 
-    Fetches data from each source, aligns timestamps, and builds an
-    NxN correlation matrix. Highlights strong correlations (|r| > 0.7).
+    Sources on the same instance are fetched with a single data request, and
+    the per-instance requests run concurrently. Series are aligned on shared
+    timestamps and an NxN correlation matrix is built. Highlights strong
+    correlations (|r| > 0.7).
 
     Args:
         client: LogicMonitor API client.
         sources: List of source dicts, each containing device_id,
             device_datasource_id, instance_id, and datapoint.
-            Maximum 10 sources.
+            Maximum 100 sources.
         hours_back: Hours of data to analyze (default: 24).
 
     Returns:
         Correlation matrix and list of strong correlations.
     """
     try:
-        if len(sources) > 10:
+        if len(sources) > MAX_CORRELATION_SOURCES:
             return format_response(
                 {
                     "error": True,
-                    "message": "Maximum 10 sources allowed for correlation.",
-                    "suggestion": "Reduce the number of sources to 10 or fewer.",
+                    "message": (
+                        f"Maximum {MAX_CORRELATION_SOURCES} sources allowed for correlation."
+                    ),
+                    "suggestion": (
+                        f"Reduce the number of sources to {MAX_CORRELATION_SOURCES} or fewer."
+                    ),
                 }
             )
 
@@ -680,39 +966,58 @@ async def correlate_metrics(
                 }
             )
 
-        # Fetch each series
-        labels = []
-        all_values = []
-        sample_counts = []
-
+        # Group sources by instance so each instance is fetched once with every
+        # datapoint it needs. A source without a datapoint needs them all.
+        groups: dict[tuple[int, int, int], list[str]] = {}
         for src in sources:
-            dp_name = src.get("datapoint", "")
-            series = await fetch_metric_series(
+            key = (src["device_id"], src["device_datasource_id"], src["instance_id"])
+            groups.setdefault(key, []).append(src.get("datapoint", ""))
+
+        def _wanted(dp_names: list[str]) -> str | None:
+            if "" in dp_names:
+                return None
+            return ",".join(dict.fromkeys(dp_names))
+
+        fetched = await bounded_gather(
+            fetch_metric_series(
                 client,
-                device_id=src["device_id"],
-                device_datasource_id=src["device_datasource_id"],
-                instance_id=src["instance_id"],
-                datapoints=dp_name if dp_name else None,
+                device_id=key[0],
+                device_datasource_id=key[1],
+                instance_id=key[2],
+                datapoints=_wanted(dp_names),
                 hours_back=hours_back,
             )
+            for key, dp_names in groups.items()
+        )
+        series_by_instance = dict(zip(groups, fetched, strict=True))
+
+        labels = []
+        raw_series = []
+        for src in sources:
+            dp_name = src.get("datapoint", "")
+            series = series_by_instance[
+                (src["device_id"], src["device_datasource_id"], src["instance_id"])
+            ]
 
             # Use the specified datapoint or the first available
             if dp_name and dp_name in series:
-                vals = series[dp_name]["values"]
+                dp_series = series[dp_name]
             elif series:
-                first_key = next(iter(series))
-                vals = series[first_key]["values"]
-                dp_name = first_key
+                dp_name = next(iter(series))
+                dp_series = series[dp_name]
             else:
-                vals = []
+                dp_series = {"timestamps": [], "values": []}
 
-            label = f"d{src['device_id']}:{dp_name}"
-            labels.append(label)
-            all_values.append(vals)
-            sample_counts.append(len(vals))
+            labels.append(f"d{src['device_id']}:{dp_name}")
+            raw_series.append((dp_series["timestamps"], dp_series["values"]))
 
-        # Align series to the shortest length
-        min_len = min(len(v) for v in all_values) if all_values else 0
+        # Join the series on shared timestamps
+        _, aligned = await run_cpu_bound(
+            align_series,
+            raw_series,
+            size=sum(len(values) for _, values in raw_series),
+        )
+        min_len = len(aligned[0])
         if min_len < 2:
             return format_response(
                 {
@@ -722,32 +1027,23 @@ async def correlate_metrics(
                 }
             )
 
-        aligned = [v[:min_len] for v in all_values]
-
-        # Build NxN correlation matrix
+        # Build NxN correlation matrix (off the event loop for large inputs)
         n = len(aligned)
-        matrix: list[list[float | None]] = []
-        strong_correlations = []
+        matrix = await run_cpu_bound(correlation_matrix, aligned, size=n * n * min_len)
 
+        strong_correlations = []
         for i in range(n):
-            row = []
-            for j in range(n):
-                if i == j:
-                    row.append(1.0)
-                else:
-                    r = pearson_correlation(aligned[i], aligned[j])
-                    r = round(r, 4)
-                    row.append(r)
-                    if i < j and abs(r) > 0.7:
-                        strong_correlations.append(
-                            {
-                                "source_a": labels[i],
-                                "source_b": labels[j],
-                                "correlation": r,
-                                "strength": ("strong_positive" if r > 0 else "strong_negative"),
-                            }
-                        )
-            matrix.append(row)
+            for j in range(i + 1, n):
+                r = matrix[i][j]
+                if abs(r) > 0.7:
+                    strong_correlations.append(
+                        {
+                            "source_a": labels[i],
+                            "source_b": labels[j],
+                            "correlation": r,
+                            "strength": ("strong_positive" if r > 0 else "strong_negative"),
+                        }
+                    )
 
         return format_response(
             {
@@ -760,3 +1056,243 @@ async def correlate_metrics(
         )
     except Exception as e:
         return handle_error(e)
+
+
+async def _fetch_group_candidates(
+    client: LogicMonitorClient,
+    device: dict,
+    datasource_name: str,
+    datapoints: str,
+    start_epoch: int,
+    end_epoch: int,
+) -> tuple[list[dict], str]:
+    """Fetch every instance of one DataSource on a device with a single data request.
+
+    A device whose lookups fail is reported rather than raised, so one
+    unreadable device does not abort the search across the group.
+
+    Returns:
+        Tuple of (candidates, "") or ([], error message). Each candidate is one
+        (instance, datapoint) with device_id, device_name, instance, datapoint,
+        timestamps, and values. Empty when the DataSource is not applied to
+        the device.
+    """
+    try:
+        dds_result = await client.get(
+            f"/device/devices/{device['id']}/devicedatasources",
+            params={
+                "filter": f"dataSourceName:{quote_filter_value(datasource_name)}",
+                "fields": "id,dataSourceName",
+                "size": 1,
+            },
+        )
+        items = dds_result.get("items", [])
+        if not items:
+            return [], ""
+
+        result = await client.get(
+            f"/device/devices/{device['id']}/devicedatasources/{items[0]['id']}/data",
+            params={"start": start_epoch, "end": end_epoch, "datapoints": datapoints},
+        )
+    except Exception as exc:
+        return [], str(exc) or type(exc).__name__
+    shared_dp_names = result.get("dataPoints", result.get("datapoints", []))
+
+    candidates = []
+    for instance_name, instance_data in (result.get("instances") or {}).items():
+        payload = dict(instance_data)
+        payload.setdefault("dataPoints", shared_dp_names)
+        for dp_name, dp_series in transpose_metric_data(payload).items():
+            if dp_series["values"]:
+                candidates.append(
+                    {
+                        "device_id": device["id"],
+                        "device_name": device.get("displayName"),
+                        "instance": instance_name,
+                        "datapoint": dp_name,
+                        "timestamps": dp_series["timestamps"],
+                        "values": dp_series["values"],
+                    }
+                )
+    return candidates, ""
+
+
+async def find_correlated_metrics(
+    client: LogicMonitorClient,
+    device_id: int,
+    device_datasource_id: int,
+    instance_id: int,
+    datapoint: str,
+    group_id: int,
+    datapoints: str | None = None,
+    hours_back: int = 24,
+    top_k: int = 10,
+    max_lag_minutes: int = 0,
+    min_correlation: float = 0.5,
+    max_devices: int = 200,
+) -> list[TextContent]:
+    """Find the series in a device group that moved most like a reference series.
+
+    Fetches the reference series, then pulls every instance of the same
+    DataSource on each device in the group with one bulk data request per
+    device (run concurrently), and ranks the candidates by absolute Pearson
+    correlation, optionally allowing the candidate to lead or lag.
+
+    Args:
+        client: LogicMonitor API client.
+        device_id: Device ID of the reference series.
+        device_datasource_id: Device-DataSource ID of the reference series.
+        instance_id: Instance ID of the reference series.
+        datapoint: Reference datapoint name.
+        group_id: Device group to search.
+        datapoints: Comma-separated candidate datapoints (default: the
+            reference datapoint).
+        hours_back: Hours of data to compare (default: 24).
+        top_k: Number of matches to return (default: 10, max 100).
+        max_lag_minutes: Largest lead/lag to test in minutes (default: 0).
+        min_correlation: Minimum |r| for a match (default: 0.5).
+        max_devices: Maximum devices to scan in the group (default: 200, max 1000).
+
+    Returns:
+        Ranked matches with correlation, lag, and search statistics. Devices
+        whose data could not be read are counted under ``devices_failed``.
+    """
+    try:
+        top_k = max(1, min(top_k, 100))
+        max_devices = max(1, min(max_devices, 1000))
+        end_epoch = int(time.time())
+        start_epoch = end_epoch - hours_back * 3600
+
+        ref_series, ref_dds, ref_instance, devices_result = await bounded_gather(
+            [
+                fetch_metric_series(
+                    client,
+                    device_id,
+                    device_datasource_id,
+                    instance_id,
+                    datapoints=datapoint,
+                    hours_back=hours_back,
+                ),
+                client.get(f"/device/devices/{device_id}/devicedatasources/{device_datasource_id}"),
+                client.get(
+                    f"/device/devices/{device_id}/devicedatasources/{device_datasource_id}"
+                    f"/instances/{instance_id}"
+                ),
+                client.get(
+                    "/device/devices",
+                    params={
+                        "filter": f"hostGroupIds~{group_id}",
+                        "fields": "id,displayName",
+                        "size": max_devices,
+                    },
+                ),
+            ]
+        )
+
+        reference = ref_series.get(datapoint)
+        if reference is None or len(reference["values"]) < 4:
+            return format_response(
+                {
+                    "error": True,
+                    "message": (
+                        f"Reference datapoint '{datapoint}' has insufficient data "
+                        f"in the last {hours_back} hours."
+                    ),
+                    "suggestion": "Check the datapoint name or increase hours_back.",
+                }
+            )
+
+        datasource_name = ref_dds.get("dataSourceName", "")
+        ref_instance_name = ref_instance.get("name") or ref_instance.get("displayName")
+        devices = devices_result.get("items", [])
+
+        per_device = await bounded_gather(
+            _fetch_group_candidates(
+                client,
+                device,
+                datasource_name,
+                datapoints or datapoint,
+                start_epoch,
+                end_epoch,
+            )
+            for device in devices
+        )
+        device_errors = [
+            {"device_id": device["id"], "device_name": device.get("displayName"), "error": error}
+            for device, (_, error) in zip(devices, per_device, strict=True)
+            if error
+        ]
+        candidates = [
+            c
+            for device_candidates, _ in per_device
+            for c in device_candidates
+            if not (
+                c["device_id"] == device_id
+                and c["instance"] == ref_instance_name
+                and c["datapoint"] == datapoint
+            )
+        ]
+
+        interval = sampling_interval(reference["timestamps"]) or 60
+        max_lag = (max_lag_minutes * 60) // interval
+        ranked = await run_cpu_bound(
+            rank_correlated_series,
+            (reference["timestamps"], reference["values"]),
+            [(c["timestamps"], c["values"]) for c in candidates],
+            top_k=top_k,
+            max_lag=max_lag,
+            min_correlation=min_correlation,
+            size=len(reference["values"]) * len(candidates) * (2 * max_lag + 1),
+        )
+
+        bucket_seconds = ranked["bucket_seconds"]
+        matches = []
+        for match in ranked["matches"]:
+            candidate = candidates[match["index"]]
+            lag_seconds = match["lag"] * bucket_seconds
+            if lag_seconds > 0:
+                timing = "leads"
+            elif lag_seconds < 0:
+                timing = "lags"
+            else:
+                timing = "concurrent"
+            matches.append(
+                {
+                    "device_id": candidate["device_id"],
+                    "device_name": candidate["device_name"],
+                    "instance": candidate["instance"],
+                    "datapoint": candidate["datapoint"],
+                    "correlation": match["correlation"],
+                    "direction": "positive" if match["correlation"] > 0 else "negative",
+                    "lag_seconds": abs(lag_seconds),
+                    "timing": timing,
+                    "overlap": match["overlap"],
+                }
+            )
+
+        response: dict = {
+            "reference": {
+                "device_id": device_id,
+                "device_datasource_id": device_datasource_id,
+                "instance_id": instance_id,
+                "instance": ref_instance_name,
+                "datasource": datasource_name,
+                "datapoint": datapoint,
+                "sample_count": len(reference["values"]),
+            },
+            "group_id": group_id,
+            "hours_back": hours_back,
+            "devices_scanned": len(devices),
+            "candidates_scanned": ranked["scanned"],
+            "pruned": ranked["pruned"],
+            "skipped_low_coverage": ranked["low_coverage"],
+            "skipped_flat": ranked["flat"],
+            "bucket_seconds": bucket_seconds,
+            "matches": matches,
+        }
+        if device_errors:
+            response["devices_failed"] = len(device_errors)
+            response["device_errors"] = device_errors[:_MAX_DEVICE_ERRORS]
+        return format_response(response)
+    except Exception as e:
+        return handle_error(e)
@@ -0,0 +1,298 @@
+# Description: Streaming monitoring-coverage audit engine.
+# Description: Pages the full device inventory, classifies in one regex pass, and diffs audits.
+
+from __future__ import annotations
+
+import re
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from lm_mcp.tools import MAX_CONCURRENT_REQUESTS, bounded_gather, safe_total
+
+if TYPE_CHECKING:
+    from lm_mcp.client import LogicMonitorClient
+
+# Devices per /device/devices page and the most devices one audit reads.
+AUDIT_PAGE_SIZE = 1000
+AUDIT_MAX_DEVICES = 100_000
+
+# Only the fields the classifier reads are requested.
+_DEVICE_FIELDS = "id,displayName,name,systemCategories,customProperties,systemProperties"
+
+# Device IDs listed per category in an audit diff.
+_DIFF_SAMPLE = 20
+
+# Audits kept for diffing, keyed by portal and scope (LRU).
+_AUDIT_HISTORY_MAX = 32
+
+# Per-device coverage flags, kept between audits for diffing.
+FLAG_POWER = 1
+FLAG_NETWORK = 2
+FLAG_SERVER = 4
+FLAG_SNMP = 8
+FLAG_NETFLOW = 16
+
+_COVERAGE_FLAGS = {
+    "snmp": FLAG_SNMP,
+    "netflow": FLAG_NETFLOW,
+    "power": FLAG_POWER,
+}
+
+# Zero-width lookahead so overlapping keywords still match ("windowswitch"
+# is network gear even though "windows" consumes the first "s"). Group
+# number is the class priority: power, then network, then server.
+_CLASS_PATTERN = re.compile(
+    r"(?=(ups|pdu|battery|power)|(switch|router|firewall|wlan)|(server|linux|windows|host))"
+)
+_CLASS_FLAGS = (0, FLAG_POWER, FLAG_NETWORK, FLAG_SERVER)
+
+_AUDIT_PROPERTIES = frozenset({"snmp.version", "snmp.community", "netflow.enabled"})
+
+
+def classify_device(device: dict) -> int:
+    """Return the coverage flags for one raw device record.
+
+    The name and systemCategories are scanned once by a precompiled pattern;
+    the property lists are walked once, stopping at the three names the audit
+    reads. Custom properties take precedence over system properties.
+    """
+    name = (device.get("displayName") or device.get("name") or "").lower()
+    categories = (device.get("systemCategories") or "").lower()
+
+    best = 4
+    for match in _CLASS_PATTERN.finditer(f"{name} {categories}"):
+        best = min(best, match.lastindex or 4)
+        if best == 1:
+            break
+    flags = _CLASS_FLAGS[best] if best < 4 else 0
+
+    found: dict[str, str] = {}
+    for key in ("customProperties", "systemProperties"):
+        for prop in device.get(key) or ():
+            prop_name = prop.get("name")
+            if prop_name in _AUDIT_PROPERTIES and prop_name not in found:
+                found[prop_name] = prop.get("value", "")
+                if len(found) == len(_AUDIT_PROPERTIES):
+                    break
+
+    if found.get("snmp.version") or found.get("snmp.community"):
+        flags |= FLAG_SNMP
+    if found.get("netflow.enabled") or "netflow" in categories:
+        flags |= FLAG_NETFLOW
+    return flags
+
+
+@dataclass
+class CoverageAudit:
+    """Coverage counters accumulated one page of devices at a time.
+
+    Only counters and one small integer per device are kept, so memory does
+    not grow with the size of the device records.
+    """
+
+    flags: dict[int, int] = field(default_factory=dict)
+    power_like: int = 0
+    network_like: int = 0
+    server_like: int = 0
+    unclassified: int = 0
+    snmp: int = 0
+    netflow: int = 0
+
+    def feed(self, devices: list[dict]) -> None:
+        """Classify and count a page of raw device records."""
+        for device in devices:
+            device_id = device.get("id")
+            # Records without an id cannot be deduplicated across pages
+            if device_id is None or device_id in self.flags:
+                continue
+            flags = classify_device(device)
+            self.flags[device_id] = flags
+            if flags & FLAG_POWER:
+                self.power_like += 1
+            elif flags & FLAG_NETWORK:
+                self.network_like += 1
+            elif flags & FLAG_SERVER:
+                self.server_like += 1
+            else:
+                self.unclassified += 1
+            if flags & FLAG_SNMP:
+                self.snmp += 1
+            if flags & FLAG_NETFLOW:
+                self.netflow += 1
+
+    def inventory(self, collectors: list[dict]) -> dict:
+        """Counts by likely device role."""
+        return {
+            "total_devices": len(self.flags),
+            "likely_power_infrastructure": self.power_like,
+            "likely_network_gear": self.network_like,
+            "likely_servers": self.server_like,
+            "unclassified": self.unclassified,
+            "total_collectors": len(collectors),
+        }
+
+    def coverage(self, collectors: list[dict]) -> dict:
+        """Counts and percentages of devices with monitoring coverage set."""
+        total = len(self.flags) or 1
+        collectors_up = sum(1 for c in collectors if c.get("status") not in ("dead", "down"))
+        return {
+            "counts": {
+                "snmp_credentialed": self.snmp,
+                "netflow_exporters": self.netflow,
+                "power_monitored_devices": self.power_like,
+                "collectors_up": collectors_up,
+                "collectors_total": len(collectors),
+            },
+            "percentages": {
+                "snmp_coverage_pct": round(100.0 * self.snmp / total, 1),
+                "netflow_coverage_pct": round(100.0 * self.netflow / total, 1),
+                "power_monitoring_coverage_pct": round(100.0 * self.power_like / total, 1),
+            },
+        }
+
+
+async def iter_device_pages(
+    client: LogicMonitorClient,
+    group_id: int | None = None,
+    max_devices: int = AUDIT_MAX_DEVICES,
+) -> AsyncIterator[tuple[list[dict], int]]:
+    """Yield (devices, total) pages covering the inventory in scope.
+
+    The first page reports the total; the remaining pages are requested
+    ``MAX_CONCURRENT_REQUESTS`` at a time, and each wave is yielded before
+    the next is fetched so at most one wave of records is held at once.
+    """
+    params: dict = {"size": AUDIT_PAGE_SIZE, "offset": 0, "fields": _DEVICE_FIELDS}
+    if group_id:
+        params["filter"] = f"hostGroupIds~{group_id}"
+
+    first = await client.get("/device/devices", params=params)
+    items = first.get("items", [])
+    total = safe_total(first)
+    yield items, total
+    if len(items) < AUDIT_PAGE_SIZE:
+        return
+
+    offsets = list(range(AUDIT_PAGE_SIZE, min(total, max_devices), AUDIT_PAGE_SIZE))
+    for start in range(0, len(offsets), MAX_CONCURRENT_REQUESTS):
+        wave = offsets[start : start + MAX_CONCURRENT_REQUESTS]
+        pages = await bounded_gather(
+            [client.get("/device/devices", params={**params, "offset": off}) for off in wave]
+        )
+        for page in pages:
+            yield page.get("items", []), total
+
+
+async def fetch_all_collectors(client: LogicMonitorClient) -> list[dict]:
+    """Every collector record, paged until a short page."""
+    collectors: list[dict] = []
+    offset = 0
+    while True:
+        result = await client.get(
+            "/setting/collector/collectors",
+            params={"size": AUDIT_PAGE_SIZE, "offset": offset, "fields": "id,hostname,status"},
+        )
+        items = result.get("items", [])
+        collectors.extend(items)
+        if len(items) < AUDIT_PAGE_SIZE:
+            return collectors
+        offset += AUDIT_PAGE_SIZE
+
+
+@dataclass
+class AuditRecord:
+    """A finished audit kept for diffing against the next one."""
+
+    audited_at: float
+    flags: dict[int, int]
+    counts: dict
+    percentages: dict
+    gap_keys: set[tuple[str, str]]
+
+
+_audit_history: OrderedDict[tuple[str, int | None], AuditRecord] = OrderedDict()
+
+
+def previous_audit(client: LogicMonitorClient, group_id: int | None) -> AuditRecord | None:
+    """The last audit recorded for this portal and scope, if any."""
+    return _audit_history.get((str(client.base_url), group_id))
+
+
+def record_audit(
+    client: LogicMonitorClient,
+    group_id: int | None,
+    audit: CoverageAudit,
+    coverage: dict,
+    gaps: list[dict],
+) -> AuditRecord:
+    """Store a finished audit as the baseline for the next diff."""
+    key = (str(client.base_url), group_id)
+    record = AuditRecord(
+        audited_at=time.time(),
+        flags=audit.flags,
+        counts=dict(coverage["counts"]),
+        percentages=dict(coverage["percentages"]),
+        gap_keys={(g["category"], g["severity"]) for g in gaps},
+    )
+    _audit_history[key] = record
+    _audit_history.move_to_end(key)
+    while len(_audit_history) > _AUDIT_HISTORY_MAX:
+        _audit_history.popitem(last=False)
+    return record
+
+
+def reset_audit_history() -> None:
+    """Forget every recorded audit. Used in tests."""
+    _audit_history.clear()
+
+
+def diff_audits(old: AuditRecord, new: AuditRecord) -> dict:
+    """Describe what changed between two audits of the same scope.
+
+    Returns:
+        Device additions and removals, count and percentage deltas, gaps
+        opened and closed, and per coverage type how many devices gained or
+        lost it (with a sample of device IDs).
+    """
+    old_flags, new_flags = old.flags, new.flags
+    added = [d for d in new_flags if d not in old_flags]
+    removed = [d for d in old_flags if d not in new_flags]
+
+    gained: dict[str, list[int]] = {name: [] for name in _COVERAGE_FLAGS}
+    lost: dict[str, list[int]] = {name: [] for name in _COVERAGE_FLAGS}
+    for device_id, flags in new_flags.items():
+        before = old_flags.get(device_id)
+        if before is None or before == flags:
+            continue
+        for name, bit in _COVERAGE_FLAGS.items():
+            if flags & bit and not before & bit:
+                gained[name].append(device_id)
+            elif before & bit and not flags & bit:
+                lost[name].append(device_id)
+
+    def _summary(changes: dict[str, list[int]]) -> dict:
+        return {
+            name: {"count": len(ids), "device_ids": ids[:_DIFF_SAMPLE]}
+            for name, ids in changes.items()
+            if ids
+        }
+
+    return {
+        "previous_audited_at": int(old.audited_at),
+        "devices_added": len(added),
+        "devices_removed": len(removed),
+        "sample_added_device_ids": added[:_DIFF_SAMPLE],
+        "sample_removed_device_ids": removed[:_DIFF_SAMPLE],
+        "counts_delta": {key: new.counts[key] - old.counts.get(key, 0) for key in new.counts},
+        "percentages_delta": {
+            key: round(new.percentages[key] - old.percentages.get(key, 0.0), 1)
+            for key in new.percentages
+        },
+        "gaps_opened": sorted(f"{c}:{s}" for c, s in new.gap_keys - old.gap_keys),
+        "gaps_closed": sorted(f"{c}:{s}" for c, s in old.gap_keys - new.gap_keys),
+        "coverage_gained": _summary(gained),
+        "coverage_lost": _summary(lost),
+    }
@@ -11,6 +11,7 @@ from mcp.types import TextContent
 
 from lm_mcp.tools import (
     WILDCARD_STRIP_NOTE,
+    bounded_gather,
     format_response,
     handle_error,
     portal_url,
@@ -227,12 +228,16 @@ async def get_dashboard_widgets(
     try:
         params: dict = {"size": limit}
 
-        result = await client.get(f"/dashboard/dashboards/{dashboard_id}/widgets", params=params)
-
         # Position (column/row/spans) lives on the parent dashboard's widgetsConfig
         # keyed by widget id, not on the widget objects -- which is why these came back
-        # null before. Fetch the dashboard and map placement onto each widget.
-        dashboard = await client.get(f"/dashboard/dashboards/{dashboard_id}")
+        # null before. Fetch the dashboard alongside the widget list and map placement
+        # onto each widget.
+        result, dashboard = await bounded_gather(
+            [
+                client.get(f"/dashboard/dashboards/{dashboard_id}/widgets", params=params),
+                client.get(f"/dashboard/dashboards/{dashboard_id}"),
+            ]
+        )
         config = dashboard.get("widgetsConfig")
         if not isinstance(config, dict):
             config = {}
@@ -11,6 +11,7 @@ from lm_mcp.tools import (
     WILDCARD_STRIP_NOTE,
     format_response,
     handle_error,
+    hydrate,
     quote_filter_value,
     require_write_permission,
     sanitize_filter_value,
@@ -228,7 +229,7 @@ async def get_recipient_groups(
     client: LogicMonitorClient,
     name_filter: str | None = None,
     limit: int = 50,
-    detail: bool = False,
+    detail: bool = True,
 ) -> list[TextContent]:
     """List recipient groups from LogicMonitor.
 
@@ -236,8 +237,9 @@ async def get_recipient_groups(
         client: LogicMonitor API client.
         name_filter: Filter by group name (supports wildcards).
         limit: Maximum number of groups to return.
-        detail: When true, fetch each group's full recipient list via an
-            extra GET per group. Off by default to avoid N+1 API calls.
+        detail: Include each group's recipient list (default: True). Groups
+            the list response already carries recipients for are used as-is;
+            the rest are fetched concurrently.
 
     Returns:
         List of TextContent with recipient group data or error.
@@ -252,17 +254,35 @@ async def get_recipient_groups(
             params["filter"] = f"name~{quote_filter_value(clean_name)}"
 
         result = await client.get("/setting/recipientgroups", params=params)
+        items = result.get("items", [])
+
+        details: list = [None] * len(items)
+        if detail:
+            details = await hydrate(
+                client,
+                items,
+                lambda item: (
+                    f"/setting/recipientgroups/{item['id']}"
+                    if item.get("id") is not None and "recipients" not in item
+                    else None
+                ),
+            )
 
         groups = []
-        for item in result.get("items", []):
+        for item, full in zip(items, details, strict=True):
             entry = {
                 "id": item.get("id"),
                 "name": _recipient_group_name(item),
                 "description": item.get("description"),
             }
-            if detail and entry["id"] is not None:
-                full = await client.get(f"/setting/recipientgroups/{entry['id']}")
-                entry["recipients"] = [_format_recipient(r) for r in full.get("recipients", [])]
+            if detail:
+                if isinstance(full, Exception):
+                    entry["recipients_error"] = str(full)
+                else:
+                    source = item if full is None else full
+                    entry["recipients"] = [
+                        _format_recipient(r) for r in source.get("recipients") or []
+                    ]
             groups.append(entry)
 
         response = {
@@ -11,6 +11,7 @@ from typing import TYPE_CHECKING, Any
 
 from mcp.types import TextContent
 
+from lm_mcp.alert_mirror import mirrored_alerts
 from lm_mcp.tools import format_response, handle_error
 
 if TYPE_CHECKING:
@@ -44,13 +45,15 @@ async def correlate_changes(
         start_epoch = now_epoch - (hours_back * 3600)
         window_seconds = correlation_window_minutes * 60
 
-        # Fetch alerts (active + cleared)
-        alert_params: dict[str, Any] = {
-            "size": 1000,
-            "filter": f"startEpoch>:{start_epoch}",
-        }
-        alert_result = await client.get("/alert/alerts", params=alert_params)
-        alerts = alert_result.get("items", [])
+        # Fetch alerts (active only, as the API query returns)
+        alerts = await mirrored_alerts(client, start_epoch, limit=1000)
+        if alerts is None:
+            alert_params: dict[str, Any] = {
+                "size": 1000,
+                "filter": f"startEpoch>:{start_epoch}",
+            }
+            alert_result = await client.get("/alert/alerts", params=alert_params)
+            alerts = alert_result.get("items", [])
 
         # Fetch audit/change logs
         audit_params: dict[str, Any] = {
@@ -3,20 +3,28 @@
 
 from __future__ import annotations
 
+import bisect
 import logging
+from collections import OrderedDict
 from typing import TYPE_CHECKING
 
 from mcp.types import TextContent
 
+from lm_mcp.executor import run_cpu_bound
 from lm_mcp.tools import format_response, handle_error
 from lm_mcp.tools.stats_helpers import (
+    HW_DEFAULT_PARAMS,
+    HoltWintersState,
     autocorrelation,
+    autocorrelation_sweep,
     coefficient_of_variation,
     cusum,
     fetch_metric_series,
-    holt_winters,
+    holt_winters_fit,
+    holt_winters_grid_search,
     linear_regression,
     prediction_interval,
+    prediction_interval_from_sse,
 )
 
 if TYPE_CHECKING:
@@ -24,6 +32,13 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Fitted Holt-Winters models kept between forecast_metric calls, keyed by
+# (portal base URL, device, device-datasource, instance, datapoint). A repeat
+# forecast over an overlapping window advances the cached model with only the
+# new points instead of refitting the whole history. Least recently used first.
+_HW_MODEL_CACHE_MAX = 256
+_hw_models: OrderedDict[tuple, HoltWintersState] = OrderedDict()
+
 
 async def forecast_metric(
     client: LogicMonitorClient,
@@ -34,6 +49,7 @@ async def forecast_metric(
     datapoints: str | None = None,
     hours_back: int = 168,
     method: str = "auto",
+    optimize_params: bool = False,
 ) -> list[TextContent]:
     """Forecast when a metric will breach a threshold.
 
@@ -50,6 +66,8 @@ async def forecast_metric(
         datapoints: Comma-separated datapoint names (all if omitted).
         hours_back: Hours of historical data for the regression (default: 168).
         method: Forecasting method - auto, linear, holt_winters, or ttm (default: auto).
+        optimize_params: Grid-search Holt-Winters smoothing parameters instead of
+            using the defaults (default: False).
 
     Returns:
         Per-datapoint forecast with slope, breach time, trend direction,
@@ -67,8 +85,11 @@ async def forecast_metric(
 
         forecasts = {}
         for dp_name, dp_data in series.items():
-            values = dp_data["values"]
-            timestamps = dp_data["timestamps"]
+            # The /data endpoint returns newest rows first; every method, and
+            # Holt-Winters model reuse, needs the series oldest first.
+            rows = sorted(zip(dp_data["timestamps"], dp_data["values"], strict=False))
+            timestamps = [ts for ts, _ in rows]
+            values = [val for _, val in rows]
 
             if len(values) < 2:
                 forecasts[dp_name] = {
@@ -97,13 +118,25 @@ async def forecast_metric(
                 x_hours = [(t - t0) / 3600.0 for t in timestamps]
 
                 if method_used == "holt_winters":
-                    forecast_result = _forecast_holt_winters(
+                    model_key = (
+                        client.base_url,
+                        device_id,
+                        device_datasource_id,
+                        instance_id,
+                        dp_name,
+                    )
+                    forecast_result, state = await run_cpu_bound(
+                        _forecast_holt_winters_incremental,
                         values,
                         timestamps,
                         threshold,
                         t0,
                         x_hours,
+                        state=_hw_models.get(model_key),
+                        optimize_params=optimize_params,
+                        size=len(values),
                     )
+                    _store_hw_model(model_key, state)
                 else:
                     forecast_result = _forecast_linear(
                         values,
@@ -315,14 +348,69 @@ def _forecast_linear(
     }
 
 
-def _forecast_holt_winters(
+def _store_hw_model(key: tuple, state: HoltWintersState | None) -> None:
+    """Cache a fitted model (or drop the entry when fitting fell back to linear)."""
+    if state is None:
+        _hw_models.pop(key, None)
+        return
+    _hw_models[key] = state
+    _hw_models.move_to_end(key)
+    while len(_hw_models) > _HW_MODEL_CACHE_MAX:
+        _hw_models.popitem(last=False)
+
+
+def reset_forecast_models() -> None:
+    """Clear cached Holt-Winters models. Used in tests."""
+    _hw_models.clear()
+
+
+def _hw_season_length(values: list[float], timestamps: list[int]) -> int:
+    """Pick a Holt-Winters season length (24h of samples) that the data can support."""
+    if len(timestamps) >= 2:
+        avg_interval = (timestamps[-1] - timestamps[0]) / (len(timestamps) - 1)
+    else:
+        avg_interval = 300
+
+    # Use 24h as default season; fall back to 12 points minimum
+    season_length = max(12, int(86400 / avg_interval)) if avg_interval > 0 else 12
+
+    # Ensure we have enough data for the season length
+    if len(values) < 2 * season_length:
+        season_length = max(4, len(values) // 2)
+    return season_length
+
+
+def _can_reuse_hw_model(
+    state: HoltWintersState,
+    timestamps: list[int],
+    season_length: int,
+    optimize_params: bool,
+) -> bool:
+    """Check whether a cached model can be advanced over this window instead of refit.
+
+    The cached model must use the same season length, its window must reach back
+    to the start of this one, and its last observation must fall inside this
+    window so the points after it are exactly the new data.
+    """
+    if not state.window or state.last_timestamp is None:
+        return False
+    if state.season_length != season_length:
+        return False
+    if optimize_params and not state.optimized:
+        return False
+    return state.window[0][0] <= timestamps[0] <= state.last_timestamp <= timestamps[-1]
+
+
+def _forecast_holt_winters_incremental(
     values: list[float],
     timestamps: list[int],
     threshold: float,
     t0: int,
     x_hours: list[float],
-) -> dict:
-    """Perform Holt-Winters forecast.
+    state: HoltWintersState | None = None,
+    optimize_params: bool = False,
+) -> tuple[dict, HoltWintersState | None]:
+    """Perform a Holt-Winters forecast, advancing a cached model when possible.
 
     Args:
         values: Time series values.
@@ -330,39 +418,53 @@ def _forecast_holt_winters(
         threshold: Breach threshold.
         t0: First timestamp.
         x_hours: Hours relative to t0.
+        state: Model cached from a previous forecast of the same series.
+        optimize_params: Grid-search smoothing parameters when fitting afresh.
 
     Returns:
-        Forecast result dict.
+        Tuple of (forecast result dict, model to cache). The model is None when
+        Holt-Winters could not be fit and the linear fallback was used.
     """
-    # Determine season length from data interval
-    if len(timestamps) >= 2:
-        avg_interval = (timestamps[-1] - timestamps[0]) / (len(timestamps) - 1)
+    season_length = _hw_season_length(values, timestamps)
+
+    model: HoltWintersState
+    last_seen = state.last_timestamp if state is not None else None
+    if (
+        state is not None
+        and last_seen is not None
+        and _can_reuse_hw_model(state, timestamps, season_length, optimize_params)
+    ):
+        # Advance a copy: with the thread fallback, concurrent forecasts of
+        # the same series would otherwise share the cached model.
+        model = state.copy()
+        start = bisect.bisect_right(timestamps, last_seen)
+        new_points = len(values) - start
+        model.update(values[start:], timestamps[start:])
+        model.trim_window(timestamps[0])
+        reused = True
     else:
-        avg_interval = 300
-
-    # Use 24h as default season; fall back to 12 points minimum
-    season_length = max(12, int(86400 / avg_interval)) if avg_interval > 0 else 12
-
-    # Ensure we have enough data for the season length
-    if len(values) < 2 * season_length:
-        season_length = max(4, len(values) // 2)
-
-    try:
-        hw_result = holt_winters(
-            values,
-            season_length=season_length,
-            forecast_periods=24,
-        )
-    except ValueError:
-        # Fall back to linear if Holt-Winters fails
-        return _forecast_linear(values, timestamps, threshold, t0, x_hours)
-
-    fitted = hw_result["fitted"]
-    forecast_vals = hw_result["forecast"]
+        try:
+            params = (
+                holt_winters_grid_search(values, season_length)
+                if optimize_params
+                else HW_DEFAULT_PARAMS
+            )
+            model, _ = holt_winters_fit(values, season_length, timestamps, *params)
+        except ValueError:
+            # Fall back to linear if Holt-Winters fails
+            return _forecast_linear(values, timestamps, threshold, t0, x_hours), None
+        model.optimized = optimize_params
+        new_points = len(values)
+        reused = False
+
+    first_fit = model.window[0][1]
+    last_fit = model.window[-1][1]
+    window_len = len(model.window)
+    forecast_vals = [round(f, 6) for f in model.forecast(24)]
     current_value = values[-1]
 
     # Trend from last fitted values
-    recent_slope = (fitted[-1] - fitted[0]) / max(len(fitted) - 1, 1) if len(fitted) >= 2 else 0.0
+    recent_slope = (last_fit - first_fit) / max(window_len - 1, 1) if window_len >= 2 else 0.0
 
     if abs(recent_slope) < 1e-10:
         trend = "stable"
@@ -388,10 +490,10 @@ def _forecast_holt_winters(
             predicted_breach_epoch = int(last_ts + (i + 1) * interval)
             break
 
-    # Confidence interval from fitted vs actual
-    conf_interval = prediction_interval(values, fitted)
+    # Confidence interval from the running fitted-vs-actual error over the window
+    conf_interval = prediction_interval_from_sse(model.window_sse, window_len, last_fit)
 
-    return {
+    result = {
         "current_value": round(current_value, 4),
         "threshold": threshold,
         "trend": trend,
@@ -403,7 +505,16 @@ def _forecast_holt_winters(
         "season_length": season_length,
         "forecast_values": forecast_vals[:24],
         "confidence_interval": conf_interval,
+        "model": {
+            "reused": reused,
+            "new_points": new_points,
+            "alpha": model.alpha,
+            "beta": model.beta,
+            "gamma": model.gamma,
+            "optimized": model.optimized,
+        },
     }
+    return result, model
 
 
 async def detect_change_points(
@@ -448,7 +559,9 @@ async def detect_change_points(
             values = dp_data["values"]
             timestamps = dp_data["timestamps"]
 
-            raw_points = cusum(values, sensitivity=sensitivity)
+            raw_points = await run_cpu_bound(
+                cusum, values, sensitivity=sensitivity, size=len(values)
+            )
 
             # Map indices back to timestamps
             change_points = []
@@ -643,17 +756,19 @@ async def detect_seasonality(
             else:
                 avg_interval = 300  # Default 5-min
 
-            # Standard period lags in hours
+            # Standard period lags in hours; the sweep is O(n) per lag, so
+            # week-long high-resolution series run off the event loop.
             period_hours = [1, 4, 12, 24, 168]
-            correlations = {}
-
-            for ph in period_hours:
-                lag = int(ph * 3600 / avg_interval) if avg_interval > 0 else 0
-                # Skip lags where we have insufficient data
-                if lag < 1 or lag >= len(values) // 2:
-                    continue
-                ac = autocorrelation(values, lag=lag)
-                correlations[f"{ph}h"] = round(ac, 4)
+            lags = {
+                f"{ph}h": int(ph * 3600 / avg_interval) if avg_interval > 0 else 0
+                for ph in period_hours
+            }
+            correlations = await run_cpu_bound(
+                autocorrelation_sweep,
+                values,
+                lags,
+                size=len(values) * len(lags),
+            )
 
             # Find dominant period
             if correlations:
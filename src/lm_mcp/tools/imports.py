@@ -8,7 +8,12 @@ from typing import TYPE_CHECKING
 
 from mcp.types import TextContent
 
-from lm_mcp.tools import format_response, handle_error, require_write_permission
+from lm_mcp.tools import (
+    bounded_gather,
+    format_response,
+    handle_error,
+    require_write_permission,
+)
 
 
 def _ensure_dict(definition: dict | str) -> dict:
@@ -327,13 +332,18 @@ async def export_dashboard(
         List of TextContent with full Dashboard definition or error.
     """
     try:
-        dashboard = await client.get(f"/dashboard/dashboards/{dashboard_id}")
-
         if include_widgets:
-            widgets_result = await client.get(
-                f"/dashboard/dashboards/{dashboard_id}/widgets", params={"size": 1000}
+            dashboard, widgets_result = await bounded_gather(
+                [
+                    client.get(f"/dashboard/dashboards/{dashboard_id}"),
+                    client.get(
+                        f"/dashboard/dashboards/{dashboard_id}/widgets", params={"size": 1000}
+                    ),
+                ]
             )
             dashboard["widgets_full"] = widgets_result.get("items", [])
+        else:
+            dashboard = await client.get(f"/dashboard/dashboards/{dashboard_id}")
 
         return format_response(
             {
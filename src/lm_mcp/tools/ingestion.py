@@ -7,6 +7,8 @@ from typing import TYPE_CHECKING
 
 from mcp.types import TextContent
 
+from lm_mcp.log_pipeline import get_log_pipeline
+from lm_mcp.metric_batcher import get_metric_batcher
 from lm_mcp.tools import (
     format_response,
     handle_error,
@@ -17,16 +19,25 @@ from lm_mcp.tools import (
 if TYPE_CHECKING:
     from lm_mcp.client import LogicMonitorClient
 
+# Seconds a submission waits for room in a full log pipeline queue.
+LOG_SUBMIT_TIMEOUT = 30
+
+# Seconds a submission waits for room in a full metric batcher.
+METRIC_SUBMIT_TIMEOUT = 30
+
 
 @require_write_permission
 async def ingest_logs(
     client: LogicMonitorClient,
     logs: list[dict],
+    wait: bool = True,
 ) -> list[TextContent]:
     """Ingest log entries into LogicMonitor.
 
-    Sends log entries to the LogicMonitor log ingestion API. Each log entry
-    should contain a message and resource mapping information.
+    Queues log entries on the portal's log pipeline, which batches them
+    within the ingestion API's size limits, uploads batches concurrently,
+    and retries or spools failed batches. Each log entry should contain a
+    message and resource mapping information.
 
     Args:
         client: LogicMonitor API client with LMv1 authentication.
@@ -34,6 +45,8 @@ async def ingest_logs(
             - message: The log message text
             - _lm.resourceId: Resource mapping (e.g., {"system.hostname": "server1"})
             - Optional: timestamp (epoch ms), other metadata
+        wait: Wait for delivery and report per-entry outcomes (default True).
+            When False, return as soon as the entries are queued.
 
     Returns:
         List containing TextContent with ingestion result.
@@ -53,8 +66,15 @@ async def ingest_logs(
                 suggestion="Pass at least one log entry with message + _lm.resourceId.",
             )
 
-        result = await client.ingest_post("/rest/log/ingest", json_body=logs)
-        return format_response(result)
+        pipeline = get_log_pipeline(client)
+        submission = await pipeline.submit(logs, timeout=LOG_SUBMIT_TIMEOUT)
+        if not wait:
+            return format_response(
+                {"queued": True, **submission.to_dict(), "queue_depth": pipeline.pending}
+            )
+        await submission.wait()
+        outcome = submission.to_dict()
+        return format_response({"success": outcome["delivered"] == len(logs), **outcome})
     except Exception as e:
         return handle_error(e)
 
@@ -62,20 +82,27 @@ async def ingest_logs(
 @require_write_permission
 async def push_metrics(
     client: LogicMonitorClient,
-    metrics: dict,
+    metrics: dict | list[dict],
+    wait: bool = True,
 ) -> list[TextContent]:
     """Push custom metrics into LogicMonitor.
 
-    Sends metric data to the LogicMonitor v2 metric ingestion API.
-    Metrics are associated with resources and organized by datasource.
+    Sends metric data to the LogicMonitor v2 metric ingestion API through
+    the portal's metric batcher, which merges payloads for the same
+    resource and datasource into one request and uploads groups
+    concurrently. Metrics are associated with resources and organized by
+    datasource.
 
     Args:
         client: LogicMonitor API client with LMv1 authentication.
-        metrics: Metric payload containing:
+        metrics: Metric payload, or a list of payloads, each containing:
             - resourceIds: Resource mapping (e.g., {"system.hostname": "server1"})
             - dataSource: Name of the datasource for these metrics
             - dataSourceGroup: Optional datasource group name
             - instances: List of instance data with datapoints
+        wait: Send the payloads now, wait for delivery, and report per-payload
+            outcomes (default True). When False, return as soon as they are
+            buffered; they are sent with other pushes for the same source.
 
     Returns:
         List containing TextContent with ingestion result.
@@ -103,20 +130,29 @@ async def push_metrics(
                 suggestion="Provide resourceIds, dataSource, and instances at minimum.",
             )
 
-        if "resourceIds" not in metrics:
-            return validation_error(
-                "VALIDATION_ERROR",
-                "metrics.resourceIds is required",
-                suggestion='Add resourceIds, e.g. {"system.hostname": "server1"}.',
+        if isinstance(metrics, dict):
+            if "resourceIds" not in metrics:
+                return validation_error(
+                    "VALIDATION_ERROR",
+                    "metrics.resourceIds is required",
+                    suggestion='Add resourceIds, e.g. {"system.hostname": "server1"}.',
+                )
+            if "dataSource" not in metrics:
+                return validation_error(
+                    "VALIDATION_ERROR",
+                    "metrics.dataSource is required",
+                    suggestion="Add a dataSource name string.",
+                )
+            metrics = [metrics]
+
+        batcher = get_metric_batcher(client)
+        submission = await batcher.submit(metrics, timeout=METRIC_SUBMIT_TIMEOUT, flush=wait)
+        if not wait:
+            return format_response(
+                {"queued": True, **submission.to_dict(), "queue_depth": batcher.pending}
             )
-        if "dataSource" not in metrics:
-            return validation_error(
-                "VALIDATION_ERROR",
-                "metrics.dataSource is required",
-                suggestion="Add a dataSource name string.",
-            )
-
-        result = await client.ingest_post("/rest/metric/ingest?create=true", json_body=metrics)
-        return format_response(result)
+        await submission.wait()
+        outcome = submission.to_dict()
+        return format_response({"success": outcome["delivered"] == len(metrics), **outcome})
     except Exception as e:
         return handle_error(e)
@@ -3,13 +3,17 @@
 
 from __future__ import annotations
 
+import bisect
 import re
 import time
-from collections import defaultdict
+from collections import Counter, defaultdict, deque
+from collections.abc import AsyncIterator, Iterable
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 from mcp.types import TextContent
 
+from lm_mcp.alert_mirror import mirrored_alerts
 from lm_mcp.tools import (
     SEVERITY_MAP,
     format_response,
@@ -347,27 +351,24 @@ async def detect_alert_burst(
     try:
         now = int(time.time())
         start_epoch = now - (hours_back * 3600)
-        filters: list[str] = [f"startEpoch>:{start_epoch}"]
-        wildcards_stripped = False
-
-        if severity and severity.lower() in SEVERITY_MAP:
-            filters.append(f"severity:{SEVERITY_MAP[severity.lower()]}")
-        if group_id is not None:
-            filters.append(await resolve_group_filter(client, group_id))
-        if device:
-            clean_device, was_modified = sanitize_filter_value(device)
-            wildcards_stripped = wildcards_stripped or was_modified
-            filters.append(f"monitorObjectName~{quote_filter_value(clean_device)}")
-
-        alerts = await _paginate_alerts(client, ",".join(filters))
-        truncated = len(alerts) >= _MAX_ALERTS_PER_WINDOW
-
-        if datasource_pattern:
-            needle = datasource_pattern.lower()
-            alerts = [a for a in alerts if needle in (a.get("dataSourceName") or "").lower()]
+        filter_str, mirrored, wildcards_stripped = await _alert_window(
+            client, start_epoch, group_id, device, severity
+        )
 
-        alerts.sort(key=lambda a: int(a.get("startEpoch") or 0))
-        bursts = _detect_bursts_in_alerts(alerts, window_seconds, min_alerts, min_devices)
+        # Pages arrive oldest first and feed the detector as they land, so
+        # only the open window per DataSource is held in memory.
+        detector = BurstDetector(window_seconds, min_alerts, min_devices)
+        needle = datasource_pattern.lower() if datasource_pattern else None
+        pulled = 0
+        matched = 0
+        async for page in _iter_alert_pages(client, filter_str, "+startEpoch", mirrored):
+            pulled += len(page)
+            if needle:
+                page = [a for a in page if needle in (a.get("dataSourceName") or "").lower()]
+            matched += len(page)
+            detector.feed(page)
+        truncated = pulled >= _MAX_ALERTS_PER_WINDOW
+        bursts = detector.finish()
 
         response: dict = {
             "params": {
@@ -380,10 +381,12 @@ async def detect_alert_burst(
                 "hours_back": hours_back,
                 "severity": severity,
             },
-            "total_alerts_in_window": len(alerts),
+            "total_alerts_in_window": matched,
             "bursts_detected": len(bursts),
             "bursts": bursts,
         }
+        if detector.out_of_order:
+            response["out_of_order_alerts"] = detector.out_of_order
         if truncated:
             response["warning"] = (
                 f"Truncated at {_MAX_ALERTS_PER_WINDOW} alerts. "
@@ -399,63 +402,150 @@ async def detect_alert_burst(
         return handle_error(e)
 
 
-def _detect_bursts_in_alerts(
-    alerts: list[dict],
-    window_seconds: int,
-    min_alerts: int,
-    min_devices: int,
-) -> list[dict]:
-    """Identify burst windows using per-DataSource sliding window analysis."""
-    by_datasource: dict[str, list[dict]] = defaultdict(list)
-    for alert in alerts:
-        ds_name = alert.get("dataSourceName") or "unknown"
-        by_datasource[ds_name].append(alert)
-
-    bursts: list[dict] = []
-    for ds_name, ds_alerts in by_datasource.items():
-        ds_alerts.sort(key=lambda a: int(a.get("startEpoch") or 0))
-        n = len(ds_alerts)
-        if n < min_alerts:
-            continue
-
-        i = 0
-        while i < n:
-            window_end = int(ds_alerts[i].get("startEpoch") or 0) + window_seconds
-            j = i
-            window_alerts: list[dict] = []
-            while j < n and int(ds_alerts[j].get("startEpoch") or 0) <= window_end:
-                window_alerts.append(ds_alerts[j])
-                j += 1
-
-            distinct_devices = {a.get("monitorObjectName") for a in window_alerts}
-            distinct_devices.discard(None)
-
-            if len(window_alerts) >= min_alerts and len(distinct_devices) >= min_devices:
-                device_counts: dict[str, int] = defaultdict(int)
-                for a in window_alerts:
-                    name = a.get("monitorObjectName") or "unknown"
-                    device_counts[name] += 1
-                top_devices = sorted(device_counts.items(), key=lambda x: x[1], reverse=True)[:10]
-
-                bursts.append(
-                    {
-                        "datasource": ds_name,
-                        "window_start": int(ds_alerts[i].get("startEpoch") or 0),
-                        "window_end": window_end,
-                        "alert_count": len(window_alerts),
-                        "device_count": len(distinct_devices),
-                        "alert_ids": [a.get("id") for a in window_alerts[:50]],
-                        "top_devices": [
-                            {"device": name, "count": count} for name, count in top_devices
-                        ],
-                    }
-                )
-                # Jump past this burst window to avoid overlapping duplicates.
-                i = j
+@dataclass
+class _OpenBurst:
+    """Running totals for a burst that is still being extended."""
+
+    start: int
+    end: int = 0
+    count: int = 0
+    devices: Counter = field(default_factory=Counter)
+    alert_ids: list = field(default_factory=list)
+
+    def add(self, alert_id: object, device: str | None) -> None:
+        self.count += 1
+        self.devices[device] += 1
+        if len(self.alert_ids) < 50:
+            self.alert_ids.append(alert_id)
+
+
+@dataclass
+class _DataSourceWindow:
+    """Two-pointer sliding window over one DataSource's alerts.
+
+    ``events`` holds every alert between the anchor (oldest) and the newest
+    alert, all within ``window_seconds`` of the anchor; ``devices`` counts
+    them per device. Each alert enters and leaves the window once, so a
+    stream of n alerts costs O(n) however dense the storm.
+    """
+
+    events: deque[tuple[int, object, str | None]] = field(default_factory=deque)
+    devices: Counter = field(default_factory=Counter)
+    burst: _OpenBurst | None = None
+
+    def distinct_devices(self) -> int:
+        return len(self.devices) - (1 if None in self.devices else 0)
+
+    def pop_anchor(self) -> tuple[int, object, str | None]:
+        event = self.events.popleft()
+        device = event[2]
+        self.devices[device] -= 1
+        if not self.devices[device]:
+            del self.devices[device]
+        return event
+
+
+class BurstDetector:
+    """Streaming, linear-time detector for per-DataSource alert bursts.
+
+    Alerts are fed in start-time order (page by page is fine). For each
+    DataSource a window anchored at the oldest unprocessed alert spans
+    ``window_seconds``; once a newer alert falls outside it, the window is
+    final and is checked against ``min_alerts`` and ``min_devices``.
+    Consecutive qualifying windows merge into one maximal burst, and alerts
+    in an emitted burst are never reused, so bursts do not overlap.
+
+    An alert older than its DataSource's current anchor cannot be placed
+    without revisiting closed windows; it is skipped and counted in
+    ``out_of_order``.
+    """
+
+    def __init__(self, window_seconds: int, min_alerts: int, min_devices: int) -> None:
+        self.window_seconds = window_seconds
+        self.min_alerts = min_alerts
+        self.min_devices = min_devices
+        self.out_of_order = 0
+        self._windows: dict[str, _DataSourceWindow] = {}
+        self._bursts: list[dict] = []
+
+    def feed(self, alerts: Iterable[dict]) -> None:
+        """Add a batch of alerts, closing any windows they move past."""
+        for alert in alerts:
+            ds_name = alert.get("dataSourceName") or "unknown"
+            window = self._windows.get(ds_name)
+            if window is None:
+                window = self._windows[ds_name] = _DataSourceWindow()
+            event = (
+                int(alert.get("startEpoch") or 0),
+                alert.get("id"),
+                alert.get("monitorObjectName"),
+            )
+            while window.events and event[0] > window.events[0][0] + self.window_seconds:
+                self._advance(ds_name, window)
+            if window.events and event[0] < window.events[-1][0]:
+                if event[0] < window.events[0][0]:
+                    self.out_of_order += 1
+                    continue
+                # Slightly late, but still inside the open window.
+                pos = bisect.bisect_right(window.events, event[0], key=_epoch)
+                window.events.insert(pos, event)
             else:
-                i += 1
-    bursts.sort(key=lambda b: b["window_start"])
-    return bursts
+                window.events.append(event)
+            window.devices[event[2]] += 1
+
+    def finish(self) -> list[dict]:
+        """Close every open window and return all bursts ordered by start time."""
+        for ds_name, window in self._windows.items():
+            while window.events:
+                self._advance(ds_name, window)
+            self._close_burst(ds_name, window)
+        self._windows.clear()
+        self._bursts.sort(key=lambda b: b["window_start"])
+        return self._bursts
+
+    def _advance(self, ds_name: str, window: _DataSourceWindow) -> None:
+        """Evaluate the final window at the anchor and move the anchor forward."""
+        anchor = window.events[0][0]
+        if len(window.events) >= self.min_alerts and window.distinct_devices() >= self.min_devices:
+            if window.burst is None:
+                window.burst = _OpenBurst(anchor)
+            window.burst.end = anchor + self.window_seconds
+            _, alert_id, device = window.pop_anchor()
+            window.burst.add(alert_id, device)
+        elif window.burst is not None:
+            # The burst covers everything up to the last qualifying window's end.
+            self._close_burst(ds_name, window)
+        else:
+            window.pop_anchor()
+
+    def _close_burst(self, ds_name: str, window: _DataSourceWindow) -> None:
+        burst = window.burst
+        if burst is None:
+            return
+        while window.events and window.events[0][0] <= burst.end:
+            _, alert_id, device = window.pop_anchor()
+            burst.add(alert_id, device)
+        window.burst = None
+        top_devices = sorted(
+            ((name or "unknown", count) for name, count in burst.devices.items()),
+            key=lambda x: x[1],
+            reverse=True,
+        )[:10]
+        self._bursts.append(
+            {
+                "datasource": ds_name,
+                "window_start": burst.start,
+                "window_end": burst.end,
+                "alert_count": burst.count,
+                "device_count": len(burst.devices) - (1 if None in burst.devices else 0),
+                "alert_ids": burst.alert_ids,
+                "top_devices": [{"device": name, "count": count} for name, count in top_devices],
+            }
+        )
+
+
+def _epoch(event: tuple[int, object, str | None]) -> int:
+    return event[0]
 
 
 async def get_link_flaps(
@@ -487,17 +577,10 @@ async def get_link_flaps(
     try:
         now = int(time.time())
         start_epoch = now - (hours_back * 3600)
-        filters: list[str] = [f"startEpoch>:{start_epoch}"]
-        wildcards_stripped = False
-
-        if group_id is not None:
-            filters.append(await resolve_group_filter(client, group_id))
-        if device:
-            clean_device, was_modified = sanitize_filter_value(device)
-            wildcards_stripped = wildcards_stripped or was_modified
-            filters.append(f"monitorObjectName~{quote_filter_value(clean_device)}")
-
-        alerts = await _paginate_alerts(client, ",".join(filters))
+        filter_str, mirrored, wildcards_stripped = await _alert_window(
+            client, start_epoch, group_id, device
+        )
+        alerts = await _paginate_alerts(client, filter_str, mirrored)
 
         pattern_re = re.compile(interface_pattern, re.IGNORECASE)
         interface_alerts = [a for a in alerts if pattern_re.search(a.get("dataSourceName") or "")]
@@ -578,19 +661,10 @@ async def get_power_events(
     try:
         now = int(time.time())
         start_epoch = now - (hours_back * 3600)
-        filters: list[str] = [f"startEpoch>:{start_epoch}"]
-        wildcards_stripped = False
-
-        if severity and severity.lower() in SEVERITY_MAP:
-            filters.append(f"severity:{SEVERITY_MAP[severity.lower()]}")
-        if group_id is not None:
-            filters.append(await resolve_group_filter(client, group_id))
-        if device:
-            clean_device, was_modified = sanitize_filter_value(device)
-            wildcards_stripped = wildcards_stripped or was_modified
-            filters.append(f"monitorObjectName~{quote_filter_value(clean_device)}")
-
-        alerts = await _paginate_alerts(client, ",".join(filters))
+        filter_str, mirrored, wildcards_stripped = await _alert_window(
+            client, start_epoch, group_id, device, severity
+        )
+        alerts = await _paginate_alerts(client, filter_str, mirrored)
 
         active_patterns = patterns or list(_DEFAULT_POWER_PATTERNS)
         lower_patterns = [p.lower() for p in active_patterns]
@@ -638,26 +712,91 @@ async def get_power_events(
         return handle_error(e)
 
 
-async def _paginate_alerts(
+async def _alert_window(
+    client: LogicMonitorClient,
+    start_epoch: int,
+    group_id: int | None = None,
+    device: str | None = None,
+    severity: str | None = None,
+) -> tuple[str, list[dict] | None, bool]:
+    """Resolve the alert scope for a burst, flap, or power-event window.
+
+    The alert mirror answers the window when it is fresh and covers
+    ``start_epoch``; its alerts are restricted to active ones, matching what
+    the unfiltered API query returns. Otherwise the API filter string is built.
+
+    Returns:
+        Tuple of (API filter string, mirrored alerts oldest first or None,
+        whether wildcards were stripped from ``device``).
+    """
+    sev = SEVERITY_MAP.get(severity.lower()) if severity else None
+    clean_device, wildcards_stripped = sanitize_filter_value(device) if device else ("", False)
+
+    mirrored = await mirrored_alerts(
+        client,
+        start_epoch,
+        group_id=group_id,
+        device=clean_device or None,
+        severity=sev,
+        cleared=False,
+    )
+    if mirrored is not None:
+        return "", mirrored, wildcards_stripped
+
+    filters: list[str] = [f"startEpoch>:{start_epoch}"]
+    if sev is not None:
+        filters.append(f"severity:{sev}")
+    if group_id is not None:
+        filters.append(await resolve_group_filter(client, group_id))
+    if clean_device:
+        filters.append(f"monitorObjectName~{quote_filter_value(clean_device)}")
+    return ",".join(filters), None, wildcards_stripped
+
+
+async def _iter_alert_pages(
     client: LogicMonitorClient,
     filter_str: str,
-) -> list[dict]:
-    """Pull alerts across pages up to the analysis cap."""
-    collected: list[dict] = []
+    sort: str | None = None,
+    mirrored: list[dict] | None = None,
+) -> AsyncIterator[list[dict]]:
+    """Yield pages of alerts matching ``filter_str`` up to the analysis cap.
+
+    When ``mirrored`` holds the window's alerts from the alert mirror (oldest
+    first), they are yielded in page-sized slices instead of querying the API.
+    """
+    if mirrored is not None:
+        capped = mirrored[:_MAX_ALERTS_PER_WINDOW]
+        for start in range(0, len(capped), _ALERTS_PAGE_SIZE):
+            yield capped[start : start + _ALERTS_PAGE_SIZE]
+        return
+
     offset = 0
-    while len(collected) < _MAX_ALERTS_PER_WINDOW:
+    while offset < _MAX_ALERTS_PER_WINDOW:
         params: dict = {
             "size": _ALERTS_PAGE_SIZE,
             "offset": offset,
             "filter": filter_str,
         }
+        if sort:
+            params["sort"] = sort
         result = await client.get("/alert/alerts", params=params)
         items = result.get("items", [])
         if not items:
             break
-        collected.extend(items)
+        yield items[: _MAX_ALERTS_PER_WINDOW - offset]
         total = safe_total(result)
         if offset + len(items) >= total:
             break
         offset += len(items)
-    return collected[:_MAX_ALERTS_PER_WINDOW]
+
+
+async def _paginate_alerts(
+    client: LogicMonitorClient,
+    filter_str: str,
+    mirrored: list[dict] | None = None,
+) -> list[dict]:
+    """Pull alerts across pages (or from the mirror) up to the analysis cap."""
+    collected: list[dict] = []
+    async for page in _iter_alert_pages(client, filter_str, mirrored=mirrored):
+        collected.extend(page)
+    return collected
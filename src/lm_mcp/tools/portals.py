@@ -4,17 +4,31 @@
 # portal registry (age vault); no token is ever returned by these tools.
 from __future__ import annotations
 
+import asyncio
+import inspect
+from typing import Any
+
 from mcp.types import TextContent
 
-from lm_mcp import portals
-from lm_mcp.tools import format_response, handle_error
+from lm_mcp import portals as portal_registry
+from lm_mcp.tools import bounded_gather, call_sub_tool, format_response, handle_error
+
+# Portals queried at once by one run_across_portals call, and tool calls in
+# flight per portal across concurrent fan-outs, so a single portal's API rate
+# limit is never hit by the fan-out alone.
+FANOUT_MAX_CONCURRENCY = 16
+FANOUT_PER_PORTAL_CONCURRENCY = 2
+
+_portal_slots: dict[str, asyncio.Semaphore] = {}
 
 
 async def list_portals() -> list[TextContent]:
     """List the customer portals available in this multi-portal server."""
     try:
-        rows = portals.names()
-        return format_response({"count": len(rows), "portals": rows})
+        rows = portal_registry.names()
+        return format_response(
+            {"count": len(rows), "portals": rows, "client_pool": portal_registry.pool_stats()}
+        )
     except Exception as e:
         return handle_error(e)
 
@@ -22,7 +36,7 @@ async def list_portals() -> list[TextContent]:
 async def use_portal(customer: str) -> list[TextContent]:
     """Switch the active customer portal for subsequent tool calls."""
     try:
-        return format_response(portals.activate(customer))
+        return format_response(portal_registry.activate(customer))
     except (ValueError, RuntimeError) as e:
         return format_response({"error": True, "message": str(e)})
     except Exception as e:
@@ -32,7 +46,7 @@ async def use_portal(customer: str) -> list[TextContent]:
 async def current_portal() -> list[TextContent]:
     """Show which customer portal is currently active."""
     try:
-        return format_response(portals.active())
+        return format_response(portal_registry.active())
     except Exception as e:
         return handle_error(e)
 
@@ -40,7 +54,101 @@ async def current_portal() -> list[TextContent]:
 async def reload_portals() -> list[TextContent]:
     """Re-read the vault so portals added/removed since startup take effect (no restart)."""
     try:
-        return format_response(await portals.reload())
+        return format_response(await portal_registry.reload())
+    except (ValueError, RuntimeError) as e:
+        return format_response({"error": True, "message": str(e)})
+    except Exception as e:
+        return handle_error(e)
+
+
+def _portal_slot(name: str) -> asyncio.Semaphore:
+    slot = _portal_slots.get(name)
+    if slot is None:
+        slot = _portal_slots[name] = asyncio.Semaphore(FANOUT_PER_PORTAL_CONCURRENCY)
+    return slot
+
+
+def _fanout_handler(tool: str) -> Any:
+    """Resolve the handler for a tool that may run across portals.
+
+    Raises:
+        ValueError: If the tool is unknown, not a read-only LogicMonitor data
+            tool, or blocked by the tool filters.
+    """
+    from lm_mcp.logging import is_write_tool
+    from lm_mcp.registry import TOOLS, get_tool_handler
+    from lm_mcp.server import CLIENT_OPTIONAL_TOOLS, PORTAL_TOOLS, SESSION_TOOLS
+    from lm_mcp.tools.workflows import check_required_tools
+
+    if tool not in {t.name for t in TOOLS}:
+        raise ValueError(f"Unknown LogicMonitor tool: {tool}")
+    if tool in PORTAL_TOOLS or tool in SESSION_TOOLS or tool in CLIENT_OPTIONAL_TOOLS:
+        raise ValueError(f"'{tool}' does not read portal data and cannot run across portals")
+    if is_write_tool(tool):
+        raise ValueError(f"'{tool}' is a write tool; only read tools can run across portals")
+    if check_required_tools([tool]):
+        raise ValueError(f"Tool '{tool}' is disabled by the server's tool filters")
+    return get_tool_handler(tool)
+
+
+async def run_across_portals(
+    tool: str,
+    arguments: dict | None = None,
+    portals: list[str] | None = None,
+) -> list[TextContent]:
+    """Run one read-only tool against many customer portals concurrently.
+
+    Each portal's call runs under that portal's own binding and cached client,
+    so links and portal lookups in its result name that portal, and the
+    caller's active portal is left unchanged. A portal that fails (unknown
+    name, bad credentials, API error) is reported under ``errors`` without
+    affecting the others.
+
+    Args:
+        tool: Name of a read-only LogicMonitor tool, e.g. get_collectors.
+        arguments: Arguments passed to the tool on every portal.
+        portals: Portal keys from list_portals (default: every portal).
+
+    Returns:
+        Per-portal results and errors as TextContent list.
+    """
+    arguments = arguments or {}
+    try:
+        portal_registry.load()
+        handler = _fanout_handler(tool)
+        try:
+            inspect.signature(handler).bind(None, **arguments)
+        except TypeError as e:
+            raise ValueError(f"Invalid arguments for {tool}: {e}") from None
+
+        names = portals or [row["name"] for row in portal_registry.names()]
+        names = list(dict.fromkeys(names))
+
+        async def _one(name: str) -> tuple[str, Any, str | None]:
+            try:
+                async with _portal_slot(name), portal_registry.lease(name) as client:
+                    binding = portal_registry.PortalBinding(
+                        name, client, portal_registry.is_writable(name)
+                    )
+                    with portal_registry.bind_session(binding):
+                        return name, await call_sub_tool(handler, client, **arguments), None
+            except Exception as exc:
+                return name, None, str(exc) or type(exc).__name__
+
+        outcomes = await bounded_gather([_one(n) for n in names], limit=FANOUT_MAX_CONCURRENCY)
+
+        results = {name: data for name, data, err in outcomes if err is None}
+        errors = {name: err for name, _, err in outcomes if err is not None}
+        return format_response(
+            {
+                "tool": tool,
+                "portal_count": len(names),
+                "succeeded": len(results),
+                "failed": len(errors),
+                "results": results,
+                "errors": errors,
+            }
+        )
     except (ValueError, RuntimeError) as e:
         return format_response({"error": True, "message": str(e)})
     except Exception as e:
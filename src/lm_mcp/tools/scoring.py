@@ -3,21 +3,27 @@
 
 from __future__ import annotations
 
+import heapq
 import math
 import time
 from collections import defaultdict
+from collections.abc import Awaitable, Iterable
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
 from mcp.types import TextContent
 
+from lm_mcp.alert_mirror import mirrored_alerts
 from lm_mcp.exceptions import LMError
 from lm_mcp.tools import (
     SEVERITY_MAP,
+    bounded_gather,
     call_sub_tool,
     format_response,
     handle_error,
     quote_filter_value,
     resolve_group_filter,
+    safe_total,
     sanitize_filter_value,
 )
 from lm_mcp.tools.stats_helpers import (
@@ -54,21 +60,25 @@ async def score_alert_noise(
         now_epoch = int(time.time())
         start_epoch = now_epoch - (hours_back * 3600)
 
-        # Fetch all alerts (active + cleared) in the time window
-        filters = [f"startEpoch>:{start_epoch}"]
-        if device:
-            clean_val, _ = sanitize_filter_value(device)
-            filters.append(f"monitorObjectName~{quote_filter_value(clean_val)}")
-        if group_id is not None:
-            filters.append(await resolve_group_filter(client, group_id))
-
-        params: dict[str, Any] = {
-            "size": 1000,
-            "filter": ",".join(filters),
-        }
+        # Fetch alerts in the time window (active only, as the API query returns)
+        alerts = await mirrored_alerts(
+            client, start_epoch, group_id=group_id, device=device, limit=1000
+        )
+        if alerts is None:
+            filters = [f"startEpoch>:{start_epoch}"]
+            if device:
+                clean_val, _ = sanitize_filter_value(device)
+                filters.append(f"monitorObjectName~{quote_filter_value(clean_val)}")
+            if group_id is not None:
+                filters.append(await resolve_group_filter(client, group_id))
+
+            params: dict[str, Any] = {
+                "size": 1000,
+                "filter": ",".join(filters),
+            }
 
-        result = await client.get("/alert/alerts", params=params)
-        alerts = result.get("items", [])
+            result = await client.get("/alert/alerts", params=params)
+            alerts = result.get("items", [])
 
         if not alerts:
             return format_response(
@@ -207,6 +217,8 @@ async def calculate_availability(
     group_id: int | None = None,
     hours_back: int = 720,
     severity_threshold: str = "error",
+    fleet: bool = False,
+    top_n: int = 10,
 ) -> list[TextContent]:
     """Calculate availability percentage from alert history.
 
@@ -214,6 +226,10 @@ async def calculate_availability(
     computes downtime windows, merges overlapping incidents, and calculates
     SLA-style availability metrics.
 
+    With ``fleet=True`` (requires ``group_id``) every qualifying alert for the
+    group is streamed page by page and swept once, giving per-device and
+    group-wide availability plus a top-offender ranking for the whole group.
+
     Args:
         client: LogicMonitor API client.
         device_id: Optional device ID filter.
@@ -222,6 +238,8 @@ async def calculate_availability(
         hours_back: Hours to look back (default: 720 = 30 days).
         severity_threshold: Minimum severity to count as downtime
             (critical, error, warning, info). Default: error.
+        fleet: Group-wide SLA report over all alerts for ``group_id``.
+        top_n: Number of worst devices to list in fleet mode (default: 10).
 
     Returns:
         Availability percentage, downtime, MTTR, and per-device breakdown.
@@ -233,25 +251,56 @@ async def calculate_availability(
 
         # Build filter for alerts at or above severity threshold
         min_severity = SEVERITY_MAP.get(severity_threshold.lower(), 3)
-        filters = [f"startEpoch>:{start_epoch}"]
-
-        if min_severity < 4:
-            filters.append(f"severity>:{min_severity}")
-        else:
-            filters.append(f"severity:{min_severity}")
 
-        if device_id is not None:
-            filters.append(f"monitorObjectId:{device_id}")
-        if group_id is not None:
-            filters.append(await resolve_group_filter(client, group_id))
-
-        params: dict[str, Any] = {
-            "size": 1000,
-            "filter": ",".join(filters),
-        }
+        if fleet:
+            if group_id is None:
+                return format_response(
+                    {
+                        "error": True,
+                        "message": "fleet mode requires group_id.",
+                        "suggestion": "Pass the device group to report on as group_id.",
+                    }
+                )
+            return format_response(
+                await _fleet_availability(
+                    client,
+                    group_id,
+                    start_epoch,
+                    now_epoch,
+                    min_severity,
+                    top_n,
+                    hours_back,
+                    severity_threshold,
+                )
+            )
+        alerts = await mirrored_alerts(
+            client,
+            start_epoch,
+            group_id=group_id,
+            device_id=device_id,
+            min_severity=min_severity,
+            limit=1000,
+        )
+        if alerts is None:
+            filters = [f"startEpoch>:{start_epoch}"]
+
+            if min_severity < 4:
+                filters.append(f"severity>:{min_severity}")
+            else:
+                filters.append(f"severity:{min_severity}")
+
+            if device_id is not None:
+                filters.append(f"monitorObjectId:{device_id}")
+            if group_id is not None:
+                filters.append(await resolve_group_filter(client, group_id))
+
+            params: dict[str, Any] = {
+                "size": 1000,
+                "filter": ",".join(filters),
+            }
 
-        result = await client.get("/alert/alerts", params=params)
-        alerts = result.get("items", [])
+            result = await client.get("/alert/alerts", params=params)
+            alerts = result.get("items", [])
 
         # Post-filter: ensure alerts match the requested device. A failed
         # device lookup must propagate -- otherwise the function would
@@ -383,6 +432,245 @@ async def calculate_availability(
         return handle_error(e)
 
 
+# Fleet availability: page size and page cap for the alert stream and the
+# device listing (50 pages of 1000 = 50k alerts per report).
+_FLEET_PAGE_SIZE = 1000
+_FLEET_MAX_PAGES = 50
+
+
+@dataclass
+class _DeviceDowntime:
+    """Downtime totals for one device during a fleet sweep."""
+
+    name: str
+    open_alerts: int = 0
+    down_since: int = 0
+    downtime: int = 0
+    incidents: int = 0
+    longest: int = 0
+
+
+class FleetDowntimeSweep:
+    """Single sweep-line pass over alert intervals for many devices.
+
+    Alerts are fed in start-time order; end times wait in a min-heap and are
+    applied once the sweep passes them. Each device counts its open alerts:
+    it goes down when the count leaves zero and comes back up when it returns
+    to zero, so overlapping alerts merge into one incident without sorting
+    any per-device interval list. The group is down while any device is.
+    Intervals that touch (an alert starting exactly when another ends) merge,
+    matching ``_merge_intervals``. An alert that arrives after the sweep has
+    passed its start is counted from the sweep position and tallied in
+    ``out_of_order``.
+    """
+
+    def __init__(self, window_start: int, window_end: int) -> None:
+        self.window_start = window_start
+        self.window_end = window_end
+        self.devices: dict[Any, _DeviceDowntime] = {}
+        self.alerts = 0
+        self.out_of_order = 0
+        self.devices_down = 0
+        self.peak_devices_down = 0
+        self.group_downtime = 0
+        self._group_down_since = 0
+        self._ends: list[tuple[int, int, _DeviceDowntime]] = []
+        self._last_start = window_start
+
+    def device(self, key: Any, name: str) -> _DeviceDowntime:
+        """Return (creating if needed) the totals for a device."""
+        entry = self.devices.get(key)
+        if entry is None:
+            entry = self.devices[key] = _DeviceDowntime(name)
+        return entry
+
+    def feed(self, alerts: Iterable[dict]) -> None:
+        """Add a batch of alerts ordered by startEpoch."""
+        for alert in alerts:
+            start = max(int(alert.get("startEpoch") or 0), self.window_start)
+            end = int(alert.get("endEpoch") or 0) or self.window_end  # 0 = still active
+            end = min(end, self.window_end)
+            if start >= end:
+                continue
+            if start < self._last_start:
+                # Already swept past this start; count it from the sweep position.
+                self.out_of_order += 1
+                start = self._last_start
+                if start >= end:
+                    continue
+            self._last_start = start
+            self._close_until(start)
+
+            name = alert.get("monitorObjectName") or "unknown"
+            dev = self.device(alert.get("monitorObjectId") or name, name)
+            self.alerts += 1
+            if dev.open_alerts == 0:
+                dev.down_since = start
+                if self.devices_down == 0:
+                    self._group_down_since = start
+                self.devices_down += 1
+                self.peak_devices_down = max(self.peak_devices_down, self.devices_down)
+            dev.open_alerts += 1
+            heapq.heappush(self._ends, (end, id(dev), dev))
+
+    def finish(self) -> None:
+        """Apply every outstanding end time."""
+        self._close_until(None)
+
+    def _close_until(self, time_point: int | None) -> None:
+        """Apply end times strictly before ``time_point`` (all when None)."""
+        ends = self._ends
+        while ends and (time_point is None or ends[0][0] < time_point):
+            end, _, dev = heapq.heappop(ends)
+            dev.open_alerts -= 1
+            if dev.open_alerts:
+                continue
+            duration = end - dev.down_since
+            dev.downtime += duration
+            dev.incidents += 1
+            dev.longest = max(dev.longest, duration)
+            self.devices_down -= 1
+            if self.devices_down == 0:
+                self.group_downtime += end - self._group_down_since
+
+
+async def _fleet_availability(
+    client: LogicMonitorClient,
+    group_id: int,
+    start_epoch: int,
+    now_epoch: int,
+    min_severity: int,
+    top_n: int,
+    hours_back: int,
+    severity_threshold: str,
+) -> dict:
+    """Stream a group's alerts through one sweep and summarize fleet availability."""
+    group_filter = await resolve_group_filter(client, group_id)
+    severity_filter = (
+        f"severity>:{min_severity}" if min_severity < 4 else f"severity:{min_severity}"
+    )
+    alert_filter = f"startEpoch>:{start_epoch},{severity_filter},{group_filter}"
+
+    # Device listing runs alongside the first alert page; it sets the
+    # denominator so devices with no downtime count as fully available.
+    lookups: list[Awaitable[Any]] = [
+        client.get(
+            "/alert/alerts",
+            params={
+                "size": _FLEET_PAGE_SIZE,
+                "offset": 0,
+                "filter": alert_filter,
+                "sort": "+startEpoch",
+            },
+        ),
+        _list_group_devices(client, group_id),
+    ]
+    results = await bounded_gather(lookups)
+    first_page: dict = results[0]
+    devices: list[dict] = results[1]
+
+    sweep = FleetDowntimeSweep(start_epoch, now_epoch)
+    for device in devices:
+        sweep.device(device.get("id"), device.get("displayName") or str(device.get("id")))
+
+    page = first_page
+    offset = 0
+    truncated = False
+    while True:
+        items = page.get("items", [])
+        sweep.feed(items)
+        offset += len(items)
+        if not items or len(items) < _FLEET_PAGE_SIZE or offset >= safe_total(page):
+            break
+        if offset >= _FLEET_PAGE_SIZE * _FLEET_MAX_PAGES:
+            truncated = True
+            break
+        page = await client.get(
+            "/alert/alerts",
+            params={
+                "size": _FLEET_PAGE_SIZE,
+                "offset": offset,
+                "filter": alert_filter,
+                "sort": "+startEpoch",
+            },
+        )
+    sweep.finish()
+
+    window_seconds = max(now_epoch - start_epoch, 1)
+    device_count = len(sweep.devices)
+    total_downtime = sum(d.downtime for d in sweep.devices.values())
+    device_seconds = window_seconds * device_count
+    incident_count = sum(d.incidents for d in sweep.devices.values())
+    down_devices = [d for d in sweep.devices.values() if d.downtime]
+    offenders = heapq.nlargest(top_n, down_devices, key=lambda d: d.downtime)
+
+    result: dict[str, Any] = {
+        "mode": "fleet",
+        "group_id": group_id,
+        "device_count": device_count,
+        "devices_with_downtime": len(down_devices),
+        # Mean per-device availability (device-minutes up / device-minutes total)
+        "availability_percent": round(
+            (1.0 - total_downtime / device_seconds) * 100 if device_seconds else 100.0,
+            4,
+        ),
+        # Share of the window with every device in the group up
+        "group_availability_percent": round(
+            max(0.0, (1.0 - sweep.group_downtime / window_seconds) * 100), 4
+        ),
+        "total_downtime_minutes": round(total_downtime / 60.0, 2),
+        "mttr_minutes": round(total_downtime / incident_count / 60.0, 2) if incident_count else 0,
+        "incident_count": incident_count,
+        "longest_incident_minutes": round(
+            max((d.longest for d in down_devices), default=0) / 60.0, 2
+        ),
+        "peak_devices_down": sweep.peak_devices_down,
+        "alerts_analyzed": sweep.alerts,
+        "top_offenders": [
+            {
+                "device": d.name,
+                "availability_percent": round(
+                    max(0.0, (1.0 - d.downtime / window_seconds) * 100), 4
+                ),
+                "downtime_minutes": round(d.downtime / 60.0, 2),
+                "incident_count": d.incidents,
+                "mttr_minutes": round(d.downtime / d.incidents / 60.0, 2),
+                "longest_incident_minutes": round(d.longest / 60.0, 2),
+            }
+            for d in offenders
+        ],
+        "hours_back": hours_back,
+        "severity_threshold": severity_threshold,
+    }
+    if sweep.out_of_order:
+        result["out_of_order_alerts"] = sweep.out_of_order
+    if truncated:
+        result["warning"] = (
+            f"Stopped after {offset} alerts. Narrow hours_back or the group for a complete report."
+        )
+    return result
+
+
+async def _list_group_devices(client: LogicMonitorClient, group_id: int) -> list[dict]:
+    """List every device in a group, across pages."""
+    devices: list[dict] = []
+    for page in range(_FLEET_MAX_PAGES):
+        result = await client.get(
+            "/device/devices",
+            params={
+                "filter": f"hostGroupIds~{group_id}",
+                "fields": "id,displayName",
+                "size": _FLEET_PAGE_SIZE,
+                "offset": page * _FLEET_PAGE_SIZE,
+            },
+        )
+        items = result.get("items", [])
+        devices.extend(items)
+        if len(items) < _FLEET_PAGE_SIZE or len(devices) >= safe_total(result):
+            break
+    return devices
+
+
 def _merge_intervals(
     intervals: list[tuple[int, int]],
 ) -> list[tuple[int, int]]:
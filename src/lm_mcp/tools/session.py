@@ -180,7 +180,7 @@ async def list_session_history(
         # Clamp limit
         limit = max(1, min(limit, 50))
 
-        history = session.history[-limit:]
+        history = list(session.history)[-limit:]
         entries = [
             {
                 "tool": entry.tool_name,
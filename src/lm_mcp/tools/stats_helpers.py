@@ -3,8 +3,15 @@
 
 from __future__ import annotations
 
+import bisect
+import heapq
 import math
+import operator
+import statistics
 import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field, replace
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -111,6 +118,331 @@ def autocorrelation(values: list[float], lag: int) -> float:
     return cov / variance
 
 
+def autocorrelation_sweep(values: list[float], lags: dict[str, int]) -> dict[str, float]:
+    """Compute autocorrelation at several labelled lags in one call.
+
+    Lags that are non-positive or leave fewer than two full periods of data
+    are skipped, so callers can pass every candidate period unfiltered.
+
+    Args:
+        values: Time series values.
+        lags: Mapping of label (e.g. "24h") to lag in samples.
+
+    Returns:
+        Mapping of label to autocorrelation rounded to 4 places, in input order.
+    """
+    correlations: dict[str, float] = {}
+    for label, lag in lags.items():
+        if lag < 1 or lag >= len(values) // 2:
+            continue
+        correlations[label] = round(autocorrelation(values, lag=lag), 4)
+    return correlations
+
+
+def unit_normalize(values: list[float]) -> list[float] | None:
+    """Center a series and scale it to unit length.
+
+    The dot product of two unit-normalized series of equal length is their
+    Pearson r, so a series normalized once can be correlated against many
+    others without recomputing its mean and variance.
+
+    Args:
+        values: Series values.
+
+    Returns:
+        Normalized values, or None if the series has zero variance.
+    """
+    n = len(values)
+    mean = sum(values) / n
+    centered = [v - mean for v in values]
+    norm = math.sqrt(sum(map(operator.mul, centered, centered)))
+    if norm == 0:
+        return None
+    return [c / norm for c in centered]
+
+
+def correlation_matrix(series: list[list[float]]) -> list[list[float]]:
+    """Build a symmetric Pearson correlation matrix for equal-length series.
+
+    Each series is unit-normalized once, so every cell is a single dot
+    product rather than a full pass computing means and variances per pair.
+
+    Args:
+        series: Aligned series, all the same length (at least 2 points).
+
+    Returns:
+        NxN matrix with 1.0 on the diagonal and r rounded to 4 places elsewhere.
+        Pairs involving a zero-variance series are 0.0.
+    """
+    n = len(series)
+    normalized = [unit_normalize(s) for s in series]
+    matrix = [[1.0] * n for _ in range(n)]
+    for i in range(n):
+        u = normalized[i]
+        for j in range(i + 1, n):
+            v = normalized[j]
+            if u is None or v is None:
+                r = 0.0
+            else:
+                r = round(max(-1.0, min(1.0, sum(map(operator.mul, u, v)))), 4)
+            matrix[i][j] = r
+            matrix[j][i] = r
+    return matrix
+
+
+def sampling_interval(timestamps: list[int]) -> int:
+    """Estimate a series' sampling interval as the median gap between samples.
+
+    Args:
+        timestamps: Epoch seconds in any order.
+
+    Returns:
+        Interval in seconds, or 0 if fewer than two distinct timestamps.
+    """
+    ordered = sorted(set(timestamps))
+    if len(ordered) < 2:
+        return 0
+    gaps = [ordered[i + 1] - ordered[i] for i in range(len(ordered) - 1)]
+    return int(statistics.median(gaps))
+
+
+def align_series(
+    series: list[tuple[list[int], list[float]]],
+    bucket_seconds: int | None = None,
+) -> tuple[list[int], list[list[float]]]:
+    """Align several series on shared timestamps with a sort-merge join.
+
+    Timestamps are floored into buckets (default: the coarsest sampling
+    interval among the series) so collectors polling a few seconds apart still
+    line up; when a series has several samples in a bucket the latest wins.
+    Each series is sorted once and the join walks all of them in a single
+    forward pass, keeping only buckets present in every series.
+
+    Args:
+        series: (timestamps, values) pairs, one per series.
+        bucket_seconds: Bucket width in seconds; derived from the data if None.
+
+    Returns:
+        Tuple of (bucket start timestamps, aligned values per series).
+    """
+    if bucket_seconds is None:
+        bucket_seconds = max((sampling_interval(ts) for ts, _ in series), default=0)
+    bucket_seconds = max(1, bucket_seconds)
+
+    bucketed: list[list[tuple[int, float]]] = []
+    for timestamps, values in series:
+        rows: list[tuple[int, float]] = []
+        for ts, val in sorted(zip(timestamps, values, strict=False)):
+            bucket = ts // bucket_seconds
+            if rows and rows[-1][0] == bucket:
+                rows[-1] = (bucket, val)
+            else:
+                rows.append((bucket, val))
+        bucketed.append(rows)
+
+    aligned_ts: list[int] = []
+    aligned: list[list[float]] = [[] for _ in bucketed]
+    if not bucketed or any(not rows for rows in bucketed):
+        return aligned_ts, aligned
+
+    cursors = [0] * len(bucketed)
+    while True:
+        target = max(rows[c][0] for rows, c in zip(bucketed, cursors, strict=True))
+        matched = True
+        for k, rows in enumerate(bucketed):
+            c = cursors[k]
+            while c < len(rows) and rows[c][0] < target:
+                c += 1
+            cursors[k] = c
+            if c == len(rows):
+                return aligned_ts, aligned
+            if rows[c][0] != target:
+                matched = False
+        if matched:
+            aligned_ts.append(target * bucket_seconds)
+            for k, rows in enumerate(bucketed):
+                aligned[k].append(rows[cursors[k]][1])
+                cursors[k] += 1
+            if any(c == len(rows) for rows, c in zip(bucketed, cursors, strict=True)):
+                return aligned_ts, aligned
+
+
+# Coarse-pass pruning for rank_correlated_series: series are block-averaged
+# down to about this many points, and a candidate whose coarse correlation
+# trails the bar by more than the margin is dropped before the full pass.
+COARSE_POINTS = 32
+COARSE_PRUNE_MARGIN = 0.15
+
+
+def _fill_on_grid(
+    grid: list[int],
+    bucket_seconds: int,
+    timestamps: list[int],
+    values: list[float],
+) -> tuple[list[float], int] | None:
+    """Place a series on a bucket grid, carrying the last value across gaps.
+
+    Returns:
+        Tuple of (values on the grid, buckets with a real sample), or None if
+        the series has no sample inside the grid.
+    """
+    by_bucket: dict[int, float] = {}
+    for ts, sample in zip(timestamps, values, strict=False):
+        by_bucket[ts // bucket_seconds] = sample
+    filled: list[float] = []
+    last: float | None = None
+    hits = 0
+    pending = 0
+    for bucket in grid:
+        val = by_bucket.get(bucket)
+        if val is None:
+            if last is None:
+                pending += 1
+                continue
+            val = last
+        else:
+            hits += 1
+            if last is None:
+                # Back-fill the leading gap with the first real sample
+                filled.extend([val] * pending)
+        filled.append(val)
+        last = val
+    if last is None:
+        return None
+    return filled, hits
+
+
+def _block_means(values: list[float], block: int) -> list[float]:
+    """Downsample by averaging consecutive blocks of ``block`` points."""
+    if block <= 1:
+        return values
+    return [
+        sum(values[i : i + block]) / len(values[i : i + block])
+        for i in range(0, len(values), block)
+    ]
+
+
+def _lagged_correlation(reference: list[float], candidate: list[float], lag: int) -> float:
+    """Pearson r between reference[t] and candidate[t - lag] over their overlap.
+
+    A positive lag pairs each reference point with an earlier candidate point,
+    i.e. it measures how well the candidate *leads* the reference.
+    """
+    n = len(reference)
+    if lag >= 0:
+        ref, cand = reference[lag:], candidate[: n - lag]
+    else:
+        ref, cand = reference[: n + lag], candidate[-lag:]
+    if len(ref) < 2:
+        return 0.0
+    return pearson_correlation(ref, cand)
+
+
+def rank_correlated_series(
+    reference: tuple[list[int], list[float]],
+    candidates: list[tuple[list[int], list[float]]],
+    top_k: int = 10,
+    max_lag: int = 0,
+    min_correlation: float = 0.5,
+    min_coverage: float = 0.5,
+) -> dict[str, Any]:
+    """Rank candidate series by their strongest (optionally lagged) correlation.
+
+    Every candidate is placed on the reference's sampling grid. Lag-0
+    correlation is a dot product against the reference, unit-normalized once.
+    Before the full lag sweep, a block-averaged coarse sweep prunes candidates
+    that cannot plausibly reach ``min_correlation`` or the current top-k bar
+    (a heuristic bound, so near-threshold series may occasionally be skipped).
+    Ranking is by absolute correlation, so inverse relationships also surface.
+
+    Args:
+        reference: (timestamps, values) of the reference series.
+        candidates: (timestamps, values) per candidate series.
+        top_k: Number of matches to return.
+        max_lag: Largest lag to test, in reference samples (0 = no lag).
+        min_correlation: Minimum |r| for a match.
+        min_coverage: Minimum fraction of reference buckets a candidate must
+            actually sample (the rest are carried forward).
+
+    Returns:
+        Dict with matches (index, correlation, lag, overlap, sorted by |r|
+        descending), bucket_seconds, and counts of candidates scanned, pruned,
+        and skipped for low coverage or zero variance.
+    """
+    ref_ts, ref_values = reference
+    bucket_seconds = max(1, sampling_interval(ref_ts))
+    ref_by_bucket: dict[int, float] = {}
+    for ref_time, ref_value in zip(ref_ts, ref_values, strict=False):
+        ref_by_bucket[ref_time // bucket_seconds] = ref_value
+    grid = sorted(ref_by_bucket)
+    ref = [ref_by_bucket[b] for b in grid]
+    n = len(ref)
+    max_lag = max(0, min(max_lag, n // 4))
+
+    stats = {"scanned": 0, "pruned": 0, "low_coverage": 0, "flat": 0}
+    ref_unit = unit_normalize(ref) if n >= 2 else None
+    if ref_unit is None:
+        return {"matches": [], "bucket_seconds": bucket_seconds, **stats}
+
+    block = max(1, n // COARSE_POINTS)
+    coarse_ref = _block_means(ref, block)
+    coarse_lags = range(-(max_lag // block), max_lag // block + 1)
+
+    heap: list[tuple[float, int, float, int]] = []  # (|r|, index, r, lag) min-heap
+    for index, (cand_ts, cand_values) in enumerate(candidates):
+        stats["scanned"] += 1
+        placed = _fill_on_grid(grid, bucket_seconds, cand_ts, cand_values)
+        if placed is None or placed[1] < min_coverage * n:
+            stats["low_coverage"] += 1
+            continue
+        cand, _ = placed
+        cand_unit = unit_normalize(cand)
+        if cand_unit is None:
+            stats["flat"] += 1
+            continue
+
+        bar = min_correlation
+        if len(heap) >= top_k:
+            bar = max(bar, heap[0][0])
+        if block > 1:
+            coarse_cand = _block_means(cand, block)
+            coarse_best = max(
+                abs(_lagged_correlation(coarse_ref, coarse_cand, lag)) for lag in coarse_lags
+            )
+            if coarse_best + COARSE_PRUNE_MARGIN < bar:
+                stats["pruned"] += 1
+                continue
+
+        best_r = max(-1.0, min(1.0, sum(map(operator.mul, ref_unit, cand_unit))))
+        best_lag = 0
+        for lag in range(-max_lag, max_lag + 1):
+            if lag == 0:
+                continue
+            r = _lagged_correlation(ref, cand, lag)
+            if abs(r) > abs(best_r):
+                best_r, best_lag = r, lag
+
+        score = abs(best_r)
+        if score < min_correlation:
+            continue
+        entry = (score, index, best_r, best_lag)
+        if len(heap) < top_k:
+            heapq.heappush(heap, entry)
+        elif score > heap[0][0]:
+            heapq.heapreplace(heap, entry)
+
+    matches = [
+        {
+            "index": index,
+            "correlation": round(r, 4),
+            "lag": lag,
+            "overlap": n - abs(lag),
+        }
+        for _, index, r, lag in sorted(heap, key=lambda e: (-e[0], e[1]))
+    ]
+    return {"matches": matches, "bucket_seconds": bucket_seconds, **stats}
+
+
 def cusum(
     values: list[float],
     target: float | None = None,
@@ -216,6 +548,186 @@ def coefficient_of_variation(values: list[float]) -> float:
     return abs(stddev / mean)
 
 
+# Default Holt-Winters smoothing parameters and the grid searched when optimizing.
+HW_DEFAULT_PARAMS = (0.3, 0.1, 0.3)
+HW_GRID_ALPHAS = (0.1, 0.3, 0.5, 0.7)
+HW_GRID_BETAS = (0.01, 0.1, 0.3)
+HW_GRID_GAMMAS = (0.1, 0.3, 0.5)
+
+
+@dataclass
+class HoltWintersState:
+    """Incremental additive Holt-Winters model.
+
+    Holds the smoothed level, trend, and seasonal components after absorbing
+    ``n_observed`` points, so a cached model can be advanced with fresh data in
+    O(new points) instead of being refit over the whole window. ``window`` keeps
+    (timestamp, fitted, squared residual) for the points still inside the
+    caller's analysis window, with ``window_sse`` maintained alongside it, so
+    fit-quality statistics need no pass over history either.
+    """
+
+    season_length: int
+    alpha: float
+    beta: float
+    gamma: float
+    level: float
+    trend: float
+    seasonals: list[float]
+    n_observed: int = 0
+    last_timestamp: int | None = None
+    one_step_sse: float = 0.0
+    optimized: bool = False
+    window: deque[tuple[int, float, float]] = field(default_factory=deque)
+    window_sse: float = 0.0
+
+    @classmethod
+    def initialize(
+        cls,
+        values: list[float],
+        season_length: int,
+        alpha: float = HW_DEFAULT_PARAMS[0],
+        beta: float = HW_DEFAULT_PARAMS[1],
+        gamma: float = HW_DEFAULT_PARAMS[2],
+    ) -> HoltWintersState:
+        """Seed level, trend, and seasonals from the first two seasons of ``values``.
+
+        Raises:
+            ValueError: If ``values`` holds fewer than two seasons.
+        """
+        n = len(values)
+        if n < 2 * season_length:
+            raise ValueError(
+                f"Need at least {2 * season_length} data points for "
+                f"season_length={season_length}, got {n}"
+            )
+        level = sum(values[:season_length]) / season_length
+        trend = sum(values[season_length + i] - values[i] for i in range(season_length)) / (
+            season_length * season_length
+        )
+        seasonals = [values[i] - level for i in range(season_length)]
+        return cls(
+            season_length=season_length,
+            alpha=alpha,
+            beta=beta,
+            gamma=gamma,
+            level=level,
+            trend=trend,
+            seasonals=seasonals,
+        )
+
+    def update(self, values: list[float], timestamps: list[int] | None = None) -> list[float]:
+        """Absorb new observations and return their fitted values.
+
+        The very first observation only seeds the fit (matching the batch
+        formulation); every later one updates level, trend, and seasonal.
+
+        Args:
+            values: New observations, oldest first.
+            timestamps: Matching epoch seconds. When given, points are tracked
+                in ``window`` for :meth:`trim_window` and fit statistics.
+
+        Returns:
+            Fitted value for each new observation.
+        """
+        fitted: list[float] = []
+        m = self.season_length
+        for k, val in enumerate(values):
+            s_idx = self.n_observed % m
+            if self.n_observed > 0:
+                predicted = self.level + self.trend + self.seasonals[s_idx]
+                self.one_step_sse += (val - predicted) ** 2
+                prev_level = self.level
+                self.level = self.alpha * (val - self.seasonals[s_idx]) + (1 - self.alpha) * (
+                    self.level + self.trend
+                )
+                self.trend = self.beta * (self.level - prev_level) + (1 - self.beta) * self.trend
+                self.seasonals[s_idx] = (
+                    self.gamma * (val - self.level) + (1 - self.gamma) * self.seasonals[s_idx]
+                )
+            fit = self.level + self.trend + self.seasonals[s_idx]
+            fitted.append(fit)
+            self.n_observed += 1
+            if timestamps is not None:
+                sq_residual = (val - fit) ** 2
+                self.window.append((timestamps[k], fit, sq_residual))
+                self.window_sse += sq_residual
+                self.last_timestamp = timestamps[k]
+        return fitted
+
+    def copy(self) -> HoltWintersState:
+        """Return an independent copy that can be advanced without touching this model."""
+        return replace(self, seasonals=list(self.seasonals), window=deque(self.window))
+
+    def trim_window(self, start_timestamp: int) -> None:
+        """Drop tracked points older than ``start_timestamp`` (amortized O(dropped))."""
+        while self.window and self.window[0][0] < start_timestamp:
+            _, _, sq_residual = self.window.popleft()
+            self.window_sse -= sq_residual
+        if not self.window:
+            self.window_sse = 0.0
+
+    def forecast(self, periods: int) -> list[float]:
+        """Project ``periods`` steps past the last absorbed observation."""
+        m = self.season_length
+        return [
+            self.level + j * self.trend + self.seasonals[(self.n_observed + j - 1) % m]
+            for j in range(1, periods + 1)
+        ]
+
+
+def holt_winters_fit(
+    values: list[float],
+    season_length: int,
+    timestamps: list[int] | None = None,
+    alpha: float = HW_DEFAULT_PARAMS[0],
+    beta: float = HW_DEFAULT_PARAMS[1],
+    gamma: float = HW_DEFAULT_PARAMS[2],
+) -> tuple[HoltWintersState, list[float]]:
+    """Fit a fresh Holt-Winters model over ``values``.
+
+    Returns:
+        Tuple of (state after absorbing every value, fitted values).
+
+    Raises:
+        ValueError: If insufficient data for the season length.
+    """
+    state = HoltWintersState.initialize(values, season_length, alpha, beta, gamma)
+    fitted = state.update(values, timestamps)
+    return state, fitted
+
+
+def holt_winters_grid_search(
+    values: list[float],
+    season_length: int,
+    alphas: tuple[float, ...] = HW_GRID_ALPHAS,
+    betas: tuple[float, ...] = HW_GRID_BETAS,
+    gammas: tuple[float, ...] = HW_GRID_GAMMAS,
+) -> tuple[float, float, float]:
+    """Pick smoothing parameters that minimize one-step-ahead squared error.
+
+    In-sample fitted values already include each observation, so their error
+    always favours alpha near 1; the one-step-ahead error does not.
+
+    Returns:
+        Tuple of (alpha, beta, gamma).
+
+    Raises:
+        ValueError: If insufficient data for the season length.
+    """
+    best = HW_DEFAULT_PARAMS
+    best_sse = math.inf
+    for alpha in alphas:
+        for beta in betas:
+            for gamma in gammas:
+                state = HoltWintersState.initialize(values, season_length, alpha, beta, gamma)
+                state.update(values)
+                if state.one_step_sse < best_sse:
+                    best_sse = state.one_step_sse
+                    best = (alpha, beta, gamma)
+    return best
+
+
 def holt_winters(
     values: list[float],
     season_length: int,
@@ -226,6 +738,9 @@ def holt_winters(
 ) -> dict:
     """Triple exponential smoothing with additive seasonality.
 
+    Batch wrapper over :class:`HoltWintersState`; use the state directly to
+    keep a model and advance it incrementally.
+
     Args:
         values: Time series values.
         season_length: Number of data points per seasonal cycle.
@@ -240,43 +755,9 @@ def holt_winters(
     Raises:
         ValueError: If insufficient data for the season length.
     """
-    n = len(values)
-    if n < 2 * season_length:
-        raise ValueError(
-            f"Need at least {2 * season_length} data points for "
-            f"season_length={season_length}, got {n}"
-        )
-
-    # Initialize level and trend from first two seasons
-    level = sum(values[:season_length]) / season_length
-    trend = sum(values[season_length + i] - values[i] for i in range(season_length)) / (
-        season_length * season_length
-    )
-
-    # Initialize seasonal components from first season
-    seasonals = [values[i] - level for i in range(season_length)]
-
-    fitted = []
-    for i in range(n):
-        s_idx = i % season_length
-        if i == 0:
-            fitted.append(level + trend + seasonals[s_idx])
-            continue
-
-        val = values[i]
-        prev_level = level
-        level = alpha * (val - seasonals[s_idx]) + (1 - alpha) * (level + trend)
-        trend = beta * (level - prev_level) + (1 - beta) * trend
-        seasonals[s_idx] = gamma * (val - level) + (1 - gamma) * seasonals[s_idx]
-        fitted.append(level + trend + seasonals[s_idx])
-
-    # Forecast future periods
-    forecast = []
-    for j in range(1, forecast_periods + 1):
-        s_idx = (n + j - 1) % season_length
-        forecast.append(round(level + j * trend + seasonals[s_idx], 6))
-
-    residuals = [round(values[i] - fitted[i], 6) for i in range(n)]
+    state, fitted = holt_winters_fit(values, season_length, alpha=alpha, beta=beta, gamma=gamma)
+    forecast = [round(f, 6) for f in state.forecast(forecast_periods)]
+    residuals = [round(values[i] - fitted[i], 6) for i in range(len(values))]
     fitted = [round(f, 6) for f in fitted]
 
     return {"fitted": fitted, "forecast": forecast, "residuals": residuals}
@@ -311,8 +792,39 @@ def prediction_interval(
             "data_quality": "insufficient",
         }
 
-    residuals = [y_values[i] - y_predicted[i] for i in range(n)]
-    sse = sum(r * r for r in residuals)
+    sse = sum((y_values[i] - y_predicted[i]) ** 2 for i in range(n))
+    return prediction_interval_from_sse(sse, n, y_predicted[-1], confidence)
+
+
+def prediction_interval_from_sse(
+    sse: float,
+    n: int,
+    last_predicted: float,
+    confidence: float = 0.95,
+) -> dict:
+    """Compute a prediction interval from a residual sum of squares.
+
+    Lets incremental models that track SSE as they go produce the same
+    interval as :func:`prediction_interval` without keeping every residual.
+
+    Args:
+        sse: Sum of squared residuals over ``n`` points.
+        n: Number of points the SSE covers.
+        last_predicted: Most recent predicted value the interval is centred on.
+        confidence: Confidence level (default: 0.95).
+
+    Returns:
+        Dict with lower, upper bounds, confidence_level, and data_quality.
+    """
+    if n < 2:
+        return {
+            "lower": 0.0,
+            "upper": 0.0,
+            "confidence_level": confidence,
+            "data_quality": "insufficient",
+        }
+
+    sse = max(sse, 0.0)
     rse = math.sqrt(sse / (n - 2)) if n > 2 else math.sqrt(sse / n)
 
     # t-distribution critical values (two-tailed)
@@ -333,7 +845,6 @@ def prediction_interval(
     t_crit = df_table[closest_df]
 
     margin = t_crit * rse
-    last_predicted = y_predicted[-1] if y_predicted else 0.0
 
     # Data quality assessment
     if n < 10:
@@ -351,6 +862,147 @@ def prediction_interval(
     }
 
 
+def _kth_of_two_sorted(
+    a: Callable[[int], float],
+    a_len: int,
+    b: Callable[[int], float],
+    b_len: int,
+    k: int,
+) -> float:
+    """Return the k-th smallest (0-based) element of two sorted sequences.
+
+    The sequences are given as index accessors so callers can expose derived
+    views (such as distances from a median) without materializing them.
+    Runs in O(log(a_len + b_len)).
+    """
+    lo, hi = max(0, k + 1 - b_len), min(k + 1, a_len)
+    while lo < hi:
+        i = (lo + hi) // 2
+        if a(i) < b(k - i):
+            lo = i + 1
+        else:
+            hi = i
+    i, j = lo, k + 1 - lo
+    candidates = []
+    if i > 0:
+        candidates.append(a(i - 1))
+    if j > 0:
+        candidates.append(b(j - 1))
+    return max(candidates)
+
+
+@dataclass
+class RollingWindow:
+    """Time-bounded sliding window with incremental summary statistics.
+
+    Mean and variance are maintained with Welford's update (and its inverse on
+    eviction); a sorted copy of the values is maintained with bisection, so
+    quantiles are O(1) and the median absolute deviation is an O(log n)
+    selection over the two sides of the median. Adding or evicting a point
+    costs O(log n) comparisons plus a list shift.
+    """
+
+    window_seconds: int
+    points: deque[tuple[int, float]] = field(default_factory=deque)
+    sorted_values: list[float] = field(default_factory=list)
+    mean: float = 0.0
+    m2: float = 0.0
+
+    @classmethod
+    def from_points(
+        cls, window_seconds: int, timestamps: list[int], values: list[float]
+    ) -> RollingWindow:
+        """Build a window from a batch of points (sorted once, not inserted one by one)."""
+        window = cls(window_seconds=window_seconds)
+        for ts, val in sorted(zip(timestamps, values, strict=False)):
+            window.points.append((ts, val))
+            window._welford_add(val)
+        window.sorted_values = sorted(values)
+        if window.points:
+            window.evict_before(window.points[-1][0] - window_seconds)
+        return window
+
+    @property
+    def count(self) -> int:
+        """Number of points in the window."""
+        return len(self.points)
+
+    @property
+    def last_timestamp(self) -> int | None:
+        """Timestamp of the newest point, or None if empty."""
+        return self.points[-1][0] if self.points else None
+
+    def _welford_add(self, value: float) -> None:
+        n = len(self.points)
+        delta = value - self.mean
+        self.mean += delta / n
+        self.m2 += delta * (value - self.mean)
+
+    def _welford_remove(self, value: float) -> None:
+        n = len(self.points)
+        if n == 0:
+            self.mean = 0.0
+            self.m2 = 0.0
+            return
+        delta = value - self.mean
+        self.mean -= delta / n
+        self.m2 = max(0.0, self.m2 - delta * (value - self.mean))
+
+    def push(self, timestamp: int, value: float) -> None:
+        """Add a point and evict points that fell out of the window."""
+        self.points.append((timestamp, value))
+        self._welford_add(value)
+        bisect.insort(self.sorted_values, value)
+        self.evict_before(timestamp - self.window_seconds)
+
+    def evict_before(self, cutoff: int) -> None:
+        """Remove points older than ``cutoff``."""
+        while self.points and self.points[0][0] < cutoff:
+            _, value = self.points.popleft()
+            del self.sorted_values[bisect.bisect_left(self.sorted_values, value)]
+            self._welford_remove(value)
+
+    def stdev(self) -> float:
+        """Sample standard deviation (0.0 with fewer than two points)."""
+        n = len(self.points)
+        return math.sqrt(self.m2 / (n - 1)) if n >= 2 else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Quantile with linear interpolation, matching :func:`iqr_anomalies`."""
+        vals = self.sorted_values
+        pos = q * (len(vals) - 1)
+        low = int(pos)
+        return vals[low] + (pos - low) * (vals[min(low + 1, len(vals) - 1)] - vals[low])
+
+    def median(self) -> float:
+        """Median of the window."""
+        vals = self.sorted_values
+        n = len(vals)
+        if n % 2 == 1:
+            return vals[n // 2]
+        return (vals[n // 2 - 1] + vals[n // 2]) / 2
+
+    def mad(self) -> float:
+        """Median absolute deviation from the median, without sorting deviations."""
+        vals = self.sorted_values
+        n = len(vals)
+        med = self.median()
+        split = bisect.bisect_left(vals, med)
+
+        def below(i: int) -> float:
+            return med - vals[split - 1 - i]
+
+        def above(j: int) -> float:
+            return vals[split + j] - med
+
+        def kth(k: int) -> float:
+            return _kth_of_two_sorted(below, split, above, n - split, k)
+
+        if n % 2 == 1:
+            return kth(n // 2)
+        return (kth(n // 2 - 1) + kth(n // 2)) / 2
+
+
 def iqr_anomalies(values: list[float], multiplier: float = 1.5) -> dict:
     """Detect anomalies using the Interquartile Range method.
 
@@ -461,6 +1113,7 @@ async def fetch_metric_series(
     instance_id: int,
     datapoints: str | None = None,
     hours_back: int = 24,
+    start_epoch: int | None = None,
 ) -> dict[str, dict[str, Any]]:
     """Fetch metric data from LM API and transpose to per-datapoint series.
 
@@ -475,14 +1128,16 @@ async def fetch_metric_series(
         instance_id: Instance ID.
         datapoints: Comma-separated datapoint names (all if omitted).
         hours_back: Number of hours to look back.
+        start_epoch: Explicit window start in epoch seconds (overrides
+            hours_back), for incremental fetches.
 
     Returns:
         Dict keyed by datapoint name, each containing:
         - values: list[float] of numeric values
         - timestamps: list[int] of epoch seconds
     """
-    now_epoch = int(time.time())
-    start_epoch = now_epoch - (hours_back * 3600)
+    if start_epoch is None:
+        start_epoch = int(time.time()) - (hours_back * 3600)
 
     params: dict[str, Any] = {"start": start_epoch}
     if datapoints:
@@ -494,7 +1149,22 @@ async def fetch_metric_series(
         f"/instances/{instance_id}/data"
     )
     result = await client.get(path, params=params)
+    return transpose_metric_data(result)
+
+
+def transpose_metric_data(result: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    """Transpose an LM ``/data`` payload into per-datapoint series.
+
+    Accepts the single-instance data response and the per-instance entries of
+    the device-datasource bulk data response, which share the
+    ``dataPoints``/``values``/``time`` layout.
 
+    Args:
+        result: Payload with datapoint names, value rows, and timestamps.
+
+    Returns:
+        Dict keyed by datapoint name with values and timestamps (epoch seconds).
+    """
     dp_names = result.get("datapoints", result.get("dataPoints", []))
     value_rows = result.get("values", [])
     raw_timestamps = result.get("time", [])
@@ -14,6 +14,7 @@ from lm_mcp.tools import (
     quote_filter_value,
     sanitize_filter_value,
 )
+from lm_mcp.tools.topology_graph import get_topology_snapshot, neighbor_summary
 
 if TYPE_CHECKING:
     from lm_mcp.client import LogicMonitorClient
@@ -73,6 +74,10 @@ async def get_device_neighbors(
 ) -> list[TextContent]:
     """Get neighboring devices for a specific device.
 
+    Direct neighbors (depth 1) come from the cached topology snapshot while
+    the device's entry is fresh, and refresh it otherwise; deeper lookups
+    always go to the API, which walks the extra hops itself.
+
     Args:
         client: LogicMonitor API client.
         device_id: Device ID to find neighbors for.
@@ -83,30 +88,31 @@ async def get_device_neighbors(
     """
     try:
         params: dict = {"depth": min(depth, 3)}
-
-        result = await client.get(f"/device/devices/{device_id}/neighbors", params=params)
-
-        neighbors = []
-        for item in result.get("items", []):
-            neighbors.append(
-                {
-                    "id": item.get("id"),
-                    "name": item.get("name"),
-                    "display_name": item.get("displayName"),
-                    "device_type": item.get("deviceType"),
-                    "ip_address": item.get("name"),
-                    "connection_type": item.get("connectionType"),
-                    "hop_count": item.get("hopCount"),
-                }
-            )
+        snapshot = get_topology_snapshot(client) if params["depth"] <= 1 else None
+
+        if snapshot is not None and snapshot.is_fresh(device_id):
+            neighbors = snapshot.neighbors[device_id]
+            total = len(neighbors)
+            cached = True
+        else:
+            cached = False
+            result = await client.get(f"/device/devices/{device_id}/neighbors", params=params)
+            items = result.get("items", [])
+            if snapshot is not None:
+                # Direct neighbors: keep the topology cache warm for blast-radius queries.
+                snapshot.prune()
+                snapshot.record(device_id, items)
+            neighbors = [neighbor_summary(item) for item in items]
+            total = result.get("total", 0)
 
         return format_response(
             {
                 "device_id": device_id,
                 "depth": depth,
-                "total": result.get("total", 0),
+                "total": total,
                 "count": len(neighbors),
                 "neighbors": neighbors,
+                "cached": cached,
             }
         )
     except Exception as e:
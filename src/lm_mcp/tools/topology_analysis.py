@@ -9,13 +9,65 @@ from typing import TYPE_CHECKING
 
 from mcp.types import TextContent
 
-from lm_mcp.tools import format_response, handle_error
+from lm_mcp.tools import bounded_gather, format_response, handle_error, safe_total
+from lm_mcp.tools.topology_graph import get_topology_snapshot
 
 if TYPE_CHECKING:
     from lm_mcp.client import LogicMonitorClient
 
 logger = logging.getLogger(__name__)
 
+# Traversal limits: maximum depth and devices visited (including the source).
+MAX_BLAST_RADIUS_DEPTH = 5
+MAX_BLAST_RADIUS_DEVICES = 500
+
+# Device IDs per batched active-alert query (monitorObjectId:1|2|...).
+ALERT_CHECK_CHUNK = 50
+
+# Page size for the batched active-alert query.
+ALERT_PAGE_SIZE = 1000
+
+
+async def _fetch_active_alerts_by_device(
+    client: LogicMonitorClient, device_ids: list[int]
+) -> dict[int, list[dict]] | None:
+    """Fetch active alerts for a chunk of devices, paging until the total is read.
+
+    During an outage a chunk can carry more than one page of active alerts;
+    stopping at the first page would report the remaining devices as healthy.
+
+    Returns:
+        Alerts keyed by device ID (every requested ID present), or None on failure.
+    """
+    ids = "|".join(str(d) for d in device_ids)
+    by_device: dict[int, list[dict]] = {d: [] for d in device_ids}
+    offset = 0
+    try:
+        while True:
+            result = await client.get(
+                "/alert/alerts",
+                params={
+                    "filter": f"monitorObjectId:{ids},cleared:false",
+                    "size": ALERT_PAGE_SIZE,
+                    "offset": offset,
+                },
+            )
+            items = result.get("items", [])
+            for alert in items:
+                try:
+                    owner = int(alert.get("monitorObjectId"))
+                except (TypeError, ValueError):
+                    continue
+                if owner in by_device:
+                    by_device[owner].append(alert)
+            offset += len(items)
+            if len(items) < ALERT_PAGE_SIZE or ("total" in result and offset >= safe_total(result)):
+                break
+    except Exception:
+        logger.exception("blast radius: alert lookup failed for devices %s", ids)
+        return None
+    return by_device
+
 
 async def analyze_blast_radius(
     client: LogicMonitorClient,
@@ -28,103 +80,79 @@ async def analyze_blast_radius(
     all potentially affected downstream devices. Checks alert status of
     affected devices and scores the overall blast radius.
 
+    Neighbor lists come from the per-portal topology cache, so repeated
+    calls around the same devices only refetch lists older than the cache
+    TTL. Articulation points among the explored devices are reported as
+    single points of failure with the number of devices each would cut off,
+    and each affected device carries how many devices depend on it for their
+    path to the source. The traversal stops at ``depth``, so devices at the
+    edge have no fetched neighbors; ``topology_partial`` flags this, and only
+    devices known to be cut off are counted.
+
     Args:
         client: LogicMonitor API client.
         device_id: ID of the device to analyze.
-        depth: Maximum traversal depth (1-3, default: 2).
+        depth: Maximum traversal depth (1-5, default: 2).
 
     Returns:
-        Blast radius score, affected devices list, and critical path devices.
+        Blast radius score, affected devices list, critical path devices,
+        single points of failure, and whether the explored topology is partial.
     """
     try:
-        depth = min(max(depth, 1), 3)
-
-        # BFS traversal of device neighbors
-        visited: set[int] = {device_id}
-        affected_devices: list[dict] = []
-        current_layer = [device_id]
-        neighbor_map: dict[int, list[int]] = defaultdict(list)
-        neighbor_lookup_failures = 0
-
-        for current_depth in range(1, depth + 1):
-            next_layer = []
-            for dev_id in current_layer:
-                if len(visited) >= 100:
-                    break
-
-                try:
-                    result = await client.get(
-                        f"/topology/devices/{dev_id}/neighbors",
-                        params={"size": 50},
-                    )
-                    neighbors = result.get("items", [])
-                except Exception:
-                    # If topology endpoint fails, try device neighbors
-                    try:
-                        result = await client.get(
-                            f"/device/devices/{dev_id}/neighbors",
-                            params={"size": 50},
-                        )
-                        neighbors = result.get("items", [])
-                    except Exception:
-                        logger.exception(
-                            "blast radius: neighbor lookup failed for device %s", dev_id
-                        )
-                        neighbor_lookup_failures += 1
-                        neighbors = []
-
-                for neighbor in neighbors:
-                    n_id = neighbor.get("id", neighbor.get("deviceId"))
-                    if n_id is None:
-                        continue
-                    n_id = int(n_id)
-
-                    neighbor_map[dev_id].append(n_id)
-
-                    if n_id not in visited:
-                        visited.add(n_id)
-                        next_layer.append(n_id)
-                        affected_devices.append(
-                            {
-                                "device_id": n_id,
-                                "device_name": neighbor.get(
-                                    "displayName",
-                                    neighbor.get("name", f"device-{n_id}"),
-                                ),
-                                "depth": current_depth,
-                            }
-                        )
-
-            current_layer = next_layer
-            if not current_layer:
-                break
+        depth = min(max(depth, 1), MAX_BLAST_RADIUS_DEPTH)
+
+        # BFS over the cached topology; only stale devices are fetched, a
+        # layer at a time and concurrently
+        snapshot = get_topology_snapshot(client)
+        walk = await snapshot.expand(client, device_id, depth, MAX_BLAST_RADIUS_DEVICES)
+        neighbor_lookup_failures = len(walk.failed)
+        affected_devices: list[dict] = [
+            {
+                "device_id": n_id,
+                "device_name": snapshot.names[n_id],
+                "depth": n_depth,
+            }
+            for n_id, n_depth in walk.reached
+        ]
+        neighbor_map = {dev: snapshot.adjacency.get(dev, []) for dev in walk.expanded}
 
-        # Check alert status of affected devices (cap at 50)
-        devices_to_check = affected_devices[:50]
+        # Check alert status of every affected device, a chunk of IDs per query
+        chunks = [
+            affected_devices[i : i + ALERT_CHECK_CHUNK]
+            for i in range(0, len(affected_devices), ALERT_CHECK_CHUNK)
+        ]
+        chunk_results = await bounded_gather(
+            [
+                _fetch_active_alerts_by_device(client, [dev["device_id"] for dev in chunk])
+                for chunk in chunks
+            ]
+        )
         critical_alert_count = 0
         alert_check_failures = 0
-        for dev in devices_to_check:
-            try:
-                alert_result = await client.get(
-                    "/alert/alerts",
-                    params={
-                        "filter": (f"monitorObjectId:{dev['device_id']},cleared:false"),
-                        "size": 5,
-                    },
-                )
-                dev_alerts = alert_result.get("items", [])
+        for chunk, by_device in zip(chunks, chunk_results, strict=True):
+            if by_device is None:
+                alert_check_failures += len(chunk)
+            for dev in chunk:
+                if by_device is None:
+                    dev["active_alert_count"] = None
+                    dev["has_critical"] = None
+                    dev["alert_status_unavailable"] = True
+                    continue
+                dev_alerts = by_device[dev["device_id"]]
                 dev["active_alert_count"] = len(dev_alerts)
                 dev["has_critical"] = any(a.get("severity", 0) >= 4 for a in dev_alerts)
                 if dev["has_critical"]:
                     critical_alert_count += 1
-            except Exception:
-                logger.exception(
-                    "blast radius: alert lookup failed for device %s", dev["device_id"]
-                )
-                alert_check_failures += 1
-                dev["active_alert_count"] = None
-                dev["has_critical"] = None
-                dev["alert_status_unavailable"] = True
+
+        # Structural scores over the cached topology: devices that lose their
+        # path to the source if a device fails, articulation points, and
+        # betweenness centrality (None when the snapshot is too large)
+        graph = snapshot.compiled()
+        downstream = graph.downstream(device_id)
+        cut_sizes = graph.cut_sizes()
+        centrality = await graph.centrality()
+        for dev in affected_devices:
+            dev["downstream_devices"] = downstream.get(dev["device_id"], 0)
 
         # Identify critical path devices (appear as neighbors of multiple devices)
         path_counts: dict[int, int] = defaultdict(int)
@@ -142,6 +170,31 @@ async def analyze_blast_radius(
             if path_counts.get(dev["device_id"], 0) >= 2
         ]
 
+        # Devices whose failure would cut others off, within the explored topology
+        explored = {device_id, *(dev["device_id"] for dev in affected_devices)}
+        names = snapshot.names
+        single_points_of_failure = sorted(
+            (
+                {
+                    "device_id": dev_id,
+                    "device_name": names[dev_id],
+                    "devices_cut_off": cut_sizes[dev_id],
+                    "degree": graph.degree(dev_id),
+                }
+                for dev_id in explored
+                if dev_id in cut_sizes
+            ),
+            key=lambda d: (-d["devices_cut_off"], d["device_id"]),
+        )
+        if centrality is not None:
+            for entry in (*critical_path_devices, *single_points_of_failure):
+                entry["centrality"] = round(centrality.get(entry["device_id"], 0.0), 4)
+
+        # Reached devices whose own neighbors were never fetched (beyond the
+        # depth or device limit, or failed lookups): structural scores only
+        # count what is known to be cut off
+        frontier = sum(1 for dev in explored if dev not in snapshot.adjacency)
+
         # Blast radius score (0-100)
         affected_count = len(affected_devices)
         blast_radius_score = min(
@@ -157,6 +210,13 @@ async def analyze_blast_radius(
             "affected_devices": affected_devices,
             "critical_path_devices": critical_path_devices,
             "critical_alert_count": critical_alert_count,
+            "single_points_of_failure": single_points_of_failure,
+            "topology_partial": frontier > 0,
+            "topology_cache": {
+                "devices_known": len(snapshot.nodes),
+                "neighbor_lookups": walk.fetched,
+                "frontier_devices": frontier,
+            },
         }
         if neighbor_lookup_failures or alert_check_failures:
             response["degraded"] = True
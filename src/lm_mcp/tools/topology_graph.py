@@ -0,0 +1,441 @@
+# Description: Cached topology graph built from device neighbor lookups.
+# Description: CSR adjacency per portal with TTL refresh, cut sizes, downstream counts, centrality.
+
+from __future__ import annotations
+
+import logging
+import time
+from array import array
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from lm_mcp.executor import run_cpu_bound
+from lm_mcp.tools import bounded_gather
+
+if TYPE_CHECKING:
+    from lm_mcp.client import LogicMonitorClient
+
+logger = logging.getLogger(__name__)
+
+# Seconds before a device's neighbor list is fetched again.
+TOPOLOGY_TTL_SECONDS = 300
+
+# Devices kept per portal snapshot; past this, the oldest neighbor lists are dropped.
+TOPOLOGY_MAX_DEVICES = 20_000
+
+# Largest snapshot for which betweenness centrality is computed (O(V * E)).
+CENTRALITY_MAX_DEVICES = 2_000
+
+# Portals whose topology is kept (LRU).
+_TOPOLOGY_CACHE_MAX = 16
+
+
+def betweenness(offsets: array, targets: array) -> list[float]:
+    """Brandes betweenness centrality over a symmetrized CSR graph.
+
+    Scores are normalized within each connected component, so unrelated parts
+    of the snapshot do not change them. O(V * E); run through the analytics
+    executor.
+    """
+    n = len(offsets) - 1
+    scores = [0.0] * n
+    for source in range(n):
+        stack: list[int] = []
+        preds: list[list[int]] = [[] for _ in range(n)]
+        paths = [0] * n
+        paths[source] = 1
+        dist = [-1] * n
+        dist[source] = 0
+        queue = deque([source])
+        while queue:
+            v = queue.popleft()
+            stack.append(v)
+            for w in targets[offsets[v] : offsets[v + 1]]:
+                if dist[w] < 0:
+                    dist[w] = dist[v] + 1
+                    queue.append(w)
+                if dist[w] == dist[v] + 1:
+                    paths[w] += paths[v]
+                    preds[w].append(v)
+        # Each unordered pair is counted from both ends: (c-1)(c-2) normalizes to 0..1.
+        scale = (len(stack) - 1) * (len(stack) - 2)
+        delta = [0.0] * n
+        while stack:
+            w = stack.pop()
+            for v in preds[w]:
+                delta[v] += paths[v] / paths[w] * (1 + delta[w])
+            if w != source and scale:
+                scores[w] += delta[w] / scale
+    return scores
+
+
+@dataclass
+class CompiledTopology:
+    """Immutable CSR view of a topology snapshot.
+
+    Devices are numbered 0..n-1 in discovery order. ``out_offsets`` and
+    ``out_targets`` hold each device's neighbor list as the API returned it
+    (used for traversal); ``offsets`` and ``targets`` hold the symmetrized
+    graph (used for articulation points, downstream counts, and centrality).
+    ``expanded`` marks devices whose own neighbor list was fetched; the rest
+    are frontier devices whose links are only known from their neighbors.
+    Structural scores are computed on first use and kept with the snapshot.
+    """
+
+    device_ids: list[int]
+    index: dict[int, int]
+    out_offsets: array
+    out_targets: array
+    offsets: array
+    targets: array
+    expanded: list[bool]
+    _cut_sizes: dict[int, int] | None = None
+    _downstream: dict[int, dict[int, int]] = field(default_factory=dict)
+    _centrality: dict[int, float] | None = None
+
+    @classmethod
+    def build(cls, adjacency: dict[int, list[int]], nodes: list[int]) -> CompiledTopology:
+        """Compile per-device neighbor lists into CSR arrays."""
+        index = {dev: i for i, dev in enumerate(nodes)}
+        out_offsets = array("l", [0])
+        out_targets = array("l")
+        undirected: list[list[int]] = [[] for _ in nodes]
+        seen: list[set[int]] = [set() for _ in nodes]
+        for i, dev in enumerate(nodes):
+            for neighbor in adjacency.get(dev, ()):
+                j = index[neighbor]
+                out_targets.append(j)
+                if j != i and j not in seen[i]:
+                    seen[i].add(j)
+                    seen[j].add(i)
+                    undirected[i].append(j)
+                    undirected[j].append(i)
+            out_offsets.append(len(out_targets))
+        offsets = array("l", [0])
+        targets = array("l")
+        for row in undirected:
+            targets.extend(row)
+            offsets.append(len(targets))
+        expanded = [dev in adjacency for dev in nodes]
+        return cls(nodes, index, out_offsets, out_targets, offsets, targets, expanded)
+
+    def neighbors(self, device_id: int) -> list[int]:
+        """Device IDs listed as neighbors of ``device_id``."""
+        i = self.index.get(device_id)
+        if i is None:
+            return []
+        ids = self.device_ids
+        return [ids[j] for j in self.out_targets[self.out_offsets[i] : self.out_offsets[i + 1]]]
+
+    def degree(self, device_id: int) -> int:
+        """Distinct devices connected to ``device_id`` in either direction."""
+        i = self.index.get(device_id)
+        return 0 if i is None else self.offsets[i + 1] - self.offsets[i]
+
+    def _separations(
+        self, root: int, disc: list[int]
+    ) -> tuple[dict[int, list[tuple[int, int]]], int, int]:
+        """Iterative Tarjan DFS over ``root``'s component.
+
+        Marks the component in ``disc`` and returns, per vertex, the
+        (size, frontier count) of each DFS child subtree with no back edge
+        above it, plus the component's size and frontier count.
+        """
+        offsets, targets, expanded = self.offsets, self.targets, self.expanded
+        low: dict[int, int] = {}
+        size: dict[int, int] = {}
+        frontier: dict[int, int] = {}
+        detached: dict[int, list[tuple[int, int]]] = {}
+        timer = 0
+
+        def visit(v: int) -> None:
+            nonlocal timer
+            disc[v] = low[v] = timer
+            timer += 1
+            size[v] = 1
+            frontier[v] = 0 if expanded[v] else 1
+
+        visit(root)
+        stack = [(root, -1, offsets[root])]
+        while stack:
+            v, parent, pos = stack[-1]
+            if pos < offsets[v + 1]:
+                stack[-1] = (v, parent, pos + 1)
+                w = targets[pos]
+                if disc[w] == -1:
+                    visit(w)
+                    stack.append((w, v, offsets[w]))
+                elif w != parent:
+                    low[v] = min(low[v], disc[w])
+                continue
+            stack.pop()
+            if parent == -1:
+                continue
+            low[parent] = min(low[parent], low[v])
+            size[parent] += size[v]
+            frontier[parent] += frontier[v]
+            if low[v] >= disc[parent]:
+                detached.setdefault(parent, []).append((size[v], frontier[v]))
+        return detached, size[root], frontier[root]
+
+    def cut_sizes(self) -> dict[int, int]:
+        """Articulation points mapped to the devices they would cut off.
+
+        Removing an articulation point splits its component into pieces. When
+        every piece is fully expanded, the devices cut off are everything
+        outside the largest piece. A piece containing a frontier device may
+        still reach the rest of the network through links not fetched yet, so
+        it is treated as the surviving side and only fully expanded pieces
+        count as cut off; a device with no such piece is not reported. One
+        DFS per component computes every value in O(V + E).
+        """
+        if self._cut_sizes is not None:
+            return self._cut_sizes
+        disc = [-1] * len(self.device_ids)
+        cut: dict[int, int] = {}
+        for root in range(len(disc)):
+            if disc[root] != -1:
+                continue
+            detached, component, component_frontier = self._separations(root, disc)
+            for v, pieces in detached.items():
+                # Children that keep a back edge stay attached to the part above v.
+                rest = component - 1 - sum(p[0] for p in pieces)
+                if rest:
+                    rest_frontier = (
+                        component_frontier
+                        - (0 if self.expanded[v] else 1)
+                        - sum(p[1] for p in pieces)
+                    )
+                    pieces = [*pieces, (rest, rest_frontier)]
+                if len(pieces) < 2:
+                    continue
+                if any(frontier for _, frontier in pieces):
+                    lost = sum(piece for piece, frontier in pieces if not frontier)
+                else:
+                    lost = component - 1 - max(piece for piece, _ in pieces)
+                if lost:
+                    cut[self.device_ids[v]] = lost
+        self._cut_sizes = cut
+        return cut
+
+    def downstream(self, root_id: int) -> dict[int, int]:
+        """Devices that would lose their path to ``root_id`` if each device failed.
+
+        Only fully expanded subtrees are counted: a subtree with frontier
+        devices may reach ``root_id`` through links not fetched yet. Devices
+        with no dependents are omitted. Cached per root with the snapshot.
+        """
+        cached = self._downstream.get(root_id)
+        if cached is not None:
+            return cached
+        result: dict[int, int] = {}
+        root = self.index.get(root_id)
+        if root is not None:
+            detached, _, _ = self._separations(root, [-1] * len(self.device_ids))
+            for v, pieces in detached.items():
+                count = sum(piece for piece, frontier in pieces if not frontier)
+                if v != root and count:
+                    result[self.device_ids[v]] = count
+        self._downstream[root_id] = result
+        return result
+
+    async def centrality(self) -> dict[int, float] | None:
+        """Betweenness centrality per device, or None above ``CENTRALITY_MAX_DEVICES``."""
+        if self._centrality is None:
+            n = len(self.device_ids)
+            if n > CENTRALITY_MAX_DEVICES:
+                return None
+            scores = await run_cpu_bound(
+                betweenness, self.offsets, self.targets, size=n * max(len(self.targets), 1)
+            )
+            self._centrality = dict(zip(self.device_ids, scores, strict=True))
+        return self._centrality
+
+
+def neighbor_summary(item: dict) -> dict:
+    """Reduce a neighbor record to the fields get_device_neighbors reports."""
+    return {
+        "id": item.get("id"),
+        "name": item.get("name"),
+        "display_name": item.get("displayName"),
+        "device_type": item.get("deviceType"),
+        "ip_address": item.get("name"),
+        "connection_type": item.get("connectionType"),
+        "hop_count": item.get("hopCount"),
+    }
+
+
+@dataclass
+class Traversal:
+    """Result of a breadth-first walk over a topology snapshot."""
+
+    reached: list[tuple[int, int]] = field(default_factory=list)
+    expanded: list[int] = field(default_factory=list)
+    failed: set[int] = field(default_factory=set)
+    fetched: int = 0
+
+
+@dataclass
+class TopologySnapshot:
+    """Mutable per-portal topology, compiled to CSR when queried.
+
+    A device's neighbor list is fetched the first time a traversal reaches it
+    and again once it is older than ``ttl`` seconds; unchanged devices are
+    never refetched, so repeated questions about the same area of the network
+    cost no API calls. Once more than ``max_devices`` devices are known, the
+    oldest half of the neighbor lists is dropped before the next traversal.
+    ``neighbors`` keeps each fetched list as ``neighbor_summary`` records so
+    get_device_neighbors can answer from the snapshot while it is fresh.
+    """
+
+    ttl: float = TOPOLOGY_TTL_SECONDS
+    max_devices: int = TOPOLOGY_MAX_DEVICES
+    adjacency: dict[int, list[int]] = field(default_factory=dict)
+    fetched_at: dict[int, float] = field(default_factory=dict)
+    names: dict[int, str] = field(default_factory=dict)
+    nodes: list[int] = field(default_factory=list)
+    neighbors: dict[int, list[dict]] = field(default_factory=dict)
+    _compiled: CompiledTopology | None = None
+
+    def _add_node(self, device_id: int) -> None:
+        if device_id not in self.names:
+            self.names[device_id] = f"device-{device_id}"
+            self.nodes.append(device_id)
+
+    def record(self, device_id: int, neighbors: list[dict], now: float | None = None) -> None:
+        """Store a freshly fetched neighbor list, replacing any previous one."""
+        self._add_node(device_id)
+        ids: list[int] = []
+        for neighbor in neighbors:
+            n_id = neighbor.get("id", neighbor.get("deviceId"))
+            if n_id is None:
+                continue
+            n_id = int(n_id)
+            self._add_node(n_id)
+            name = neighbor.get("displayName", neighbor.get("name"))
+            if name:
+                self.names[n_id] = name
+            ids.append(n_id)
+        self.adjacency[device_id] = ids
+        self.neighbors[device_id] = [neighbor_summary(neighbor) for neighbor in neighbors]
+        self.fetched_at[device_id] = time.monotonic() if now is None else now
+        self._compiled = None
+
+    def prune(self) -> None:
+        """Drop the oldest half of the neighbor lists when over ``max_devices``."""
+        if len(self.nodes) <= self.max_devices:
+            return
+        by_age = sorted(self.fetched_at, key=self.fetched_at.__getitem__)
+        for dev in by_age[: max(1, len(by_age) // 2)]:
+            del self.adjacency[dev]
+            del self.fetched_at[dev]
+            del self.neighbors[dev]
+        live = set(self.adjacency)
+        for ids in self.adjacency.values():
+            live.update(ids)
+        self.nodes = [dev for dev in self.nodes if dev in live]
+        self.names = {dev: self.names[dev] for dev in self.nodes}
+        self._compiled = None
+
+    def is_fresh(self, device_id: int) -> bool:
+        fetched = self.fetched_at.get(device_id)
+        return fetched is not None and time.monotonic() - fetched < self.ttl
+
+    def compiled(self) -> CompiledTopology:
+        """Return the CSR view, rebuilding it only after the topology changed."""
+        if self._compiled is None:
+            self._compiled = CompiledTopology.build(self.adjacency, self.nodes)
+        return self._compiled
+
+    async def expand(
+        self,
+        client: LogicMonitorClient,
+        device_id: int,
+        depth: int,
+        max_devices: int,
+    ) -> Traversal:
+        """Breadth-first traversal from ``device_id``, fetching stale layers concurrently.
+
+        Args:
+            client: LogicMonitor API client.
+            device_id: Traversal root.
+            depth: Maximum hops.
+            max_devices: Stop adding devices once this many (including the root)
+                have been visited.
+
+        Returns:
+            Reached devices as (device_id, depth) pairs in discovery order, the
+            devices whose neighbor lists were walked, devices whose lookup
+            failed, and how many lookups went to the API.
+        """
+        self.prune()
+        self._add_node(device_id)
+        visited = {device_id}
+        walk = Traversal()
+        layer = [device_id]
+        for current_depth in range(1, depth + 1):
+            stale = [dev for dev in layer if not self.is_fresh(dev)]
+            if stale:
+                results = await bounded_gather([fetch_neighbors(client, dev) for dev in stale])
+                for dev, neighbors in zip(stale, results, strict=True):
+                    if neighbors is None:
+                        walk.failed.add(dev)
+                    else:
+                        self.record(dev, neighbors)
+                        walk.fetched += 1
+            next_layer = []
+            for dev in layer:
+                if len(visited) >= max_devices:
+                    break
+                if dev in walk.failed:
+                    continue
+                walk.expanded.append(dev)
+                for n_id in self.adjacency.get(dev, ()):
+                    if n_id not in visited:
+                        visited.add(n_id)
+                        next_layer.append(n_id)
+                        walk.reached.append((n_id, current_depth))
+            layer = next_layer
+            if not layer:
+                break
+        return walk
+
+
+_snapshots: OrderedDict[str, TopologySnapshot] = OrderedDict()
+
+
+def get_topology_snapshot(client: LogicMonitorClient) -> TopologySnapshot:
+    """Return the cached topology for ``client``'s portal, creating it if needed."""
+    key = str(client.base_url)
+    snapshot = _snapshots.get(key)
+    if snapshot is None:
+        snapshot = _snapshots[key] = TopologySnapshot()
+        while len(_snapshots) > _TOPOLOGY_CACHE_MAX:
+            _snapshots.popitem(last=False)
+    _snapshots.move_to_end(key)
+    return snapshot
+
+
+def reset_topology_cache() -> None:
+    """Drop every cached topology. Used in tests."""
+    _snapshots.clear()
+
+
+async def fetch_neighbors(client: LogicMonitorClient, dev_id: int) -> list[dict] | None:
+    """Fetch a device's neighbors, falling back to the device endpoint.
+
+    Returns:
+        Neighbor records, or None when both endpoints fail.
+    """
+    try:
+        result = await client.get(f"/topology/devices/{dev_id}/neighbors", params={"size": 50})
+        return result.get("items", [])
+    except Exception:
+        # If topology endpoint fails, try device neighbors
+        try:
+            result = await client.get(f"/device/devices/{dev_id}/neighbors", params={"size": 50})
+            return result.get("items", [])
+        except Exception:
+            logger.exception("topology: neighbor lookup failed for device %s", dev_id)
+            return None
@@ -5,12 +5,13 @@ from __future__ import annotations
 
 import logging
 import re
+import time
 from fnmatch import fnmatch
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from mcp.types import TextContent
 
-from lm_mcp.tools import call_sub_tool, format_response, handle_error
+from lm_mcp.tools import bounded_gather, call_sub_tool, format_response, handle_error, safe_total
 
 # Audit logger for write workflows. Configured via standard logging; if no
 # handler is attached, records propagate to the root logger.
@@ -723,21 +724,37 @@ _PORTAL_OVERVIEW_REQUIRED = [
 ]
 
 
+# One paged /alert/alerts read feeds statistics, clusters, and the
+# critical/error lists; pages past the first are fetched concurrently.
+_OVERVIEW_ALERT_PAGE_SIZE = 1000
+_OVERVIEW_ALERT_MAX_PAGES = 10
+_OVERVIEW_LIST_LIMIT = 20
+
+
 async def portal_overview(
     client: LogicMonitorClient,
     hours_back: int = 4,
     detail_level: str = "summary",
     summarize: bool = False,
+    max_age_seconds: int | None = None,
 ) -> list[TextContent]:
     """Composite portal overview for shift-handoff reporting.
 
     Aggregates alert statistics, collector health, maintenance windows,
-    noise scores, and dead/unmonitored devices.
+    noise scores, and dead/unmonitored devices. Sections are gathered
+    concurrently, and the alert sections share one paged alert fetch.
+
+    Reports are cached per portal and ``hours_back``. Concurrent identical
+    requests share one build; ``generated_at`` and ``cache_age_seconds``
+    say how fresh the returned report is.
 
     Args:
         client: LogicMonitor API client.
         hours_back: Hours to look back (default: 4).
         detail_level: 'summary' or 'full' (default: summary).
+        max_age_seconds: Accept a cached report up to this old. Defaults to
+            twice the background refresh interval when
+            ``LM_OVERVIEW_REFRESH_INTERVAL`` is set, else 0 (always rebuild).
 
     Returns:
         Portal overview report as TextContent list.
@@ -747,109 +764,156 @@ async def portal_overview(
         return blocked
 
     try:
-        from lm_mcp.tools.alerts import get_alerts
-        from lm_mcp.tools.collectors import get_collectors
-        from lm_mcp.tools.correlation import correlate_alerts, get_alert_statistics
-        from lm_mcp.tools.devices import get_devices
-        from lm_mcp.tools.scoring import score_alert_noise
-        from lm_mcp.tools.sdts import get_active_sdts
+        from lm_mcp.report_cache import get_report, refresh_interval
 
-        warnings: list[str] = []
-        report: dict = {"hours_back": hours_back, "detail_level": detail_level}
+        key = overview_cache_key(client, hours_back)
+        if max_age_seconds is None:
+            interval = refresh_interval(key)
+            max_age_seconds = interval * 2 if interval else 0
 
-        # 1. Alert statistics
-        try:
-            stats = await call_sub_tool(
-                get_alert_statistics,
-                client,
-                hours_back=hours_back,
-            )
-            report["alert_statistics"] = stats
-        except Exception as exc:
-            warnings.append(f"get_alert_statistics failed: {exc}")
-            report["alert_statistics"] = None
+        cached = await get_report(
+            key, lambda: build_portal_overview(client, hours_back), max_age_seconds
+        )
+        report = {
+            **cached.report,
+            "detail_level": detail_level,
+            "generated_at": int(cached.generated_at),
+            "cache_age_seconds": round(cached.age(), 1),
+        }
+        warnings = list(report.get("warnings", []))
 
-        # 2. High-severity active alerts (critical + error)
-        try:
-            crit_alerts = await call_sub_tool(
-                get_alerts,
-                client,
-                severity="critical",
-                cleared=False,
-                limit=20,
-            )
-            err_alerts = await call_sub_tool(
-                get_alerts,
-                client,
-                severity="error",
-                cleared=False,
-                limit=20,
-            )
-            report["critical_alerts"] = crit_alerts
-            report["error_alerts"] = err_alerts
-        except Exception as exc:
-            warnings.append(f"get_alerts failed: {exc}")
-            report["critical_alerts"] = None
-            report["error_alerts"] = None
+        full_keys = {"critical_alerts", "error_alerts", "dead_devices"}
+        report = _trim_detail(report, detail_level, full_keys)
+        await _maybe_summarize(report, "portal_overview", summarize, warnings)
+        if warnings:
+            report["warnings"] = warnings
 
-        # 3. Collector health
-        try:
-            coll_data = await call_sub_tool(get_collectors, client)
-            report["collectors"] = coll_data
-        except Exception as exc:
-            warnings.append(f"get_collectors failed: {exc}")
-            report["collectors"] = None
+        return format_response(report)
+    except Exception as e:
+        return handle_error(e)
 
-        # 4. Active SDTs
-        try:
-            sdt_data = await call_sub_tool(get_active_sdts, client)
-            report["active_sdts"] = sdt_data
-        except Exception as exc:
-            warnings.append(f"get_active_sdts failed: {exc}")
-            report["active_sdts"] = None
 
-        # 5. Correlate alerts
-        try:
-            cluster_data = await call_sub_tool(
-                correlate_alerts,
-                client,
-                hours_back=hours_back,
-            )
-            report["alert_clusters"] = cluster_data
-        except Exception as exc:
-            warnings.append(f"correlate_alerts failed: {exc}")
-            report["alert_clusters"] = None
+def overview_cache_key(client: LogicMonitorClient, hours_back: int) -> tuple:
+    """Report-cache key for a portal overview."""
+    return ("portal_overview", str(client.base_url), hours_back)
 
-        # 6. Noise assessment
-        try:
-            noise = await call_sub_tool(
-                score_alert_noise,
-                client,
-                hours_back=hours_back,
-            )
-            report["noise"] = noise
-        except Exception as exc:
-            warnings.append(f"score_alert_noise failed: {exc}")
-            report["noise"] = None
 
-        # 7. Dead/unmonitored devices
+async def build_portal_overview(client: LogicMonitorClient, hours_back: int) -> dict:
+    """Gather every portal_overview section concurrently into one full report.
+
+    A failing section is reported as None with a warning; it never fails the
+    report.
+    """
+    from lm_mcp.tools.collectors import get_collectors
+    from lm_mcp.tools.devices import get_devices
+    from lm_mcp.tools.scoring import score_alert_noise
+    from lm_mcp.tools.sdts import get_active_sdts
+
+    warnings: list[str] = []
+
+    async def _section(name: str, aw: Any) -> Any:
         try:
-            dead = await call_sub_tool(get_devices, client, status="dead", limit=20)
-            report["dead_devices"] = dead
+            return await aw
         except Exception as exc:
-            warnings.append(f"get_devices (dead) failed: {exc}")
-            report["dead_devices"] = None
+            warnings.append(f"{name} failed: {exc}")
+            return None
+
+    alert_data, coll_data, sdt_data, noise, dead = await bounded_gather(
+        [
+            _section("alert fetch", _fetch_overview_alerts(client)),
+            _section("get_collectors", call_sub_tool(get_collectors, client)),
+            _section("get_active_sdts", call_sub_tool(get_active_sdts, client)),
+            _section(
+                "score_alert_noise",
+                call_sub_tool(score_alert_noise, client, hours_back=hours_back),
+            ),
+            _section(
+                "get_devices (dead)",
+                call_sub_tool(get_devices, client, status="dead", limit=20),
+            ),
+        ]
+    )
 
-        if warnings:
-            report["warnings"] = warnings
+    report: dict = {"hours_back": hours_back}
+    report.update(_overview_alert_sections(alert_data, hours_back, warnings))
+    report["collectors"] = coll_data
+    report["active_sdts"] = sdt_data
+    report["noise"] = noise
+    report["dead_devices"] = dead
+    if warnings:
+        report["warnings"] = warnings
+    return report
 
-        full_keys = {"critical_alerts", "error_alerts", "dead_devices"}
-        report = _trim_detail(report, detail_level, full_keys)
-        await _maybe_summarize(report, "portal_overview", summarize, warnings)
 
-        return format_response(report)
-    except Exception as e:
-        return handle_error(e)
+async def _fetch_overview_alerts(client: LogicMonitorClient) -> tuple[list[dict], int]:
+    """Active alerts, newest first, with the reported total."""
+    params: dict = {
+        "size": _OVERVIEW_ALERT_PAGE_SIZE,
+        "offset": 0,
+        "filter": "cleared:false",
+        "sort": "-startEpoch",
+    }
+    first = await client.get("/alert/alerts", params=params)
+    alerts = list(first.get("items", []))
+    total = safe_total(first)
+    if len(alerts) == _OVERVIEW_ALERT_PAGE_SIZE:
+        stop = min(total, _OVERVIEW_ALERT_PAGE_SIZE * _OVERVIEW_ALERT_MAX_PAGES)
+        offsets = range(_OVERVIEW_ALERT_PAGE_SIZE, stop, _OVERVIEW_ALERT_PAGE_SIZE)
+        pages = await bounded_gather(
+            [client.get("/alert/alerts", params={**params, "offset": o}) for o in offsets]
+        )
+        for page in pages:
+            alerts.extend(page.get("items", []))
+    return alerts, max(total, len(alerts))
+
+
+def _overview_alert_sections(
+    alert_data: tuple[list[dict], int] | None,
+    hours_back: int,
+    warnings: list[str],
+) -> dict:
+    """Statistics, clusters, and critical/error lists from one alert fetch."""
+    sections = ("alert_statistics", "critical_alerts", "error_alerts", "alert_clusters")
+    if alert_data is None:
+        return dict.fromkeys(sections)
+
+    from lm_mcp.tools.alerts import alert_row
+    from lm_mcp.tools.correlation import cluster_alerts, summarize_alert_statistics
+
+    alerts, total = alert_data
+    if total > len(alerts):
+        warnings.append(f"Alert sections cover the newest {len(alerts)} of {total} active alerts.")
+    start_epoch = int(time.time()) - hours_back * 3600
+    recent = [a for a in alerts if (a.get("startEpoch") or 0) >= start_epoch]
+
+    def _severity_list(severity: int) -> dict:
+        matching = [a for a in alerts if a.get("severity") == severity]
+        rows = [alert_row(a) for a in matching[:_OVERVIEW_LIST_LIMIT]]
+        return {
+            "total": len(matching),
+            "count": len(rows),
+            "offset": 0,
+            "has_more": len(matching) > len(rows),
+            "alerts": rows,
+        }
+
+    return {
+        "alert_statistics": summarize_alert_statistics(recent, hours_back),
+        "critical_alerts": _severity_list(4),
+        "error_alerts": _severity_list(3),
+        "alert_clusters": cluster_alerts(recent, hours_back),
+    }
+
+
+def start_overview_refresh(client: LogicMonitorClient, interval: int, hours_back: int = 4) -> None:
+    """Precompute the default portal overview every ``interval`` seconds."""
+    from lm_mcp.report_cache import start_report_refresh
+
+    start_report_refresh(
+        overview_cache_key(client, hours_back),
+        lambda: build_portal_overview(client, hours_back),
+        interval,
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -1423,8 +1487,6 @@ _SITE_OUTAGE_REQUIRED = [
     "get_power_events",
 ]
 
-_POWER_KEYWORDS = ("ups", "pdu", "battery", "power")
-
 
 async def detect_site_outage(
     client: LogicMonitorClient,
@@ -1481,27 +1543,31 @@ async def detect_site_outage(
         dead_devices = _count_dead_devices(devices)
         collector_ids = _collector_ids_from_devices(devices)
 
-        # Signal A: CollectorDown on collectors serving this group. Each
-        # collector is probed independently so a single bad collector ID
-        # (e.g., orphaned reference to a deleted collector) does not abort
-        # the rest of the signal.
+        # Signal A: CollectorDown on collectors serving this group. All
+        # collectors are probed in one call; a bad collector ID (e.g., an
+        # orphaned reference to a deleted collector) is reported per ID and
+        # does not abort the rest of the signal.
         collector_down_count = 0
         collectors_inspected: list[dict] = []
         collector_probe_failures: list[str] = []
-        for cid in collector_ids:
+        if collector_ids:
             try:
                 health_data = await call_sub_tool(
                     get_collector_health,
                     client,
-                    collector_id=cid,
+                    collector_ids=collector_ids,
                     include_history=False,
                 )
-                entry = (health_data.get("collectors") or [{}])[0]
-                collectors_inspected.append(entry)
-                if entry.get("is_down"):
-                    collector_down_count += 1
+                collectors_inspected = list(health_data.get("collectors") or [])
+                collector_down_count = sum(1 for c in collectors_inspected if c.get("is_down"))
+                for err in health_data.get("collector_errors") or []:
+                    collector_probe_failures.append(
+                        f"collector_id={err.get('collector_id')}: {err.get('error')}"
+                    )
+                if health_data.get("warning"):
+                    warnings.append(health_data["warning"])
             except Exception as exc:
-                collector_probe_failures.append(f"collector_id={cid}: {exc}")
+                collector_probe_failures = [f"collector_id={cid}: {exc}" for cid in collector_ids]
 
         if collector_probe_failures:
             failures_shown = "; ".join(collector_probe_failures[:5])
@@ -1722,6 +1788,7 @@ def _site_outage_recommendations(
 # Composite tool: audit_network_monitoring_coverage
 # ---------------------------------------------------------------------------
 
+# The audit reads the same endpoints as these tools, so it honours their filters.
 _AUDIT_COVERAGE_REQUIRED = [
     "get_devices",
     "get_collectors",
@@ -1739,138 +1806,70 @@ async def audit_network_monitoring_coverage(
     with specific recommendations — turns "you can't detect X" into
     "here's how to enable detection of X."
 
+    The full device inventory is paged (up to ``AUDIT_MAX_DEVICES``) and
+    counted as it streams in. Each audit is kept per portal and scope; when
+    a previous one exists, ``changes`` describes what moved since then.
+
     Args:
         client: LogicMonitor API client.
         group_id: Scope the audit to a device group. None = portal-wide.
 
     Returns:
-        TextContent list with inventory, coverage percentages, and prioritized gaps.
+        TextContent list with inventory, coverage percentages, prioritized gaps,
+        and changes since the previous audit of the same scope.
     """
     blocked = check_required_tools(_AUDIT_COVERAGE_REQUIRED)
     if blocked:
         return blocked
 
     try:
-        from lm_mcp.tools.collectors import get_collectors
-        from lm_mcp.tools.devices import get_devices
+        from lm_mcp.tools.coverage_audit import (
+            AUDIT_MAX_DEVICES,
+            CoverageAudit,
+            diff_audits,
+            fetch_all_collectors,
+            iter_device_pages,
+            previous_audit,
+            record_audit,
+        )
 
         warnings: list[str] = []
 
-        devices_data = await call_sub_tool(
-            get_devices,
-            client,
-            group_id=group_id,
-            limit=1000,
-        )
-        devices = devices_data.get("devices", [])
-        collectors_data = await call_sub_tool(get_collectors, client, limit=200)
-        collectors = collectors_data.get("collectors", [])
+        audit = CoverageAudit()
+        total = 0
+        async for devices, page_total in iter_device_pages(client, group_id):
+            total = page_total
+            audit.feed(devices)
+        if total > AUDIT_MAX_DEVICES:
+            warnings.append(
+                f"Audited the first {len(audit.flags)} of {total} devices "
+                f"(cap {AUDIT_MAX_DEVICES}); scope the audit with group_id."
+            )
+        collectors = await fetch_all_collectors(client)
 
-        inventory = _build_inventory(devices, collectors)
-        coverage = _compute_coverage(devices, collectors)
+        inventory = audit.inventory(collectors)
+        coverage = audit.coverage(collectors)
         gaps = _derive_gaps(inventory, coverage)
 
-        return format_response(
-            {
-                "scope": {"group_id": group_id, "portal_wide": group_id is None},
-                "inventory": inventory,
-                "coverage_percentages": coverage["percentages"],
-                "coverage_counts": coverage["counts"],
-                "gaps": gaps,
-                "summary": _audit_summary(inventory, coverage, gaps),
-                "warnings": warnings,
-            }
-        )
+        previous = previous_audit(client, group_id)
+        current = record_audit(client, group_id, audit, coverage, gaps)
+
+        response = {
+            "scope": {"group_id": group_id, "portal_wide": group_id is None},
+            "inventory": inventory,
+            "coverage_percentages": coverage["percentages"],
+            "coverage_counts": coverage["counts"],
+            "gaps": gaps,
+            "summary": _audit_summary(inventory, coverage, gaps),
+            "warnings": warnings,
+        }
+        if previous is not None:
+            response["changes"] = diff_audits(previous, current)
+        return format_response(response)
     except Exception as e:
         return handle_error(e)
 
 
-def _build_inventory(devices: list[dict], collectors: list[dict]) -> dict:
-    """Counts by deviceType and likely power infrastructure."""
-    total_devices = len(devices)
-    power_like = 0
-    network_like = 0
-    server_like = 0
-    unknown = 0
-
-    for dev in devices:
-        name = (dev.get("displayName") or dev.get("name") or "").lower()
-        system_categories = (dev.get("systemCategories") or "").lower()
-        combined = f"{name} {system_categories}"
-        if any(kw in combined for kw in _POWER_KEYWORDS):
-            power_like += 1
-        elif any(kw in combined for kw in ("switch", "router", "firewall", "wlan")):
-            network_like += 1
-        elif any(kw in combined for kw in ("server", "linux", "windows", "host")):
-            server_like += 1
-        else:
-            unknown += 1
-
-    return {
-        "total_devices": total_devices,
-        "likely_power_infrastructure": power_like,
-        "likely_network_gear": network_like,
-        "likely_servers": server_like,
-        "unclassified": unknown,
-        "total_collectors": len(collectors),
-    }
-
-
-def _compute_coverage(devices: list[dict], collectors: list[dict]) -> dict:
-    """Count devices with specific monitoring properties set."""
-    total = len(devices) or 1
-    snmp_count = 0
-    netflow_count = 0
-    power_monitored = 0
-
-    for dev in devices:
-        props = _properties_dict(dev)
-        categories = (dev.get("systemCategories") or "").lower()
-        name = (dev.get("displayName") or dev.get("name") or "").lower()
-
-        if props.get("snmp.version") or props.get("snmp.community"):
-            snmp_count += 1
-        if (
-            props.get("netflow.enabled")
-            or "netflow" in categories
-            or "netflowexporter" in categories
-        ):
-            netflow_count += 1
-        if any(kw in f"{name} {categories}" for kw in _POWER_KEYWORDS):
-            power_monitored += 1
-
-    collectors_up = sum(1 for c in collectors if c.get("status") not in ("dead", "down"))
-
-    return {
-        "counts": {
-            "snmp_credentialed": snmp_count,
-            "netflow_exporters": netflow_count,
-            "power_monitored_devices": power_monitored,
-            "collectors_up": collectors_up,
-            "collectors_total": len(collectors),
-        },
-        "percentages": {
-            "snmp_coverage_pct": round(100.0 * snmp_count / total, 1),
-            "netflow_coverage_pct": round(100.0 * netflow_count / total, 1),
-            "power_monitoring_coverage_pct": round(100.0 * power_monitored / total, 1),
-        },
-    }
-
-
-def _properties_dict(device: dict) -> dict[str, str]:
-    """Flatten a device's customProperties list into a name->value dict."""
-    result: dict[str, str] = {}
-    for prop in device.get("customProperties", []) or []:
-        name = prop.get("name")
-        if name:
-            result[name] = prop.get("value", "")
-    for prop in device.get("systemProperties", []) or []:
-        name = prop.get("name")
-        if name and name not in result:
-            result[name] = prop.get("value", "")
-    return result
-
-
 def _derive_gaps(inventory: dict, coverage: dict) -> list[dict]:
     """Prioritized list of coverage gaps with concrete recommendations."""
     gaps: list[dict] = []
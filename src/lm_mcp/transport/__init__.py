@@ -39,6 +39,8 @@ async def run_stdio() -> None:
         from lm_mcp import portals
 
         portals.load()
+        # Evict idle portal clients and pre-warm the most-used ones
+        portals.start_pool_maintenance(config.portal_prewarm)
     else:
         auth = create_auth_provider(config)
         client = LogicMonitorClient(
@@ -47,6 +49,7 @@ async def run_stdio() -> None:
             timeout=config.timeout,
             api_version=config.api_version,
             ingest_url=config.ingest_url,
+            ingest_gzip_min_bytes=config.ingest_gzip_min_bytes,
         )
         _set_client(client)
 
@@ -144,6 +147,42 @@ async def run_stdio() -> None:
         session = get_session()
         session.max_history_size = config.session_history_size
 
+    # Start the background alert mirror (single-portal only: it mirrors one client)
+    from lm_mcp.alert_mirror import start_alert_mirror, stop_alert_mirror
+
+    if config.alert_mirror_enabled and client is not None:
+        start_alert_mirror(
+            client,
+            interval=config.alert_mirror_interval,
+            retention_hours=config.alert_mirror_hours,
+            max_alerts=config.alert_mirror_max_alerts,
+        )
+
+    # Precompute scheduled analysis workflows so matching tool calls are reads
+    from lm_mcp.analysis import stop_analysis_scheduler
+
+    if config.analysis_schedule and client is not None:
+        from lm_mcp.analysis import parse_schedule, start_analysis_scheduler
+
+        start_analysis_scheduler(client, parse_schedule(config.analysis_schedule))
+
+    # Replay log batches spooled to disk before the last shutdown
+    from lm_mcp.log_pipeline import start_log_pipeline, stop_log_pipelines
+
+    if config.log_spool_dir and client is not None:
+        start_log_pipeline(client)
+
+    # Buffered metric pushes are flushed on shutdown
+    from lm_mcp.metric_batcher import stop_metric_batchers
+
+    # Keep the default portal_overview report warm for shift handoffs
+    from lm_mcp.report_cache import stop_report_refreshes
+
+    if config.overview_refresh_interval and client is not None:
+        from lm_mcp.tools.workflows import start_overview_refresh
+
+        start_overview_refresh(client, config.overview_refresh_interval)
+
     try:
         async with stdio_server() as (read_stream, write_stream):
             await server.run(
@@ -152,6 +191,11 @@ async def run_stdio() -> None:
                 server.create_initialization_options(),
             )
     finally:
+        await stop_alert_mirror()
+        await stop_log_pipelines()
+        await stop_metric_batchers()
+        await stop_report_refreshes()
+        await stop_analysis_scheduler()
         if tf_runner is not None:
             await tf_runner.close()
         if watsonx_client is not None:
@@ -163,6 +207,9 @@ async def run_stdio() -> None:
         from lm_mcp import portals
 
         await portals.close_all()
+        from lm_mcp.executor import shutdown_executor
+
+        shutdown_executor()
 
 
 async def run_http() -> None:
@@ -4,9 +4,12 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import hmac
 import json
 import logging
 import secrets
+import zlib
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
@@ -23,6 +26,14 @@ logger = logging.getLogger(__name__)
 # /readyz reaches the LM API when LM_HEALTH_CHECK_CONNECTIVITY is enabled.
 _OPEN_PATHS = frozenset({"/", "/health", "/healthz", "/readyz"})
 
+# Seconds a POST /api/v1/logs request waits for room in a full log queue
+# before it is answered with 429.
+_LOG_SUBMIT_TIMEOUT = 2
+
+# Largest POST /api/v1/logs body accepted, on the wire and after gunzipping;
+# larger requests get 413.
+_LOG_MAX_BODY_BYTES = 32 * 1024 * 1024
+
 
 def _is_open_path(path: str) -> bool:
     """Match the probe allowlist, tolerating a trailing slash.
@@ -35,6 +46,88 @@ def _is_open_path(path: str) -> bool:
     return path in _OPEN_PATHS or path.rstrip("/") in _OPEN_PATHS
 
 
+async def _read_log_body(request, limit: int) -> bytes | None:
+    """Read a request body, gunzipping it when Content-Encoding is gzip.
+
+    The body is read and inflated chunk by chunk with the output capped at
+    ``limit`` bytes, so a small gzip bomb never expands in memory.
+
+    Returns:
+        The (decompressed) body, or None when it exceeds ``limit``.
+
+    Raises:
+        zlib.error, EOFError: If the gzip stream is corrupt or truncated.
+    """
+    gzipped = request.headers.get("content-encoding", "").lower() == "gzip"
+    inflater = zlib.decompressobj(16 + zlib.MAX_WBITS) if gzipped else None
+    received = 0
+    out = bytearray()
+    async for chunk in request.stream():
+        received += len(chunk)
+        if received > limit:
+            return None
+        if inflater is None:
+            out += chunk
+            continue
+        data = chunk
+        while data:
+            out += inflater.decompress(data, limit - len(out) + 1)
+            if len(out) > limit:
+                return None
+            if inflater.eof and inflater.unused_data:
+                # Concatenated gzip members, as gzip.decompress accepts.
+                data = inflater.unused_data
+                inflater = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            else:
+                data = inflater.unconsumed_tail
+    if inflater is not None:
+        out += inflater.flush(limit - len(out) + 1)
+        if len(out) > limit:
+            return None
+        if not inflater.eof:
+            raise EOFError("truncated gzip body")
+    return bytes(out)
+
+
+# Signs the Mcp-Session-Id values this process issues, so only those select a
+# session context. Regenerated on restart, which ends every session.
+_SESSION_SECRET = secrets.token_bytes(32)
+
+
+def _session_mac(nonce: str) -> str:
+    return hmac.new(_SESSION_SECRET, nonce.encode(), hashlib.sha256).hexdigest()[:32]
+
+
+def _issue_session_id() -> str:
+    """A new Mcp-Session-Id, returned on the response to initialize."""
+    nonce = secrets.token_hex(16)
+    return f"{nonce}.{_session_mac(nonce)}"
+
+
+def _valid_session_id(session_id: str) -> bool:
+    """Whether ``session_id`` was issued by this process."""
+    nonce, _, mac = session_id.partition(".")
+    return bool(nonce) and hmac.compare_digest(mac, _session_mac(nonce))
+
+
+def _session_key(headers) -> str | None:
+    """Key for the request's session context: MCP session ID, else auth principal.
+
+    Session IDs are issued by the server on initialize, and the /mcp endpoint
+    refuses IDs it did not issue, so agents sharing one bearer token are kept
+    apart only when they echo their Mcp-Session-Id. The principal fallback is
+    a digest of the Authorization header, so credentials are never held as
+    keys. Requests with neither share the process-wide session.
+    """
+    session_id = headers.get("mcp-session-id")
+    if session_id and _valid_session_id(session_id):
+        return f"session:{session_id}"
+    authorization = headers.get("authorization")
+    if authorization:
+        return "principal:" + hashlib.sha256(authorization.encode()).hexdigest()[:32]
+    return None
+
+
 class BearerAuthMiddleware:
     """Require a bearer token on every route outside _OPEN_PATHS.
 
@@ -141,6 +234,7 @@ def create_asgi_app() -> Starlette:
             _watsonx_client,
             execute_tool,
         )
+        from lm_mcp.session import use_session
 
         try:
             body = await request.json()
@@ -154,8 +248,34 @@ def create_asgi_app() -> Starlette:
         params = body.get("params", {})
         req_id = body.get("id")
 
+        session_id = request.headers.get("mcp-session-id")
+        if session_id and not _valid_session_id(session_id):
+            # Unknown or expired (e.g. issued before a restart): the client
+            # must initialize again for a new ID, as the MCP spec prescribes.
+            return JSONResponse(
+                {
+                    "jsonrpc": "2.0",
+                    "error": {"code": -32001, "message": "Unknown session; initialize again"},
+                    "id": req_id,
+                },
+                status_code=404,
+            )
+
         try:
-            if method == "tools/list":
+            if method == "initialize":
+                from lm_mcp import __version__
+
+                result = {
+                    "protocolVersion": params.get("protocolVersion", "2025-03-26"),
+                    "capabilities": {"tools": {}, "resources": {}, "prompts": {}},
+                    "serverInfo": {"name": "logicmonitor-platform", "version": __version__},
+                }
+                return JSONResponse(
+                    {"jsonrpc": "2.0", "result": result, "id": req_id},
+                    headers={"Mcp-Session-Id": _issue_session_id()},
+                )
+
+            elif method == "tools/list":
                 all_tools = list(TOOLS)
                 if _awx_client is not None:
                     all_tools.extend(AWX_TOOLS)
@@ -181,7 +301,8 @@ def create_asgi_app() -> Starlette:
                         status_code=400,
                     )
 
-                result = await execute_tool(tool_name, arguments)
+                with use_session(_session_key(request.headers)):
+                    result = await execute_tool(tool_name, arguments)
 
                 # Extract text content from result
                 if result and len(result) > 0:
@@ -229,10 +350,15 @@ def create_asgi_app() -> Starlette:
                 status_code=500,
             )
 
-    # Analysis store (shared across requests within the ASGI app)
-    from lm_mcp.analysis import AnalysisStore, run_analysis, validate_workflow
+    # Analysis store (shared with the scheduler, so scheduled runs can be polled)
+    from lm_mcp.analysis import (
+        get_analysis_store,
+        precomputed_workflow,
+        run_analysis,
+        validate_workflow,
+    )
 
-    analysis_store = AnalysisStore(ttl_minutes=60)
+    analysis_store = get_analysis_store()
     # Hold references to background tasks to prevent garbage collection (RUF006)
     _background_tasks: set[asyncio.Task] = set()  # type: ignore[type-arg]
 
@@ -240,7 +366,9 @@ def create_asgi_app() -> Starlette:
         """Start an analysis workflow.
 
         Accepts JSON body with 'workflow' and 'arguments' fields.
-        Returns 202 with analysis_id for async polling.
+        Returns 202 with analysis_id for async polling, or 200 with the
+        result of a fresh scheduled run of the same workflow and arguments
+        (marked ``cached`` with its ``computed_at`` time).
         """
         try:
             body = await request.json()
@@ -257,6 +385,24 @@ def create_asgi_app() -> Starlette:
             return JSONResponse({"error": str(e)}, status_code=400)
 
         arguments = body.get("arguments", {})
+
+        from lm_mcp.server import get_client
+
+        try:
+            cached = precomputed_workflow(get_client(), workflow, arguments)
+        except RuntimeError:
+            cached = None
+        if cached is not None:
+            return JSONResponse(
+                {
+                    "analysis_id": cached.analysis_id,
+                    "status": "completed",
+                    "result": cached.result,
+                    "cached": True,
+                    "computed_at": cached.recorded_at,
+                }
+            )
+
         req = analysis_store.create(workflow, arguments)
 
         # Run analysis in background
@@ -313,6 +459,53 @@ def create_asgi_app() -> Starlette:
             status_code=202,
         )
 
+    async def ingest_logs_endpoint(request: Request) -> Response:
+        """Queue log entries on the log ingestion pipeline.
+
+        Accepts a JSON array of log entries (or {"logs": [...]}), optionally
+        gzip-encoded. Returns 202 once the entries are queued; 429 with
+        Retry-After when the queue stays full, so shippers back off; 413 when
+        the body, compressed or not, exceeds _LOG_MAX_BODY_BYTES.
+        """
+        from lm_mcp.log_pipeline import QueueFullError, get_log_pipeline
+        from lm_mcp.server import get_client
+
+        if not config.enable_write_operations:
+            return JSONResponse(
+                {"error": "Write operations are disabled (LM_ENABLE_WRITE_OPERATIONS)"},
+                status_code=403,
+            )
+        try:
+            raw = await _read_log_body(request, _LOG_MAX_BODY_BYTES)
+            if raw is None:
+                return JSONResponse(
+                    {"error": f"Body exceeds {_LOG_MAX_BODY_BYTES} bytes"}, status_code=413
+                )
+            body = json.loads(raw)
+        except (zlib.error, EOFError, ValueError):
+            return JSONResponse({"error": "Invalid JSON body"}, status_code=400)
+
+        logs = body.get("logs") if isinstance(body, dict) else body
+        if not isinstance(logs, list) or not logs:
+            return JSONResponse(
+                {"error": "Body must be a non-empty array of log entries"}, status_code=400
+            )
+
+        pipeline = get_log_pipeline(get_client())
+        try:
+            submission = await pipeline.submit(logs, timeout=_LOG_SUBMIT_TIMEOUT)
+        except QueueFullError as e:
+            return JSONResponse({"error": e.message}, status_code=429, headers={"Retry-After": "1"})
+        return JSONResponse(
+            {
+                "accepted": submission.accepted,
+                "rejected": submission.rejected,
+                "errors": submission.errors,
+                "queue_depth": pipeline.pending,
+            },
+            status_code=202,
+        )
+
     async def root(request: Request) -> Response:
         """Root endpoint with server info."""
         from lm_mcp import __version__
@@ -330,6 +523,7 @@ def create_asgi_app() -> Starlette:
                     "analyze": "/api/v1/analyze",
                     "analysis": "/api/v1/analysis/{id}",
                     "webhook_alert": "/api/v1/webhooks/alert",
+                    "logs": "/api/v1/logs",
                 },
                 "timestamp": datetime.now(UTC).isoformat(),
             }
@@ -344,6 +538,7 @@ def create_asgi_app() -> Starlette:
         Route("/api/v1/analyze", post_analyze, methods=["POST"]),
         Route("/api/v1/analysis/{analysis_id}", get_analysis, methods=["GET"]),
         Route("/api/v1/webhooks/alert", webhook_alert, methods=["POST"]),
+        Route("/api/v1/logs", ingest_logs_endpoint, methods=["POST"]),
     ]
 
     # Configure CORS middleware. Order matters: the first entry is outermost,
@@ -359,6 +554,7 @@ def create_asgi_app() -> Starlette:
                 allow_credentials=True,
                 allow_methods=["*"],
                 allow_headers=["*"],
+                expose_headers=["Mcp-Session-Id"],
             )
         )
 
@@ -396,6 +592,7 @@ async def create_http_server() -> None:
         timeout=config.timeout,
         api_version=config.api_version,
         ingest_url=config.ingest_url,
+        ingest_gzip_min_bytes=config.ingest_gzip_min_bytes,
     )
     _set_client(client)
 
@@ -481,6 +678,42 @@ async def create_http_server() -> None:
         session = get_session()
         session.max_history_size = config.session_history_size
 
+    # Start the background alert mirror (single-portal only: it mirrors one client)
+    from lm_mcp.alert_mirror import start_alert_mirror, stop_alert_mirror
+
+    if config.alert_mirror_enabled:
+        start_alert_mirror(
+            client,
+            interval=config.alert_mirror_interval,
+            retention_hours=config.alert_mirror_hours,
+            max_alerts=config.alert_mirror_max_alerts,
+        )
+
+    # Precompute scheduled analysis workflows so matching tool calls are reads
+    from lm_mcp.analysis import stop_analysis_scheduler
+
+    if config.analysis_schedule:
+        from lm_mcp.analysis import parse_schedule, start_analysis_scheduler
+
+        start_analysis_scheduler(client, parse_schedule(config.analysis_schedule))
+
+    # Replay log batches spooled to disk before the last shutdown
+    from lm_mcp.log_pipeline import start_log_pipeline, stop_log_pipelines
+
+    if config.log_spool_dir:
+        start_log_pipeline(client)
+
+    # Buffered metric pushes are flushed on shutdown
+    from lm_mcp.metric_batcher import stop_metric_batchers
+
+    # Keep the default portal_overview report warm for shift handoffs
+    from lm_mcp.report_cache import stop_report_refreshes
+
+    if config.overview_refresh_interval:
+        from lm_mcp.tools.workflows import start_overview_refresh
+
+        start_overview_refresh(client, config.overview_refresh_interval)
+
     # Create ASGI app
     app = create_asgi_app()
 
@@ -509,6 +742,11 @@ async def create_http_server() -> None:
     try:
         await server.serve()
     finally:
+        await stop_alert_mirror()
+        await stop_log_pipelines()
+        await stop_metric_batchers()
+        await stop_report_refreshes()
+        await stop_analysis_scheduler()
         if tf_runner is not None:
             await tf_runner.close()
         if watsonx_client is not None:
@@ -517,3 +755,6 @@ async def create_http_server() -> None:
             await awx_client.close()
         if client is not None:
             await client.close()
+        from lm_mcp.executor import shutdown_executor
+
+        shutdown_executor()
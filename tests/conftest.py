@@ -4,10 +4,19 @@
 import pytest
 
 from lm_mcp import portals
+from lm_mcp.analysis import reset_analysis_scheduler
 from lm_mcp.awx_config import reset_awx_config
 from lm_mcp.config import reset_config
 from lm_mcp.ibm_config import reset_watsonx_config
+from lm_mcp.log_pipeline import reset_log_pipelines
+from lm_mcp.metric_batcher import reset_metric_batchers
+from lm_mcp.report_cache import reset_report_cache
 from lm_mcp.server import _set_awx_client, _set_client, _set_tf_runner, _set_watsonx_client
+from lm_mcp.session import reset_session_store
+from lm_mcp.tools.correlation import reset_anomaly_streams
+from lm_mcp.tools.coverage_audit import reset_audit_history
+from lm_mcp.tools.forecasting import reset_forecast_models
+from lm_mcp.tools.topology_graph import reset_topology_cache
 
 
 @pytest.fixture(autouse=True)
@@ -16,8 +25,11 @@ def _reset_config_cache():
 
     Tests that use monkeypatch to set environment variables need
     fresh config instances. This fixture clears LM config, AWX config,
-    watsonx config, their clients, and the Terraform runner before and
-    after each test.
+    watsonx config, their clients, the Terraform runner, cached
+    forecast models, streaming anomaly state, cached topology, recorded
+    coverage audits, cached reports, scheduled analysis state, log
+    ingestion pipelines, metric batchers, and the HTTP session store before
+    and after each test.
     """
     reset_config()
     reset_awx_config()
@@ -25,6 +37,15 @@ def _reset_config_cache():
     _set_awx_client(None)
     _set_watsonx_client(None)
     _set_tf_runner(None)
+    reset_forecast_models()
+    reset_anomaly_streams()
+    reset_topology_cache()
+    reset_audit_history()
+    reset_report_cache()
+    reset_analysis_scheduler()
+    reset_log_pipelines()
+    reset_metric_batchers()
+    reset_session_store()
     yield
     reset_config()
     reset_awx_config()
@@ -32,6 +53,15 @@ def _reset_config_cache():
     _set_awx_client(None)
     _set_watsonx_client(None)
     _set_tf_runner(None)
+    reset_forecast_models()
+    reset_anomaly_streams()
+    reset_topology_cache()
+    reset_audit_history()
+    reset_report_cache()
+    reset_analysis_scheduler()
+    reset_log_pipelines()
+    reset_metric_batchers()
+    reset_session_store()
 
 
 @pytest.fixture
@@ -46,12 +76,13 @@ def reset_portals():
         portals._state.update(
             {
                 "portals": {},
-                "clients": {},
-                "active": None,
-                "active_writable": False,
+                "clients": portals.ClientPool(),
                 "loaded": False,
+                "maintenance": None,
             }
         )
+        portals._process_binding.clear()
+        portals._vault_cache.clear()
         _set_client(None)
 
     _clear()
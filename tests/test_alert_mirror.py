@@ -0,0 +1,507 @@
+# Description: Tests for the incrementally synced alert mirror.
+# Description: Validates watermark sync, index queries, eviction, and tool fallback.
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+import respx
+
+from lm_mcp import alert_mirror
+from lm_mcp.alert_mirror import AlertMirror, mirrored_alerts
+from lm_mcp.auth.bearer import BearerAuth
+from lm_mcp.client import LogicMonitorClient
+
+BASE_URL = "https://test.logicmonitor.com/santaba/rest"
+ALERT_URL = f"{BASE_URL}/alert/alerts"
+
+
+@pytest.fixture
+def client():
+    """Create a LogicMonitorClient instance for testing."""
+    return LogicMonitorClient(
+        base_url=BASE_URL,
+        auth=BearerAuth("test-token"),
+        timeout=30,
+        api_version=3,
+    )
+
+
+@pytest.fixture(autouse=True)
+def _reset_mirror():
+    """Start and end every test without a process-wide mirror."""
+    alert_mirror._state.update({"mirror": None, "task": None})
+    yield
+    alert_mirror._state.update({"mirror": None, "task": None})
+
+
+def _alert(alert_id, start, device="web01", severity=3, cleared=False, **extra):
+    return {
+        "id": f"LMA{alert_id}",
+        "startEpoch": start,
+        "endEpoch": start + 60 if cleared else 0,
+        "cleared": cleared,
+        "severity": severity,
+        "monitorObjectName": device,
+        "monitorObjectId": extra.pop("device_id", 1),
+        "resourceTemplateName": extra.pop("datasource", "CPU"),
+        "dataPointName": extra.pop("datapoint", "CPUBusyPercent"),
+        "monitorObjectGroups": extra.pop("groups", [{"fullPath": "Prod/Web"}]),
+        **extra,
+    }
+
+
+class TestAlertMirrorSync:
+    """Tests for watermark-based synchronization."""
+
+    @respx.mock
+    async def test_initial_sync_loads_retention_window(self, client):
+        """The first sync reads every alert in the retention window, active or cleared."""
+        now = int(time.time())
+        route = respx.get(ALERT_URL).mock(
+            return_value=httpx.Response(
+                200,
+                json={"items": [_alert(1, now - 600), _alert(2, now - 300, cleared=True)]},
+            )
+        )
+
+        mirror = AlertMirror(client, retention_seconds=3600)
+        count = await mirror.sync()
+
+        assert count == 2
+        assert len(mirror) == 2
+        assert mirror.watermark == now - 300
+        assert mirror.covers(now - 3500)
+        assert not mirror.covers(now - 7200)
+        filter_str = route.calls[0].request.url.params["filter"]
+        assert "cleared:*" in filter_str
+        assert filter_str.startswith("startEpoch>:")
+
+    @respx.mock
+    async def test_incremental_sync_queries_since_watermark(self, client):
+        """Later syncs ask only for new starts and recent clears, and update in place."""
+        now = int(time.time())
+        respx.get(ALERT_URL).mock(
+            side_effect=[
+                httpx.Response(200, json={"items": [_alert(1, now - 600)]}),
+                httpx.Response(200, json={"items": [_alert(2, now - 10)]}),
+                httpx.Response(200, json={"items": [_alert(1, now - 600, cleared=True)]}),
+            ]
+        )
+
+        mirror = AlertMirror(client, retention_seconds=3600)
+        await mirror.sync()
+        await mirror.sync()
+
+        calls = respx.calls
+        assert (
+            calls[1]
+            .request.url.params["filter"]
+            .startswith(f"startEpoch>:{now - 600 - alert_mirror.WATERMARK_OVERLAP_SECONDS}")
+        )
+        assert calls[2].request.url.params["filter"].startswith("endEpoch>:")
+        assert len(mirror) == 2
+        assert [a["id"] for a in mirror.query(cleared=False)] == ["LMA2"]
+        assert [a["id"] for a in mirror.query(cleared=True)] == ["LMA1"]
+
+    @respx.mock
+    async def test_pages_until_short_page(self, client):
+        """Sync follows offsets until a page comes back short."""
+        now = int(time.time())
+        full_page = [_alert(i, now - 100) for i in range(alert_mirror.PAGE_SIZE)]
+        route = respx.get(ALERT_URL).mock(
+            side_effect=[
+                httpx.Response(200, json={"items": full_page}),
+                httpx.Response(200, json={"items": [_alert(99999, now - 50)]}),
+            ]
+        )
+
+        mirror = AlertMirror(client, retention_seconds=3600)
+        await mirror.sync()
+
+        assert route.call_count == 2
+        assert route.calls[1].request.url.params["offset"] == str(alert_mirror.PAGE_SIZE)
+        assert len(mirror) == alert_mirror.PAGE_SIZE + 1
+        # the bulk load re-sorts the start index once: the later alert comes last
+        assert mirror.query(limit=1)[0]["id"] == "LMA99999"
+        assert mirror._by_start == sorted(mirror._by_start)
+
+    @respx.mock
+    async def test_size_cap_evicts_oldest_and_narrows_coverage(self, client):
+        """Exceeding max_alerts drops the oldest alerts and moves coverage past them."""
+        now = int(time.time())
+        respx.get(ALERT_URL).mock(
+            return_value=httpx.Response(
+                200, json={"items": [_alert(i, now - 1000 + i * 100) for i in range(5)]}
+            )
+        )
+
+        mirror = AlertMirror(client, retention_seconds=3600, max_alerts=3)
+        await mirror.sync()
+
+        assert len(mirror) == 3
+        assert [a["id"] for a in mirror.query()] == ["LMA2", "LMA3", "LMA4"]
+        assert mirror.coverage_start == now - 900 + 1
+        assert not mirror.covers(now - 1000)
+        assert mirror.covers(now - 800)
+
+    @respx.mock
+    async def test_page_cap_leaves_window_uncovered(self, client, monkeypatch, caplog):
+        """A full load cut short by the page cap is logged and answers nothing."""
+        monkeypatch.setattr(alert_mirror, "PAGE_SIZE", 2)
+        monkeypatch.setattr(alert_mirror, "MAX_PAGES", 2)
+        now = int(time.time())
+        respx.get(ALERT_URL).mock(
+            side_effect=[
+                httpx.Response(200, json={"items": [_alert(1, now - 60), _alert(2, now - 50)]}),
+                httpx.Response(200, json={"items": [_alert(3, now - 40), _alert(4, now - 30)]}),
+            ]
+        )
+
+        mirror = AlertMirror(client, retention_seconds=3600)
+        with caplog.at_level("WARNING", logger="lm_mcp.alert_mirror"):
+            await mirror.sync()
+
+        assert len(mirror) == 4
+        assert mirror.coverage_start is None
+        assert not mirror.covers(now - 10)
+        assert "page cap" in caplog.text
+        assert await mirrored_alerts(client, now - 10) is None
+
+    @respx.mock
+    async def test_truncated_full_load_retries_on_backoff(self, client, monkeypatch):
+        """After a truncated full load, syncs stay quiet until the retry, which can recover."""
+        monkeypatch.setattr(alert_mirror, "PAGE_SIZE", 2)
+        monkeypatch.setattr(alert_mirror, "MAX_PAGES", 2)
+        now = int(time.time())
+        page = [_alert(1, now - 60), _alert(2, now - 50)]
+        route = respx.get(ALERT_URL).mock(
+            side_effect=[
+                httpx.Response(200, json={"items": page}),
+                httpx.Response(200, json={"items": page}),
+                httpx.Response(200, json={"items": [*page, _alert(3, now - 40)], "total": 3}),
+            ]
+        )
+
+        mirror = AlertMirror(client, retention_seconds=3600, max_age_seconds=60)
+        await mirror.sync()
+        assert mirror.coverage_start is None
+        assert mirror._full_load_retry_at == pytest.approx(time.monotonic() + 60, abs=5)
+
+        assert await mirror.sync() == 0
+        assert route.call_count == 2
+
+        mirror._full_load_retry_at = time.monotonic() - 1
+        await mirror.sync()
+
+        assert route.call_count == 3
+        assert route.calls[2].request.url.params["filter"].startswith("startEpoch>:")
+        assert mirror.covers(now - 3000)
+        assert mirror._full_load_retry_at is None
+
+    @respx.mock
+    async def test_truncated_incremental_sync_uncovers_until_reload(self, client, monkeypatch):
+        """An incremental sync hitting the cap drops coverage; the next sync reloads the window."""
+        monkeypatch.setattr(alert_mirror, "PAGE_SIZE", 2)
+        monkeypatch.setattr(alert_mirror, "MAX_PAGES", 2)
+        now = int(time.time())
+        full = [_alert(2, now - 50), _alert(3, now - 40)]
+        route = respx.get(ALERT_URL).mock(
+            side_effect=[
+                httpx.Response(200, json={"items": [_alert(1, now - 600)]}),
+                httpx.Response(200, json={"items": full}),
+                httpx.Response(200, json={"items": full}),
+                httpx.Response(200, json={"items": []}),
+                httpx.Response(200, json={"items": [_alert(4, now - 20)]}),
+            ]
+        )
+
+        mirror = AlertMirror(client, retention_seconds=3600)
+        await mirror.sync()
+        assert mirror.covers(now - 3000)
+
+        await mirror.sync()
+        assert mirror.coverage_start is None
+
+        await mirror.sync()
+        reload_filter = route.calls[4].request.url.params["filter"]
+        reload_start = int(reload_filter.split(",")[0].removeprefix("startEpoch>:"))
+        assert reload_start <= now - 3600 + 5
+        assert mirror.covers(now - 3000)
+        assert len(mirror) == 4
+
+    async def test_stale_mirror_does_not_cover(self, client):
+        """A mirror that has not synced within max_age does not answer queries."""
+        mirror = AlertMirror(client, max_age_seconds=60)
+        mirror.coverage_start = 0
+        mirror.last_sync = time.monotonic() - 120
+
+        assert not mirror.is_fresh()
+        assert not mirror.covers(int(time.time()))
+
+
+class TestAlertMirrorQuery:
+    """Tests for index-backed queries."""
+
+    @pytest.fixture
+    def mirror(self, client):
+        now = int(time.time())
+        mirror = AlertMirror(client, retention_seconds=86400)
+        for alert in [
+            _alert(1, now - 500, device="web01", severity=2),
+            _alert(2, now - 400, device="web02", severity=4, datasource="Memory"),
+            _alert(3, now - 300, device="db01", severity=3, device_id=7, groups="Prod/DB"),
+            _alert(4, now - 200, device="WEB03", severity=4, datapoint="PercentUsed"),
+        ]:
+            mirror._upsert(alert)
+        return mirror
+
+    def test_device_contains_is_case_insensitive(self, mirror):
+        assert [a["id"] for a in mirror.query(device="web")] == ["LMA1", "LMA2", "LMA4"]
+
+    def test_combined_indexes(self, mirror):
+        result = mirror.query(min_severity=3, datasource="cpu", group_path="prod/web")
+        assert [a["id"] for a in result] == ["LMA4"]
+
+    def test_exact_device_id_and_severity(self, mirror):
+        assert [a["id"] for a in mirror.query(device_id=7)] == ["LMA3"]
+        assert [a["id"] for a in mirror.query(severity=4)] == ["LMA2", "LMA4"]
+
+    def test_time_range_and_limit(self, mirror):
+        now = int(time.time())
+        assert [a["id"] for a in mirror.query(start_epoch=now - 350)] == ["LMA3", "LMA4"]
+        assert [a["id"] for a in mirror.query(end_epoch=now - 400)] == ["LMA1", "LMA2"]
+        assert [a["id"] for a in mirror.query(limit=1)] == ["LMA4"]
+
+    def test_update_moves_indexes(self, mirror):
+        """Re-upserting an alert replaces its old index entries."""
+        now = int(time.time())
+        mirror._upsert(_alert(1, now - 500, device="app01", severity=2))
+
+        assert [a["id"] for a in mirror.query(device="web01")] == []
+        assert [a["id"] for a in mirror.query(device="app01")] == ["LMA1"]
+        assert len(mirror) == 4
+
+
+class TestMirroredAlerts:
+    """Tests for the tool-facing mirror lookup and fallback."""
+
+    async def test_returns_none_without_mirror(self, client):
+        assert await mirrored_alerts(client, int(time.time()) - 3600) is None
+
+    async def test_returns_none_for_other_client(self, client):
+        other = LogicMonitorClient(base_url=BASE_URL, auth=BearerAuth("x"), timeout=30)
+        mirror = AlertMirror(other)
+        mirror.coverage_start = 0
+        mirror.last_sync = time.monotonic()
+        alert_mirror._state["mirror"] = mirror
+
+        assert await mirrored_alerts(client, int(time.time()) - 3600) is None
+
+    @respx.mock
+    async def test_resolves_group_to_path(self, client):
+        now = int(time.time())
+        respx.get(f"{BASE_URL}/device/groups/12").mock(
+            return_value=httpx.Response(200, json={"id": 12, "fullPath": "Prod/DB"})
+        )
+        mirror = AlertMirror(client)
+        mirror._upsert(_alert(1, now - 100))
+        mirror._upsert(_alert(2, now - 50, groups="Prod/DB,Shared"))
+        mirror.coverage_start = now - 3600
+        mirror.last_sync = time.monotonic()
+        alert_mirror._state["mirror"] = mirror
+
+        result = await mirrored_alerts(client, now - 3600, group_id=12)
+
+        assert [a["id"] for a in result] == ["LMA2"]
+
+    @respx.mock
+    async def test_correlate_alerts_uses_fresh_mirror(self, client):
+        """correlate_alerts answers from a fresh mirror without calling /alert/alerts."""
+        from lm_mcp.tools.correlation import correlate_alerts
+
+        now = int(time.time())
+        route = respx.get(ALERT_URL).mock(return_value=httpx.Response(200, json={"items": []}))
+        mirror = AlertMirror(client)
+        mirror._upsert(_alert(1, now - 100))
+        mirror._upsert(_alert(2, now - 90))
+        mirror._upsert(_alert(3, now - 80, cleared=True))
+        mirror.coverage_start = now - 86400
+        mirror.last_sync = time.monotonic()
+        alert_mirror._state["mirror"] = mirror
+
+        result = await correlate_alerts(client, hours_back=4)
+
+        data = json.loads(result[0].text)
+        assert data["total_alerts"] == 2
+        assert route.call_count == 0
+
+    @respx.mock
+    async def test_correlate_alerts_falls_back_when_not_covered(self, client):
+        """A query reaching past the mirror's coverage goes to the API."""
+        from lm_mcp.tools.correlation import correlate_alerts
+
+        now = int(time.time())
+        route = respx.get(ALERT_URL).mock(
+            return_value=httpx.Response(200, json={"items": [_alert(1, now - 100)]})
+        )
+        mirror = AlertMirror(client)
+        mirror.coverage_start = now - 3600
+        mirror.last_sync = time.monotonic()
+        alert_mirror._state["mirror"] = mirror
+
+        result = await correlate_alerts(client, hours_back=4)
+
+        assert json.loads(result[0].text)["total_alerts"] == 1
+        assert route.call_count == 1
+
+    @respx.mock
+    async def test_power_events_use_fresh_mirror(self, client):
+        """get_power_events scans active mirrored alerts without calling /alert/alerts."""
+        from lm_mcp.tools.networking import get_power_events
+
+        now = int(time.time())
+        route = respx.get(ALERT_URL).mock(return_value=httpx.Response(200, json={"items": []}))
+        mirror = AlertMirror(client)
+        mirror._upsert(_alert(1, now - 100, device="ups01", dataSourceName="APC_UPS"))
+        mirror._upsert(_alert(2, now - 90, device="web01", dataSourceName="CPU"))
+        mirror._upsert(_alert(3, now - 80, device="ups01", dataSourceName="APC_UPS", cleared=True))
+        mirror.coverage_start = now - 86400
+        mirror.last_sync = time.monotonic()
+        alert_mirror._state["mirror"] = mirror
+
+        result = await get_power_events(client, device="ups*")
+
+        data = json.loads(result[0].text)
+        assert data["total_alerts_scanned"] == 1
+        assert [e["id"] for e in data["events"]] == ["LMA1"]
+        assert "note" in data
+        assert route.call_count == 0
+
+    @respx.mock
+    async def test_collector_history_uses_mirror_active_lookup_does_not(self, client):
+        """CollectorDown history comes from the mirror; active alerts still need the API."""
+        from lm_mcp.tools.collectors import get_collector_health
+
+        now = int(time.time())
+        respx.get(f"{BASE_URL}/setting/collector/collectors/3").mock(
+            return_value=httpx.Response(200, json={"id": 3, "hostname": "col-03"})
+        )
+        respx.get(f"{BASE_URL}/device/devices").mock(
+            return_value=httpx.Response(200, json={"items": [], "total": 0})
+        )
+        route = respx.get(ALERT_URL).mock(return_value=httpx.Response(200, json={"items": []}))
+        mirror = AlertMirror(client)
+        mirror._upsert(_alert(1, now - 100, device="col-03", alertType="CollectorDown"))
+        mirror._upsert(_alert(2, now - 90, device="col-03"))
+        mirror.coverage_start = now - 30 * 86400
+        mirror.last_sync = time.monotonic()
+        alert_mirror._state["mirror"] = mirror
+
+        result = await get_collector_health(client, collector_id=3, include_history=True)
+
+        history = json.loads(result[0].text)["collectors"][0]["collector_down_history"]
+        assert [h["alert_id"] for h in history] == ["LMA1"]
+        assert route.call_count == 1
+        assert "cleared:false" in route.calls[0].request.url.params["filter"]
+
+
+class TestMirrorMatchesApi:
+    """Mirror consumers report the same alerts whichever path serves them."""
+
+    @pytest.fixture
+    def alerts(self):
+        now = int(time.time())
+        return [
+            _alert(1, now - 3000),
+            _alert(2, now - 2500, device="app01", cleared=True),
+            _alert(3, now - 2000),
+        ]
+
+    async def _both_paths(self, client, monkeypatch, alerts, tool, **kwargs):
+        """Run ``tool`` from a mirror holding ``alerts``, then from the API.
+
+        The API answers as the unfiltered ``startEpoch>:`` query does: with
+        the active alerts only.
+        """
+        now = int(time.time())
+        monkeypatch.setattr(time, "time", lambda: now)
+        active = [a for a in alerts if not a["cleared"]]
+        respx.get(f"{BASE_URL}/setting/accesslogs").mock(
+            return_value=httpx.Response(200, json={"items": []})
+        )
+        route = respx.get(ALERT_URL).mock(
+            return_value=httpx.Response(200, json={"items": active, "total": len(active)})
+        )
+        mirror = AlertMirror(client)
+        for alert in alerts:
+            mirror._upsert(alert)
+        mirror.coverage_start = now - 86400
+        mirror.last_sync = time.monotonic()
+        alert_mirror._state["mirror"] = mirror
+
+        from_mirror = json.loads((await tool(client, **kwargs))[0].text)
+        assert route.call_count == 0
+
+        alert_mirror._state["mirror"] = None
+        from_api = json.loads((await tool(client, **kwargs))[0].text)
+        assert route.call_count == 1
+        return from_mirror, from_api
+
+    @respx.mock
+    async def test_score_alert_noise(self, client, monkeypatch, alerts):
+        from lm_mcp.tools.scoring import score_alert_noise
+
+        from_mirror, from_api = await self._both_paths(
+            client, monkeypatch, alerts, score_alert_noise, hours_back=4
+        )
+
+        assert from_mirror["total_alerts"] == 2
+        assert from_mirror == from_api
+
+    @respx.mock
+    async def test_calculate_availability(self, client, monkeypatch, alerts):
+        from lm_mcp.tools.scoring import calculate_availability
+
+        from_mirror, from_api = await self._both_paths(
+            client, monkeypatch, alerts, calculate_availability, hours_back=4
+        )
+
+        assert from_mirror["incident_count"] == 1
+        assert from_mirror == from_api
+
+    @respx.mock
+    async def test_correlate_changes(self, client, monkeypatch, alerts):
+        from lm_mcp.tools.event_correlation import correlate_changes
+
+        from_mirror, from_api = await self._both_paths(
+            client, monkeypatch, alerts, correlate_changes, hours_back=4
+        )
+
+        assert from_mirror["total_alerts"] == 2
+        assert from_mirror == from_api
+
+
+class TestMirrorLifecycle:
+    """Tests for the background sync task."""
+
+    @respx.mock
+    async def test_start_and_stop(self, client):
+        respx.get(ALERT_URL).mock(return_value=httpx.Response(200, json={"items": []}))
+
+        mirror = alert_mirror.start_alert_mirror(client, interval=3600, retention_hours=1)
+        for _ in range(50):
+            if mirror.sync_count:
+                break
+            await asyncio.sleep(0.01)
+
+        assert alert_mirror.get_alert_mirror() is mirror
+        assert mirror.sync_count == 1
+        assert mirror.is_fresh()
+
+        await alert_mirror.stop_alert_mirror()
+        assert alert_mirror.get_alert_mirror() is None
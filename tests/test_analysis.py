@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import json
 import time
 
 import pytest
@@ -254,3 +255,186 @@ class TestDeviceHealthAssessmentWorkflow:
         assert "score_device_health" in calls
         assert "analyze_blast_radius" in calls
         assert "get_metric_anomalies" in calls
+
+
+class TestParseSchedule:
+    """Tests for LM_ANALYSIS_SCHEDULE parsing."""
+
+    def test_pairs_with_units(self):
+        """workflow=interval pairs accept seconds, minutes, and hours."""
+        from lm_mcp.analysis import parse_schedule
+
+        schedule = parse_schedule("health_check=5m, alert_correlation=600,top_talkers=1h")
+        assert [(s.workflow, s.interval) for s in schedule] == [
+            ("health_check", 300),
+            ("alert_correlation", 600),
+            ("top_talkers", 3600),
+        ]
+
+    def test_json_entries_carry_arguments(self):
+        """The JSON form passes arguments through to the workflow."""
+        from lm_mcp.analysis import parse_schedule
+
+        schedule = parse_schedule(
+            '[{"workflow": "capacity_forecast", "interval": "15m",'
+            ' "arguments": {"device_id": 1, "device_datasource_id": 2, "instance_id": 3}}]'
+        )
+        assert schedule[0].interval == 900
+        assert schedule[0].arguments["device_id"] == 1
+
+    @pytest.mark.parametrize(
+        "spec",
+        ["health_check", "unknown=5m", "health_check=10s", "health_check=2d", "[{}]"],
+    )
+    def test_invalid_specs_raise(self, spec):
+        """Missing intervals, unknown workflows, and out-of-range intervals are rejected."""
+        from lm_mcp.analysis import parse_schedule
+
+        with pytest.raises(ValueError):
+            parse_schedule(spec)
+
+
+class TestPrecomputedResults:
+    """Tests for tool results recorded by scheduled runs."""
+
+    def _result(self, text: str = '{"clusters": []}'):
+        from mcp.types import TextContent
+
+        return [TextContent(type="text", text=text)]
+
+    def test_schema_defaults_match(self):
+        """A call relying on schema defaults matches the recorded explicit call."""
+        from lm_mcp.analysis import AnalysisStore
+
+        store = AnalysisStore()
+        result = self._result()
+        store.record_tool_result("portal-a", "correlate_alerts", {"hours_back": 4}, result, 60)
+        assert store.tool_result("portal-a", "correlate_alerts", {}).result is result
+        assert store.tool_result("portal-a", "correlate_alerts", {"hours_back": 8}) is None
+        assert store.tool_result("portal-b", "correlate_alerts", {}) is None
+
+    def test_stale_result_not_served(self):
+        """Results older than their max age are ignored."""
+        from lm_mcp.analysis import AnalysisStore
+
+        store = AnalysisStore()
+        store.record_tool_result("p", "correlate_alerts", {"hours_back": 4}, self._result(), 60)
+        entry = next(iter(store._tool_results.values()))
+        entry.recorded_at = time.time() - 61
+        assert store.tool_result("p", "correlate_alerts", {"hours_back": 4}) is None
+
+
+class TestAnalysisScheduler:
+    """Tests for the background analysis scheduler."""
+
+    @pytest.fixture
+    def lm_client(self, monkeypatch):
+        from lm_mcp.auth.bearer import BearerAuth
+        from lm_mcp.client import LogicMonitorClient
+
+        monkeypatch.setenv("LM_PORTAL", "test.logicmonitor.com")
+        monkeypatch.setenv("LM_BEARER_TOKEN", "test-bearer-token-value")
+        return LogicMonitorClient(
+            base_url="https://test.logicmonitor.com/santaba/rest",
+            auth=BearerAuth("test-token"),
+        )
+
+    async def test_scheduled_run_serves_matching_tool_call(self, lm_client, monkeypatch):
+        """A scheduled alert_correlation run answers later identical tool calls."""
+        import asyncio
+        from unittest.mock import AsyncMock
+
+        from mcp.types import TextContent
+
+        from lm_mcp import server
+        from lm_mcp.analysis import (
+            ScheduledWorkflow,
+            get_analysis_store,
+            start_analysis_scheduler,
+            stop_analysis_scheduler,
+        )
+
+        scheduled = AsyncMock(return_value=[TextContent(type="text", text='{"n": 1}')])
+        live = AsyncMock(return_value=[TextContent(type="text", text='{"n": 2}')])
+        monkeypatch.setattr("lm_mcp.registry.get_tool_handler", lambda name: scheduled)
+        monkeypatch.setattr(server, "get_tool_handler", lambda name: live)
+        server._set_client(lm_client)
+
+        start_analysis_scheduler(
+            lm_client, [ScheduledWorkflow("alert_correlation", 300, {"hours_back": 4})]
+        )
+        await asyncio.sleep(0.05)
+
+        runs = get_analysis_store().list_recent()
+        assert runs[0].scheduled is True
+        assert runs[0].status == "completed"
+
+        result = json.loads((await server.execute_tool("correlate_alerts", {}))[0].text)
+        assert result["n"] == 1
+        assert result["cached"] is True
+        assert result["computed_at"] <= time.time()
+        live.assert_not_called()
+
+        # Calls the schedule did not cover still run live
+        other = await server.execute_tool("correlate_alerts", {"hours_back": 24})
+        assert other[0].text == '{"n": 2}'
+
+        await stop_analysis_scheduler()
+        after = await server.execute_tool("correlate_alerts", {})
+        assert after[0].text == '{"n": 2}'
+        server._set_client(None)
+
+    async def test_primitive_reads_never_served(self, lm_client, monkeypatch):
+        """A health_check schedule serves its own report, never get_alerts/get_devices."""
+        import asyncio
+        from unittest.mock import AsyncMock
+
+        from mcp.types import TextContent
+
+        from lm_mcp import server
+        from lm_mcp.analysis import (
+            ScheduledWorkflow,
+            precomputed_workflow,
+            start_analysis_scheduler,
+            stop_analysis_scheduler,
+        )
+
+        scheduled = AsyncMock(return_value=[TextContent(type="text", text='{"items": [1]}')])
+        live = AsyncMock(return_value=[TextContent(type="text", text='{"items": [2]}')])
+        monkeypatch.setattr("lm_mcp.registry.get_tool_handler", lambda name: scheduled)
+        monkeypatch.setattr(server, "get_tool_handler", lambda name: live)
+        server._set_client(lm_client)
+
+        start_analysis_scheduler(lm_client, [ScheduledWorkflow("health_check", 300)])
+        await asyncio.sleep(0.05)
+
+        result = await server.execute_tool("get_alerts", {"limit": 50})
+        assert result[0].text == '{"items": [2]}'
+        report = precomputed_workflow(lm_client, "health_check", {})
+        assert report.result["alerts"] == {"items": [1]}
+        assert precomputed_workflow(lm_client, "health_check", {"x": 1}) is None
+
+        await stop_analysis_scheduler()
+        server._set_client(None)
+
+    async def test_error_results_not_recorded(self, lm_client, monkeypatch):
+        """Tool errors from a scheduled run are never served to callers."""
+        import asyncio
+        from unittest.mock import AsyncMock
+
+        from mcp.types import TextContent
+
+        from lm_mcp.analysis import (
+            ScheduledWorkflow,
+            precomputed_result,
+            start_analysis_scheduler,
+            stop_analysis_scheduler,
+        )
+
+        failing = AsyncMock(return_value=[TextContent(type="text", text="Error: rate limited")])
+        monkeypatch.setattr("lm_mcp.registry.get_tool_handler", lambda name: failing)
+
+        start_analysis_scheduler(lm_client, [ScheduledWorkflow("top_talkers", 300)])
+        await asyncio.sleep(0.05)
+        assert precomputed_result(lm_client, "get_alert_statistics", {"hours_back": 24}) is None
+        await stop_analysis_scheduler()
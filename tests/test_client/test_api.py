@@ -751,3 +751,98 @@ class TestRequestBodyAuthSignature:
         ) as client:
             with pytest.raises(LMError):
                 await client.ingest_post("/rest/log/ingest", json_body={"foo": "bar"})
+
+
+class TestSerializedRequestBody:
+    """The body is serialized once, signed on the bytes sent, and re-signed per attempt."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_sent_bytes_match_signed_body(self):
+        from lm_mcp.client import LogicMonitorClient
+
+        route = respx.post("https://test.logicmonitor.com/santaba/rest/sdt/sdts").mock(
+            return_value=Response(200, json={"id": 1})
+        )
+
+        auth = _RecordingAuth()
+        async with LogicMonitorClient(
+            base_url="https://test.logicmonitor.com/santaba/rest",
+            auth=auth,
+        ) as client:
+            await client.post("/sdt/sdts", json_body={"type": "DeviceSDT", "comment": "café"})
+
+        assert route.calls.last.request.content == auth.captured_body.encode()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_retry_re_signs_each_attempt(self):
+        from lm_mcp.client import LogicMonitorClient
+
+        route = respx.post("https://test.logicmonitor.com/santaba/rest/sdt/sdts")
+        route.side_effect = [
+            Response(429, headers={"Retry-After": "0"}),
+            Response(200, json={"id": 1}),
+        ]
+
+        auth = _RecordingAuth()
+        async with LogicMonitorClient(
+            base_url="https://test.logicmonitor.com/santaba/rest",
+            auth=auth,
+        ) as client:
+            await client.post("/sdt/sdts", json_body={"type": "DeviceSDT"})
+
+        assert route.call_count == 2
+        assert len(auth.calls) == 2
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_large_ingest_payload_is_gzipped(self):
+        import gzip
+        import json
+
+        from lm_mcp.client import LogicMonitorClient
+
+        route = respx.post("https://test.logicmonitor.com/rest/log/ingest").mock(
+            return_value=Response(202, json={"success": True})
+        )
+        entries = [{"msg": "disk full on /var", "_lm.resourceId": {"system.hostname": "web01"}}]
+        entries *= 200
+
+        auth = _RecordingAuth()
+        async with LogicMonitorClient(
+            base_url="https://test.logicmonitor.com/santaba/rest",
+            auth=auth,
+            ingest_url="https://test.logicmonitor.com",
+            ingest_gzip_min_bytes=1024,
+        ) as client:
+            await client.ingest_post("/rest/log/ingest", json_body=entries)
+
+        request = route.calls.last.request
+        assert request.headers["Content-Encoding"] == "gzip"
+        # signed over the uncompressed JSON that the wire bytes decompress to
+        assert gzip.decompress(request.content) == auth.captured_body.encode()
+        assert json.loads(auth.captured_body) == entries
+        assert len(request.content) < len(auth.captured_body)
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_small_ingest_payload_is_not_gzipped(self):
+        from lm_mcp.client import LogicMonitorClient
+
+        route = respx.post("https://test.logicmonitor.com/rest/log/ingest").mock(
+            return_value=Response(202, json={"success": True})
+        )
+
+        auth = _RecordingAuth()
+        async with LogicMonitorClient(
+            base_url="https://test.logicmonitor.com/santaba/rest",
+            auth=auth,
+            ingest_url="https://test.logicmonitor.com",
+            ingest_gzip_min_bytes=1024,
+        ) as client:
+            await client.ingest_post("/rest/log/ingest", json_body=[{"msg": "ok"}])
+
+        request = route.calls.last.request
+        assert "Content-Encoding" not in request.headers
+        assert request.content == auth.captured_body.encode()
@@ -428,3 +428,174 @@ class TestMultiPortalConfig:
         config = LMConfig()
         with pytest.raises(ValueError, match="portal"):
             _ = config.ingest_url
+
+
+class TestAnalysisExecutorConfig:
+    """Tests for analytics executor settings."""
+
+    def test_defaults(self, monkeypatch):
+        monkeypatch.setenv("LM_PORTAL", "test.logicmonitor.com")
+        monkeypatch.setenv("LM_BEARER_TOKEN", "test_token_123")
+        config = LMConfig()
+        assert config.analysis_workers == 2
+        assert config.analysis_offload_threshold == 5000
+
+    def test_negative_workers_rejected(self, monkeypatch):
+        monkeypatch.setenv("LM_PORTAL", "test.logicmonitor.com")
+        monkeypatch.setenv("LM_BEARER_TOKEN", "test_token_123")
+        monkeypatch.setenv("LM_ANALYSIS_WORKERS", "-1")
+        with pytest.raises(ValidationError, match="analysis_workers"):
+            LMConfig()
+
+    def test_zero_threshold_rejected(self, monkeypatch):
+        monkeypatch.setenv("LM_PORTAL", "test.logicmonitor.com")
+        monkeypatch.setenv("LM_BEARER_TOKEN", "test_token_123")
+        monkeypatch.setenv("LM_ANALYSIS_OFFLOAD_THRESHOLD", "0")
+        with pytest.raises(ValidationError, match="analysis_offload_threshold"):
+            LMConfig()
+
+
+class TestAlertMirrorConfig:
+    """Tests for alert mirror settings."""
+
+    def test_defaults(self, monkeypatch):
+        monkeypatch.setenv("LM_PORTAL", "test.logicmonitor.com")
+        monkeypatch.setenv("LM_BEARER_TOKEN", "test_token_123")
+        config = LMConfig()
+        assert config.alert_mirror_enabled is False
+        assert config.alert_mirror_interval == 60
+        assert config.alert_mirror_hours == 168
+        assert config.alert_mirror_max_alerts == 50000
+
+    def test_short_interval_rejected(self, monkeypatch):
+        monkeypatch.setenv("LM_PORTAL", "test.logicmonitor.com")
+        monkeypatch.setenv("LM_BEARER_TOKEN", "test_token_123")
+        monkeypatch.setenv("LM_ALERT_MIRROR_INTERVAL", "5")
+        with pytest.raises(ValidationError, match="alert_mirror_interval"):
+            LMConfig()
+
+    def test_excessive_retention_rejected(self, monkeypatch):
+        monkeypatch.setenv("LM_PORTAL", "test.logicmonitor.com")
+        monkeypatch.setenv("LM_BEARER_TOKEN", "test_token_123")
+        monkeypatch.setenv("LM_ALERT_MIRROR_HOURS", "721")
+        with pytest.raises(ValidationError, match="alert_mirror_hours"):
+            LMConfig()
+
+
+class TestOverviewRefreshConfig:
+    """Tests for the portal overview background refresh setting."""
+
+    def test_disabled_by_default(self, monkeypatch):
+        monkeypatch.setenv("LM_PORTAL", "test.logicmonitor.com")
+        monkeypatch.setenv("LM_BEARER_TOKEN", "test_token_123")
+        assert LMConfig().overview_refresh_interval == 0
+
+    def test_valid_interval(self, monkeypatch):
+        monkeypatch.setenv("LM_PORTAL", "test.logicmonitor.com")
+        monkeypatch.setenv("LM_BEARER_TOKEN", "test_token_123")
+        monkeypatch.setenv("LM_OVERVIEW_REFRESH_INTERVAL", "300")
+        assert LMConfig().overview_refresh_interval == 300
+
+    def test_short_interval_rejected(self, monkeypatch):
+        monkeypatch.setenv("LM_PORTAL", "test.logicmonitor.com")
+        monkeypatch.setenv("LM_BEARER_TOKEN", "test_token_123")
+        monkeypatch.setenv("LM_OVERVIEW_REFRESH_INTERVAL", "30")
+        with pytest.raises(ValidationError, match="overview_refresh_interval"):
+            LMConfig()
+
+    def test_excessive_interval_rejected(self, monkeypatch):
+        monkeypatch.setenv("LM_PORTAL", "test.logicmonitor.com")
+        monkeypatch.setenv("LM_BEARER_TOKEN", "test_token_123")
+        monkeypatch.setenv("LM_OVERVIEW_REFRESH_INTERVAL", "3601")
+        with pytest.raises(ValidationError, match="overview_refresh_interval"):
+            LMConfig()
+
+
+class TestAnalysisScheduleConfig:
+    """Tests for the scheduled analysis setting."""
+
+    def test_unset_by_default(self, monkeypatch):
+        monkeypatch.setenv("LM_PORTAL", "test.logicmonitor.com")
+        monkeypatch.setenv("LM_BEARER_TOKEN", "test_token_123")
+        assert LMConfig().analysis_schedule is None
+
+    def test_valid_schedule(self, monkeypatch):
+        monkeypatch.setenv("LM_PORTAL", "test.logicmonitor.com")
+        monkeypatch.setenv("LM_BEARER_TOKEN", "test_token_123")
+        monkeypatch.setenv("LM_ANALYSIS_SCHEDULE", "health_check=5m,alert_correlation=10m")
+        assert LMConfig().analysis_schedule == "health_check=5m,alert_correlation=10m"
+
+    def test_unknown_workflow_rejected(self, monkeypatch):
+        monkeypatch.setenv("LM_PORTAL", "test.logicmonitor.com")
+        monkeypatch.setenv("LM_BEARER_TOKEN", "test_token_123")
+        monkeypatch.setenv("LM_ANALYSIS_SCHEDULE", "nightly_report=1h")
+        with pytest.raises(ValidationError, match="analysis_schedule"):
+            LMConfig()
+
+
+class TestPortalPoolConfig:
+    """Tests for the multi-portal client pool settings."""
+
+    def test_defaults(self, monkeypatch):
+        monkeypatch.setenv("LM_PORTAL", "test.logicmonitor.com")
+        monkeypatch.setenv("LM_BEARER_TOKEN", "test_token_123")
+        config = LMConfig()
+        assert config.portal_pool_size == 32
+        assert config.portal_idle_timeout == 900
+        assert config.portal_prewarm == 0
+        assert config.portal_usage_file is None
+
+    def test_zero_pool_size_rejected(self, monkeypatch):
+        monkeypatch.setenv("LM_PORTAL", "test.logicmonitor.com")
+        monkeypatch.setenv("LM_BEARER_TOKEN", "test_token_123")
+        monkeypatch.setenv("LM_PORTAL_POOL_SIZE", "0")
+        with pytest.raises(ValidationError, match="portal_pool_size"):
+            LMConfig()
+
+    def test_short_idle_timeout_rejected(self, monkeypatch):
+        monkeypatch.setenv("LM_PORTAL", "test.logicmonitor.com")
+        monkeypatch.setenv("LM_BEARER_TOKEN", "test_token_123")
+        monkeypatch.setenv("LM_PORTAL_IDLE_TIMEOUT", "30")
+        with pytest.raises(ValidationError, match="portal_idle_timeout"):
+            LMConfig()
+
+    def test_idle_eviction_can_be_disabled(self, monkeypatch):
+        monkeypatch.setenv("LM_PORTAL", "test.logicmonitor.com")
+        monkeypatch.setenv("LM_BEARER_TOKEN", "test_token_123")
+        monkeypatch.setenv("LM_PORTAL_IDLE_TIMEOUT", "0")
+        assert LMConfig().portal_idle_timeout == 0
+
+
+class TestIngestGzipConfig:
+    """Tests for the ingestion payload compression threshold."""
+
+    def test_disabled_by_default(self, monkeypatch):
+        monkeypatch.setenv("LM_PORTAL", "test.logicmonitor.com")
+        monkeypatch.setenv("LM_BEARER_TOKEN", "test_token_123")
+        assert LMConfig().ingest_gzip_min_bytes == 0
+
+    def test_negative_threshold_rejected(self, monkeypatch):
+        monkeypatch.setenv("LM_PORTAL", "test.logicmonitor.com")
+        monkeypatch.setenv("LM_BEARER_TOKEN", "test_token_123")
+        monkeypatch.setenv("LM_INGEST_GZIP_MIN_BYTES", "-1")
+        with pytest.raises(ValidationError, match="ingest_gzip_min_bytes"):
+            LMConfig()
+
+
+class TestMetricBatcherConfig:
+    """Tests for the metric push batching settings."""
+
+    def test_defaults(self, monkeypatch):
+        monkeypatch.setenv("LM_PORTAL", "test.logicmonitor.com")
+        monkeypatch.setenv("LM_BEARER_TOKEN", "test_token_123")
+        config = LMConfig()
+        assert config.metric_queue_size == 50_000
+        assert config.metric_upload_concurrency == 8
+        assert config.metric_flush_interval == 1.0
+
+    def test_tiny_flush_interval_rejected(self, monkeypatch):
+        monkeypatch.setenv("LM_PORTAL", "test.logicmonitor.com")
+        monkeypatch.setenv("LM_BEARER_TOKEN", "test_token_123")
+        monkeypatch.setenv("LM_METRIC_FLUSH_INTERVAL", "0.001")
+        with pytest.raises(ValidationError, match="metric_flush_interval"):
+            LMConfig()
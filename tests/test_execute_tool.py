@@ -1,6 +1,7 @@
 # Description: Tests for the shared execute_tool middleware function.
 # Description: Validates tool filtering, write audit, and session recording.
 
+import asyncio
 import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -156,6 +157,58 @@ class TestExecuteToolMiddleware:
             "get_devices", {"limit": 10}, {"id": 1}, success=True
         )
 
+    @pytest.mark.asyncio
+    async def test_records_structured_result_without_parsing(self, monkeypatch, mock_client):
+        """execute_tool records format_response data without re-parsing the text."""
+        monkeypatch.setenv("LM_PORTAL", "test.logicmonitor.com")
+        monkeypatch.setenv("LM_BEARER_TOKEN", "test-token")
+        monkeypatch.setenv("LM_SESSION_ENABLED", "true")
+
+        from lm_mcp.tools import format_response
+
+        data = {"items": [{"id": 7, "name": "web01"}]}
+        handler = AsyncMock(return_value=format_response(data))
+        mock_session = MagicMock()
+
+        with (
+            patch("lm_mcp.server.get_tool_handler", return_value=handler),
+            patch("lm_mcp.server.get_client", return_value=mock_client),
+            patch("lm_mcp.server.get_session", return_value=mock_session),
+            patch("lm_mcp.server.json.loads", side_effect=AssertionError("re-parsed")),
+        ):
+            from lm_mcp.server import execute_tool
+
+            await execute_tool("get_devices", {})
+
+        mock_session.record_result.assert_called_once_with("get_devices", {}, data, success=True)
+
+    @pytest.mark.asyncio
+    async def test_deferred_recording_runs_after_return(
+        self, monkeypatch, mock_handler, mock_client
+    ):
+        """With LM_SESSION_RECORD_DEFERRED the result is recorded after the call returns."""
+        monkeypatch.setenv("LM_PORTAL", "test.logicmonitor.com")
+        monkeypatch.setenv("LM_BEARER_TOKEN", "test-token")
+        monkeypatch.setenv("LM_SESSION_ENABLED", "true")
+        monkeypatch.setenv("LM_SESSION_RECORD_DEFERRED", "true")
+
+        mock_session = MagicMock()
+
+        with (
+            patch("lm_mcp.server.get_tool_handler", return_value=mock_handler),
+            patch("lm_mcp.server.get_client", return_value=mock_client),
+            patch("lm_mcp.server.get_session", return_value=mock_session),
+        ):
+            from lm_mcp.server import execute_tool
+
+            await execute_tool("get_devices", {"limit": 10})
+            mock_session.record_result.assert_not_called()
+            await asyncio.sleep(0)
+
+        mock_session.record_result.assert_called_once_with(
+            "get_devices", {"limit": 10}, {"id": 1}, success=True
+        )
+
     @pytest.mark.asyncio
     async def test_skips_session_for_session_tools(self, monkeypatch, mock_handler):
         """execute_tool does not record session tools in session history."""
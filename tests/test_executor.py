@@ -0,0 +1,156 @@
+# Description: Tests for the shared analytics executor.
+# Description: Validates inline/offload selection, thread fallback, and timing stats.
+
+from __future__ import annotations
+
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from lm_mcp import executor
+from lm_mcp.tools.stats_helpers import coefficient_of_variation
+
+
+@pytest.fixture(autouse=True)
+def _reset_executor():
+    """Start every test with no pool and no recorded timings."""
+    executor.shutdown_executor()
+    executor.reset_executor_stats()
+    yield
+    executor.shutdown_executor()
+    executor.reset_executor_stats()
+
+
+@pytest.fixture
+def offload_all(monkeypatch):
+    """Configure a threshold of 1 so every call is offloaded."""
+    monkeypatch.setenv("LM_PORTAL", "test.logicmonitor.com")
+    monkeypatch.setenv("LM_BEARER_TOKEN", "test-token-123")
+    monkeypatch.setenv("LM_ANALYSIS_OFFLOAD_THRESHOLD", "1")
+    monkeypatch.setenv("LM_ANALYSIS_WORKERS", "1")
+
+
+class TestRunCpuBound:
+    """Tests for run_cpu_bound offload decisions."""
+
+    async def test_small_input_runs_inline(self):
+        """Inputs below the threshold run on the event loop without a pool."""
+        result = await executor.run_cpu_bound(coefficient_of_variation, [1.0, 2.0, 3.0], size=3)
+
+        assert result == pytest.approx(0.5)
+        stats = executor.get_executor_stats()
+        assert stats["kind"] is None
+        entry = stats["functions"]["coefficient_of_variation"]
+        assert entry["calls"] == 1
+        assert entry["offloaded"] == 0
+
+    async def test_zero_workers_disables_offload(self, monkeypatch):
+        """LM_ANALYSIS_WORKERS=0 keeps every call inline regardless of size."""
+        monkeypatch.setenv("LM_PORTAL", "test.logicmonitor.com")
+        monkeypatch.setenv("LM_BEARER_TOKEN", "test-token-123")
+        monkeypatch.setenv("LM_ANALYSIS_WORKERS", "0")
+
+        await executor.run_cpu_bound(coefficient_of_variation, [1.0, 2.0], size=10**9)
+
+        assert executor.get_executor_stats()["kind"] is None
+
+    async def test_large_input_uses_process_pool(self, offload_all):
+        """Inputs at the threshold run in the process pool."""
+        result = await executor.run_cpu_bound(coefficient_of_variation, [1.0, 2.0, 3.0], size=3)
+
+        assert result == pytest.approx(0.5)
+        stats = executor.get_executor_stats()
+        assert stats["kind"] == "process"
+        assert stats["functions"]["coefficient_of_variation"]["offloaded"] == 1
+
+    async def test_pool_creation_failure_falls_back_to_threads(self, offload_all, monkeypatch):
+        """A platform without process support uses a thread pool instead."""
+
+        def _no_processes(*args, **kwargs):
+            raise OSError("no /dev/shm")
+
+        monkeypatch.setattr(executor, "ProcessPoolExecutor", _no_processes)
+
+        result = await executor.run_cpu_bound(coefficient_of_variation, [2.0, 4.0], size=2)
+
+        assert result == pytest.approx(0.4714, abs=1e-4)
+        assert executor.get_executor_stats()["kind"] == "thread"
+
+    async def test_broken_pool_retries_on_threads(self, offload_all):
+        """A broken process pool is replaced and the call is retried on threads."""
+
+        class _BrokenPool:
+            def submit(self, fn, *args, **kwargs):
+                future: Future = Future()
+                future.set_exception(BrokenProcessPool("worker died"))
+                return future
+
+            def shutdown(self, wait=True, cancel_futures=False):
+                pass
+
+        executor._state.update({"executor": _BrokenPool(), "kind": "process"})
+
+        result = await executor.run_cpu_bound(coefficient_of_variation, [1.0, 2.0, 3.0], size=3)
+
+        assert result == pytest.approx(0.5)
+        assert executor.get_executor_stats()["kind"] == "thread"
+
+    async def test_function_errors_propagate(self, offload_all):
+        """Exceptions raised in a worker reach the caller unchanged, without fallback."""
+        from lm_mcp.tools.stats_helpers import linear_regression
+
+        with pytest.raises(ValueError, match="same length"):
+            await executor.run_cpu_bound(linear_regression, [1.0], [1.0, 2.0], size=2)
+        assert executor.get_executor_stats()["kind"] == "process"
+
+    async def test_function_oserror_does_not_fall_back(self, offload_all):
+        """An OSError raised by the function propagates once and keeps the process pool."""
+        import os
+
+        with pytest.raises(FileNotFoundError):
+            await executor.run_cpu_bound(os.stat, "/nonexistent/lm-mcp", size=2)
+        assert executor.get_executor_stats()["kind"] == "process"
+
+    async def test_function_typeerror_is_not_taken_for_a_pickling_error(self, offload_all):
+        """A TypeError raised by the function propagates instead of rerunning on a thread."""
+        with pytest.raises(TypeError) as excinfo:
+            await executor.run_cpu_bound(coefficient_of_variation, [1.0, "x"], size=2)
+        assert any("analysis worker" in note for note in excinfo.value.__notes__)
+        assert executor._state["threads"] is None
+
+    async def test_unpicklable_call_runs_on_thread(self, offload_all):
+        """A local closure cannot reach a worker; it runs on a thread for that call only."""
+        offset = 1.0
+
+        def shifted_cv(values):
+            return coefficient_of_variation([v + offset for v in values])
+
+        result = await executor.run_cpu_bound(shifted_cv, [0.0, 1.0, 2.0], size=3)
+
+        assert result == pytest.approx(0.5)
+        stats = executor.get_executor_stats()
+        assert stats["kind"] == "process"
+        (entry,) = stats["functions"].values()
+        assert entry["offloaded"] == 1
+
+
+class TestExecutorStats:
+    """Tests for timing statistics."""
+
+    async def test_stats_accumulate_per_function(self):
+        """Repeated calls accumulate count and timing under one label."""
+        for _ in range(3):
+            await executor.run_cpu_bound(coefficient_of_variation, [1.0, 2.0], size=2)
+
+        entry = executor.get_executor_stats()["functions"]["coefficient_of_variation"]
+        assert entry["calls"] == 3
+        assert entry["total_seconds"] >= 0.0
+        assert entry["max_seconds"] >= 0.0
+
+    def test_reset_clears_stats(self):
+        """reset_executor_stats empties the timing table."""
+        executor._record("fn", "inline", 0.01, 10)
+        executor.reset_executor_stats()
+
+        assert executor.get_executor_stats()["functions"] == {}
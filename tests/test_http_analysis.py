@@ -207,3 +207,47 @@ class TestRootEndpoint:
         assert "analyze" in endpoints
         assert "analysis" in endpoints
         assert "webhook_alert" in endpoints
+
+
+class TestPrecomputedAnalyze:
+    """POST /api/v1/analyze answers from a fresh scheduled run."""
+
+    @pytest.mark.asyncio
+    async def test_scheduled_result_served_as_cached(self, _set_env, monkeypatch):
+        import asyncio
+        from unittest.mock import AsyncMock
+
+        from httpx import ASGITransport, AsyncClient
+        from mcp.types import TextContent
+
+        from lm_mcp import server
+        from lm_mcp.analysis import (
+            ScheduledWorkflow,
+            start_analysis_scheduler,
+            stop_analysis_scheduler,
+        )
+        from lm_mcp.auth.bearer import BearerAuth
+        from lm_mcp.client import LogicMonitorClient
+        from lm_mcp.transport.http import create_asgi_app
+
+        lm_client = LogicMonitorClient(
+            base_url="https://test.logicmonitor.com/santaba/rest", auth=BearerAuth("t")
+        )
+        handler = AsyncMock(return_value=[TextContent(type="text", text='{"items": []}')])
+        monkeypatch.setattr("lm_mcp.registry.get_tool_handler", lambda name: handler)
+        server._set_client(lm_client)
+        start_analysis_scheduler(lm_client, [ScheduledWorkflow("health_check", 300)])
+        await asyncio.sleep(0.05)
+
+        app = create_asgi_app()
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+            resp = await c.post("/api/v1/analyze", json={"workflow": "health_check"})
+
+        await stop_analysis_scheduler()
+        server._set_client(None)
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["cached"] is True
+        assert data["status"] == "completed"
+        assert data["result"]["workflow"] == "health_check"
+        assert "computed_at" in data
@@ -317,3 +317,90 @@ class TestHttpToolsListWithTerraform:
 
         names = {t["name"] for t in resp.json()["result"]}
         assert names.isdisjoint({t.name for t in TF_TOOLS})
+
+
+async def _initialize(client) -> str:
+    """Send initialize and return the Mcp-Session-Id the server issued."""
+    resp = await client.post(
+        "/mcp", json={"jsonrpc": "2.0", "method": "initialize", "params": {}, "id": 0}
+    )
+    assert resp.status_code == 200
+    return resp.headers["Mcp-Session-Id"]
+
+
+class TestHttpSessionIsolation:
+    """Tests for per-session contexts on HTTP /mcp tools/call."""
+
+    @pytest.mark.asyncio
+    async def test_session_ids_get_separate_contexts(self, monkeypatch):
+        """Variables set under one Mcp-Session-Id are invisible to another."""
+        monkeypatch.setenv("LM_PORTAL", "test.logicmonitor.com")
+        monkeypatch.setenv("LM_BEARER_TOKEN", "test-token")
+
+        from httpx import ASGITransport, AsyncClient
+
+        from lm_mcp.session import get_session, get_session_store
+        from lm_mcp.transport.http import create_asgi_app
+
+        def call(name, arguments):
+            return {
+                "jsonrpc": "2.0",
+                "method": "tools/call",
+                "params": {"name": name, "arguments": arguments},
+                "id": 1,
+            }
+
+        transport = ASGITransport(app=create_asgi_app())
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            agent_a, agent_b = await _initialize(client), await _initialize(client)
+            await client.post(
+                "/mcp",
+                json=call("set_session_variable", {"name": "site", "value": "nyc"}),
+                headers={"Mcp-Session-Id": agent_a},
+            )
+            own = await client.post(
+                "/mcp",
+                json=call("get_session_variable", {"name": "site"}),
+                headers={"Mcp-Session-Id": agent_a},
+            )
+            other = await client.post(
+                "/mcp",
+                json=call("get_session_variable", {"name": "site"}),
+                headers={"Mcp-Session-Id": agent_b},
+            )
+
+        assert own.json()["result"]["value"] == "nyc"
+        assert "not found" in other.json()["result"]
+        assert len(get_session_store()) == 2
+        assert "site" not in get_session().variables
+
+    @pytest.mark.asyncio
+    async def test_only_issued_session_ids_accepted(self, monkeypatch):
+        """A made-up Mcp-Session-Id is refused instead of opening a context."""
+        monkeypatch.setenv("LM_PORTAL", "test.logicmonitor.com")
+        monkeypatch.setenv("LM_BEARER_TOKEN", "test-token")
+
+        from httpx import ASGITransport, AsyncClient
+
+        from lm_mcp.session import get_session_store
+        from lm_mcp.transport.http import create_asgi_app
+
+        body = {
+            "jsonrpc": "2.0",
+            "method": "tools/call",
+            "params": {"name": "get_session_variable", "arguments": {"name": "site"}},
+            "id": 1,
+        }
+        transport = ASGITransport(app=create_asgi_app())
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            issued = await _initialize(client)
+            assert issued != await _initialize(client)
+            forged = issued.split(".")[0] + ".0"
+            refused = await client.post("/mcp", json=body, headers={"Mcp-Session-Id": forged})
+            guessed = await client.post("/mcp", json=body, headers={"Mcp-Session-Id": "agent-a"})
+            accepted = await client.post("/mcp", json=body, headers={"Mcp-Session-Id": issued})
+
+        assert refused.status_code == guessed.status_code == 404
+        assert refused.json()["error"]["code"] == -32001
+        assert accepted.status_code == 200
+        assert len(get_session_store()) == 1
@@ -0,0 +1,369 @@
+# Description: Tests for the buffered log ingestion pipeline and its HTTP endpoint.
+# Description: Validates batching limits, backpressure, retries, batch splitting, and the spool.
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import os
+
+import pytest
+
+from lm_mcp import log_pipeline
+from lm_mcp.exceptions import LMError, ServerError
+from lm_mcp.log_pipeline import LogPipeline, QueueFullError
+
+
+class _IngestClient:
+    """Stand-in for LogicMonitorClient.ingest_post that records batch bodies."""
+
+    ingest_url = "https://acme.logicmonitor.com"
+
+    def __init__(self, fail=None, gate: asyncio.Event | None = None) -> None:
+        self.fail = fail
+        self.gate = gate
+        self.bodies: list[list[dict]] = []
+        self.sizes: list[int] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def ingest_post(self, path: str, json_body=None) -> dict:
+        assert path == "/rest/log/ingest"
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.gate is not None:
+                await self.gate.wait()
+            entries = json.loads(json_body)
+            if self.fail is not None:
+                self.fail(entries)
+            self.bodies.append(entries)
+            self.sizes.append(len(json_body))
+            return {"success": True}
+        finally:
+            self.in_flight -= 1
+
+
+def _logs(count: int, prefix: str = "line") -> list[dict]:
+    return [
+        {"message": f"{prefix} {i}", "_lm.resourceId": {"system.hostname": "web01"}}
+        for i in range(count)
+    ]
+
+
+@pytest.fixture(autouse=True)
+def _fast(monkeypatch):
+    monkeypatch.setattr(log_pipeline, "BATCH_LINGER_SECONDS", 0.01)
+    monkeypatch.setattr(log_pipeline, "UPLOAD_BACKOFF_SECONDS", 0)
+
+
+class TestBatching:
+    async def test_batches_respect_record_limit(self):
+        client = _IngestClient()
+        pipeline = LogPipeline(client, concurrency=1, max_batch_records=3)
+        submission = await pipeline.submit(_logs(7))
+        await submission.wait()
+
+        assert submission.delivered == 7
+        assert sorted(len(b) for b in client.bodies) == [1, 3, 3]
+        assert pipeline.pending == 0
+        await pipeline.close()
+
+    async def test_batches_respect_byte_limit(self):
+        client = _IngestClient()
+        limit = 400
+        pipeline = LogPipeline(client, concurrency=1, max_batch_bytes=limit)
+        submission = await pipeline.submit(_logs(20))
+        await submission.wait()
+
+        assert submission.delivered == 20
+        assert len(client.bodies) > 1
+        assert max(client.sizes) <= limit
+        await pipeline.close()
+
+    async def test_oversized_and_invalid_entries_rejected_up_front(self):
+        client = _IngestClient()
+        pipeline = LogPipeline(client, max_batch_bytes=200)
+        submission = await pipeline.submit([{"message": "x" * 500}, "not an object", *_logs(1)])
+        await submission.wait()
+
+        assert submission.rejected == 2
+        assert submission.delivered == 1
+        assert len(submission.errors) == 2
+        await pipeline.close()
+
+    async def test_batches_upload_concurrently(self):
+        gate = asyncio.Event()
+        client = _IngestClient(gate=gate)
+        pipeline = LogPipeline(client, concurrency=3, max_batch_records=1)
+        submission = await pipeline.submit(_logs(6))
+        await asyncio.sleep(0.05)
+        assert client.max_in_flight == 3
+
+        gate.set()
+        await submission.wait()
+        assert submission.delivered == 6
+        await pipeline.close()
+
+
+class TestBackpressure:
+    async def test_full_queue_refuses_without_waiting(self):
+        gate = asyncio.Event()
+        pipeline = LogPipeline(_IngestClient(gate=gate), max_queue=3)
+        await pipeline.submit(_logs(3))
+        with pytest.raises(QueueFullError):
+            await pipeline.submit(_logs(1))
+
+        gate.set()
+        await pipeline.flush()
+        assert pipeline.pending == 0
+        await pipeline.close()
+
+    async def test_submission_waits_for_room(self):
+        gate = asyncio.Event()
+        pipeline = LogPipeline(_IngestClient(gate=gate), max_queue=3)
+        await pipeline.submit(_logs(3))
+        waiting = asyncio.ensure_future(pipeline.submit(_logs(2), timeout=5))
+        await asyncio.sleep(0.02)
+        assert not waiting.done()
+
+        gate.set()
+        submission = await waiting
+        await submission.wait()
+        assert submission.delivered == 2
+        await pipeline.close()
+
+    async def test_submission_larger_than_queue_refused(self):
+        pipeline = LogPipeline(_IngestClient(), max_queue=2)
+        with pytest.raises(QueueFullError, match="exceed the queue size"):
+            await pipeline.submit(_logs(3), timeout=5)
+
+
+class TestFailures:
+    async def test_retryable_failure_is_retried(self):
+        attempts = {"n": 0}
+
+        def flaky(entries):
+            attempts["n"] += 1
+            if attempts["n"] == 1:
+                raise ServerError("portal busy")
+
+        pipeline = LogPipeline(_IngestClient(fail=flaky), concurrency=1)
+        submission = await pipeline.submit(_logs(4))
+        await submission.wait()
+
+        assert submission.delivered == 4
+        assert pipeline.stats()["retries"] == 1
+        await pipeline.close()
+
+    async def test_bad_entry_isolated_by_splitting(self):
+        def reject_bad(entries):
+            if any(e["message"] == "bad" for e in entries):
+                raise LMError("malformed entry", code="HTTP_400")
+
+        client = _IngestClient(fail=reject_bad)
+        pipeline = LogPipeline(client, concurrency=1)
+        submission = await pipeline.submit([*_logs(3), {"message": "bad"}, *_logs(4, "more")])
+        await submission.wait()
+
+        assert submission.delivered == 7
+        assert submission.rejected == 1
+        assert submission.errors == ["malformed entry"]
+        assert pipeline.stats()["splits"] >= 1
+        await pipeline.close()
+
+    async def test_partial_rejection_counted_per_batch(self):
+        """LM's rejection count is reported without pinning it on particular entries."""
+
+        class _PartialClient(_IngestClient):
+            async def ingest_post(self, path: str, json_body=None) -> dict:
+                await super().ingest_post(path, json_body)
+                return {"success": True, "errors": [{"error": "bad timestamp"}]}
+
+        gate = asyncio.Event()
+        pipeline = LogPipeline(_PartialClient(gate=gate), concurrency=1)
+        alone = await pipeline.submit(_logs(3))
+        gate.set()
+        await alone.wait()
+
+        assert (alone.delivered, alone.rejected, alone.batch_rejected) == (2, 1, 0)
+        assert alone.errors == ["bad timestamp"]
+
+        gate.clear()
+        first = await pipeline.submit(_logs(2))
+        second = await pipeline.submit(_logs(2, "other"))
+        gate.set()
+        await first.wait()
+        await second.wait()
+
+        for submission in (first, second):
+            assert (submission.delivered, submission.rejected) == (2, 0)
+            assert submission.batch_rejected == 1
+        stats = pipeline.stats()
+        assert (stats["delivered"], stats["rejected"]) == (5, 2)
+        await pipeline.close()
+
+    async def test_failed_batch_counted_without_spool(self):
+        def down(entries):
+            raise ServerError("portal down")
+
+        pipeline = LogPipeline(_IngestClient(fail=down))
+        submission = await pipeline.submit(_logs(2))
+        await submission.wait()
+
+        assert submission.failed == 2
+        assert "portal down" in submission.errors
+        await pipeline.close()
+
+
+class TestSpool:
+    async def test_failed_batches_spooled_and_replayed(self, tmp_path):
+        def down(entries):
+            raise ServerError("portal down")
+
+        failing = LogPipeline(_IngestClient(fail=down), spool_dir=str(tmp_path))
+        submission = await failing.submit(_logs(3))
+        await submission.wait()
+        await failing.close()
+        assert submission.spooled == 3
+        spool = tmp_path / "acme.logicmonitor.com"
+        assert len(os.listdir(spool)) == 1
+
+        client = _IngestClient()
+        healthy = LogPipeline(client, spool_dir=str(tmp_path))
+        healthy.start()
+        for _ in range(100):
+            if not os.listdir(spool):
+                break
+            await asyncio.sleep(0.01)
+        assert os.listdir(spool) == []
+        assert sum(len(b) for b in client.bodies) == 3
+        assert healthy.stats()["replayed"] == 3
+        await healthy.close()
+
+    async def test_close_spools_undelivered_entries(self, tmp_path):
+        pipeline = LogPipeline(
+            _IngestClient(gate=asyncio.Event()), concurrency=1, spool_dir=str(tmp_path)
+        )
+        submission = await pipeline.submit(_logs(5))
+        await pipeline.close(timeout=0.05)
+
+        assert submission.spooled == 5
+        await submission.wait()
+        spooled = [
+            entry
+            for name in os.listdir(tmp_path / "acme.logicmonitor.com")
+            for entry in json.loads((tmp_path / "acme.logicmonitor.com" / name).read_text())
+        ]
+        assert len(spooled) == 5
+
+
+class TestIngestLogsTool:
+    async def test_wait_false_returns_once_queued(self, monkeypatch):
+        from lm_mcp.tools.ingestion import ingest_logs
+
+        monkeypatch.setenv("LM_PORTAL", "test.logicmonitor.com")
+        monkeypatch.setenv("LM_BEARER_TOKEN", "test-token")
+        monkeypatch.setenv("LM_ENABLE_WRITE_OPERATIONS", "true")
+        gate = asyncio.Event()
+        client = _IngestClient(gate=gate)
+
+        result = await ingest_logs(client, logs=_logs(2), wait=False)
+        data = json.loads(result[0].text)
+        assert data["queued"] is True
+        assert data["accepted"] == 2
+        assert data["queue_depth"] == 2
+
+        gate.set()
+        await log_pipeline.get_log_pipeline(client).flush()
+        assert sum(len(b) for b in client.bodies) == 2
+
+
+@pytest.fixture
+def _http_env(monkeypatch):
+    monkeypatch.setenv("LM_PORTAL", "test.logicmonitor.com")
+    monkeypatch.setenv("LM_BEARER_TOKEN", "test-token")
+    monkeypatch.setenv("LM_ENABLE_WRITE_OPERATIONS", "true")
+
+
+class TestLogsEndpoint:
+    async def _post(self, **kwargs):
+        from httpx import ASGITransport, AsyncClient
+
+        from lm_mcp.transport.http import create_asgi_app
+
+        transport = ASGITransport(app=create_asgi_app())
+        async with AsyncClient(transport=transport, base_url="http://test") as http:
+            return await http.post("/api/v1/logs", **kwargs)
+
+    @pytest.fixture
+    def ingest_client(self):
+        from lm_mcp.server import _set_client
+
+        client = _IngestClient()
+        _set_client(client)
+        yield client
+        _set_client(None)
+
+    async def test_queues_entries(self, _http_env, ingest_client):
+        resp = await self._post(json=_logs(3))
+        assert resp.status_code == 202
+        assert resp.json()["accepted"] == 3
+
+        await log_pipeline.get_log_pipeline(ingest_client).flush()
+        assert sum(len(b) for b in ingest_client.bodies) == 3
+
+    async def test_accepts_gzip_and_wrapped_body(self, _http_env, ingest_client):
+        body = gzip.compress(json.dumps({"logs": _logs(2)}).encode())
+        resp = await self._post(
+            content=body,
+            headers={"content-type": "application/json", "content-encoding": "gzip"},
+        )
+        assert resp.status_code == 202
+        assert resp.json()["accepted"] == 2
+
+    async def test_gzip_bomb_returns_413(self, _http_env, ingest_client, monkeypatch):
+        from lm_mcp.transport import http
+
+        monkeypatch.setattr(http, "_LOG_MAX_BODY_BYTES", 64 * 1024)
+        bomb = gzip.compress(b"[" + b" " * (10 * 1024 * 1024) + b"]")
+        assert len(bomb) < 64 * 1024
+
+        resp = await self._post(
+            content=bomb,
+            headers={"content-type": "application/json", "content-encoding": "gzip"},
+        )
+        assert resp.status_code == 413
+        resp = await self._post(content=b" " * (64 * 1024 + 1))
+        assert resp.status_code == 413
+
+    async def test_gzip_members_and_truncation(self, _http_env, ingest_client):
+        headers = {"content-type": "application/json", "content-encoding": "gzip"}
+        text = json.dumps(_logs(2)).encode()
+        middle = len(text) // 2
+
+        resp = await self._post(
+            content=gzip.compress(text[:middle]) + gzip.compress(text[middle:]), headers=headers
+        )
+        assert resp.status_code == 202
+        resp = await self._post(content=gzip.compress(text)[:-12], headers=headers)
+        assert resp.status_code == 400
+
+    async def test_invalid_body_rejected(self, _http_env, ingest_client):
+        resp = await self._post(content=b"not json", headers={"content-type": "application/json"})
+        assert resp.status_code == 400
+        resp = await self._post(json=[])
+        assert resp.status_code == 400
+
+    async def test_full_queue_returns_429(self, _http_env, ingest_client, monkeypatch):
+        monkeypatch.setenv("LM_LOG_QUEUE_SIZE", "2")
+        resp = await self._post(json=_logs(3))
+        assert resp.status_code == 429
+        assert resp.headers["Retry-After"] == "1"
+
+    async def test_write_disabled_returns_403(self, monkeypatch, ingest_client):
+        monkeypatch.setenv("LM_PORTAL", "test.logicmonitor.com")
+        monkeypatch.setenv("LM_BEARER_TOKEN", "test-token")
+        resp = await self._post(json=_logs(1))
+        assert resp.status_code == 403
@@ -0,0 +1,252 @@
+# Description: Tests for the coalescing metric batcher behind push_metrics.
+# Description: Validates grouping and merging, size and interval flushes, retries, and backpressure.
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+from lm_mcp import metric_batcher
+from lm_mcp.exceptions import LMError, ServerError
+from lm_mcp.log_pipeline import QueueFullError
+from lm_mcp.metric_batcher import MetricBatcher
+
+
+class _IngestClient:
+    """Stand-in for LogicMonitorClient.ingest_post that records pushed payloads."""
+
+    def __init__(self, fail=None, gate: asyncio.Event | None = None) -> None:
+        self.fail = fail
+        self.gate = gate
+        self.payloads: list[dict] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def ingest_post(self, path: str, json_body=None) -> dict:
+        assert path == "/rest/metric/ingest?create=true"
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.gate is not None:
+                await self.gate.wait()
+            payload = json.loads(json_body)
+            if self.fail is not None:
+                self.fail(payload)
+            self.payloads.append(payload)
+            return {"success": True}
+        finally:
+            self.in_flight -= 1
+
+
+def _metric(host: str, instance: str, datapoint: str, ts: int, value: float) -> dict:
+    return {
+        "resourceIds": {"system.hostname": host},
+        "dataSource": "CustomApp",
+        "instances": [
+            {
+                "instanceName": instance,
+                "dataPoints": [{"dataPointName": datapoint, "values": {str(ts): value}}],
+            }
+        ],
+    }
+
+
+@pytest.fixture(autouse=True)
+def _fast(monkeypatch):
+    monkeypatch.setattr(metric_batcher, "UPLOAD_BACKOFF_SECONDS", 0)
+
+
+class TestCoalescing:
+    async def test_same_source_merged_into_one_request(self):
+        client = _IngestClient()
+        batcher = MetricBatcher(client)
+        submission = await batcher.submit(
+            [
+                _metric("web01", "main", "requests", 1, 10),
+                _metric("web01", "main", "requests", 2, 20),
+                _metric("web01", "main", "errors", 1, 0),
+                _metric("web01", "worker", "requests", 1, 5),
+            ]
+        )
+        await batcher.flush()
+
+        assert submission.delivered == 4
+        assert len(client.payloads) == 1
+        instances = {i["instanceName"]: i for i in client.payloads[0]["instances"]}
+        main = {dp["dataPointName"]: dp["values"] for dp in instances["main"]["dataPoints"]}
+        assert main == {"requests": {"1": 10, "2": 20}, "errors": {"1": 0}}
+        assert len(instances["worker"]["dataPoints"]) == 1
+        assert batcher.stats()["coalesced"] == 3
+        await batcher.close()
+
+    async def test_resource_properties_merged_and_sources_kept_apart(self):
+        client = _IngestClient()
+        batcher = MetricBatcher(client)
+        first = {**_metric("web01", "main", "rps", 1, 1), "resourceProperties": {"a": "1"}}
+        second = {**_metric("web01", "main", "rps", 2, 2), "resourceProperties": {"b": "2"}}
+        await batcher.submit([first, second, _metric("web02", "main", "rps", 1, 3)])
+        await batcher.flush()
+
+        by_host = {p["resourceIds"]["system.hostname"]: p for p in client.payloads}
+        assert sorted(by_host) == ["web01", "web02"]
+        assert by_host["web01"]["resourceProperties"] == {"a": "1", "b": "2"}
+        await batcher.close()
+
+    async def test_invalid_payloads_rejected_up_front(self):
+        batcher = MetricBatcher(_IngestClient())
+        submission = await batcher.submit(
+            ["not an object", {"dataSource": "x"}, _metric("web01", "main", "rps", 1, 1)],
+            flush=True,
+        )
+        await submission.wait()
+
+        assert submission.rejected == 2
+        assert submission.delivered == 1
+        await batcher.close()
+
+
+class TestFlushing:
+    async def test_group_sent_at_size_limit(self):
+        client = _IngestClient()
+        payload = _metric("web01", "main", "rps", 1, 1)
+        size = len(json.dumps(payload))
+        batcher = MetricBatcher(client, flush_interval=60, max_group_bytes=size * 3)
+        submission = await batcher.submit(
+            [_metric("web01", "main", "rps", ts, ts) for ts in range(7)]
+        )
+        await asyncio.sleep(0.01)
+        assert len(client.payloads) == 2
+
+        await batcher.flush()
+        await submission.wait()
+        assert submission.delivered == 7
+        assert len(client.payloads) == 3
+        await batcher.close()
+
+    async def test_group_sent_after_flush_interval(self):
+        client = _IngestClient()
+        batcher = MetricBatcher(client, flush_interval=0.05)
+        submission = await batcher.submit([_metric("web01", "main", "rps", 1, 1)])
+        assert client.payloads == []
+
+        await asyncio.wait_for(submission.wait(), 1)
+        assert submission.delivered == 1
+        await batcher.close()
+
+    async def test_groups_upload_concurrently(self):
+        gate = asyncio.Event()
+        client = _IngestClient(gate=gate)
+        batcher = MetricBatcher(client, concurrency=3)
+        submission = await batcher.submit(
+            [_metric(f"web{i}", "main", "rps", 1, i) for i in range(6)], flush=True
+        )
+        await asyncio.sleep(0.02)
+        assert client.max_in_flight == 3
+
+        gate.set()
+        await submission.wait()
+        assert submission.delivered == 6
+        await batcher.close()
+
+
+class TestFailures:
+    async def test_retryable_failure_is_retried(self):
+        attempts = {"n": 0}
+
+        def flaky(payload):
+            attempts["n"] += 1
+            if attempts["n"] == 1:
+                raise ServerError("portal busy")
+
+        batcher = MetricBatcher(_IngestClient(fail=flaky))
+        submission = await batcher.submit([_metric("web01", "main", "rps", 1, 1)], flush=True)
+        await submission.wait()
+
+        assert submission.delivered == 1
+        assert batcher.stats()["retries"] == 1
+        await batcher.close()
+
+    async def test_refused_group_rejected_for_every_contributor(self):
+        def refuse(payload):
+            raise LMError("unknown datasource", code="HTTP_400")
+
+        batcher = MetricBatcher(_IngestClient(fail=refuse))
+        first = await batcher.submit([_metric("web01", "main", "rps", 1, 1)])
+        second = await batcher.submit([_metric("web01", "main", "rps", 2, 2)], flush=True)
+        await first.wait()
+        await second.wait()
+
+        assert first.rejected == second.rejected == 1
+        assert second.errors == ["unknown datasource"]
+        await batcher.close()
+
+    async def test_refused_group_resent_per_submission(self):
+        """One caller's bad datapoint does not reject another caller's payloads."""
+
+        def refuse_negative(payload):
+            for instance in payload["instances"]:
+                for datapoint in instance["dataPoints"]:
+                    if any(v < 0 for v in datapoint["values"].values()):
+                        raise LMError("invalid value", code="HTTP_400")
+
+        client = _IngestClient(fail=refuse_negative)
+        batcher = MetricBatcher(client)
+        good = await batcher.submit([_metric("web01", "main", "rps", 1, 1)])
+        bad = await batcher.submit([_metric("web01", "main", "rps", 2, -1)], flush=True)
+        await good.wait()
+        await bad.wait()
+
+        assert (good.delivered, good.rejected) == (1, 0)
+        assert (bad.delivered, bad.rejected) == (0, 1)
+        assert bad.errors == ["invalid value"] and good.errors == []
+        assert len(client.payloads) == 1
+        assert batcher.stats()["splits"] == 1
+        await batcher.close()
+
+
+class TestBackpressure:
+    async def test_full_batcher_refuses_without_waiting(self):
+        batcher = MetricBatcher(_IngestClient(), max_pending=2, flush_interval=60)
+        await batcher.submit([_metric("web01", "main", "rps", ts, 1) for ts in range(2)])
+        with pytest.raises(QueueFullError):
+            await batcher.submit([_metric("web01", "main", "rps", 9, 1)])
+
+        await batcher.flush()
+        assert batcher.pending == 0
+        await batcher.close()
+
+
+class TestPushMetricsTool:
+    @pytest.fixture(autouse=True)
+    def _env(self, monkeypatch):
+        monkeypatch.setenv("LM_PORTAL", "test.logicmonitor.com")
+        monkeypatch.setenv("LM_BEARER_TOKEN", "test-token")
+        monkeypatch.setenv("LM_ENABLE_WRITE_OPERATIONS", "true")
+
+    async def test_list_of_payloads_coalesced(self):
+        from lm_mcp.tools.ingestion import push_metrics
+
+        client = _IngestClient()
+        result = await push_metrics(
+            client, metrics=[_metric("web01", "main", "rps", ts, ts) for ts in range(5)]
+        )
+        data = json.loads(result[0].text)
+        assert data["success"] is True
+        assert data["delivered"] == 5
+        assert len(client.payloads) == 1
+
+    async def test_wait_false_returns_once_buffered(self):
+        from lm_mcp.tools.ingestion import push_metrics
+
+        client = _IngestClient()
+        result = await push_metrics(
+            client, metrics=_metric("web01", "main", "rps", 1, 1), wait=False
+        )
+        data = json.loads(result[0].text)
+        assert data["queued"] is True
+        assert data["queue_depth"] == 1
+
+        await metric_batcher.get_metric_batcher(client).flush()
+        assert len(client.payloads) == 1
@@ -275,6 +275,91 @@ def test_age_decrypt_failure_surfaces_stderr(tmp_path, monkeypatch, reset_portal
         portals.load()
 
 
+def _age_vault(tmp_path, monkeypatch) -> str:
+    """Write a (fake) encrypted vault file and point the age settings at it."""
+    _age_env(monkeypatch, tmp_path)
+    vault = tmp_path / "secrets.age"
+    vault.write_bytes(b"ciphertext-v1")
+    return str(vault)
+
+
+def _age_process(stdout: bytes = b"", stderr: bytes = b"", returncode: int = 0):
+    from unittest.mock import AsyncMock, MagicMock
+
+    proc = MagicMock()
+    proc.communicate = AsyncMock(return_value=(stdout, stderr))
+    proc.returncode = returncode
+    return proc
+
+
+@pytest.mark.asyncio
+async def test_reload_decrypts_with_async_subprocess(tmp_path, monkeypatch, reset_portals):
+    from unittest.mock import AsyncMock, patch
+
+    _age_vault(tmp_path, monkeypatch)
+    vault_json = json.dumps({"acme": {"portal": "acme.example.com", "bearer_token": "t"}})
+    spawn = AsyncMock(return_value=_age_process(vault_json.encode()))
+    with (
+        patch("lm_mcp.portals.subprocess.run", side_effect=AssertionError("blocking decrypt")),
+        patch("lm_mcp.portals.asyncio.create_subprocess_exec", spawn),
+    ):
+        out = await portals.reload()
+    assert out["count"] == 1
+    assert spawn.await_args.args[:2] == ("age", "-d")
+
+
+@pytest.mark.asyncio
+async def test_unchanged_vault_skips_decryption(tmp_path, monkeypatch, reset_portals):
+    import os
+    from unittest.mock import AsyncMock, patch
+
+    vault = _age_vault(tmp_path, monkeypatch)
+    vault_json = json.dumps({"acme": {"portal": "acme.example.com", "bearer_token": "t"}})
+    spawn = AsyncMock(return_value=_age_process(vault_json.encode()))
+    with patch("lm_mcp.portals.asyncio.create_subprocess_exec", spawn):
+        await portals.reload()
+        await portals.reload()
+        assert spawn.await_count == 1
+
+        # touched but identical: the content hash still matches
+        st = os.stat(vault)
+        os.utime(vault, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        await portals.reload()
+        assert spawn.await_count == 1
+
+        # new ciphertext: decrypted again
+        with open(vault, "wb") as f:
+            f.write(b"ciphertext-v2")
+        await portals.reload()
+        assert spawn.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_async_decrypt_failure_surfaces_stderr(tmp_path, monkeypatch, reset_portals):
+    from unittest.mock import AsyncMock, patch
+
+    _age_vault(tmp_path, monkeypatch)
+    spawn = AsyncMock(return_value=_age_process(stderr=b"no identity matched", returncode=1))
+    with (
+        patch("lm_mcp.portals.asyncio.create_subprocess_exec", spawn),
+        pytest.raises(RuntimeError, match="no identity matched"),
+    ):
+        await portals.reload()
+
+
+@pytest.mark.asyncio
+async def test_async_decrypt_missing_age_binary(tmp_path, monkeypatch, reset_portals):
+    from unittest.mock import AsyncMock, patch
+
+    _age_vault(tmp_path, monkeypatch)
+    spawn = AsyncMock(side_effect=FileNotFoundError("age"))
+    with (
+        patch("lm_mcp.portals.asyncio.create_subprocess_exec", spawn),
+        pytest.raises(RuntimeError, match="age binary not found"),
+    ):
+        await portals.reload()
+
+
 def test_vault_record_portal_scheme_is_normalized(tmp_path, monkeypatch, reset_portals):
     vault = _vault(tmp_path, {"acme": {"portal": "https://acme.example.com/", "bearer_token": "t"}})
     _multi(monkeypatch, vault)
@@ -342,9 +427,36 @@ async def test_reload_closes_replaced_clients(tmp_path, monkeypatch, reset_porta
     old_client = server.get_client()
     old_client.close = AsyncMock()
 
-    await portals.reload()
+    p.write_text(json.dumps({"acme": {"portal": "acme.example.com", "bearer_token": "rotated"}}))
+    out = await portals.reload()
     old_client.close.assert_awaited_once()
     assert server.get_client() is not old_client
+    assert out["clients_replaced"] == ["acme"]
+
+
+@pytest.mark.asyncio
+async def test_reload_keeps_clients_with_unchanged_credentials(
+    tmp_path, monkeypatch, reset_portals
+):
+    from unittest.mock import AsyncMock
+
+    p = tmp_path / "portals.json"
+    p.write_text(json.dumps({"acme": {"portal": "acme.example.com", "bearer_token": "t"}}))
+    _multi(monkeypatch, str(p))
+
+    portals.activate("acme")
+    old_client = server.get_client()
+    old_client.close = AsyncMock()
+
+    # only the write flag changes: the client is kept, the flag is refreshed
+    p.write_text(
+        json.dumps({"acme": {"portal": "acme.example.com", "bearer_token": "t", "writable": True}})
+    )
+    out = await portals.reload()
+    old_client.close.assert_not_awaited()
+    assert server.get_client() is old_client
+    assert portals.is_active_writable() is True
+    assert out["clients_replaced"] == []
 
 
 @pytest.mark.asyncio
@@ -375,3 +487,394 @@ def test_portal_url_empty_before_use_portal(tmp_path, monkeypatch, reset_portals
     _multi(monkeypatch, vault)
 
     assert portal_url("device", 5) == ""
+
+
+@pytest.mark.asyncio
+async def test_run_across_portals_isolates_failures(tmp_path, monkeypatch, reset_portals):
+    import httpx
+    import respx
+
+    from lm_mcp.tools import portals as portal_tools
+
+    vault = _vault(
+        tmp_path,
+        {
+            "acme": {"portal": "acme.example.com", "bearer_token": "t1"},
+            "globex": {"portal": "globex.example.com", "bearer_token": "t2"},
+        },
+    )
+    _multi(monkeypatch, vault)
+
+    with respx.mock(assert_all_called=False) as router:
+        router.get("https://acme.example.com/santaba/rest/setting/collector/collectors").mock(
+            return_value=httpx.Response(
+                200, json={"items": [{"id": 1, "hostname": "col-a"}], "total": 1}
+            )
+        )
+        router.get("https://globex.example.com/santaba/rest/setting/collector/collectors").mock(
+            return_value=httpx.Response(401, json={"errorMessage": "bad token"})
+        )
+        text = (
+            await portal_tools.run_across_portals(
+                "get_collectors", {"limit": 10}, portals=["acme", "globex", "nope"]
+            )
+        )[0].text
+
+    payload = json.loads(text)
+    assert payload["portal_count"] == 3
+    assert payload["succeeded"] == 1
+    assert payload["results"]["acme"]["total"] == 1
+    assert set(payload["errors"]) == {"globex", "nope"}
+    assert "not found" in payload["errors"]["nope"]
+    # fan-out never switches the active portal
+    assert portals.has_active() is False
+    assert set(portals._state["clients"]) == {"acme", "globex"}
+
+
+@pytest.mark.asyncio
+async def test_run_across_portals_binds_each_portal_during_its_call(
+    tmp_path, monkeypatch, reset_portals
+):
+    import httpx
+    import respx
+
+    from lm_mcp.tools import portals as portal_tools
+
+    vault = _vault(
+        tmp_path,
+        {
+            "acme": {"portal": "acme.example.com", "bearer_token": "t1"},
+            "globex": {"portal": "globex.example.com", "bearer_token": "t2", "writable": True},
+        },
+    )
+    _multi(monkeypatch, vault)
+    portals.activate("acme")
+
+    seen = {}
+    real_handler = portal_tools._fanout_handler
+
+    def _recording_handler(tool):
+        handler = real_handler(tool)
+
+        async def _wrapped(client, **kwargs):
+            seen[portals.active()["active"]] = portals.active()
+            return await handler(client, **kwargs)
+
+        return _wrapped
+
+    monkeypatch.setattr(portal_tools, "_fanout_handler", _recording_handler)
+
+    with respx.mock() as router:
+        router.get(url__regex=r"https://\w+\.example\.com/santaba/rest/device/devices/5").mock(
+            return_value=httpx.Response(200, json={"id": 5, "displayName": "web-5"})
+        )
+        payload = json.loads(
+            (await portal_tools.run_across_portals("get_device", {"device_id": 5}))[0].text
+        )
+
+    results = payload["results"]
+    assert results["acme"]["portal_url"] == "https://acme.example.com/santaba/uiv4/devices/5"
+    assert results["globex"]["portal_url"] == "https://globex.example.com/santaba/uiv4/devices/5"
+    assert seen == {
+        "acme": {"active": "acme", "portal": "acme.example.com", "writable": False},
+        "globex": {"active": "globex", "portal": "globex.example.com", "writable": True},
+    }
+    # the caller's own active portal is untouched
+    assert portals.active()["active"] == "acme"
+
+
+@pytest.mark.asyncio
+async def test_run_across_portals_defaults_to_every_portal(tmp_path, monkeypatch, reset_portals):
+    import httpx
+    import respx
+
+    from lm_mcp.tools import portals as portal_tools
+
+    vault = _vault(
+        tmp_path,
+        {
+            "acme": {"portal": "acme.example.com", "bearer_token": "t1"},
+            "globex": {"portal": "globex.example.com", "bearer_token": "t2"},
+        },
+    )
+    _multi(monkeypatch, vault)
+
+    with respx.mock() as router:
+        router.get(url__regex=r"https://\w+\.example\.com/santaba/rest/setting/collector/").mock(
+            return_value=httpx.Response(200, json={"items": [], "total": 0})
+        )
+        payload = json.loads((await portal_tools.run_across_portals("get_collectors"))[0].text)
+
+    assert sorted(payload["results"]) == ["acme", "globex"]
+    assert payload["failed"] == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("tool", "arguments", "message"),
+    [
+        ("delete_device", {"device_id": 1}, "write tool"),
+        ("use_portal", {}, "cannot run across portals"),
+        ("no_such_tool", {}, "Unknown LogicMonitor tool"),
+        ("get_collectors", {"bogus": 1}, "Invalid arguments"),
+    ],
+)
+async def test_run_across_portals_rejects_unsuitable_calls(
+    tmp_path, monkeypatch, reset_portals, tool, arguments, message
+):
+    from lm_mcp.tools import portals as portal_tools
+
+    vault = _vault(tmp_path, {"acme": {"portal": "acme.example.com", "bearer_token": "t"}})
+    _multi(monkeypatch, vault)
+
+    text = (await portal_tools.run_across_portals(tool, arguments))[0].text
+    assert message in text
+    assert len(portals._state["clients"]) == 0
+
+
+@pytest.mark.asyncio
+async def test_run_across_portals_errors_in_single_portal_mode(monkeypatch, reset_portals):
+    from lm_mcp.tools import portals as portal_tools
+
+    monkeypatch.delenv("LM_MULTI_PORTAL", raising=False)
+    monkeypatch.setenv("LM_PORTAL", "acme.example.com")
+    monkeypatch.setenv("LM_BEARER_TOKEN", "test-token-1234")
+
+    text = (await portal_tools.run_across_portals("get_collectors"))[0].text
+    assert "Multi-portal mode is disabled" in text
+
+
+@pytest.mark.asyncio
+async def test_concurrent_sessions_target_different_portals(tmp_path, monkeypatch, reset_portals):
+    import asyncio
+
+    vault = _vault(
+        tmp_path,
+        {
+            "acme": {"portal": "acme.example.com", "bearer_token": "t1"},
+            "globex": {"portal": "globex.example.com", "bearer_token": "t2", "writable": True},
+        },
+    )
+    _multi(monkeypatch, vault)
+    both_active = asyncio.Barrier(2)
+
+    async def session(customer: str) -> tuple[str, str, bool]:
+        with portals.bind_session():
+            portals.activate(customer)
+            # both sessions have switched before either reads its client back
+            await both_active.wait()
+            client = server.get_client()
+            return portals.active()["active"], str(client.base_url), portals.is_active_writable()
+
+    acme, globex = await asyncio.gather(session("acme"), session("globex"))
+    assert acme == ("acme", "https://acme.example.com/santaba/rest", False)
+    assert globex == ("globex", "https://globex.example.com/santaba/rest", True)
+    # per-session switches leave the process binding untouched
+    assert portals.has_active() is False
+    # the clients themselves are still shared through the registry cache
+    assert set(portals._state["clients"]) == {"acme", "globex"}
+
+
+@pytest.mark.asyncio
+async def test_session_binding_persists_across_its_tasks(tmp_path, monkeypatch, reset_portals):
+    import asyncio
+
+    vault = _vault(tmp_path, {"acme": {"portal": "acme.example.com", "bearer_token": "t"}})
+    _multi(monkeypatch, vault)
+
+    with portals.bind_session():
+        # use_portal in one request task is seen by the session's later tasks
+        await asyncio.create_task(_activate_async("acme"))
+        assert await asyncio.create_task(_active_name()) == "acme"
+    assert portals.has_active() is False
+
+
+async def _activate_async(customer: str) -> None:
+    portals.activate(customer)
+
+
+async def _active_name() -> str | None:
+    return portals.active()["active"]
+
+
+@pytest.mark.asyncio
+async def test_reload_refreshes_every_session_binding(tmp_path, monkeypatch, reset_portals):
+    p = tmp_path / "portals.json"
+    p.write_text(
+        json.dumps(
+            {
+                "acme": {"portal": "acme.example.com", "bearer_token": "t"},
+                "globex": {"portal": "globex.example.com", "bearer_token": "t"},
+            }
+        )
+    )
+    _multi(monkeypatch, str(p))
+
+    with portals.bind_session() as other:
+        portals.activate("globex")
+    portals.activate("acme")
+    old_acme = server.get_client()
+
+    p.write_text(json.dumps({"acme": {"portal": "acme.example.com", "bearer_token": "t"}}))
+    await portals.reload()
+
+    # acme's credentials did not change, so its client is kept
+    assert server.get_client() is old_acme
+    assert server.get_client() is portals._state["clients"]["acme"]
+    # the other session's portal was removed, so it has none selected
+    assert other.name is None and other.client is None
+
+
+def _fake_clients(monkeypatch) -> dict:
+    """Build portal clients as mocks with an awaitable close(), keyed by host."""
+    from unittest.mock import AsyncMock, MagicMock
+
+    built: dict = {}
+
+    def _build(rec):
+        client = MagicMock()
+        client.close = AsyncMock()
+        built[rec["portal"]] = client
+        return client
+
+    monkeypatch.setattr(portals, "_build_client", _build)
+    return built
+
+
+_THREE_PORTALS = {
+    "acme": {"portal": "acme.example.com", "bearer_token": "t"},
+    "globex": {"portal": "globex.example.com", "bearer_token": "t"},
+    "initech": {"portal": "initech.example.com", "bearer_token": "t"},
+}
+
+
+@pytest.mark.asyncio
+async def test_pool_evicts_least_recently_used_but_never_bound(
+    tmp_path, monkeypatch, reset_portals
+):
+    import asyncio
+
+    _multi(monkeypatch, _vault(tmp_path, _THREE_PORTALS))
+    monkeypatch.setenv("LM_PORTAL_POOL_SIZE", "1")
+    built = _fake_clients(monkeypatch)
+
+    portals.activate("acme")
+    portals.client_for("globex")
+    # acme is this session's active portal, so the pool runs over capacity
+    assert set(portals._state["clients"]) == {"acme", "globex"}
+
+    portals.client_for("initech")
+    await asyncio.sleep(0)
+    assert set(portals._state["clients"]) == {"acme", "initech"}
+    built["globex.example.com"].close.assert_awaited_once()
+    built["acme.example.com"].close.assert_not_awaited()
+    assert portals.pool_stats()["evictions"] == 1
+
+
+@pytest.mark.asyncio
+async def test_pool_idle_eviction_skips_leased_clients(tmp_path, monkeypatch, reset_portals):
+    _multi(monkeypatch, _vault(tmp_path, _THREE_PORTALS))
+    built = _fake_clients(monkeypatch)
+    pool = portals._state["clients"]
+
+    portals.client_for("acme")
+    async with portals.lease("globex"):
+        for entry in pool._entries.values():
+            entry.last_used -= pool.idle_timeout + 1
+        evicted = pool.evict_idle()
+
+    assert evicted == [built["acme.example.com"]]
+    assert set(pool) == {"globex"}
+
+
+@pytest.mark.asyncio
+async def test_reload_defers_closing_leased_clients(tmp_path, monkeypatch, reset_portals):
+    p = tmp_path / "portals.json"
+    p.write_text(json.dumps(_THREE_PORTALS))
+    _multi(monkeypatch, str(p))
+    built = _fake_clients(monkeypatch)
+
+    async with portals.lease("globex") as client:
+        rotated = {
+            **_THREE_PORTALS,
+            "globex": {"portal": "globex.example.com", "bearer_token": "r"},
+        }
+        p.write_text(json.dumps(rotated))
+        await portals.reload()
+        # the in-flight call keeps a usable client
+        client.close.assert_not_awaited()
+        assert "globex" not in portals._state["clients"]
+
+    built["globex.example.com"].close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_list_portals_reports_pool_stats(tmp_path, monkeypatch, reset_portals):
+    from lm_mcp.tools import portals as portal_tools
+
+    _multi(monkeypatch, _vault(tmp_path, _THREE_PORTALS))
+    _fake_clients(monkeypatch)
+    portals.activate("acme")
+    portals.activate("acme")
+
+    payload = json.loads((await portal_tools.list_portals())[0].text)
+    rows = {r["name"]: r for r in payload["portals"]}
+    assert rows["acme"]["pooled"] is True and rows["acme"]["uses"] == 2
+    assert rows["globex"]["pooled"] is False
+    stats = payload["client_pool"]
+    assert (stats["size"], stats["hits"], stats["misses"]) == (1, 1, 1)
+
+
+@pytest.mark.asyncio
+async def test_prewarm_uses_persisted_usage(tmp_path, monkeypatch, reset_portals):
+    import httpx
+    import respx
+
+    usage_file = tmp_path / "usage.json"
+    usage_file.write_text(json.dumps({"globex": 9, "initech": 4, "gone": 50, "acme": 1}))
+    _multi(monkeypatch, _vault(tmp_path, _THREE_PORTALS))
+    monkeypatch.setenv("LM_PORTAL_USAGE_FILE", str(usage_file))
+
+    with respx.mock() as router:
+        warm_route = router.get(url__regex=r"https://(globex|initech)\.example\.com/")
+        warm_route.mock(return_value=httpx.Response(200, json={"items": [], "total": 0}))
+        portals.load()
+        warmed = await portals.prewarm(2)
+
+    # "gone" is no longer in the vault, so the next most-used portals are warmed
+    assert warmed == ["globex", "initech"]
+    assert warm_route.call_count == 2
+    assert set(portals._state["clients"]) == {"globex", "initech"}
+    assert portals.pool_stats()["prewarmed"] == 2
+
+    await portals.close_all()
+    saved = json.loads(usage_file.read_text())
+    assert saved["globex"] == 10 and saved["gone"] == 50
+    assert len(portals._state["clients"]) == 0
+
+
+@pytest.mark.asyncio
+async def test_closing_a_client_stops_its_ingest_queues(tmp_path, monkeypatch, reset_portals):
+    from unittest.mock import AsyncMock
+
+    from lm_mcp import log_pipeline, metric_batcher
+
+    p = tmp_path / "portals.json"
+    p.write_text(json.dumps(_THREE_PORTALS))
+    _multi(monkeypatch, str(p))
+    _fake_clients(monkeypatch)
+    client = portals.client_for("acme")
+    pipeline = log_pipeline.get_log_pipeline(client)
+    pipeline.close = AsyncMock()
+    batcher = metric_batcher.get_metric_batcher(client)
+    batcher.close = AsyncMock()
+
+    rotated = {**_THREE_PORTALS, "acme": {"portal": "acme.example.com", "bearer_token": "r"}}
+    p.write_text(json.dumps(rotated))
+    await portals.reload()
+
+    pipeline.close.assert_awaited_once()
+    batcher.close.assert_awaited_once()
+    client.close.assert_awaited_once()
+    assert log_pipeline.get_log_pipeline(portals.client_for("acme")) is not pipeline
+    assert metric_batcher.get_metric_batcher(portals.client_for("acme")) is not batcher
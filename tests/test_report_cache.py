@@ -0,0 +1,105 @@
+# Description: Tests for the composite report cache.
+# Description: Validates single-flight builds, max-age reuse, eviction, and background refresh.
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from lm_mcp import report_cache
+from lm_mcp.report_cache import (
+    get_report,
+    refresh_interval,
+    start_report_refresh,
+    stop_report_refreshes,
+)
+
+
+def _counting_build(delay: float = 0):
+    """A build callable that counts its invocations."""
+    calls = {"n": 0}
+
+    async def build() -> dict:
+        calls["n"] += 1
+        if delay:
+            await asyncio.sleep(delay)
+        return {"build": calls["n"]}
+
+    return build, calls
+
+
+class TestGetReport:
+    async def test_concurrent_callers_share_one_build(self):
+        build, calls = _counting_build(delay=0.01)
+        first, second = await asyncio.gather(get_report("k", build), get_report("k", build))
+        assert calls["n"] == 1
+        assert first is second
+
+    async def test_zero_max_age_rebuilds(self):
+        build, calls = _counting_build()
+        await get_report("k", build)
+        entry = await get_report("k", build)
+        assert calls["n"] == 2
+        assert entry.report == {"build": 2}
+
+    async def test_max_age_reuses_recent_report(self):
+        build, calls = _counting_build()
+        await get_report("k", build)
+        entry = await get_report("k", build, max_age=60)
+        assert calls["n"] == 1
+        assert entry.age() < 60
+
+    async def test_failed_build_is_not_cached(self):
+        async def broken() -> dict:
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            await get_report("k", broken)
+        build, calls = _counting_build()
+        await get_report("k", build, max_age=60)
+        assert calls["n"] == 1
+
+    async def test_cancelled_caller_does_not_cancel_shared_build(self):
+        build, calls = _counting_build(delay=0.02)
+        waiter = asyncio.ensure_future(get_report("k", build))
+        await asyncio.sleep(0)
+        survivor = asyncio.ensure_future(get_report("k", build))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        entry = await survivor
+        assert entry.report == {"build": 1}
+        assert calls["n"] == 1
+
+    async def test_least_recently_used_report_evicted(self, monkeypatch):
+        monkeypatch.setattr(report_cache, "_REPORT_CACHE_MAX", 2)
+        build, _ = _counting_build()
+        for key in ("a", "b", "c"):
+            await get_report(key, build)
+        assert list(report_cache._reports) == ["b", "c"]
+
+
+class TestBackgroundRefresh:
+    async def test_refresh_precomputes_report(self):
+        build, calls = _counting_build()
+        start_report_refresh("k", build, interval=3600)
+        assert refresh_interval("k") == 3600
+        await asyncio.sleep(0.01)
+        assert calls["n"] == 1
+
+        entry = await get_report("k", build, max_age=60)
+        assert calls["n"] == 1
+        assert entry.report == {"build": 1}
+
+        await stop_report_refreshes()
+        assert refresh_interval("k") is None
+
+    async def test_refresh_survives_failed_build(self):
+        async def broken() -> dict:
+            raise RuntimeError("boom")
+
+        start_report_refresh("k", broken, interval=3600)
+        await asyncio.sleep(0.01)
+        task, _ = report_cache._refreshers["k"]
+        assert not task.done()
+        await stop_report_refreshes()
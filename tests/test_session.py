@@ -1,13 +1,16 @@
 # Description: Tests for the session context module.
 # Description: Validates session state tracking, history, and variable management.
 
+import pytest
 
 from lm_mcp.session import (
     HistoryEntry,
     SessionContext,
+    SessionStore,
     get_session,
     reset_session,
     set_session,
+    use_session,
 )
 
 
@@ -53,7 +56,7 @@ class TestSessionContext:
         assert session.last_alert is None
         assert session.last_device_list == []
         assert session.variables == {}
-        assert session.history == []
+        assert list(session.history) == []
 
     def test_set_and_get_variable(self):
         """Variables can be set and retrieved."""
@@ -124,7 +127,7 @@ class TestSessionContext:
         assert session.last_device == devices[0]
 
     def test_record_result_stores_alert(self):
-        """Recording get_alert_details stores the alert result."""
+        """Recording get_alert_details keeps only the alert's identifying fields."""
         session = SessionContext()
 
         alert_data = {"id": "LMA123", "severity": 4, "type": "alertAck"}
@@ -135,7 +138,8 @@ class TestSessionContext:
             success=True,
         )
 
-        assert session.last_alert == alert_data
+        assert session.last_alert == {"id": "LMA123"}
+        assert session.get_implicit_id("alert") == "LMA123"
 
     def test_get_implicit_id(self):
         """Implicit ID can be retrieved from last result."""
@@ -177,6 +181,15 @@ class TestSessionContext:
         assert session.history[0].tool_name == "tool_5"
         assert session.history[-1].tool_name == "tool_9"
 
+    def test_list_results_keep_only_reference_fields(self):
+        """Stored list results drop everything but id and name fields."""
+        session = SessionContext()
+        alerts = [{"id": f"LMA{i}", "severity": 4, "detail": "x" * 100} for i in range(3)]
+        session.record_result("get_alerts", {}, {"items": alerts}, True)
+
+        assert session.last_alert_list == [{"id": "LMA0"}, {"id": "LMA1"}, {"id": "LMA2"}]
+        assert alerts[0]["detail"] == "x" * 100
+
     def test_clear_resets_all_state(self):
         """Clear resets all session state."""
         session = SessionContext()
@@ -193,7 +206,7 @@ class TestSessionContext:
         assert session.last_alert is None
         assert session.last_device_list == []
         assert session.variables == {}
-        assert session.history == []
+        assert list(session.history) == []
 
     def test_to_dict_serializes_session(self):
         """Session can be serialized to dictionary."""
@@ -311,3 +324,64 @@ class TestResultSummarization:
         )
 
         assert session.history[0].result_summary is None
+
+
+class TestSessionStore:
+    """Tests for per-client session contexts (HTTP transport)."""
+
+    def test_keys_get_separate_contexts(self):
+        """Each key gets its own context, and the same key gets it back."""
+        store = SessionStore()
+        store.get("a").set_variable("site", "nyc")
+
+        assert store.get("a").get_variable("site") == "nyc"
+        assert store.get("b").get_variable("site") is None
+        assert store.get("a") is store.get("a")
+
+    def test_least_recently_used_context_evicted(self):
+        """The context untouched longest is evicted at capacity."""
+        store = SessionStore(max_sessions=2)
+        first = store.get("a")
+        store.get("b")
+        store.get("a")
+        store.get("c")
+
+        assert len(store) == 2
+        assert store.get("a") is first
+        assert store.stats()["evicted"] == 1
+
+    def test_idle_context_expires(self, monkeypatch):
+        """Contexts idle past idle_timeout are dropped on the next lookup."""
+        now = [1000.0]
+        monkeypatch.setattr("lm_mcp.session.time.monotonic", lambda: now[0])
+        store = SessionStore(idle_timeout=60)
+        stale = store.get("a")
+        now[0] += 61
+        store.get("b")
+
+        assert len(store) == 1
+        assert store.get("a") is not stale
+        assert store.stats()["expired"] == 1
+
+    def test_memory_caps_apply(self):
+        """Store contexts cap variable size and stored list results."""
+        store = SessionStore(max_variable_bytes=50, max_list_items=2)
+        session = store.get("a")
+        with pytest.raises(ValueError, match="50-byte limit"):
+            session.set_variable("blob", "x" * 100)
+        session.record_result("get_devices", {}, {"items": [{"id": i} for i in range(5)]})
+
+        assert session.variables == {}
+        assert len(session.last_device_list) == 2
+
+    def test_use_session_selects_context(self, monkeypatch):
+        """get_session() returns the keyed context inside use_session()."""
+        monkeypatch.setenv("LM_PORTAL", "test.logicmonitor.com")
+        monkeypatch.setenv("LM_BEARER_TOKEN", "test-token")
+        with use_session("a") as session:
+            assert get_session() is session
+            session.set_variable("site", "nyc")
+        with use_session(None) as default:
+            assert default is get_session()
+
+        assert "site" not in get_session().variables
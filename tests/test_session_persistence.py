@@ -1,5 +1,5 @@
 # Description: Tests for session persistence layer.
-# Description: Validates file-backed variable storage and loading.
+# Description: Validates the variables snapshot, its append-only journal, and loading.
 
 from __future__ import annotations
 
@@ -46,84 +46,67 @@ class TestPersistencePath:
         assert get_persistence_path() == "/tmp/test_session.json"
 
 
+def _persisted() -> dict:
+    """Variables a restarted server would load (snapshot plus journal)."""
+    from lm_mcp.session import SessionContext, _load_variables
+
+    session = SessionContext()
+    _load_variables(session)
+    return session.variables
+
+
 class TestSaveVariables:
     """Tests for saving session variables to file."""
 
-    def test_variables_saved_on_set(self):
-        """Setting a variable writes to the persistence file."""
+    def test_variables_saved_on_set(self, tmp_path):
+        """Setting a variable persists it."""
         from lm_mcp.session import set_persistence_path
 
-        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
-            path = f.name
+        set_persistence_path(str(tmp_path / "session.json"))
+        session = get_session()
+        session.set_variable("test_key", "test_value")
 
-        try:
-            set_persistence_path(path)
-            session = get_session()
-            session.set_variable("test_key", "test_value")
+        assert _persisted()["test_key"] == "test_value"
 
-            with open(path) as f:
-                data = json.load(f)
-            assert data["test_key"] == "test_value"
-        finally:
-            os.unlink(path)
-
-    def test_saved_file_is_valid_json(self):
-        """Persistence file contains valid JSON."""
+    def test_journal_records_are_valid_json(self, tmp_path):
+        """Each mutation is appended to the journal as one JSON record."""
         from lm_mcp.session import set_persistence_path
 
-        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
-            path = f.name
+        path = tmp_path / "session.json"
+        set_persistence_path(str(path))
+        session = get_session()
+        session.set_variable("key1", {"nested": [1, 2, 3]})
 
-        try:
-            set_persistence_path(path)
-            session = get_session()
-            session.set_variable("key1", {"nested": [1, 2, 3]})
+        lines = (tmp_path / "session.json.journal").read_text().splitlines()
+        assert [json.loads(line) for line in lines] == [
+            {"op": "set", "name": "key1", "value": {"nested": [1, 2, 3]}}
+        ]
+        assert not path.exists()
 
-            with open(path) as f:
-                data = json.load(f)
-            assert data["key1"]["nested"] == [1, 2, 3]
-        finally:
-            os.unlink(path)
-
-    def test_save_empty_variables(self):
-        """Clearing variables writes empty dict to file."""
+    def test_save_empty_variables(self, tmp_path):
+        """Clearing variables persists an empty set."""
         from lm_mcp.session import set_persistence_path
 
-        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
-            path = f.name
-
-        try:
-            set_persistence_path(path)
-            session = get_session()
-            session.set_variable("key", "val")
-            session.clear()
+        set_persistence_path(str(tmp_path / "session.json"))
+        session = get_session()
+        session.set_variable("key", "val")
+        session.clear()
 
-            with open(path) as f:
-                data = json.load(f)
-            assert data == {}
-        finally:
-            os.unlink(path)
+        assert _persisted() == {}
 
-    def test_delete_variable_updates_file(self):
-        """Deleting a variable updates the persistence file."""
+    def test_delete_variable_updates_file(self, tmp_path):
+        """Deleting a variable persists the deletion."""
         from lm_mcp.session import set_persistence_path
 
-        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
-            path = f.name
+        set_persistence_path(str(tmp_path / "session.json"))
+        session = get_session()
+        session.set_variable("a", 1)
+        session.set_variable("b", 2)
+        session.delete_variable("a")
 
-        try:
-            set_persistence_path(path)
-            session = get_session()
-            session.set_variable("a", 1)
-            session.set_variable("b", 2)
-            session.delete_variable("a")
-
-            with open(path) as f:
-                data = json.load(f)
-            assert "a" not in data
-            assert data["b"] == 2
-        finally:
-            os.unlink(path)
+        data = _persisted()
+        assert "a" not in data
+        assert data["b"] == 2
 
     def test_no_save_when_persistence_disabled(self):
         """Variables are not saved to file when persistence is disabled."""
@@ -135,6 +118,76 @@ class TestSaveVariables:
         # No file created, no error raised
 
 
+class TestJournal:
+    """Tests for the append-only variables journal."""
+
+    def test_set_does_not_rewrite_snapshot(self, tmp_path):
+        """Writes append to the journal and leave the snapshot alone."""
+        from lm_mcp.session import set_persistence_path
+
+        path = tmp_path / "session.json"
+        path.write_text(json.dumps({"baseline_big": "x" * 10_000}))
+        set_persistence_path(str(path))
+        set_session(None)
+        session = get_session()
+        before = path.stat().st_mtime_ns
+        session.set_variable("small", 1)
+
+        assert path.stat().st_mtime_ns == before
+        assert (tmp_path / "session.json.journal").stat().st_size < 100
+        assert _persisted() == {"baseline_big": "x" * 10_000, "small": 1}
+
+    def test_journal_compacted_into_snapshot(self, tmp_path, monkeypatch):
+        """Once the journal outgrows the snapshot it is folded into it."""
+        from lm_mcp import session as session_module
+        from lm_mcp.session import set_persistence_path
+
+        monkeypatch.setattr(session_module, "JOURNAL_COMPACT_BYTES", 200)
+        path = tmp_path / "session.json"
+        set_persistence_path(str(path))
+        session = get_session()
+        for i in range(10):
+            session.set_variable("counter", i)
+
+        assert "counter" in json.loads(path.read_text())
+        assert (tmp_path / "session.json.journal").stat().st_size < 200
+        assert _persisted() == {"counter": 9}
+
+    def test_fsync_is_batched(self, tmp_path, monkeypatch):
+        """The journal is fsynced once per batch of records, not per write."""
+        from lm_mcp import session as session_module
+        from lm_mcp.session import close_persistence, set_persistence_path
+
+        monkeypatch.setattr(session_module, "JOURNAL_FSYNC_RECORDS", 5)
+        monkeypatch.setattr(session_module, "JOURNAL_FSYNC_SECONDS", 3600)
+        synced = []
+        real_fsync = os.fsync
+        monkeypatch.setattr(os, "fsync", lambda fd: synced.append(fd) or real_fsync(fd))
+        set_persistence_path(str(tmp_path / "session.json"))
+        session = get_session()
+        for i in range(12):
+            session.set_variable(f"v{i}", i)
+        assert len(synced) == 2
+
+        close_persistence()
+        assert len(synced) == 3
+
+    def test_torn_record_skipped_and_appends_continue(self, tmp_path):
+        """A record cut short by a crash is skipped; later records still load."""
+        from lm_mcp.session import set_persistence_path
+
+        path = tmp_path / "session.json"
+        journal = tmp_path / "session.json.journal"
+        journal.write_text('{"op": "set", "name": "a", "value": 1}\n{"op": "set", "na')
+        set_persistence_path(str(path))
+        set_session(None)
+        session = get_session()
+        assert session.variables == {"a": 1}
+
+        session.set_variable("b", 2)
+        assert _persisted() == {"a": 1, "b": 2}
+
+
 class TestLoadVariables:
     """Tests for loading session variables from file."""
 
@@ -201,24 +254,18 @@ class TestLoadVariables:
 class TestPersistenceIntegration:
     """Integration tests for persistence round-trip."""
 
-    def test_set_variable_survives_session_reset(self):
+    def test_set_variable_survives_session_reset(self, tmp_path):
         """Variables set in one session are available after reset."""
         from lm_mcp.session import set_persistence_path
 
-        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
-            path = f.name
-
-        try:
-            set_persistence_path(path)
-            session = get_session()
-            session.set_variable("persist_me", "hello")
+        set_persistence_path(str(tmp_path / "session.json"))
+        session = get_session()
+        session.set_variable("persist_me", "hello")
 
-            # Simulate server restart: clear in-memory session
-            set_session(None)
-            new_session = get_session()
-            assert new_session.get_variable("persist_me") == "hello"
-        finally:
-            os.unlink(path)
+        # Simulate server restart: clear in-memory session
+        set_session(None)
+        new_session = get_session()
+        assert new_session.get_variable("persist_me") == "hello"
 
     def test_persistence_disabled_by_default(self):
         """Without configuring a path, no persistence occurs."""
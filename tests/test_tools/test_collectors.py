@@ -497,3 +497,113 @@ class TestGetCollectorHealth:
         history = data["collectors"][0]["collector_down_history"]
         assert len(history) == 1
         assert history[0]["alert_type"] == "CollectorDown"
+
+    @respx.mock
+    async def test_collector_ids_share_one_alert_query(self, client):
+        """Collectors are enriched concurrently; CollectorDown alerts come from one query."""
+        from lm_mcp.tools.collectors import get_collector_health
+
+        base = "https://test.logicmonitor.com/santaba/rest"
+        for cid in (1, 2, 3):
+            respx.get(f"{base}/setting/collector/collectors/{cid}").mock(
+                return_value=httpx.Response(
+                    200, json={"id": cid, "hostname": f"Col-{cid}", "status": "normal"}
+                )
+            )
+        respx.get(f"{base}/setting/collector/collectors/4").mock(
+            return_value=httpx.Response(404, json={"errorMessage": "not found"})
+        )
+        device_route = respx.get(f"{base}/device/devices").mock(
+            return_value=httpx.Response(200, json={"items": [], "total": 7})
+        )
+        alert_route = respx.get(f"{base}/alert/alerts").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "items": [
+                        {"id": 1, "monitorObjectName": "col-2", "cleared": False},
+                        {"id": 2, "monitorObjectName": "col-2", "cleared": False},
+                        {"id": 3, "monitorObjectName": "other-col", "cleared": False},
+                    ]
+                },
+            )
+        )
+
+        result = await get_collector_health(client, collector_ids=[1, 2, 3, 4])
+        data = json.loads(result[0].text)
+
+        assert alert_route.call_count == 1
+        assert "monitorObjectName" not in alert_route.calls[0].request.url.params["filter"]
+        assert device_route.call_count == 3
+        assert data["total_collectors"] == 3
+        assert data["collectors_down"] == 1
+        by_id = {c["id"]: c for c in data["collectors"]}
+        assert by_id[2]["active_collector_down_alerts"] == 2
+        assert by_id[1]["active_collector_down_alerts"] == 0
+        assert by_id[3]["downstream_device_count"] == 7
+        assert [e["collector_id"] for e in data["collector_errors"]] == [4]
+
+    @respx.mock
+    async def test_history_query_failure_keeps_empty_history(self, client):
+        """A failed history query leaves active status intact and history empty."""
+        from lm_mcp.tools.collectors import get_collector_health
+
+        base = "https://test.logicmonitor.com/santaba/rest"
+        respx.get(f"{base}/setting/collector/collectors").mock(
+            return_value=httpx.Response(
+                200,
+                json={"items": [{"id": 1, "hostname": "col-a"}, {"id": 2, "hostname": "col-b"}]},
+            )
+        )
+        respx.get(f"{base}/device/devices").mock(
+            return_value=httpx.Response(200, json={"items": [], "total": 0})
+        )
+
+        def alerts(request):
+            if "cleared:false" in request.url.params["filter"]:
+                active = [{"id": 9, "monitorObjectName": "col-b", "cleared": False}]
+                return httpx.Response(200, json={"items": active})
+            return httpx.Response(400, json={"errorMessage": "bad filter"})
+
+        respx.get(f"{base}/alert/alerts").mock(side_effect=alerts)
+
+        result = await get_collector_health(client, include_history=True)
+        data = json.loads(result[0].text)
+
+        assert data["collectors_down"] == 1
+        assert "warning" not in data
+        assert [c["collector_down_history"] for c in data["collectors"]] == [[], []]
+
+    @respx.mock
+    async def test_page_cap_marks_result_truncated(self, client, monkeypatch):
+        """Hitting the page cap reports collectors without an alert as unknown, not up."""
+        from lm_mcp.tools import collectors
+        from lm_mcp.tools.collectors import get_collector_health
+
+        monkeypatch.setattr(collectors, "_COLLECTOR_ALERT_PAGE_SIZE", 1)
+        monkeypatch.setattr(collectors, "_COLLECTOR_ALERT_MAX_PAGES", 2)
+        base = "https://test.logicmonitor.com/santaba/rest"
+        respx.get(f"{base}/setting/collector/collectors").mock(
+            return_value=httpx.Response(
+                200,
+                json={"items": [{"id": 1, "hostname": "col-a"}, {"id": 2, "hostname": "col-b"}]},
+            )
+        )
+        respx.get(f"{base}/device/devices").mock(
+            return_value=httpx.Response(200, json={"items": [], "total": 0})
+        )
+        respx.get(f"{base}/alert/alerts").mock(
+            return_value=httpx.Response(
+                200, json={"items": [{"id": 9, "monitorObjectName": "col-b", "cleared": False}]}
+            )
+        )
+
+        result = await get_collector_health(client)
+        data = json.loads(result[0].text)
+
+        assert data["truncated"] is True
+        assert data["collectors_down"] == 1
+        by_id = {c["id"]: c for c in data["collectors"]}
+        assert by_id[1]["down_signal_unavailable"] is True
+        assert "down_signal_unavailable" not in by_id[2]
+        assert data["collectors_down_signal_unavailable"] == 1
@@ -903,6 +903,108 @@ class TestGetMetricAnomaliesMethod:
         assert data["data_quality"] in ("insufficient", "limited", "good")
 
 
+class TestGetMetricAnomaliesStream:
+    """Tests for get_metric_anomalies stream mode."""
+
+    DATA_URL = (
+        "https://test.logicmonitor.com/santaba/rest"
+        "/device/devices/1/devicedatasources/10/instances/100/data"
+    )
+
+    @staticmethod
+    def _response(points):
+        return httpx.Response(
+            200,
+            json={
+                "dataPoints": ["cpu"],
+                "values": [[v] for _, v in points],
+                "time": [ts * 1000 for ts, _ in points],
+            },
+        )
+
+    @respx.mock
+    async def test_second_call_fetches_and_reports_only_new_points(self, client):
+        """After priming, only points after the last seen timestamp are fetched and scored."""
+        from lm_mcp.tools.correlation import get_metric_anomalies
+
+        history = [(BASE_EPOCH + i * 300, 50.0 + (i % 5) * 0.5) for i in range(48)]
+        history[10] = (history[10][0], 95.0)
+        last_ts = history[-1][0]
+        fresh = [
+            history[-1],
+            (last_ts + 300, 51.0),
+            (last_ts + 600, 99.0),
+        ]
+        route = respx.get(self.DATA_URL).mock(
+            side_effect=[self._response(history), self._response(fresh)]
+        )
+        kwargs = dict(
+            device_id=1, device_datasource_id=10, instance_id=100, method="zscore", stream=True
+        )
+
+        first = json.loads((await get_metric_anomalies(client, **kwargs))[0].text)
+        second = json.loads((await get_metric_anomalies(client, **kwargs))[0].text)
+
+        assert first["stream"]["primed"] is True
+        assert [a["value"] for a in first["anomalies"]] == [95.0]
+        assert dict(route.calls[1].request.url.params)["start"] == str(last_ts + 1)
+        assert second["stream"]["primed"] is False
+        assert second["stream"]["new_points"] == 2
+        assert second["stream"]["window_points"] == 50
+        assert [a["timestamp"] for a in second["anomalies"]] == [last_ts + 600]
+
+    @respx.mock
+    async def test_stream_mad_matches_batch_statistics(self, client):
+        """Streaming MAD reports the same median and MAD as a batch recompute."""
+        from lm_mcp.tools.correlation import get_metric_anomalies
+        from lm_mcp.tools.stats_helpers import mad_anomalies
+
+        history = [(BASE_EPOCH + i * 300, float((i * 7) % 11)) for i in range(40)]
+        spike = (history[-1][0] + 300, 80.0)
+        respx.get(self.DATA_URL).mock(
+            side_effect=[self._response(history), self._response([spike])]
+        )
+        kwargs = dict(
+            device_id=1, device_datasource_id=10, instance_id=100, method="mad", stream=True
+        )
+
+        await get_metric_anomalies(client, **kwargs)
+        second = json.loads((await get_metric_anomalies(client, **kwargs))[0].text)
+
+        batch = mad_anomalies([v for _, v in history] + [spike[1]])
+        anomaly = second["anomalies"][0]
+        assert anomaly["value"] == 80.0
+        assert anomaly["mean"] == round(batch["median"], 2)
+        assert anomaly["stddev"] == round(batch["mad"], 2)
+
+    @respx.mock
+    async def test_sessions_keep_separate_streams(self, client, monkeypatch):
+        """A second session primes its own stream instead of resuming the first's."""
+        from lm_mcp.session import use_session
+        from lm_mcp.tools.correlation import get_metric_anomalies
+
+        monkeypatch.setenv("LM_PORTAL", "test.logicmonitor.com")
+        monkeypatch.setenv("LM_BEARER_TOKEN", "test-token")
+
+        history = [(BASE_EPOCH + i * 300, 50.0 + (i % 5) * 0.5) for i in range(48)]
+        route = respx.get(self.DATA_URL).mock(return_value=self._response(history))
+        kwargs = dict(
+            device_id=1, device_datasource_id=10, instance_id=100, method="zscore", stream=True
+        )
+
+        with use_session("alice"):
+            await get_metric_anomalies(client, **kwargs)
+        with use_session("bob"):
+            other = json.loads((await get_metric_anomalies(client, **kwargs))[0].text)
+        with use_session("alice"):
+            resumed = json.loads((await get_metric_anomalies(client, **kwargs))[0].text)
+
+        assert other["stream"]["primed"] is True
+        assert other["stream"]["new_points"] == 48
+        assert resumed["stream"]["primed"] is False
+        assert dict(route.calls[2].request.url.params)["start"] == str(history[-1][0] + 1)
+
+
 class TestCorrelateMetrics:
     """Tests for correlate_metrics tool."""
 
@@ -981,17 +1083,95 @@ class TestCorrelateMetrics:
 
     @respx.mock
     async def test_too_many_sources_rejected(self, client):
-        """More than 10 sources returns error."""
+        """More than 100 sources returns error."""
         from lm_mcp.tools.correlation import correlate_metrics
 
         sources = [
             {"device_id": i, "device_datasource_id": 10, "instance_id": 100, "datapoint": "cpu"}
-            for i in range(11)
+            for i in range(101)
         ]
 
         result = await correlate_metrics(client, sources=sources)
 
-        assert "Error:" in result[0].text or "Maximum 10" in result[0].text
+        assert "Error:" in result[0].text or "Maximum 100" in result[0].text
+
+    @respx.mock
+    async def test_same_instance_datapoints_fetched_once(self, client):
+        """Sources on one instance share a single request for all their datapoints."""
+        from lm_mcp.tools.correlation import correlate_metrics
+
+        route = respx.get(
+            "https://test.logicmonitor.com/santaba/rest"
+            "/device/devices/1/devicedatasources/10/instances/100/data"
+        ).mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "dataPoints": ["cpu", "mem"],
+                    "values": [[float(10 + i), float(100 - i)] for i in range(10)],
+                    "time": [(BASE_EPOCH + i * 300) * 1000 for i in range(10)],
+                },
+            )
+        )
+
+        sources = [
+            {"device_id": 1, "device_datasource_id": 10, "instance_id": 100, "datapoint": "cpu"},
+            {"device_id": 1, "device_datasource_id": 10, "instance_id": 100, "datapoint": "mem"},
+        ]
+
+        result = await correlate_metrics(client, sources=sources)
+
+        data = json.loads(result[0].text)
+        assert route.call_count == 1
+        assert dict(route.calls[0].request.url.params)["datapoints"] == "cpu,mem"
+        assert data["labels"] == ["d1:cpu", "d1:mem"]
+        assert data["correlation_matrix"][0][1] == -1.0
+
+    @respx.mock
+    async def test_series_aligned_on_timestamps(self, client):
+        """Series are joined on shared timestamps, not truncated by position."""
+        from lm_mcp.tools.correlation import correlate_metrics
+
+        # Device 1 has every sample; device 2 is missing the first three and
+        # polls a few seconds later. Positional truncation would pair the wrong
+        # samples and lose the perfect correlation.
+        respx.get(
+            "https://test.logicmonitor.com/santaba/rest"
+            "/device/devices/1/devicedatasources/10/instances/100/data"
+        ).mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "dataPoints": ["cpu"],
+                    "values": [[float((i * 7) % 11)] for i in range(12)],
+                    "time": [(BASE_EPOCH + i * 300) * 1000 for i in range(12)],
+                },
+            )
+        )
+        respx.get(
+            "https://test.logicmonitor.com/santaba/rest"
+            "/device/devices/2/devicedatasources/10/instances/100/data"
+        ).mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "dataPoints": ["cpu"],
+                    "values": [[float((i * 7) % 11) * 2] for i in range(3, 12)],
+                    "time": [(BASE_EPOCH + i * 300 + 4) * 1000 for i in range(3, 12)],
+                },
+            )
+        )
+
+        sources = [
+            {"device_id": 1, "device_datasource_id": 10, "instance_id": 100, "datapoint": "cpu"},
+            {"device_id": 2, "device_datasource_id": 10, "instance_id": 100, "datapoint": "cpu"},
+        ]
+
+        result = await correlate_metrics(client, sources=sources)
+
+        data = json.loads(result[0].text)
+        assert data["sample_count"] == 9
+        assert data["correlation_matrix"][0][1] == 1.0
 
     @respx.mock
     async def test_fewer_than_two_sources_rejected(self, client):
@@ -1145,3 +1325,191 @@ class TestCorrelateMetrics:
         result = await correlate_metrics(client, sources=sources)
 
         assert "Error:" in result[0].text
+
+
+LM_BASE = "https://test.logicmonitor.com/santaba/rest"
+
+
+def _pattern(i):
+    """Deterministic irregular pattern for correlation fixtures."""
+    return float((i * 7) % 11) + i * 0.2
+
+
+def _mock_correlation_search(ref_values, device_instances):
+    """Mock the reference, group listing, and per-device bulk data endpoints.
+
+    Args:
+        ref_values: Reference series values (5-minute samples from BASE_EPOCH).
+        device_instances: {device_id: {instance_name: values}} for the group.
+    """
+    times = [(BASE_EPOCH + i * 300) * 1000 for i in range(len(ref_values))]
+    respx.get(f"{LM_BASE}/device/devices/1/devicedatasources/10/instances/100/data").mock(
+        return_value=httpx.Response(
+            200,
+            json={"dataPoints": ["cpu"], "values": [[v] for v in ref_values], "time": times},
+        )
+    )
+    respx.get(f"{LM_BASE}/device/devices/1/devicedatasources/10").mock(
+        return_value=httpx.Response(200, json={"id": 10, "dataSourceName": "CPU"})
+    )
+    respx.get(f"{LM_BASE}/device/devices/1/devicedatasources/10/instances/100").mock(
+        return_value=httpx.Response(200, json={"id": 100, "name": "cpu0"})
+    )
+    respx.get(f"{LM_BASE}/device/devices").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "total": len(device_instances),
+                "items": [
+                    {"id": dev_id, "displayName": f"host{dev_id}"} for dev_id in device_instances
+                ],
+            },
+        )
+    )
+    routes = {}
+    for dev_id, instances in device_instances.items():
+        dds_id = dev_id * 10
+        respx.get(f"{LM_BASE}/device/devices/{dev_id}/devicedatasources").mock(
+            return_value=httpx.Response(
+                200, json={"items": [{"id": dds_id, "dataSourceName": "CPU"}]}
+            )
+        )
+        routes[dev_id] = respx.get(
+            f"{LM_BASE}/device/devices/{dev_id}/devicedatasources/{dds_id}/data"
+        ).mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "dataSourceName": "CPU",
+                    "dataPoints": ["cpu"],
+                    "instances": {
+                        name: {"values": [[v] for v in values], "time": times[: len(values)]}
+                        for name, values in instances.items()
+                    },
+                },
+            )
+        )
+    return routes
+
+
+class TestFindCorrelatedMetrics:
+    """Tests for find_correlated_metrics tool."""
+
+    @respx.mock
+    async def test_ranks_matches_and_excludes_reference(self, client):
+        """Candidates rank by |r| and the reference series itself is excluded."""
+        from lm_mcp.tools.correlation import find_correlated_metrics
+
+        ref = [_pattern(i) for i in range(48)]
+        routes = _mock_correlation_search(
+            ref,
+            {
+                1: {"cpu0": ref, "cpu1": [100 - v for v in ref]},
+                2: {"cpu0": [v * 3 + 1 for v in ref], "cpu1": [float(i % 2) for i in range(48)]},
+            },
+        )
+
+        result = await find_correlated_metrics(
+            client,
+            device_id=1,
+            device_datasource_id=10,
+            instance_id=100,
+            datapoint="cpu",
+            group_id=5,
+        )
+
+        data = json.loads(result[0].text)
+        assert all(route.call_count == 1 for route in routes.values())
+        assert data["reference"]["datasource"] == "CPU"
+        assert data["candidates_scanned"] == 3
+        found = [(m["device_id"], m["instance"], m["direction"]) for m in data["matches"]]
+        assert (2, "cpu0", "positive") in found
+        assert (1, "cpu1", "negative") in found
+        assert (1, "cpu0", "positive") not in found
+        assert all(abs(m["correlation"]) >= 0.5 for m in data["matches"])
+
+    @respx.mock
+    async def test_lagged_candidate_reports_lead(self, client):
+        """A candidate that moves two samples earlier is reported as leading."""
+        from lm_mcp.tools.correlation import find_correlated_metrics
+
+        ref = [_pattern(i) for i in range(48)]
+        leading = [_pattern(i + 2) for i in range(48)]
+        _mock_correlation_search(ref, {2: {"cpu0": leading}})
+
+        result = await find_correlated_metrics(
+            client,
+            device_id=1,
+            device_datasource_id=10,
+            instance_id=100,
+            datapoint="cpu",
+            group_id=5,
+            max_lag_minutes=15,
+        )
+
+        match = json.loads(result[0].text)["matches"][0]
+        assert match["timing"] == "leads"
+        assert match["lag_seconds"] == 600
+        assert match["correlation"] == 1.0
+
+    @respx.mock
+    async def test_failed_device_is_reported_not_fatal(self, client):
+        """A device the API refuses is listed under device_errors; the rest still rank."""
+        from lm_mcp.tools.correlation import find_correlated_metrics
+
+        ref = [_pattern(i) for i in range(48)]
+        routes = _mock_correlation_search(ref, {2: {"cpu0": ref}, 3: {"cpu0": ref}})
+        routes[3].mock(return_value=httpx.Response(403, json={"errorMessage": "forbidden"}))
+
+        result = await find_correlated_metrics(
+            client,
+            device_id=1,
+            device_datasource_id=10,
+            instance_id=100,
+            datapoint="cpu",
+            group_id=5,
+        )
+
+        data = json.loads(result[0].text)
+        assert data["devices_scanned"] == 2
+        assert data["devices_failed"] == 1
+        assert data["device_errors"][0]["device_id"] == 3
+        assert [m["device_id"] for m in data["matches"]] == [2]
+
+    @respx.mock
+    async def test_insufficient_reference_data(self, client):
+        """A reference series without data returns an error."""
+        from lm_mcp.tools.correlation import find_correlated_metrics
+
+        _mock_correlation_search([1.0], {})
+
+        result = await find_correlated_metrics(
+            client,
+            device_id=1,
+            device_datasource_id=10,
+            instance_id=100,
+            datapoint="cpu",
+            group_id=5,
+        )
+
+        assert "insufficient data" in result[0].text
+
+    @respx.mock
+    async def test_error_handling(self, client):
+        """API errors are returned as error response."""
+        from lm_mcp.tools.correlation import find_correlated_metrics
+
+        respx.get(url__startswith=LM_BASE).mock(
+            return_value=httpx.Response(500, json={"errorMessage": "error"})
+        )
+
+        result = await find_correlated_metrics(
+            client,
+            device_id=1,
+            device_datasource_id=10,
+            instance_id=100,
+            datapoint="cpu",
+            group_id=5,
+        )
+
+        assert "Error:" in result[0].text
@@ -0,0 +1,156 @@
+# Description: Tests for the streaming coverage audit engine.
+# Description: Validates classification, inventory paging, and audit diffs.
+
+import httpx
+import pytest
+import respx
+
+from lm_mcp.auth.bearer import BearerAuth
+from lm_mcp.client import LogicMonitorClient
+from lm_mcp.tools.coverage_audit import (
+    AUDIT_PAGE_SIZE,
+    FLAG_NETFLOW,
+    FLAG_NETWORK,
+    FLAG_POWER,
+    FLAG_SERVER,
+    FLAG_SNMP,
+    CoverageAudit,
+    classify_device,
+    diff_audits,
+    iter_device_pages,
+    previous_audit,
+    record_audit,
+)
+
+BASE_URL = "https://test.logicmonitor.com/santaba/rest"
+
+
+@pytest.fixture
+def client():
+    """Create a LogicMonitorClient instance for testing."""
+    return LogicMonitorClient(
+        base_url=BASE_URL,
+        auth=BearerAuth("test-token"),
+        timeout=30,
+        api_version=3,
+    )
+
+
+class TestClassifyDevice:
+    """Tests for the single-pass device classifier."""
+
+    def test_role_priority(self):
+        """Power wins over network, network over server."""
+        assert classify_device({"displayName": "linux-ups-01"}) == FLAG_POWER
+        assert classify_device({"displayName": "host", "systemCategories": "router"}) == (
+            FLAG_NETWORK
+        )
+        assert classify_device({"displayName": "web-server"}) == FLAG_SERVER
+        assert classify_device({"displayName": "mystery"}) == 0
+
+    def test_overlapping_keywords_still_match(self):
+        """A keyword sharing letters with an earlier one is not skipped."""
+        assert classify_device({"displayName": "windowswitch"}) == FLAG_NETWORK
+
+    def test_properties_and_precedence(self):
+        """Custom properties take precedence over system properties of the same name."""
+        device = {
+            "displayName": "edge",
+            "systemCategories": "NetflowExporter",
+            "customProperties": [{"name": "snmp.version", "value": ""}],
+            "systemProperties": [{"name": "snmp.version", "value": "v2c"}],
+        }
+        assert classify_device(device) == FLAG_NETFLOW
+
+        device["systemProperties"].append({"name": "snmp.community", "value": "public"})
+        assert classify_device(device) == FLAG_NETFLOW | FLAG_SNMP
+
+
+class TestCoverageAudit:
+    """Tests for paging and the streaming counters."""
+
+    @respx.mock
+    async def test_pages_full_inventory(self, client):
+        """Every page up to the reported total is requested and counted once."""
+        total = AUDIT_PAGE_SIZE * 3 + 5
+
+        def page(request):
+            offset = int(request.url.params["offset"])
+            count = min(AUDIT_PAGE_SIZE, total - offset)
+            ids = range(offset, offset + count)
+            items = [{"id": i, "displayName": f"switch-{i}"} for i in ids]
+            return httpx.Response(200, json={"items": items, "total": total})
+
+        route = respx.get(f"{BASE_URL}/device/devices").mock(side_effect=page)
+
+        audit = CoverageAudit()
+        async for devices, _ in iter_device_pages(client, group_id=7):
+            audit.feed(devices)
+
+        assert route.call_count == 4
+        params = route.calls[0].request.url.params
+        assert params["filter"] == "hostGroupIds~7"
+        assert "customProperties" in params["fields"]
+        assert audit.inventory([])["total_devices"] == total
+        assert audit.network_like == total
+
+    @respx.mock
+    async def test_respects_device_cap(self, client):
+        respx.get(f"{BASE_URL}/device/devices").mock(
+            return_value=httpx.Response(
+                200,
+                json={"items": [{"id": 1}] * AUDIT_PAGE_SIZE, "total": AUDIT_PAGE_SIZE * 10},
+            )
+        )
+
+        pages = [p async for p in iter_device_pages(client, max_devices=AUDIT_PAGE_SIZE * 2)]
+
+        assert len(pages) == 2
+
+    def test_feed_skips_records_without_id(self):
+        audit = CoverageAudit()
+        audit.feed([{"displayName": "sw1"}, {"id": 2, "displayName": "sw2"}])
+
+        assert audit.inventory([])["total_devices"] == 1
+        assert audit.unclassified == 1
+
+    def test_diff_reports_coverage_changes(self, client):
+        first = CoverageAudit()
+        first.feed(
+            [
+                {
+                    "id": 1,
+                    "displayName": "sw1",
+                    "customProperties": [{"name": "snmp.version", "value": "v2c"}],
+                },
+                {"id": 2, "displayName": "sw2"},
+                {"id": 3, "displayName": "ups1"},
+            ]
+        )
+        first.feed([{"id": 1, "displayName": "sw1"}])  # duplicates are ignored
+        old = record_audit(client, None, first, first.coverage([]), [])
+
+        second = CoverageAudit()
+        second.feed(
+            [
+                {"id": 1, "displayName": "sw1"},
+                {
+                    "id": 2,
+                    "displayName": "sw2",
+                    "customProperties": [{"name": "snmp.version", "value": "v3"}],
+                },
+                {"id": 4, "displayName": "pdu1"},
+            ]
+        )
+        gaps = [{"category": "netflow", "severity": "medium"}]
+        new = record_audit(client, None, second, second.coverage([]), gaps)
+
+        diff = diff_audits(old, new)
+
+        assert previous_audit(client, None) is new
+        assert diff["devices_added"] == 1
+        assert diff["sample_removed_device_ids"] == [3]
+        assert diff["coverage_gained"] == {"snmp": {"count": 1, "device_ids": [2]}}
+        assert diff["coverage_lost"] == {"snmp": {"count": 1, "device_ids": [1]}}
+        assert diff["counts_delta"]["snmp_credentialed"] == 0
+        assert diff["gaps_opened"] == ["netflow:medium"]
@@ -270,7 +270,7 @@ class TestGetRecipientGroups:
             )
         )
 
-        result = await get_recipient_groups(client)
+        result = await get_recipient_groups(client, detail=False)
 
         assert len(result) == 1
         data = json.loads(result[0].text)
@@ -366,7 +366,7 @@ class TestGetRecipientGroup:
             )
         )
 
-        result = await get_recipient_groups(client)
+        result = await get_recipient_groups(client, detail=False)
 
         data = json.loads(result[0].text)
         assert data["recipient_groups"][0]["name"] == "Legacy Key Group"
@@ -413,3 +413,39 @@ class TestGetRecipientGroup:
         assert group["name"] == "Team A"
         assert len(group["recipients"]) == 1
         assert group["recipients"][0]["address"] == "a@example.com"
+
+    @respx.mock
+    async def test_get_recipient_groups_detail_by_default(self, client):
+        """Detail is the default; embedded recipients are reused and failures stay per group."""
+        from lm_mcp.tools.escalations import get_recipient_groups
+
+        base = "https://test.logicmonitor.com/santaba/rest/setting/recipientgroups"
+        respx.get(base).mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "items": [
+                        {"id": 1, "groupName": "Inline", "recipients": [{"addr": "i@x.com"}]},
+                        {"id": 2, "groupName": "Fetched"},
+                        {"id": 3, "groupName": "Broken"},
+                    ],
+                    "total": 3,
+                },
+            )
+        )
+        inline_route = respx.get(f"{base}/1").mock(return_value=httpx.Response(200, json={}))
+        respx.get(f"{base}/2").mock(
+            return_value=httpx.Response(200, json={"id": 2, "recipients": [{"addr": "f@x.com"}]})
+        )
+        respx.get(f"{base}/3").mock(
+            return_value=httpx.Response(404, json={"errorMessage": "not found"})
+        )
+
+        result = await get_recipient_groups(client)
+
+        groups = json.loads(result[0].text)["recipient_groups"]
+        assert inline_route.call_count == 0
+        assert groups[0]["recipients"][0]["address"] == "i@x.com"
+        assert groups[1]["recipients"][0]["address"] == "f@x.com"
+        assert "recipients" not in groups[2]
+        assert groups[2]["recipients_error"]
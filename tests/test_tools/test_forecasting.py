@@ -37,9 +37,11 @@ DATA_URL = (
 )
 
 
-def _make_metric_response(dp_names, values, interval_sec=300):
-    """Helper to build metric API response."""
+def _make_metric_response(dp_names, values, interval_sec=300, newest_first=False):
+    """Helper to build metric API response (oldest first, or newest first like LM)."""
     times = [(BASE_EPOCH + i * interval_sec) * 1000 for i in range(len(values))]
+    if newest_first:
+        values, times = values[::-1], times[::-1]
     return {
         "dataPoints": dp_names,
         "values": values,
@@ -376,6 +378,131 @@ class TestForecastMetricMethod:
         assert cpu["method_used"] == "linear"
 
 
+class TestForecastMetricModelReuse:
+    """Tests for Holt-Winters model caching across forecast_metric calls."""
+
+    @respx.mock
+    async def test_repeat_forecast_advances_cached_model(self, client):
+        """A repeat forecast with one new point reuses the model and matches a refit."""
+        from lm_mcp.tools.forecasting import forecast_metric, reset_forecast_models
+
+        values = [[float(50 + 10 * math.sin(2 * math.pi * i / 12))] for i in range(49)]
+        route = respx.get(DATA_URL).mock(
+            side_effect=[
+                httpx.Response(200, json=_make_metric_response(["cpu"], values[:48])),
+                httpx.Response(200, json=_make_metric_response(["cpu"], values)),
+                httpx.Response(200, json=_make_metric_response(["cpu"], values)),
+            ]
+        )
+        kwargs = dict(
+            device_id=1,
+            device_datasource_id=10,
+            instance_id=100,
+            threshold=200.0,
+            method="holt_winters",
+        )
+
+        first = json.loads((await forecast_metric(client, **kwargs))[0].text)
+        second = json.loads((await forecast_metric(client, **kwargs))[0].text)
+        reset_forecast_models()
+        fresh = json.loads((await forecast_metric(client, **kwargs))[0].text)
+
+        assert route.call_count == 3
+        assert first["forecasts"]["cpu"]["model"]["reused"] is False
+        cpu = second["forecasts"]["cpu"]
+        assert cpu["model"]["reused"] is True
+        assert cpu["model"]["new_points"] == 1
+        assert cpu["forecast_values"] == fresh["forecasts"]["cpu"]["forecast_values"]
+        assert cpu["confidence_interval"] == fresh["forecasts"]["cpu"]["confidence_interval"]
+
+    def test_advancing_leaves_cached_model_untouched(self):
+        """Reuse advances a copy, so a model shared by concurrent calls never changes."""
+        from lm_mcp.tools.forecasting import (
+            _forecast_holt_winters_incremental,
+            _hw_season_length,
+        )
+        from lm_mcp.tools.stats_helpers import holt_winters_fit
+
+        values = [float(50 + 10 * math.sin(2 * math.pi * i / 12)) for i in range(49)]
+        timestamps = [BASE_EPOCH + i * 300 for i in range(49)]
+        x_hours = [(t - timestamps[0]) / 3600.0 for t in timestamps]
+        season_length = _hw_season_length(values, timestamps)
+        cached, _ = holt_winters_fit(values[:48], season_length, timestamps[:48])
+        before = (cached.n_observed, cached.level, list(cached.seasonals), len(cached.window))
+
+        result, advanced = _forecast_holt_winters_incremental(
+            values, timestamps, 200.0, timestamps[0], x_hours, state=cached
+        )
+
+        assert result["model"]["reused"] is True
+        assert advanced is not cached
+        assert advanced.n_observed == 49
+        assert (
+            cached.n_observed,
+            cached.level,
+            list(cached.seasonals),
+            len(cached.window),
+        ) == before
+
+    @respx.mock
+    async def test_newest_first_data_reuses_cached_model(self, client):
+        """Rows in the API's newest-first order still advance the cached model."""
+        from lm_mcp.tools.forecasting import forecast_metric, reset_forecast_models
+
+        values = [[float(50 + 10 * math.sin(2 * math.pi * i / 12) + i * 0.1)] for i in range(49)]
+        respx.get(DATA_URL).mock(
+            side_effect=[
+                httpx.Response(
+                    200, json=_make_metric_response(["cpu"], values[:48], newest_first=True)
+                ),
+                httpx.Response(200, json=_make_metric_response(["cpu"], values, newest_first=True)),
+                httpx.Response(200, json=_make_metric_response(["cpu"], values)),
+            ]
+        )
+        kwargs = dict(
+            device_id=1,
+            device_datasource_id=10,
+            instance_id=100,
+            threshold=200.0,
+            method="holt_winters",
+        )
+
+        await forecast_metric(client, **kwargs)
+        second = json.loads((await forecast_metric(client, **kwargs))[0].text)
+        reset_forecast_models()
+        ascending = json.loads((await forecast_metric(client, **kwargs))[0].text)
+
+        cpu = second["forecasts"]["cpu"]
+        assert cpu["model"]["reused"] is True
+        assert cpu["model"]["new_points"] == 1
+        assert cpu["current_value"] == round(values[-1][0], 4)
+        assert cpu["forecast_values"] == ascending["forecasts"]["cpu"]["forecast_values"]
+
+    @respx.mock
+    async def test_optimize_params_refits_with_grid_search(self, client):
+        """optimize_params=True fits with searched parameters and marks the model."""
+        from lm_mcp.tools.forecasting import forecast_metric
+
+        values = [[float(50 + 10 * math.sin(2 * math.pi * i / 12))] for i in range(48)]
+        respx.get(DATA_URL).mock(
+            return_value=httpx.Response(200, json=_make_metric_response(["cpu"], values))
+        )
+        kwargs = dict(
+            device_id=1,
+            device_datasource_id=10,
+            instance_id=100,
+            threshold=200.0,
+            method="holt_winters",
+        )
+
+        await forecast_metric(client, **kwargs)
+        result = await forecast_metric(client, optimize_params=True, **kwargs)
+
+        model = json.loads(result[0].text)["forecasts"]["cpu"]["model"]
+        assert model["optimized"] is True
+        assert model["reused"] is False
+
+
 class TestDetectChangePoints:
     """Tests for detect_change_points tool."""
 
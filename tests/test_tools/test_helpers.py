@@ -1,8 +1,11 @@
 # Description: Tests for tool helper functions.
 # Description: Validates format_response and handle_error utilities.
 
+import asyncio
 import json
 
+import pytest
+
 from lm_mcp.exceptions import AuthenticationError, LMError, NotFoundError
 
 
@@ -317,6 +320,91 @@ class TestCallSubTool:
             await call_sub_tool(handler, client=None)
 
 
+class TestBoundedGather:
+    """Tests for the bounded_gather concurrency helper."""
+
+    async def test_results_in_input_order(self):
+        from lm_mcp.tools import bounded_gather
+
+        async def _delayed(value, delay):
+            await asyncio.sleep(delay)
+            return value
+
+        result = await bounded_gather([_delayed(1, 0.02), _delayed(2, 0.0), _delayed(3, 0.01)])
+        assert result == [1, 2, 3]
+
+    async def test_limit_caps_in_flight_calls(self):
+        from lm_mcp.tools import bounded_gather
+
+        in_flight = 0
+        peak = 0
+
+        async def _tracked():
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        await bounded_gather([_tracked() for _ in range(10)], limit=3)
+        assert peak == 3
+
+    async def test_first_error_propagates_and_cancels_rest(self):
+        from lm_mcp.tools import bounded_gather
+
+        finished = []
+
+        async def _fail():
+            raise NotFoundError("missing")
+
+        async def _slow():
+            await asyncio.sleep(1)
+            finished.append(True)
+
+        with pytest.raises(NotFoundError):
+            await bounded_gather([_fail(), _slow(), _slow()], limit=2)
+        await asyncio.sleep(0)
+        assert finished == []
+
+
+class TestHydrate:
+    """Tests for the hydrate list-then-detail helper."""
+
+    async def test_dedupes_skips_and_keeps_order(self):
+        from lm_mcp.tools import hydrate
+
+        calls = []
+
+        class _Client:
+            async def get(self, path):
+                calls.append(path)
+                await asyncio.sleep(0.01 if path.endswith("1") else 0)
+                return {"path": path}
+
+        items = [{"id": 1}, {"id": 2}, {"id": None}, {"id": 1}]
+        result = await hydrate(
+            _Client(), items, lambda i: f"/x/{i['id']}" if i["id"] is not None else None
+        )
+
+        assert result == [{"path": "/x/1"}, {"path": "/x/2"}, None, {"path": "/x/1"}]
+        assert sorted(calls) == ["/x/1", "/x/2"]
+
+    async def test_failed_lookup_returned_not_raised(self):
+        from lm_mcp.tools import hydrate
+
+        class _Client:
+            async def get(self, path):
+                if path == "/x/2":
+                    raise NotFoundError("gone")
+                return {"path": path}
+
+        result = await hydrate(_Client(), [1, 2, 3], lambda i: f"/x/{i}")
+
+        assert result[0] == {"path": "/x/1"}
+        assert isinstance(result[1], NotFoundError)
+        assert result[2] == {"path": "/x/3"}
+
+
 class TestValidationError:
     """Tests for the validation_error helper."""
 
@@ -272,6 +272,135 @@ class TestDetectAlertBurst:
         # Only interface alerts should qualify.
         assert data["total_alerts_in_window"] == 12
 
+    @respx.mock
+    async def test_streams_pages_oldest_first(self, client, monkeypatch):
+        """Alerts are requested sorted by start time and a burst spanning pages is found."""
+        from lm_mcp.tools import networking
+        from lm_mcp.tools.networking import detect_alert_burst
+
+        now = int(time.time())
+        alerts = [
+            {
+                "id": i,
+                "startEpoch": now - 100 + i,
+                "dataSourceName": "SNMP_Network_Interfaces",
+                "monitorObjectName": f"sw-{i % 5}",
+            }
+            for i in range(12)
+        ]
+        route = respx.get(f"{BASE}/alert/alerts").mock(
+            side_effect=[
+                httpx.Response(200, json={"items": alerts[:6], "total": 12}),
+                httpx.Response(200, json={"items": alerts[6:], "total": 12}),
+            ]
+        )
+        monkeypatch.setattr(networking, "_ALERTS_PAGE_SIZE", 6)
+
+        result = await detect_alert_burst(client, window_seconds=60, min_alerts=10, min_devices=3)
+
+        data = json.loads(result[0].text)
+        assert route.call_count == 2
+        assert route.calls[0].request.url.params["sort"] == "+startEpoch"
+        assert data["bursts_detected"] == 1
+        assert data["bursts"][0]["alert_count"] == 12
+
+
+def _reference_bursts(alerts, window_seconds, min_alerts, min_devices):
+    """Quadratic reference: rebuild each anchor's window from scratch."""
+    by_ds: dict = {}
+    for a in sorted(alerts, key=lambda a: a["startEpoch"]):
+        by_ds.setdefault(a["dataSourceName"], []).append(a)
+    out = []
+    for ds, items in by_ds.items():
+        n = len(items)
+        i = 0
+        burst = None
+        while i < n:
+            anchor = items[i]["startEpoch"]
+            window = [a for a in items[i:] if a["startEpoch"] <= anchor + window_seconds]
+            devices = {a["monitorObjectName"] for a in window}
+            if len(window) >= min_alerts and len(devices) >= min_devices:
+                burst = burst or {"datasource": ds, "window_start": anchor, "alert_count": 0}
+                burst["window_end"] = anchor + window_seconds
+                burst["alert_count"] += 1
+                i += 1
+            elif burst:
+                while i < n and items[i]["startEpoch"] <= burst["window_end"]:
+                    burst["alert_count"] += 1
+                    i += 1
+                out.append(burst)
+                burst = None
+            else:
+                i += 1
+        if burst:
+            out.append(burst)
+    return sorted(out, key=lambda b: b["window_start"])
+
+
+class TestBurstDetector:
+    """Tests for the streaming two-pointer burst detector."""
+
+    def test_matches_reference_on_random_storms(self):
+        """Incremental windows give the same bursts as rebuilding every window."""
+        import random
+
+        from lm_mcp.tools.networking import BurstDetector
+
+        rng = random.Random(7)
+        for _ in range(20):
+            alerts = [
+                {
+                    "id": i,
+                    "startEpoch": rng.randint(0, 1200),
+                    "dataSourceName": rng.choice(["If", "CPU", "Ping"]),
+                    "monitorObjectName": f"dev-{rng.randint(0, 6)}",
+                }
+                for i in range(rng.randint(0, 400))
+            ]
+            detector = BurstDetector(60, 8, 3)
+            detector.feed(sorted(alerts, key=lambda a: a["startEpoch"]))
+            got = [
+                {k: b[k] for k in ("datasource", "window_start", "window_end", "alert_count")}
+                for b in detector.finish()
+            ]
+            assert got == _reference_bursts(alerts, 60, 8, 3)
+
+    def test_overlapping_windows_merge_into_one_burst(self):
+        """A storm longer than the window is reported once, spanning its full length."""
+        from lm_mcp.tools.networking import BurstDetector
+
+        alerts = [
+            {"id": i, "startEpoch": i * 5, "dataSourceName": "If", "monitorObjectName": f"d{i % 4}"}
+            for i in range(60)
+        ]
+        detector = BurstDetector(60, 10, 3)
+        for start in range(0, 60, 7):
+            detector.feed(alerts[start : start + 7])
+        bursts = detector.finish()
+
+        assert len(bursts) == 1
+        assert bursts[0]["window_start"] == 0
+        assert bursts[0]["alert_count"] == 60
+        assert bursts[0]["device_count"] == 4
+        assert len(bursts[0]["alert_ids"]) == 50
+
+    def test_late_alert_inside_window_is_placed(self):
+        """A slightly out-of-order alert within the open window still counts."""
+        from lm_mcp.tools.networking import BurstDetector
+
+        alerts = [
+            {"id": i, "startEpoch": 100 + i, "dataSourceName": "If", "monitorObjectName": f"d{i}"}
+            for i in range(10)
+        ]
+        alerts[3], alerts[7] = alerts[7], alerts[3]
+        alerts.append({"id": 99, "startEpoch": 10, "dataSourceName": "If"})
+        detector = BurstDetector(60, 10, 3)
+        detector.feed(alerts)
+        bursts = detector.finish()
+
+        assert bursts[0]["alert_count"] == 10
+        assert detector.out_of_order == 1
+
 
 class TestGetLinkFlaps:
     @respx.mock
@@ -667,6 +667,137 @@ class TestCalculateAvailability:
         assert "other-server" not in data.get("by_device", {})
 
 
+def _fleet_alert(alert_id, device, device_id, start_epoch, end_epoch):
+    """Alert with a monitorObjectId, as fleet mode keys devices by ID."""
+    alert = _make_alert(alert_id, device, "CPU", start_epoch=start_epoch, end_epoch=end_epoch)
+    alert["monitorObjectId"] = device_id
+    return alert
+
+
+class TestCalculateAvailabilityFleet:
+    """Tests for calculate_availability fleet mode."""
+
+    @staticmethod
+    def _mock_fleet(alerts, devices):
+        base = "https://test.logicmonitor.com/santaba/rest"
+        respx.get(f"{base}/device/groups/5").mock(
+            return_value=httpx.Response(200, json={"id": 5, "fullPath": "Prod"})
+        )
+        respx.get(f"{base}/device/devices").mock(
+            return_value=httpx.Response(200, json={"items": devices, "total": len(devices)})
+        )
+        return respx.get(ALERT_URL).mock(
+            return_value=httpx.Response(200, json={"items": alerts, "total": len(alerts)})
+        )
+
+    async def test_requires_group_id(self, client):
+        from lm_mcp.tools.scoring import calculate_availability
+
+        result = await calculate_availability(client, fleet=True)
+
+        assert "fleet mode requires group_id" in result[0].text
+
+    @respx.mock
+    async def test_group_report_with_offenders(self, client):
+        """Per-device merged downtime, device-less devices, and group downtime in one sweep."""
+        from lm_mcp.tools.scoring import calculate_availability
+
+        now = int(time.time())
+        t = now - 36000
+        alerts = [
+            _fleet_alert(1, "web01", 1, t, t + 3600),
+            _fleet_alert(2, "web01", 1, t + 1800, t + 5400),
+            _fleet_alert(3, "db01", 2, t + 6000, t + 6600),
+        ]
+        devices = [
+            {"id": 1, "displayName": "web01"},
+            {"id": 2, "displayName": "db01"},
+            {"id": 3, "displayName": "cache01"},
+            {"id": 4, "displayName": "cache02"},
+        ]
+        route = self._mock_fleet(alerts, devices)
+
+        result = await calculate_availability(client, group_id=5, hours_back=24, fleet=True)
+
+        data = json.loads(result[0].text)
+        assert data["mode"] == "fleet"
+        assert data["device_count"] == 4
+        assert data["devices_with_downtime"] == 2
+        assert data["incident_count"] == 2
+        # web01 merged 5400s, db01 600s; the group is down 0..5400 and 6000..6600
+        assert data["total_downtime_minutes"] == 100.0
+        assert data["peak_devices_down"] == 1
+        assert data["availability_percent"] == round((1 - 6000 / (4 * 86400)) * 100, 4)
+        assert data["group_availability_percent"] == round((1 - 6000 / 86400) * 100, 4)
+        assert [o["device"] for o in data["top_offenders"]] == ["web01", "db01"]
+        assert data["top_offenders"][0]["downtime_minutes"] == 90.0
+        params = route.calls[0].request.url.params
+        assert params["sort"] == "+startEpoch"
+        assert 'monitorObjectGroups~"Prod"' in params["filter"]
+
+    @respx.mock
+    async def test_concurrent_outages_and_active_alerts(self, client):
+        """Active alerts run to now, and overlapping devices raise peak_devices_down."""
+        from lm_mcp.tools.scoring import calculate_availability
+
+        now = int(time.time())
+        t = now - 3600
+        alerts = [
+            _fleet_alert(1, "a", 1, t, t + 600),
+            _fleet_alert(2, "b", 2, t + 300, 0),
+        ]
+        self._mock_fleet(alerts, [{"id": 1, "displayName": "a"}, {"id": 2, "displayName": "b"}])
+
+        result = await calculate_availability(client, group_id=5, hours_back=2, fleet=True, top_n=1)
+
+        data = json.loads(result[0].text)
+        assert data["peak_devices_down"] == 2
+        assert len(data["top_offenders"]) == 1
+        assert data["top_offenders"][0]["device"] == "b"
+        assert data["top_offenders"][0]["downtime_minutes"] == pytest.approx(55.0, abs=0.1)
+
+
+class TestFleetDowntimeSweep:
+    """Tests for the sweep-line downtime accumulator."""
+
+    def test_matches_interval_merge(self):
+        """Per-device downtime equals the sorted interval merge for random alerts."""
+        import random
+
+        from lm_mcp.tools.scoring import FleetDowntimeSweep, _merge_intervals
+
+        rng = random.Random(3)
+        alerts = []
+        for i in range(500):
+            start = rng.randint(0, 90000)
+            alerts.append(
+                {
+                    "id": i,
+                    "monitorObjectName": f"d{rng.randint(0, 20)}",
+                    "startEpoch": start,
+                    "endEpoch": start + rng.randint(1, 4000) if rng.random() < 0.9 else 0,
+                }
+            )
+        alerts.sort(key=lambda a: a["startEpoch"])
+        sweep = FleetDowntimeSweep(1000, 86400)
+        for offset in range(0, len(alerts), 37):
+            sweep.feed(alerts[offset : offset + 37])
+        sweep.finish()
+
+        for name, dev in sweep.devices.items():
+            intervals = []
+            for a in alerts:
+                if a["monitorObjectName"] != name:
+                    continue
+                start = max(a["startEpoch"], 1000)
+                end = min(a["endEpoch"] or 86400, 86400)
+                if start < end:
+                    intervals.append((start, end))
+            merged = _merge_intervals(intervals)
+            assert dev.downtime == sum(e - s for s, e in merged)
+            assert dev.incidents == len(merged)
+
+
 # Base epoch for metric data
 METRIC_BASE = 1705276800
 DATA_URL = (
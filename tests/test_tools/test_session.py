@@ -198,7 +198,7 @@ class TestClearSessionContext:
 
         assert session.last_device is None
         assert session.variables == {}
-        assert session.history == []
+        assert list(session.history) == []
 
 
 class TestListSessionHistory:
@@ -217,6 +217,189 @@ class TestAutocorrelation:
         assert autocorrelation([], lag=1) == 0.0
 
 
+class TestAutocorrelationSweep:
+    """Tests for autocorrelation_sweep."""
+
+    def test_labels_preserved_in_order(self):
+        """Each usable lag is returned under its label."""
+        from lm_mcp.tools.stats_helpers import autocorrelation_sweep
+
+        values = [math.sin(2 * math.pi * i / 10) for i in range(100)]
+        result = autocorrelation_sweep(values, {"10": 10, "5": 5})
+        assert list(result) == ["10", "5"]
+        assert result["10"] > 0.9
+        assert result["5"] < -0.9
+
+    def test_unusable_lags_skipped(self):
+        """Lags below 1 or beyond half the series are omitted."""
+        from lm_mcp.tools.stats_helpers import autocorrelation_sweep
+
+        values = [float(i % 4) for i in range(20)]
+        result = autocorrelation_sweep(values, {"zero": 0, "long": 10, "ok": 4})
+        assert list(result) == ["ok"]
+
+
+class TestCorrelationMatrix:
+    """Tests for correlation_matrix."""
+
+    def test_symmetric_with_unit_diagonal(self):
+        """Matrix is symmetric with 1.0 on the diagonal."""
+        from lm_mcp.tools.stats_helpers import correlation_matrix
+
+        a = [1.0, 2.0, 3.0, 4.0]
+        b = [4.0, 3.0, 2.0, 1.0]
+        c = [1.0, 3.0, 2.0, 4.0]
+        matrix = correlation_matrix([a, b, c])
+        assert [matrix[i][i] for i in range(3)] == [1.0, 1.0, 1.0]
+        assert matrix[0][1] == -1.0
+        assert matrix[0][2] == matrix[2][0]
+
+    def test_zero_variance_series_correlates_as_zero(self):
+        """A constant series yields 0.0 against every other series."""
+        from lm_mcp.tools.stats_helpers import correlation_matrix
+
+        matrix = correlation_matrix([[5.0, 5.0, 5.0], [1.0, 2.0, 3.0]])
+        assert matrix[0][1] == 0.0
+        assert matrix[1][0] == 0.0
+
+    def test_matches_pairwise_pearson(self):
+        """Normalized dot products match pearson_correlation."""
+        from lm_mcp.tools.stats_helpers import correlation_matrix, pearson_correlation
+
+        a = [float((i * 7) % 11) for i in range(30)]
+        b = [float((i * 3) % 5) + i * 0.1 for i in range(30)]
+        matrix = correlation_matrix([a, b])
+        assert matrix[0][1] == round(pearson_correlation(a, b), 4)
+
+
+class TestAlignSeries:
+    """Tests for align_series sort-merge join."""
+
+    def test_keeps_only_shared_timestamps(self):
+        """Only buckets present in every series survive the join."""
+        from lm_mcp.tools.stats_helpers import align_series
+
+        ts_a = [0, 300, 600, 900, 1200]
+        ts_b = [300, 900, 1200, 1500]
+        timestamps, aligned = align_series(
+            [(ts_a, [1.0, 2.0, 3.0, 4.0, 5.0]), (ts_b, [20.0, 40.0, 50.0, 60.0])]
+        )
+
+        assert timestamps == [300, 900, 1200]
+        assert aligned == [[2.0, 4.0, 5.0], [20.0, 40.0, 50.0]]
+
+    def test_unsorted_input_with_jitter(self):
+        """Newest-first input and a few seconds of polling jitter still align."""
+        from lm_mcp.tools.stats_helpers import align_series
+
+        ts_a = [600, 300, 0]
+        ts_b = [605, 302, 7]
+        _, aligned = align_series([(ts_a, [3.0, 2.0, 1.0]), (ts_b, [30.0, 20.0, 10.0])])
+
+        assert aligned == [[1.0, 2.0, 3.0], [10.0, 20.0, 30.0]]
+
+    def test_empty_series_yields_nothing(self):
+        """An empty series leaves nothing to join."""
+        from lm_mcp.tools.stats_helpers import align_series
+
+        timestamps, aligned = align_series([([0, 300], [1.0, 2.0]), ([], [])])
+
+        assert timestamps == []
+        assert aligned == [[], []]
+
+
+class TestRankCorrelatedSeries:
+    """Tests for rank_correlated_series top-k search."""
+
+    def _reference(self, n=64):
+        ts = [BASE_EPOCH + i * 300 for i in range(n)]
+        return ts, [float((i * 7) % 11) + i * 0.2 for i in range(n)]
+
+    def test_top_k_limits_and_orders_matches(self):
+        """Matches are the k strongest by |r|, strongest first."""
+        from lm_mcp.tools.stats_helpers import rank_correlated_series
+
+        ts, ref = self._reference()
+        noise = [float((i * 5) % 3) for i in range(len(ref))]
+        candidates = [
+            (ts, [v + 0.5 * w for v, w in zip(ref, noise, strict=True)]),
+            (ts, [-v for v in ref]),
+            (ts, [v + 3.0 * w for v, w in zip(ref, noise, strict=True)]),
+        ]
+
+        result = rank_correlated_series((ts, ref), candidates, top_k=2, min_correlation=0.1)
+
+        assert [m["index"] for m in result["matches"]] == [1, 0]
+        assert result["matches"][0]["correlation"] == -1.0
+        assert result["scanned"] == 3
+
+    def test_coarse_pass_prunes_unrelated_series(self):
+        """Series with no relationship are pruned before the full lag sweep."""
+        from lm_mcp.tools.stats_helpers import rank_correlated_series
+
+        ts, ref = self._reference(n=256)
+        unrelated = [(ts, [float((i * 13) % 4) for i in range(256)])]
+
+        result = rank_correlated_series((ts, ref), unrelated, min_correlation=0.8)
+
+        assert result["pruned"] == 1
+        assert result["matches"] == []
+
+    def test_sparse_candidate_skipped(self):
+        """A candidate covering too little of the reference window is skipped."""
+        from lm_mcp.tools.stats_helpers import rank_correlated_series
+
+        ts, ref = self._reference()
+        sparse = [(ts[:10], ref[:10])]
+
+        result = rank_correlated_series((ts, ref), sparse)
+
+        assert result["low_coverage"] == 1
+
+
+class TestRollingWindow:
+    """Tests for RollingWindow incremental statistics."""
+
+    def test_statistics_match_batch_after_eviction(self):
+        """Mean, stdev, median, MAD, and quartiles match a recompute of the live window."""
+        import statistics
+
+        from lm_mcp.tools.stats_helpers import RollingWindow, iqr_anomalies
+
+        points = [
+            (i * 60, float((i * 7) % 13) + (20.0 if i % 11 == 0 else 0.0)) for i in range(200)
+        ]
+        window = RollingWindow(window_seconds=3000)
+        for ts, val in points:
+            window.push(ts, val)
+
+        live = [v for ts, v in points if ts >= points[-1][0] - 3000]
+        median = statistics.median(live)
+        assert window.count == len(live)
+        assert window.mean == pytest.approx(statistics.mean(live))
+        assert window.stdev() == pytest.approx(statistics.stdev(live))
+        assert window.median() == median
+        assert window.mad() == statistics.median([abs(v - median) for v in live])
+        assert round(window.quantile(0.25), 4) == iqr_anomalies(live)["q1"]
+
+    def test_from_points_matches_pushes(self):
+        """Bulk construction gives the same state as pushing points one at a time."""
+        from lm_mcp.tools.stats_helpers import RollingWindow
+
+        timestamps = [i * 300 for i in range(30)]
+        values = [float(i % 7) for i in range(30)]
+        pushed = RollingWindow(window_seconds=3600)
+        for ts, val in zip(timestamps, values, strict=True):
+            pushed.push(ts, val)
+
+        bulk = RollingWindow.from_points(3600, timestamps[::-1], values[::-1])
+
+        assert bulk.sorted_values == pushed.sorted_values
+        assert bulk.mean == pytest.approx(pushed.mean)
+        assert bulk.mad() == pushed.mad()
+        assert bulk.last_timestamp == timestamps[-1]
+
+
 class TestCusum:
     """Tests for CUSUM change point detection."""
 
@@ -549,6 +732,66 @@ class TestHoltWinters:
         assert len(result["forecast"]) == 6
 
 
+class TestHoltWintersState:
+    """Tests for the incremental HoltWintersState model."""
+
+    def test_incremental_update_matches_batch_fit(self):
+        """Fitting in two chunks gives the same model as one batch fit."""
+        from lm_mcp.tools.stats_helpers import HoltWintersState, holt_winters_fit
+
+        values = [float(10 + 5 * math.sin(2 * math.pi * i / 6) + i * 0.1) for i in range(30)]
+        timestamps = [BASE_EPOCH + i * 300 for i in range(30)]
+
+        batch, batch_fitted = holt_winters_fit(values, 6, timestamps)
+        inc = HoltWintersState.initialize(values, 6)
+        inc_fitted = inc.update(values[:20], timestamps[:20])
+        inc_fitted += inc.update(values[20:], timestamps[20:])
+
+        assert inc_fitted == pytest.approx(batch_fitted)
+        assert inc.forecast(6) == pytest.approx(batch.forecast(6))
+        assert inc.window_sse == pytest.approx(batch.window_sse)
+        assert inc.last_timestamp == timestamps[-1]
+
+    def test_trim_window_drops_old_points(self):
+        """trim_window removes points before the cutoff and their squared error."""
+        from lm_mcp.tools.stats_helpers import holt_winters_fit
+
+        values = [10, 15, 20, 15, 10, 5] * 3
+        timestamps = [BASE_EPOCH + i * 300 for i in range(len(values))]
+        state, fitted = holt_winters_fit(values, 6, timestamps)
+
+        state.trim_window(timestamps[6])
+
+        assert len(state.window) == 12
+        expected = sum((values[i] - fitted[i]) ** 2 for i in range(6, 18))
+        assert state.window_sse == pytest.approx(expected)
+
+    def test_grid_search_returns_grid_params(self):
+        """Grid search picks parameters from the supplied grid."""
+        from lm_mcp.tools.stats_helpers import holt_winters_grid_search
+
+        values = [10, 15, 20, 15, 10, 5] * 4
+        alpha, beta, gamma = holt_winters_grid_search(
+            values, 6, alphas=(0.2, 0.6), betas=(0.05,), gammas=(0.1, 0.4)
+        )
+
+        assert alpha in (0.2, 0.6)
+        assert beta == 0.05
+        assert gamma in (0.1, 0.4)
+
+    def test_prediction_interval_from_sse_matches_residuals(self):
+        """The SSE form gives the same interval as the residual form."""
+        from lm_mcp.tools.stats_helpers import prediction_interval, prediction_interval_from_sse
+
+        y_vals = [10.0, 12.0, 11.0, 13.0, 14.0, 12.0, 15.0, 13.0, 16.0, 14.0]
+        y_pred = [10.5, 11.5, 12.0, 12.5, 13.0, 13.5, 14.0, 14.5, 15.0, 15.5]
+        sse = sum((a - b) ** 2 for a, b in zip(y_vals, y_pred, strict=True))
+
+        assert prediction_interval_from_sse(sse, len(y_vals), y_pred[-1]) == (
+            prediction_interval(y_vals, y_pred)
+        )
+
+
 class TestPredictionInterval:
     """Tests for prediction_interval function."""
 
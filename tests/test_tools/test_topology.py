@@ -105,6 +105,30 @@ class TestGetDeviceNeighbors:
         assert data["total"] == 2
         assert len(data["neighbors"]) == 2
 
+    @respx.mock
+    async def test_direct_neighbors_served_from_fresh_snapshot(self, client):
+        """A repeat depth-1 lookup is answered from the topology snapshot."""
+        from lm_mcp.tools.topology import get_device_neighbors
+
+        route = respx.get(
+            "https://test.logicmonitor.com/santaba/rest/device/devices/123/neighbors"
+        ).mock(
+            return_value=httpx.Response(
+                200,
+                json={"items": [{"id": 456, "displayName": "router-01"}], "total": 1},
+            )
+        )
+
+        first = json.loads((await get_device_neighbors(client, device_id=123))[0].text)
+        second = json.loads((await get_device_neighbors(client, device_id=123))[0].text)
+        await get_device_neighbors(client, device_id=123, depth=2)
+
+        assert route.call_count == 2
+        assert first["cached"] is False
+        assert second["cached"] is True
+        assert second["neighbors"] == first["neighbors"]
+        assert second["total"] == 1
+
 
 class TestGetDeviceInterfaces:
     """Tests for get_device_interfaces tool."""
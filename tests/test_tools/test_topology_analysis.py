@@ -123,10 +123,11 @@ class TestAnalyzeBlastRadius:
         assert dev["alert_status_unavailable"] is True
         # Not a confident "healthy" -- the critical status is unknown.
         assert dev["has_critical"] is None
+        assert "1 alert lookup(s)" in data["degraded_detail"]
 
     @respx.mock
-    async def test_depth_capped_at_three(self, client):
-        """Depth is capped at maximum of 3."""
+    async def test_depth_capped_at_five(self, client):
+        """Depth is capped at maximum of 5."""
         from lm_mcp.tools.topology_analysis import analyze_blast_radius
 
         respx.get(f"{BASE_URL}/topology/devices/1/neighbors").mock(
@@ -136,7 +137,7 @@ class TestAnalyzeBlastRadius:
         result = await analyze_blast_radius(client, device_id=1, depth=10)
 
         data = json.loads(result[0].text)
-        assert data["depth"] == 3
+        assert data["depth"] == 5
 
     @respx.mock
     async def test_critical_alerts_increase_score(self, client):
@@ -153,7 +154,9 @@ class TestAnalyzeBlastRadius:
             return_value=httpx.Response(
                 200,
                 json={
-                    "items": [{"id": "LMA1", "severity": 4, "cleared": False}],
+                    "items": [
+                        {"id": "LMA1", "severity": 4, "cleared": False, "monitorObjectId": 2}
+                    ],
                     "total": 1,
                 },
             )
@@ -246,3 +249,101 @@ class TestAnalyzeBlastRadius:
 
         data = json.loads(result[0].text)
         assert data["total_affected_devices"] == 0
+
+    @respx.mock
+    async def test_alert_status_batched_per_chunk(self, client):
+        """Affected devices are checked with one alert query per chunk of IDs."""
+        from lm_mcp.tools import topology_analysis
+        from lm_mcp.tools.topology_analysis import analyze_blast_radius
+
+        neighbors = [{"id": i, "displayName": f"edge-{i}"} for i in range(10, 70)]
+        respx.get(f"{BASE_URL}/topology/devices/1/neighbors").mock(
+            return_value=httpx.Response(200, json={"items": neighbors})
+        )
+        alerts_route = respx.get(ALERT_URL).mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "items": [
+                        {"id": "LMA1", "severity": 4, "monitorObjectId": 12},
+                        {"id": "LMA2", "severity": 2, "monitorObjectId": 12},
+                        {"id": "LMA3", "severity": 3, "monitorObjectId": 65},
+                    ]
+                },
+            )
+        )
+
+        result = await analyze_blast_radius(client, device_id=1, depth=1)
+
+        data = json.loads(result[0].text)
+        assert data["total_affected_devices"] == 60
+        expected_queries = -(-60 // topology_analysis.ALERT_CHECK_CHUNK)
+        assert alerts_route.call_count == expected_queries
+        first_filter = alerts_route.calls[0].request.url.params["filter"]
+        assert first_filter.startswith("monitorObjectId:10|11|12|")
+        by_id = {d["device_id"]: d for d in data["affected_devices"]}
+        assert by_id[12]["active_alert_count"] == 2
+        assert by_id[12]["has_critical"] is True
+        assert by_id[65]["active_alert_count"] == 1
+        assert by_id[30]["active_alert_count"] == 0
+        assert data["critical_alert_count"] == 1
+
+    @respx.mock
+    async def test_alert_status_pages_until_total(self, client, monkeypatch):
+        """A chunk with more active alerts than one page is read in full."""
+        from lm_mcp.tools import topology_analysis
+        from lm_mcp.tools.topology_analysis import analyze_blast_radius
+
+        monkeypatch.setattr(topology_analysis, "ALERT_PAGE_SIZE", 2)
+        respx.get(f"{BASE_URL}/topology/devices/1/neighbors").mock(
+            return_value=httpx.Response(200, json={"items": [{"id": 2}, {"id": 3}]})
+        )
+        pages = [
+            [{"id": "LMA1", "severity": 2, "monitorObjectId": 2}] * 2,
+            [{"id": "LMA2", "severity": 4, "monitorObjectId": 3}],
+        ]
+        alerts_route = respx.get(ALERT_URL).mock(
+            side_effect=[httpx.Response(200, json={"items": p, "total": 3}) for p in pages]
+        )
+
+        result = await analyze_blast_radius(client, device_id=1, depth=1)
+
+        data = json.loads(result[0].text)
+        assert alerts_route.call_count == 2
+        assert alerts_route.calls[1].request.url.params["offset"] == "2"
+        by_id = {d["device_id"]: d for d in data["affected_devices"]}
+        assert by_id[2]["active_alert_count"] == 2
+        assert by_id[3]["has_critical"] is True
+        assert data["critical_alert_count"] == 1
+
+    @respx.mock
+    async def test_layer_expanded_concurrently_in_order(self, client):
+        """Every device in a layer is expanded, and depths follow BFS order."""
+        from lm_mcp.tools.topology_analysis import analyze_blast_radius
+
+        respx.get(f"{BASE_URL}/topology/devices/1/neighbors").mock(
+            return_value=httpx.Response(200, json={"items": [{"id": 2}, {"id": 3}]})
+        )
+        respx.get(f"{BASE_URL}/topology/devices/2/neighbors").mock(
+            return_value=httpx.Response(200, json={"items": [{"id": 4}, {"id": 3}]})
+        )
+        respx.get(f"{BASE_URL}/topology/devices/3/neighbors").mock(
+            return_value=httpx.Response(200, json={"items": [{"id": 4}, {"id": 5}]})
+        )
+        for dev_id in (4, 5):
+            respx.get(f"{BASE_URL}/topology/devices/{dev_id}/neighbors").mock(
+                return_value=httpx.Response(200, json={"items": []})
+            )
+        respx.get(ALERT_URL).mock(return_value=httpx.Response(200, json={"items": []}))
+
+        result = await analyze_blast_radius(client, device_id=1, depth=4)
+
+        data = json.loads(result[0].text)
+        assert [(d["device_id"], d["depth"]) for d in data["affected_devices"]] == [
+            (2, 1),
+            (3, 1),
+            (4, 2),
+            (5, 2),
+        ]
+        critical = {d["device_id"] for d in data["critical_path_devices"]}
+        assert critical == {3, 4}
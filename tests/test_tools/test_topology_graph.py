@@ -0,0 +1,221 @@
+# Description: Tests for the cached topology graph.
+# Description: Validates CSR compilation, cut sizes with frontier devices, scores, and TTL refresh.
+
+import json
+import random
+
+import httpx
+import pytest
+import respx
+
+from lm_mcp.auth.bearer import BearerAuth
+from lm_mcp.client import LogicMonitorClient
+from lm_mcp.tools.topology_graph import (
+    CompiledTopology,
+    TopologySnapshot,
+    get_topology_snapshot,
+)
+
+BASE_URL = "https://test.logicmonitor.com/santaba/rest"
+ALERT_URL = f"{BASE_URL}/alert/alerts"
+
+
+@pytest.fixture
+def client():
+    """Create a LogicMonitorClient instance for testing."""
+    return LogicMonitorClient(
+        base_url=BASE_URL,
+        auth=BearerAuth("test-token"),
+        timeout=30,
+        api_version=3,
+    )
+
+
+def _brute_cut_sizes(adjacency, nodes):
+    """Remove each device and count what falls outside the largest remaining piece."""
+    undirected = {v: set() for v in nodes}
+    for a, targets in adjacency.items():
+        for b in targets:
+            if a != b:
+                undirected[a].add(b)
+                undirected[b].add(a)
+
+    def reach(start, removed):
+        seen, stack = set(), [start]
+        while stack:
+            x = stack.pop()
+            if x in seen or x == removed:
+                continue
+            seen.add(x)
+            stack.extend(undirected[x])
+        return seen
+
+    result = {}
+    for v in nodes:
+        rest = reach(v, None) - {v}
+        pieces, covered = [], set()
+        for start in rest:
+            if start not in covered:
+                piece = reach(start, v)
+                covered |= piece
+                pieces.append(len(piece))
+        if len(pieces) >= 2:
+            result[v] = len(rest) - max(pieces)
+    return result
+
+
+class TestCompiledTopology:
+    """Tests for the CSR view and structural scores."""
+
+    def test_neighbors_and_degree(self):
+        graph = CompiledTopology.build({1: [2, 3], 2: [1], 3: [4]}, [1, 2, 3, 4])
+
+        assert graph.neighbors(1) == [2, 3]
+        assert graph.neighbors(4) == []
+        assert graph.degree(3) == 2
+        assert graph.degree(99) == 0
+
+    def test_star_and_chain_cut_sizes(self):
+        """A hub cuts off all but one spoke; a chain link cuts off the shorter side."""
+        star = CompiledTopology.build({1: [2, 3, 4], 2: [], 3: [], 4: []}, [1, 2, 3, 4])
+        chain = CompiledTopology.build({1: [2], 2: [3], 3: [4], 4: [5], 5: []}, [1, 2, 3, 4, 5])
+
+        assert star.cut_sizes() == {1: 2}
+        assert chain.cut_sizes() == {2: 1, 3: 2, 4: 1}
+
+    def test_cycle_has_no_articulation_points(self):
+        ring = CompiledTopology.build({1: [2], 2: [3], 3: [4], 4: [1]}, [1, 2, 3, 4])
+        assert ring.cut_sizes() == {}
+
+    def test_frontier_devices_are_not_leaves(self):
+        """A triangle seen from one corner at depth 1 has no single point of failure."""
+        graph = CompiledTopology.build({1: [2, 3]}, [1, 2, 3])
+
+        assert graph.cut_sizes() == {}
+
+    def test_only_expanded_pieces_count_as_cut_off(self):
+        """Pieces reaching the unexplored frontier are assumed to survive."""
+        # 3 is a fully expanded leaf behind 2; 4 is an unexpanded frontier device.
+        graph = CompiledTopology.build({1: [2], 2: [1, 3, 4], 3: [2]}, [1, 2, 3, 4])
+
+        assert graph.cut_sizes() == {2: 2}
+
+    def test_downstream_counts_dependents_of_root(self):
+        """Devices behind a link lose their path to the root when it fails."""
+        graph = CompiledTopology.build(
+            {1: [2], 2: [3, 4], 3: [5], 4: [], 5: [], 6: [7]}, [1, 2, 3, 4, 5, 6, 7]
+        )
+
+        assert graph.downstream(1) == {2: 3, 3: 1}
+        assert graph.downstream(99) == {}
+
+    async def test_centrality_scores_hubs(self):
+        star = CompiledTopology.build({1: [2, 3, 4], 2: [], 3: [], 4: []}, [1, 2, 3, 4])
+
+        scores = await star.centrality()
+
+        assert scores == {1: 1.0, 2: 0.0, 3: 0.0, 4: 0.0}
+
+    def test_matches_brute_force(self):
+        rng = random.Random(5)
+        for _ in range(200):
+            nodes = list(range(100, 100 + rng.randint(1, 30)))
+            adjacency = {v: [] for v in nodes}
+            for _ in range(rng.randint(0, 45)):
+                adjacency[rng.choice(nodes)].append(rng.choice(nodes))
+            graph = CompiledTopology.build(adjacency, nodes)
+            assert graph.cut_sizes() == _brute_cut_sizes(adjacency, nodes)
+
+
+class TestTopologySnapshot:
+    """Tests for the cached, TTL-refreshed snapshot."""
+
+    def test_record_replaces_and_recompiles(self):
+        snapshot = TopologySnapshot()
+        snapshot.record(1, [{"id": 2, "displayName": "sw-2"}, {"id": 3}])
+        first = snapshot.compiled()
+        assert snapshot.compiled() is first
+
+        snapshot.record(1, [{"id": 3}])
+
+        assert snapshot.compiled() is not first
+        assert snapshot.compiled().neighbors(1) == [3]
+        assert snapshot.names[2] == "sw-2"
+
+    def test_prune_drops_oldest_neighbor_lists(self):
+        snapshot = TopologySnapshot(max_devices=4)
+        snapshot.record(1, [{"id": 2}, {"id": 3}], now=1.0)
+        snapshot.record(4, [{"id": 5}, {"id": 6}], now=2.0)
+
+        snapshot.prune()
+
+        assert snapshot.adjacency == {4: [5, 6]}
+        assert snapshot.nodes == [4, 5, 6]
+        assert sorted(snapshot.names) == [4, 5, 6]
+        assert snapshot.compiled().neighbors(4) == [5, 6]
+
+    def test_cache_is_per_portal(self, client):
+        other = LogicMonitorClient(
+            base_url="https://other.logicmonitor.com/santaba/rest",
+            auth=BearerAuth("x"),
+            timeout=30,
+        )
+        assert get_topology_snapshot(client) is get_topology_snapshot(client)
+        assert get_topology_snapshot(client) is not get_topology_snapshot(other)
+
+    @respx.mock
+    async def test_blast_radius_reuses_cached_neighbors(self, client):
+        """A repeat blast radius only hits the alert API; expired entries are refetched."""
+        from lm_mcp.tools.topology_analysis import analyze_blast_radius
+
+        routes = {
+            dev: respx.get(f"{BASE_URL}/topology/devices/{dev}/neighbors").mock(
+                return_value=httpx.Response(200, json={"items": items})
+            )
+            for dev, items in {
+                1: [{"id": 2, "displayName": "core"}],
+                2: [{"id": 1}, {"id": 3}, {"id": 4}],
+                3: [],
+                4: [],
+            }.items()
+        }
+        respx.get(ALERT_URL).mock(return_value=httpx.Response(200, json={"items": []}))
+
+        first = json.loads((await analyze_blast_radius(client, device_id=1, depth=2))[0].text)
+        second = json.loads((await analyze_blast_radius(client, device_id=1, depth=2))[0].text)
+
+        assert first["topology_cache"]["neighbor_lookups"] == 2
+        assert second["topology_cache"]["neighbor_lookups"] == 0
+        assert routes[1].call_count == 1
+        assert routes[2].call_count == 1
+        assert first["affected_devices"] == second["affected_devices"]
+        # 3 and 4 were reached but not expanded: only device 1 is known to be cut off.
+        spof = {d["device_id"]: d["devices_cut_off"] for d in second["single_points_of_failure"]}
+        assert spof == {2: 1}
+        assert second["topology_partial"] is True
+        assert second["topology_cache"]["frontier_devices"] == 2
+
+        get_topology_snapshot(client).ttl = 0
+        third = json.loads((await analyze_blast_radius(client, device_id=1, depth=1))[0].text)
+        assert third["topology_cache"]["neighbor_lookups"] == 1
+        assert routes[1].call_count == 2
+
+    @respx.mock
+    async def test_device_neighbors_warms_cache(self, client):
+        """get_device_neighbors at depth 1 records adjacency used by blast radius."""
+        from lm_mcp.tools.topology import get_device_neighbors
+        from lm_mcp.tools.topology_analysis import analyze_blast_radius
+
+        respx.get(f"{BASE_URL}/device/devices/1/neighbors").mock(
+            return_value=httpx.Response(200, json={"items": [{"id": 7, "displayName": "fw"}]})
+        )
+        topology_route = respx.get(f"{BASE_URL}/topology/devices/1/neighbors").mock(
+            return_value=httpx.Response(200, json={"items": []})
+        )
+        respx.get(ALERT_URL).mock(return_value=httpx.Response(200, json={"items": []}))
+
+        await get_device_neighbors(client, device_id=1)
+        result = json.loads((await analyze_blast_radius(client, device_id=1, depth=1))[0].text)
+
+        assert topology_route.call_count == 0
+        assert result["affected_devices"][0]["device_name"] == "fw"
@@ -6,7 +6,9 @@ from __future__ import annotations
 import json
 from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
+import respx
 
 from lm_mcp.auth.bearer import BearerAuth
 from lm_mcp.client import LogicMonitorClient
@@ -573,11 +575,32 @@ class TestCapacityPlan:
 # ---------------------------------------------------------------------------
 
 
+def _mock_overview_alerts(alerts: list[dict]) -> respx.MockRouter:
+    """Serve raw active-alert records to the overview's shared alert fetch."""
+    router = respx.mock(base_url="https://test.logicmonitor.com/santaba/rest")
+    router.get("/alert/alerts").mock(
+        return_value=httpx.Response(200, json={"items": alerts, "total": len(alerts)})
+    )
+    return router
+
+
+def _overview_subs(**overrides) -> list:
+    """Patches for the non-alert portal_overview sections."""
+    data = {
+        "lm_mcp.tools.collectors.get_collectors": {"total": 3, "collectors": []},
+        "lm_mcp.tools.sdts.get_active_sdts": {"active_sdts": []},
+        "lm_mcp.tools.scoring.score_alert_noise": {"noise_score": 5},
+        "lm_mcp.tools.devices.get_devices": {"devices": [], "total": 0},
+    }
+    data.update(overrides)
+    return [_patch_sub(path, value) for path, value in data.items()]
+
+
 class TestPortalOverview:
     """Tests for the portal_overview composite tool."""
 
-    async def test_happy_path_summary(self, client, monkeypatch):
-        """Portal overview returns expected keys in summary mode."""
+    @pytest.fixture(autouse=True)
+    def _reset_config(self, monkeypatch):
         monkeypatch.setenv("LM_PORTAL", "test.logicmonitor.com")
         monkeypatch.setenv("LM_BEARER_TOKEN", "test-bearer-token-value")
         monkeypatch.delenv("LM_ENABLED_TOOLS", raising=False)
@@ -585,25 +608,50 @@ class TestPortalOverview:
         from lm_mcp.config import reset_config
 
         reset_config()
+        yield
+        reset_config()
 
-        stats_data = {"summary": {"total": 10}}
-        alert_data = {"total": 2, "alerts": []}
-        coll_data = {"total": 3, "collectors": []}
-        sdt_data = {"active_sdts": []}
-        cluster_data = {"clusters": [], "total_alerts": 0}
-        noise_data = {"noise_score": 5}
-        dead_data = {"devices": [], "total": 0}
+    @staticmethod
+    def _alerts() -> list[dict]:
+        import time
+
+        now = int(time.time())
+        return [
+            {
+                "id": "LMA1",
+                "severity": 4,
+                "monitorObjectName": "db-01",
+                "monitorObjectId": 1,
+                "dataPointName": "CPU",
+                "alertValue": "99",
+                "startEpoch": now - 60,
+            },
+            {
+                "id": "LMA2",
+                "severity": 3,
+                "monitorObjectName": "db-01",
+                "monitorObjectId": 1,
+                "dataPointName": "Memory",
+                "alertValue": "95",
+                "startEpoch": now - 120,
+            },
+            {
+                "id": "LMA3",
+                "severity": 4,
+                "monitorObjectName": "web-01",
+                "monitorObjectId": 2,
+                "dataPointName": "Ping",
+                "alertValue": "0",
+                "startEpoch": now - 30 * 3600,
+            },
+        ]
 
-        with (
-            _patch_sub("lm_mcp.tools.correlation.get_alert_statistics", stats_data),
-            _patch_sub("lm_mcp.tools.alerts.get_alerts", alert_data),
-            _patch_sub("lm_mcp.tools.collectors.get_collectors", coll_data),
-            _patch_sub("lm_mcp.tools.sdts.get_active_sdts", sdt_data),
-            _patch_sub("lm_mcp.tools.correlation.correlate_alerts", cluster_data),
-            _patch_sub("lm_mcp.tools.scoring.score_alert_noise", noise_data),
-            _patch_sub("lm_mcp.tools.devices.get_devices", dead_data),
-        ):
-            result = await portal_overview(client, detail_level="summary")
+    async def test_happy_path_summary(self, client):
+        """Portal overview returns expected keys in summary mode."""
+        with _mock_overview_alerts(self._alerts()):
+            subs = _overview_subs()
+            with subs[0], subs[1], subs[2], subs[3]:
+                result = await portal_overview(client, detail_level="summary")
 
         data = json.loads(result[0].text)
         assert "alert_statistics" in data
@@ -611,41 +659,85 @@ class TestPortalOverview:
         # summary strips detail lists
         assert "critical_alerts" not in data
         assert "dead_devices" not in data
-        reset_config()
 
-    async def test_happy_path_full(self, client, monkeypatch):
+    async def test_happy_path_full(self, client):
         """Portal overview full mode includes all keys."""
-        monkeypatch.setenv("LM_PORTAL", "test.logicmonitor.com")
-        monkeypatch.setenv("LM_BEARER_TOKEN", "test-bearer-token-value")
-        monkeypatch.delenv("LM_ENABLED_TOOLS", raising=False)
-        monkeypatch.delenv("LM_DISABLED_TOOLS", raising=False)
-        from lm_mcp.config import reset_config
-
-        reset_config()
-
-        stats_data = {"summary": {"total": 10}}
-        alert_data = {"total": 2, "alerts": []}
-        coll_data = {"total": 3, "collectors": []}
-        sdt_data = {"active_sdts": []}
-        cluster_data = {"clusters": [], "total_alerts": 0}
-        noise_data = {"noise_score": 5}
-        dead_data = {"devices": [], "total": 0}
-
-        with (
-            _patch_sub("lm_mcp.tools.correlation.get_alert_statistics", stats_data),
-            _patch_sub("lm_mcp.tools.alerts.get_alerts", alert_data),
-            _patch_sub("lm_mcp.tools.collectors.get_collectors", coll_data),
-            _patch_sub("lm_mcp.tools.sdts.get_active_sdts", sdt_data),
-            _patch_sub("lm_mcp.tools.correlation.correlate_alerts", cluster_data),
-            _patch_sub("lm_mcp.tools.scoring.score_alert_noise", noise_data),
-            _patch_sub("lm_mcp.tools.devices.get_devices", dead_data),
-        ):
-            result = await portal_overview(client, detail_level="full")
+        with _mock_overview_alerts(self._alerts()):
+            subs = _overview_subs()
+            with subs[0], subs[1], subs[2], subs[3]:
+                result = await portal_overview(client, detail_level="full")
 
         data = json.loads(result[0].text)
         assert "critical_alerts" in data
         assert "dead_devices" in data
-        reset_config()
+        assert "generated_at" in data
+        assert "cache_age_seconds" in data
+
+    async def test_alert_sections_share_one_fetch(self, client):
+        """Statistics, clusters, and critical/error lists come from one alert read."""
+        with _mock_overview_alerts(self._alerts()) as router:
+            subs = _overview_subs()
+            with subs[0], subs[1], subs[2], subs[3]:
+                result = await portal_overview(client, hours_back=4, detail_level="full")
+            assert router.calls.call_count == 1
+            params = router.calls.last.request.url.params
+            assert params["filter"] == "cleared:false"
+            assert params["sort"] == "-startEpoch"
+
+        data = json.loads(result[0].text)
+        assert [a["id"] for a in data["critical_alerts"]["alerts"]] == ["LMA1", "LMA3"]
+        assert data["critical_alerts"]["alerts"][0]["device"] == "db-01"
+        assert [a["id"] for a in data["error_alerts"]["alerts"]] == ["LMA2"]
+        # LMA3 started before the window, so only two alerts are counted.
+        assert data["alert_statistics"]["summary"]["total"] == 2
+        assert data["alert_clusters"]["total_alerts"] == 2
+
+    async def test_failed_section_becomes_warning(self, client):
+        """A failing section is reported as None with a warning."""
+        failing = patch(
+            "lm_mcp.tools.collectors.get_collectors",
+            new_callable=AsyncMock,
+            side_effect=RuntimeError("collector API down"),
+        )
+        with _mock_overview_alerts(self._alerts()):
+            subs = _overview_subs()
+            with failing, subs[1], subs[2], subs[3]:
+                result = await portal_overview(client, detail_level="full")
+
+        data = json.loads(result[0].text)
+        assert data["collectors"] is None
+        assert any("get_collectors failed" in w for w in data["warnings"])
+        assert data["critical_alerts"]["total"] == 2
+
+    async def test_concurrent_calls_share_one_build(self, client):
+        """Identical overlapping requests are served by a single build."""
+        import asyncio
+
+        with _mock_overview_alerts(self._alerts()) as router:
+            subs = _overview_subs()
+            with subs[0], subs[1], subs[2], subs[3]:
+                first, second = await asyncio.gather(
+                    portal_overview(client), portal_overview(client)
+                )
+            assert router.calls.call_count == 1
+
+        assert (
+            json.loads(first[0].text)["generated_at"] == json.loads(second[0].text)["generated_at"]
+        )
+
+    async def test_max_age_serves_cached_report(self, client):
+        """max_age_seconds reuses a recent report; the default rebuilds."""
+        with _mock_overview_alerts(self._alerts()) as router:
+            subs = _overview_subs()
+            with subs[0], subs[1], subs[2], subs[3]:
+                await portal_overview(client)
+                cached = await portal_overview(client, max_age_seconds=300)
+                assert router.calls.call_count == 1
+                await portal_overview(client)
+                assert router.calls.call_count == 2
+
+        data = json.loads(cached[0].text)
+        assert data["cache_age_seconds"] >= 0
 
     async def test_required_tool_blocked(self, client, monkeypatch):
         """Portal overview returns error when a required tool is disabled."""
@@ -1157,8 +1249,9 @@ class TestDetectSiteOutage:
     async def test_partial_collector_failures_do_not_abort_loop(self, client):
         """One bad collector probe no longer aborts the rest (v3.8.2 fix).
 
-        Composite must continue probing remaining collector IDs and
-        surface a single aggregate warning summarizing the failures.
+        Composite probes all collector IDs in one call, keeps the ones that
+        resolved, and surfaces a single aggregate warning summarizing the
+        failures.
         """
         from mcp.types import TextContent
 
@@ -1172,28 +1265,22 @@ class TestDetectSiteOutage:
             ]
         }
 
-        async def selective_health(_client, collector_id, **_kwargs):
+        async def selective_health(_client, collector_ids, **_kwargs):
             # Collector 20 fails; 10 and 30 succeed.
-            if collector_id == 20:
-                return [
-                    TextContent(
-                        type="text",
-                        text="Error: collector 20 not found\nSuggestion: Verify ID.",
-                    )
-                ]
+            assert collector_ids == [10, 20, 30]
             return [
                 TextContent(
                     type="text",
                     text=json.dumps(
                         {
-                            "total_collectors": 1,
+                            "total_collectors": 2,
                             "collectors_down": 0,
                             "collectors": [
-                                {
-                                    "id": collector_id,
-                                    "hostname": f"col-{collector_id}",
-                                    "is_down": False,
-                                }
+                                {"id": cid, "hostname": f"col-{cid}", "is_down": False}
+                                for cid in (10, 30)
+                            ],
+                            "collector_errors": [
+                                {"collector_id": 20, "error": "collector 20 not found"}
                             ],
                         }
                     ),
@@ -1219,7 +1306,7 @@ class TestDetectSiteOutage:
             result = await detect_site_outage(client, group_id=42, detail_level="full")
 
         data = json.loads(result[0].text)
-        # Composite kept going past collector 20 and probed 30.
+        # Collector 20 failing did not drop collector 30.
         inspected_ids = [c.get("id") for c in data["collectors_inspected"]]
         assert 10 in inspected_ids
         assert 30 in inspected_ids
@@ -1247,6 +1334,19 @@ class TestDetectSiteOutage:
 # ---------------------------------------------------------------------------
 
 
+def _mock_audit_api(devices_data: dict, collectors_data: dict) -> respx.MockRouter:
+    """Serve raw device and collector records to the audit's paged API reads."""
+    router = respx.mock(base_url="https://test.logicmonitor.com/santaba/rest")
+    devices = devices_data["devices"]
+    router.get("/device/devices").mock(
+        return_value=httpx.Response(200, json={"items": devices, "total": len(devices)})
+    )
+    router.get("/setting/collector/collectors").mock(
+        return_value=httpx.Response(200, json={"items": collectors_data["collectors"]})
+    )
+    return router
+
+
 class TestAuditNetworkMonitoringCoverage:
     """Tests for the audit_network_monitoring_coverage composite."""
 
@@ -1285,10 +1385,7 @@ class TestAuditNetworkMonitoringCoverage:
         }
         collectors_data = {"collectors": [{"id": 1, "hostname": "col-01", "status": "normal"}]}
 
-        with (
-            _patch_sub("lm_mcp.tools.devices.get_devices", devices_data),
-            _patch_sub("lm_mcp.tools.collectors.get_collectors", collectors_data),
-        ):
+        with _mock_audit_api(devices_data, collectors_data):
             result = await audit_network_monitoring_coverage(client, group_id=1)
 
         data = json.loads(result[0].text)
@@ -1314,10 +1411,7 @@ class TestAuditNetworkMonitoringCoverage:
         }
         collectors_data = {"collectors": [{"id": 1, "status": "normal"}]}
 
-        with (
-            _patch_sub("lm_mcp.tools.devices.get_devices", devices_data),
-            _patch_sub("lm_mcp.tools.collectors.get_collectors", collectors_data),
-        ):
+        with _mock_audit_api(devices_data, collectors_data):
             result = await audit_network_monitoring_coverage(client)
 
         data = json.loads(result[0].text)
@@ -1340,10 +1434,7 @@ class TestAuditNetworkMonitoringCoverage:
         }
         collectors_data = {"collectors": [{"id": 1, "status": "normal"}]}
 
-        with (
-            _patch_sub("lm_mcp.tools.devices.get_devices", devices_data),
-            _patch_sub("lm_mcp.tools.collectors.get_collectors", collectors_data),
-        ):
+        with _mock_audit_api(devices_data, collectors_data):
             result = await audit_network_monitoring_coverage(client)
 
         data = json.loads(result[0].text)
@@ -1351,6 +1442,34 @@ class TestAuditNetworkMonitoringCoverage:
         power_gaps = [g for g in data["gaps"] if g["category"] == "power"]
         assert power_gaps == []
 
+    async def test_second_audit_reports_changes(self, client):
+        """A repeat audit of the same scope diffs against the previous one."""
+        from lm_mcp.tools.workflows import audit_network_monitoring_coverage
+
+        collectors_data = {"collectors": [{"id": 1, "status": "normal"}]}
+        before = {"devices": [{"id": 1, "displayName": "router-01"}]}
+        after = {
+            "devices": [
+                {
+                    "id": 1,
+                    "displayName": "router-01",
+                    "customProperties": [{"name": "snmp.version", "value": "v3"}],
+                },
+                {"id": 2, "displayName": "ups-01"},
+            ]
+        }
+
+        with _mock_audit_api(before, collectors_data):
+            first = json.loads((await audit_network_monitoring_coverage(client))[0].text)
+        with _mock_audit_api(after, collectors_data):
+            second = json.loads((await audit_network_monitoring_coverage(client))[0].text)
+
+        assert "changes" not in first
+        changes = second["changes"]
+        assert changes["devices_added"] == 1
+        assert changes["coverage_gained"]["snmp"]["device_ids"] == [1]
+        assert "power:high" in changes["gaps_closed"]
+
     async def test_critical_when_no_collectors(self, client):
         """Zero collectors → critical gap."""
         from lm_mcp.tools.workflows import audit_network_monitoring_coverage
@@ -1358,10 +1477,7 @@ class TestAuditNetworkMonitoringCoverage:
         devices_data = {"devices": []}
         collectors_data = {"collectors": []}
 
-        with (
-            _patch_sub("lm_mcp.tools.devices.get_devices", devices_data),
-            _patch_sub("lm_mcp.tools.collectors.get_collectors", collectors_data),
-        ):
+        with _mock_audit_api(devices_data, collectors_data):
             result = await audit_network_monitoring_coverage(client)
 
         data = json.loads(result[0].text)
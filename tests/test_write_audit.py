@@ -66,6 +66,13 @@ class TestWriteToolPrefixDetection:
         assert is_write_tool("recover_device")
         assert is_write_tool("collect_device_config")
 
+    def test_run_across_portals_is_not_a_write_tool(self):
+        """run_across_portals only fans out read-only tools despite its run_ prefix."""
+        from lm_mcp.logging import is_write_tool
+
+        assert not is_write_tool("run_across_portals")
+        assert is_write_tool("run_netscan")
+
 
 class TestAwxWriteToolPrefixes:
     """Tests for AWX write tool prefix detection."""